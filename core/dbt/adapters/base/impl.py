@@ -4,6 +4,7 @@ from contextlib import contextmanager
 from datetime import datetime
 import time
 from itertools import chain
+import re
 from typing import (
     Optional,
     Tuple,
@@ -20,6 +21,7 @@ from typing import (
 
 import agate
 import pytz
+from dateutil.parser import parse as parse_datetime
 
 from dbt.exceptions import (
     DbtInternalError,
@@ -43,6 +45,7 @@ from dbt.clients.agate_helper import empty_table, merge_tables, table_from_rows
 from dbt.clients.jinja import MacroGenerator
 from dbt.contracts.graph.manifest import Manifest, MacroManifest
 from dbt.contracts.graph.nodes import ResultNode
+from dbt.events.base_types import EventLevel
 from dbt.events.functions import fire_event, warn_or_error
 from dbt.events.types import (
     CacheMiss,
@@ -50,8 +53,9 @@ from dbt.events.types import (
     CodeExecution,
     CodeExecutionStatus,
     CatalogGenerationError,
+    Note,
 )
-from dbt.utils import filter_null_values, executor, cast_to_str, AttrDict
+from dbt.utils import filter_null_values, executor, cast_to_str, AttrDict, lowercase
 
 from dbt.adapters.base.connections import Connection, AdapterResponse
 from dbt.adapters.base.meta import AdapterMeta, available
@@ -63,11 +67,13 @@ from dbt.adapters.base.relation import (
 )
 from dbt.adapters.base import Column as BaseColumn
 from dbt.adapters.base import Credentials
-from dbt.adapters.cache import RelationsCache, _make_ref_key_msg
+from dbt.adapters.cache import GrantsCache, RelationsCache, _make_ref_key_msg
 
 
 GET_CATALOG_MACRO_NAME = "get_catalog"
 FRESHNESS_MACRO_NAME = "collect_freshness"
+FRESHNESS_BATCH_MACRO_NAME = "collect_freshness_batch"
+LIST_GRANTS_IN_SCHEMA_MACRO_NAME = "list_grants_in_schema"
 
 
 def _expect_row_value(key: str, row: agate.Row):
@@ -112,6 +118,20 @@ def _utc(dt: Optional[datetime], source: BaseRelation, field_name: str) -> datet
         return dt.replace(tzinfo=pytz.UTC)
 
 
+# a date and a time, as collect_freshness_batch returns timestamps
+_TIMESTAMP_STRING_PAT = re.compile(r"^\s*\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}")
+
+
+def _parse_batched_timestamp(value: Any) -> Any:
+    """collect_freshness_batch returns its timestamps as strings. Parse one,
+    keeping its time zone if it has one. Anything else is returned as is, so
+    that _utc rejects it as collect_freshness would.
+    """
+    if isinstance(value, str) and _TIMESTAMP_STRING_PAT.match(value):
+        return parse_datetime(value)
+    return value
+
+
 def _relation_name(rel: Optional[BaseRelation]) -> str:
     if rel is None:
         return "null relation"
@@ -148,6 +168,28 @@ class PythonJobHelper:
         raise NotImplementedError("PythonJobHelper submit function is not implemented yet")
 
 
+def _build_freshness(
+    source: BaseRelation,
+    loaded_at_field: str,
+    max_loaded_at: Optional[datetime],
+    snapshotted_at: Optional[datetime],
+) -> Dict[str, Any]:
+    if max_loaded_at is None:
+        # no records in the table, so really the max_loaded_at was
+        # infinitely long ago. Just call it 0:00 January 1 year UTC
+        max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
+    else:
+        max_loaded_at = _utc(max_loaded_at, source, loaded_at_field)
+
+    snapshotted_at = _utc(snapshotted_at, source, loaded_at_field)
+    age = (snapshotted_at - max_loaded_at).total_seconds()
+    return {
+        "max_loaded_at": max_loaded_at,
+        "snapshotted_at": snapshotted_at,
+        "age": age,
+    }
+
+
 class BaseAdapter(metaclass=AdapterMeta):
     """The BaseAdapter provides an abstract base class for adapters.
 
@@ -204,6 +246,7 @@ class BaseAdapter(metaclass=AdapterMeta):
     def __init__(self, config):
         self.config = config
         self.cache = RelationsCache()
+        self.grants_cache = GrantsCache()
         self.connections = self.ConnectionManager(config)
         self._macro_manifest_lazy: Optional[MacroManifest] = None
 
@@ -446,6 +489,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             name = self.nice_connection_name()
             raise NullRelationCacheAttemptedError(name)
         self.cache.add(relation)
+        self.grants_cache.invalidate(relation)
         # so jinja doesn't render things
         return ""
 
@@ -458,6 +502,7 @@ class BaseAdapter(metaclass=AdapterMeta):
             name = self.nice_connection_name()
             raise NullRelationDropAttemptedError(name)
         self.cache.drop(relation)
+        self.grants_cache.invalidate(relation)
         return ""
 
     @available
@@ -476,6 +521,8 @@ class BaseAdapter(metaclass=AdapterMeta):
             raise RenameToNoneAttemptedError(src_name, dst_name, name)
 
         self.cache.rename(from_relation, to_relation)
+        self.grants_cache.invalidate(from_relation)
+        self.grants_cache.invalidate(to_relation)
         return ""
 
     ###
@@ -610,6 +657,94 @@ class BaseAdapter(metaclass=AdapterMeta):
                 grants_dict.update({privilege: [grantee]})
         return grants_dict
 
+    def _list_grants_in_schema(
+        self, schema_relation: BaseRelation, manifest: Manifest
+    ) -> Optional[Dict[str, Dict[str, List[str]]]]:
+        """Get the standardized grants dict of every relation in a schema that
+        has any grants, keyed by identifier, or None if the adapter cannot
+        list the grants of a whole schema at once.
+        """
+        kwargs = {"schema_relation": schema_relation}
+        table = self.execute_macro(
+            LIST_GRANTS_IN_SCHEMA_MACRO_NAME, kwargs=kwargs, manifest=manifest
+        )
+        if table is None:
+            return None
+
+        column_names, column_types = table.column_names, table.column_types  # type: ignore
+        rows_by_identifier: Dict[str, List[agate.Row]] = {}
+        for row in table:
+            rows_by_identifier.setdefault(row["table_name"], []).append(row)
+        return {
+            identifier: self.standardize_grants_dict(
+                agate.Table(rows, column_names, column_types, _is_fork=True)
+            )
+            for identifier, rows in rows_by_identifier.items()
+        }
+
+    def set_grants_cache(self, manifest: Manifest, selected_uids: Iterable[str]) -> None:
+        """Fill the grants cache for every schema containing a selected node
+        with a `grants` config, using one query per schema. Schemas whose
+        grants cannot be listed are left out of the cache, and the grants on
+        their relations are looked up one relation at a time instead.
+        """
+        cache_schemas: Set[BaseRelation] = set()
+        for unique_id in selected_uids:
+            node = manifest.nodes.get(unique_id)
+            if node is None or not node.is_relational or node.is_ephemeral_model:
+                continue
+            if not node.config.get("grants"):
+                continue
+            relation = self.Relation.create_from(self.config, node)
+            cache_schemas.add(relation.without_identifier())
+
+        with self.grants_cache.lock:
+            self.grants_cache.clear()
+            if not cache_schemas:
+                return
+            with executor(self.config) as tpe:
+                futures: Dict[Future, BaseRelation] = {}
+                for cache_schema in cache_schemas:
+                    fut = tpe.submit_connected(
+                        self,
+                        f"list_grants_{cache_schema.database}_{cache_schema.schema}",
+                        self._list_grants_in_schema,
+                        cache_schema,
+                        manifest,
+                    )
+                    futures[fut] = cache_schema
+
+                for future in as_completed(futures):
+                    cache_schema = futures[future]
+                    try:
+                        grants = future.result()
+                    except Exception as exc:
+                        fire_event(
+                            Note(
+                                msg=f"Could not list grants in {cache_schema}, "
+                                f"falling back to per-relation lookups: {exc}"
+                            ),
+                            level=EventLevel.DEBUG,
+                        )
+                        continue
+                    if grants is not None:
+                        self.grants_cache.add_schema(
+                            cache_schema.database, cache_schema.schema, grants
+                        )
+
+    @available
+    def get_cached_grants(self, relation: BaseRelation) -> Optional[Dict[str, List[str]]]:
+        """Get the standardized grants dict of a relation from the grants
+        cache, or None if it has to be looked up with `get_show_grant_sql`.
+        """
+        return self.grants_cache.get(relation)
+
+    @available
+    def invalidate_cached_grants(self, relation: BaseRelation) -> str:
+        """Forget the cached grants of a relation after changing them."""
+        self.grants_cache.invalidate(relation)
+        return ""
+
     ###
     # Provided methods about relations
     ###
@@ -1042,12 +1177,24 @@ class BaseAdapter(metaclass=AdapterMeta):
         results = self._catalog_filter_table(table, manifest)  # type: ignore[arg-type]
         return results
 
-    def get_catalog(self, manifest: Manifest) -> Tuple[agate.Table, List[Exception]]:
+    def get_catalog(
+        self,
+        manifest: Manifest,
+        only_schemas: Optional[Set[Tuple[Optional[str], str]]] = None,
+    ) -> Tuple[agate.Table, List[Exception]]:
+        """Query the catalog for every schema used in the manifest.
+
+        :param only_schemas: If set, only query the (database, schema) pairs
+            it contains. Both names must be lowercased.
+        """
         schema_map = self._get_catalog_schemas(manifest)
 
         with executor(self.config) as tpe:
             futures: List[Future[agate.Table]] = []
             for info, schemas in schema_map.items():
+                if only_schemas is not None:
+                    database = lowercase(info.database)
+                    schemas = {s for s in schemas if (database, s) in only_schemas}
                 if len(schemas) == 0:
                     continue
                 name = ".".join([str(info.database), "information_schema"])
@@ -1086,20 +1233,43 @@ class BaseAdapter(metaclass=AdapterMeta):
         # the current time according to the db.
         if len(table) != 1 or len(table[0]) != 2:
             raise MacroResultError(FRESHNESS_MACRO_NAME, table)
-        if table[0][0] is None:
-            # no records in the table, so really the max_loaded_at was
-            # infinitely long ago. Just call it 0:00 January 1 year UTC
-            max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
-        else:
-            max_loaded_at = _utc(table[0][0], source, loaded_at_field)
-
-        snapshotted_at = _utc(table[0][1], source, loaded_at_field)
-        age = (snapshotted_at - max_loaded_at).total_seconds()
-        freshness = {
-            "max_loaded_at": max_loaded_at,
-            "snapshotted_at": snapshotted_at,
-            "age": age,
+        freshness = _build_freshness(source, loaded_at_field, table[0][0], table[0][1])
+        return adapter_response, freshness
+
+    def calculate_freshness_batch(
+        self,
+        sources: List[Tuple[BaseRelation, str]],
+        filter: Optional[str],
+        manifest: Optional[Manifest] = None,
+    ) -> Tuple[AdapterResponse, List[Dict[str, Any]]]:
+        """Calculate the freshness of several sources that share the same
+        filter with a single query, and return it in the order of `sources`.
+
+        :param sources: (relation, loaded_at_field) pairs.
+        """
+        kwargs: Dict[str, Any] = {
+            "sources": sources,
+            "filter": filter,
         }
+
+        result = self.execute_macro(FRESHNESS_BATCH_MACRO_NAME, kwargs=kwargs, manifest=manifest)
+        adapter_response, table = result.response, result.table  # type: ignore[attr-defined]
+        # one row per source: its index in `sources`, the maximum
+        # `loaded_at_field` value and the current time according to the db.
+        if len(table) != len(sources) or len(table.column_names) != 3:
+            raise MacroResultError(FRESHNESS_BATCH_MACRO_NAME, table)
+
+        freshness: List[Dict[str, Any]] = [{} for _ in sources]
+        for source_index, max_loaded_at, snapshotted_at in table:
+            source, loaded_at_field = sources[int(source_index)]
+            freshness[int(source_index)] = _build_freshness(
+                source,
+                loaded_at_field,
+                _parse_batched_timestamp(max_loaded_at),
+                _parse_batched_timestamp(snapshotted_at),
+            )
+        if not all(freshness):
+            raise MacroResultError(FRESHNESS_BATCH_MACRO_NAME, table)
         return adapter_response, freshness
 
     def pre_model_hook(self, config: Mapping[str, Any]) -> Any:
@@ -521,3 +521,81 @@ class RelationsCache:
             drop_key = _make_ref_key(relation)
             if drop_key in self.relations:
                 self.drop(drop_key)
+
+
+class GrantsCache:
+    """A cache of the grants on relations, filled one schema at a time so that
+    applying grants does not need a "show grants" query per relation.
+
+    Within a cached schema, a relation without an entry has no grants. A
+    relation that was created, dropped, renamed or had grants applied since
+    the schema was cached is invalidated, and lookups for it miss until its
+    schema is cached again.
+
+    :attr threading.RLock lock: The lock around the cache, held during updates.
+    :attr Set[Tuple[Optional[str], Optional[str]]] schemas: The cached schemas,
+        all lowercased.
+    :attr Dict[_ReferenceKey, Dict[str, List[str]]] grants: The standardized
+        grants of each relation in a cached schema.
+    :attr Set[_ReferenceKey] invalidated: The relations whose grants may have
+        changed since their schema was cached.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
+        self.grants: Dict[_ReferenceKey, Dict[str, List[str]]] = {}
+        self.invalidated: Set[_ReferenceKey] = set()
+
+    def add_schema(
+        self,
+        database: Optional[str],
+        schema: Optional[str],
+        grants: Dict[str, Dict[str, List[str]]],
+    ) -> None:
+        """Cache the grants of every relation in a schema.
+
+        :param database: The database name of the schema.
+        :param schema: The schema name.
+        :param grants: The standardized grants dict of each relation in the
+            schema that has any grants, keyed by identifier.
+        """
+        database, schema = lowercase(database), lowercase(schema)
+        with self.lock:
+            for key in [k for k in self.grants if (k.database, k.schema) == (database, schema)]:
+                del self.grants[key]
+            self.invalidated = {
+                k for k in self.invalidated if (k.database, k.schema) != (database, schema)
+            }
+            for identifier, relation_grants in grants.items():
+                key = _ReferenceKey(database, schema, lowercase(identifier))
+                self.grants[key] = relation_grants
+            self.schemas.add((database, schema))
+
+    def get(self, relation: Any) -> Optional[Dict[str, List[str]]]:
+        """Get the grants on a relation, or None if they are not cached.
+
+        :param relation: The relation to look up.
+        """
+        key = _make_ref_key(relation)
+        with self.lock:
+            if (key.database, key.schema) not in self.schemas or key in self.invalidated:
+                return None
+            return deepcopy(self.grants.get(key, {}))
+
+    def invalidate(self, relation: Any) -> None:
+        """Forget the grants on a relation, so that they are looked up again.
+
+        :param relation: The relation whose grants may have changed.
+        """
+        key = _make_ref_key(relation)
+        with self.lock:
+            self.grants.pop(key, None)
+            self.invalidated.add(key)
+
+    def clear(self):
+        """Clear the cache"""
+        with self.lock:
+            self.schemas.clear()
+            self.grants.clear()
+            self.invalidated.clear()
@@ -1,6 +1,6 @@
 import abc
 import time
-from typing import List, Optional, Tuple, Any, Iterable, Dict, Union
+from typing import List, Optional, Tuple, Any, Iterable, Iterator, Dict, Union
 
 import agate
 
@@ -24,6 +24,9 @@ class SQLConnectionManager(BaseConnectionManager):
         - open
     """
 
+    # the number of rows requested per `fetchmany` call when reading results
+    FETCH_BATCH_SIZE: int = 10000
+
     @abc.abstractmethod
     def cancel(self, connection: Connection):
         """Cancel the given connection."""
@@ -98,36 +101,54 @@ class SQLConnectionManager(BaseConnectionManager):
             "`get_response` is not implemented for this adapter!"
         )
 
+    @classmethod
+    def process_column_names(cls, column_names: List[str]) -> List[str]:
+        """Deduplicate column names in place by suffixing repeated names."""
+        unique_col_names: Dict[str, int] = dict()
+        for idx in range(len(column_names)):
+            col_name = column_names[idx]
+            if col_name in unique_col_names:
+                unique_col_names[col_name] += 1
+                column_names[idx] = f"{col_name}_{unique_col_names[col_name]}"
+            else:
+                unique_col_names[column_names[idx]] = 1
+        return column_names
+
     @classmethod
     def process_results(
         cls, column_names: Iterable[str], rows: Iterable[Any]
     ) -> List[Dict[str, Any]]:
         # TODO CT-211
-        unique_col_names = dict()  # type: ignore[var-annotated]
-        # TODO CT-211
-        for idx in range(len(column_names)):  # type: ignore[arg-type]
-            # TODO CT-211
-            col_name = column_names[idx]  # type: ignore[index]
-            if col_name in unique_col_names:
-                unique_col_names[col_name] += 1
-                # TODO CT-211
-                column_names[idx] = f"{col_name}_{unique_col_names[col_name]}"  # type: ignore[index] # noqa
-            else:
-                # TODO CT-211
-                unique_col_names[column_names[idx]] = 1  # type: ignore[index]
+        column_names = cls.process_column_names(column_names)  # type: ignore[arg-type]
         return [dict(zip(column_names, row)) for row in rows]
 
     @classmethod
-    def get_result_from_cursor(cls, cursor: Any) -> agate.Table:
-        data: List[Any] = []
-        column_names: List[str] = []
+    def get_column_names_from_cursor(cls, cursor: Any) -> List[str]:
+        if cursor.description is None:
+            return []
+        return cls.process_column_names([col[0] for col in cursor.description])
 
-        if cursor.description is not None:
-            column_names = [col[0] for col in cursor.description]
-            rows = cursor.fetchall()
-            data = cls.process_results(column_names, rows)
+    @classmethod
+    def iter_batches_from_cursor(
+        cls, cursor: Any, batch_size: Optional[int] = None
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        """Fetch the cursor's results in batches of at most `batch_size` rows."""
+        if cursor.description is None:
+            return
+        if batch_size is None:
+            batch_size = cls.FETCH_BATCH_SIZE
+        while True:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                return
+            yield batch
 
-        return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
+    @classmethod
+    def get_result_from_cursor(cls, cursor: Any) -> agate.Table:
+        table = dbt.clients.agate_helper.ColumnarTable(cls.get_column_names_from_cursor(cursor))
+        for batch in cls.iter_batches_from_cursor(cursor):
+            table.extend(batch)
+        return table
 
     @classmethod
     def data_type_code_to_name(cls, type_code: Union[int, str]) -> str:
@@ -149,6 +170,22 @@ class SQLConnectionManager(BaseConnectionManager):
             table = dbt.clients.agate_helper.empty_table()
         return response, table
 
+    def execute_stream(
+        self, sql: str, auto_begin: bool = False, batch_size: Optional[int] = None
+    ) -> Tuple[AdapterResponse, List[str], Iterator[Tuple[Any, ...]]]:
+        """Execute the given SQL and return its column names and a lazy
+        iterator over the result rows, which are fetched from the cursor in
+        batches of `batch_size` (FETCH_BATCH_SIZE by default).
+        """
+        sql = self._add_query_comment(sql)
+        _, cursor = self.add_query(sql, auto_begin)
+        response = self.get_response(cursor)
+        column_names = self.get_column_names_from_cursor(cursor)
+        rows = (
+            row for batch in self.iter_batches_from_cursor(cursor, batch_size) for row in batch
+        )
+        return response, column_names, rows
+
     def add_begin_query(self):
         return self.add_query("BEGIN", auto_begin=False)
 
@@ -1,7 +1,7 @@
 import agate
-from typing import Any, Optional, Tuple, Type, List
+from typing import Any, Iterator, Optional, Tuple, Type, List
 
-from dbt.contracts.connection import Connection
+from dbt.contracts.connection import AdapterResponse, Connection
 from dbt.exceptions import RelationTypeNullError
 from dbt.adapters.base import BaseAdapter, available
 from dbt.adapters.cache import _make_ref_key_msg
@@ -64,6 +64,23 @@ class SQLAdapter(BaseAdapter):
         """
         return self.connections.add_query(sql, auto_begin, bindings, abridge_sql_log)
 
+    @available.parse(lambda *a, **k: ("", [], iter([])))
+    def execute_stream(
+        self, sql: str, auto_begin: bool = False, batch_size: Optional[int] = None
+    ) -> Tuple[AdapterResponse, List[str], Iterator[Tuple[Any, ...]]]:
+        """Execute the given SQL and stream its results. A thin wrapper around
+        ConnectionManager.execute_stream.
+
+        :param sql: The sql to execute.
+        :param auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param batch_size: The number of rows to fetch from the cursor at a
+            time.
+        :return: A tuple of the query status, the column names and an
+            iterator over the result rows.
+        """
+        return self.connections.execute_stream(sql, auto_begin, batch_size)
+
     @classmethod
     def convert_text_type(cls, agate_table: agate.Table, col_idx: int) -> str:
         return "text"
@@ -1,26 +1,15 @@
 from copy import copy
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, TYPE_CHECKING
 
 import click
 from dbt.cli import requires, params as p
-from dbt.config.project import Project
-from dbt.config.profile import Profile
-from dbt.contracts.graph.manifest import Manifest
-from dbt.task.clean import CleanTask
-from dbt.task.compile import CompileTask
-from dbt.task.deps import DepsTask
-from dbt.task.debug import DebugTask
-from dbt.task.run import RunTask
-from dbt.task.serve import ServeTask
-from dbt.task.test import TestTask
-from dbt.task.snapshot import SnapshotTask
-from dbt.task.seed import SeedTask
-from dbt.task.list import ListTask
-from dbt.task.freshness import FreshnessTask
-from dbt.task.run_operation import RunOperationTask
-from dbt.task.build import BuildTask
-from dbt.task.generate import GenerateTask
-from dbt.task.init import InitTask
+
+# Tasks, configs and contracts are imported by the commands that use them, so
+# that lightweight commands (and --help, --version) don't pay to import them.
+if TYPE_CHECKING:
+    from dbt.config.project import Project
+    from dbt.config.profile import Profile
+    from dbt.contracts.graph.manifest import Manifest
 
 
 class dbtUsageException(Exception):
@@ -34,7 +23,10 @@ class dbtInternalException(Exception):
 # Programmatic invocation
 class dbtRunner:
     def __init__(
-        self, project: Project = None, profile: Profile = None, manifest: Manifest = None
+        self,
+        project: Optional["Project"] = None,
+        profile: Optional["Profile"] = None,
+        manifest: Optional["Manifest"] = None,
     ):
         self.project = project
         self.profile = profile
@@ -67,10 +59,14 @@ class dbtRunner:
 )
 @click.pass_context
 @p.send_anonymous_usage_stats
+@p.artifact_compression
 @p.cache_selected_only
+@p.cache_selection
 @p.debug
 @p.enable_legacy_logger
 @p.fail_fast
+@p.log_async
+@p.log_async_back_pressure
 @p.log_cache_events
 @p.log_format
 @p.log_format_file
@@ -84,16 +80,20 @@ class dbtRunner:
 @p.printer_width
 @p.quiet
 @p.record_timing_info
+@p.shard_manifest
 @p.single_threaded
 @p.static_parser
 @p.use_colors
 @p.use_colors_file
 @p.use_experimental_parser
+@p.validate_manifest_edges
 @p.version
 @p.version_check
 @p.warn_error
 @p.warn_error_options
 @p.write_json
+@p.write_manifest_async
+@p.write_run_results_jsonl
 def cli(ctx, **kwargs):
     """An ELT tool for managing your SQL transformations and data models.
     For more documentation on these commands, visit: docs.getdbt.com
@@ -130,6 +130,8 @@ def cli(ctx, **kwargs):
 @requires.manifest
 def build(ctx, **kwargs):
     """Run all Seeds, Models, Snapshots, and tests in DAG order"""
+    from dbt.task.build import BuildTask
+
     task = BuildTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -154,6 +156,8 @@ def build(ctx, **kwargs):
 @requires.project
 def clean(ctx, **kwargs):
     """Delete all folders in the clean-targets list (usually the dbt_packages and target directories.)"""
+    from dbt.task.clean import CleanTask
+
     task = CleanTask(ctx.obj["flags"], ctx.obj["project"])
 
     results = task.run()
@@ -175,6 +179,7 @@ def docs(ctx, **kwargs):
 @p.defer
 @p.exclude
 @p.favor_state
+@p.incremental_catalog
 @p.profile
 @p.profiles_dir
 @p.project_dir
@@ -193,6 +198,8 @@ def docs(ctx, **kwargs):
 @requires.manifest(write=False)
 def docs_generate(ctx, **kwargs):
     """Generate the documentation website for your project"""
+    from dbt.task.generate import GenerateTask
+
     task = GenerateTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -221,6 +228,8 @@ def docs_generate(ctx, **kwargs):
 @requires.manifest
 def docs_serve(ctx, **kwargs):
     """Serve the documentation website for your project"""
+    from dbt.task.serve import ServeTask
+
     task = ServeTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -262,6 +271,8 @@ def docs_serve(ctx, **kwargs):
 def compile(ctx, **kwargs):
     """Generates executable SQL from source, model, test, and analysis files. Compiled SQL files are written to the
     target/ directory."""
+    from dbt.task.compile import CompileTask
+
     task = CompileTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -286,6 +297,8 @@ def compile(ctx, **kwargs):
 @requires.preflight
 def debug(ctx, **kwargs):
     """Show some helpful information about dbt for debugging. Not to be confused with the --debug option which increases verbosity."""
+    from dbt.task.debug import DebugTask
+
     task = DebugTask(
         ctx.obj["flags"],
         None,
@@ -309,6 +322,8 @@ def debug(ctx, **kwargs):
 @requires.project
 def deps(ctx, **kwargs):
     """Pull the most recent version of the dependencies listed in packages.yml"""
+    from dbt.task.deps import DepsTask
+
     task = DepsTask(ctx.obj["flags"], ctx.obj["project"])
     results = task.run()
     success = task.interpret_results(results)
@@ -329,6 +344,8 @@ def deps(ctx, **kwargs):
 @requires.preflight
 def init(ctx, **kwargs):
     """Initialize a new dbt project."""
+    from dbt.task.init import InitTask
+
     task = InitTask(ctx.obj["flags"], None)
 
     results = task.run()
@@ -360,6 +377,8 @@ def init(ctx, **kwargs):
 @requires.manifest
 def list(ctx, **kwargs):
     """List the resources in your project"""
+    from dbt.task.list import ListTask
+
     task = ListTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -427,6 +446,8 @@ def parse(ctx, **kwargs):
 @requires.manifest
 def run(ctx, **kwargs):
     """Compile SQL and execute against the current target database."""
+    from dbt.task.run import RunTask
+
     task = RunTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -455,6 +476,8 @@ def run(ctx, **kwargs):
 @requires.manifest
 def run_operation(ctx, **kwargs):
     """Run the named macro with any supplied arguments."""
+    from dbt.task.run_operation import RunOperationTask
+
     task = RunOperationTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -490,6 +513,8 @@ def run_operation(ctx, **kwargs):
 @requires.manifest
 def seed(ctx, **kwargs):
     """Load data from csv files into your data warehouse."""
+    from dbt.task.seed import SeedTask
+
     task = SeedTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -522,6 +547,8 @@ def seed(ctx, **kwargs):
 @requires.manifest
 def snapshot(ctx, **kwargs):
     """Execute snapshots defined in your project"""
+    from dbt.task.snapshot import SnapshotTask
+
     task = SnapshotTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -561,6 +588,8 @@ def source(ctx, **kwargs):
 @requires.manifest
 def freshness(ctx, **kwargs):
     """check the current freshness of the project's sources"""
+    from dbt.task.freshness import FreshnessTask
+
     task = FreshnessTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
@@ -605,6 +634,8 @@ cli.commands["source"].add_command(snapshot_freshness, "snapshot-freshness")  #
 @requires.manifest
 def test(ctx, **kwargs):
     """Runs tests on data in deployed models. Run this after `dbt run`"""
+    from dbt.task.test import TestTask
+
     task = TestTask(
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
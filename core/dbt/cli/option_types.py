@@ -1,9 +1,7 @@
 from click import ParamType, Choice
 
-from dbt.config.utils import parse_cli_vars
-from dbt.exceptions import ValidationError
-
-from dbt.helper_types import WarnErrorOptions
+# dbt modules are imported when values are converted, to keep importing the
+# cli cheap
 
 
 class YAML(ParamType):
@@ -15,6 +13,9 @@ class YAML(ParamType):
         # assume non-string values are a problem
         if not isinstance(value, str):
             self.fail(f"Cannot load YAML from type {type(value)}", param, ctx)
+        from dbt.config.utils import parse_cli_vars
+        from dbt.exceptions import ValidationError
+
         try:
             return parse_cli_vars(value)
         except ValidationError:
@@ -29,6 +30,7 @@ class WarnErrorOptionsType(YAML):
     def convert(self, value, param, ctx):
         # this function is being used by param in click
         include_exclude = super().convert(value, param, ctx)
+        from dbt.helper_types import WarnErrorOptions
 
         return WarnErrorOptions(
             include=include_exclude.get("include", []), exclude=include_exclude.get("exclude", [])
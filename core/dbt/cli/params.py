@@ -4,7 +4,6 @@ import click
 from dbt.cli.options import MultiOption
 from dbt.cli.option_types import YAML, ChoiceTuple, WarnErrorOptionsType
 from dbt.cli.resolvers import default_project_dir, default_profiles_dir
-from dbt.version import get_version_information
 
 
 args = click.option(
@@ -27,6 +26,13 @@ cache_selected_only = click.option(
     help="Pre cache database objects relevant to selected resource only.",
 )
 
+cache_selection = click.option(
+    "--cache-selection/--no-cache-selection",
+    envvar="DBT_CACHE_SELECTION",
+    help="Cache the nodes selected by --select, --exclude and --selector in the target directory, and reuse them while the project, the selection and any --state artifacts are unchanged.",
+    default=False,
+)
+
 introspect = click.option(
     "--introspect/--no-introspect",
     envvar="DBT_INTROSPECT",
@@ -103,6 +109,13 @@ full_refresh = click.option(
     is_flag=True,
 )
 
+incremental_catalog = click.option(
+    "--incremental-catalog/--no-incremental-catalog",
+    envvar="DBT_INCREMENTAL_CATALOG",
+    help="Reuse entries of the existing catalog.json for relations that were not rebuilt since it was generated (according to executed_nodes.json in the target path, where every run, build, seed, snapshot, test and run-operation since the last catalog is recorded), and only query the catalog for the schemas that may have changed.",
+    default=False,
+)
+
 indirect_selection = click.option(
     "--indirect-selection",
     envvar="DBT_INDIRECT_SELECTION",
@@ -111,6 +124,21 @@ indirect_selection = click.option(
     default="eager",
 )
 
+log_async = click.option(
+    "--log-async/--no-log-async",
+    envvar="DBT_LOG_ASYNC",
+    help="Write log lines on a background thread, instead of on the threads that fire the events.",
+    default=False,
+)
+
+log_async_back_pressure = click.option(
+    "--log-async-back-pressure",
+    envvar="DBT_LOG_ASYNC_BACK_PRESSURE",
+    help="When the background log writer falls behind, either block the threads firing events or drop debug events.",
+    type=click.Choice(["block", "drop-debug"], case_sensitive=False),
+    default="block",
+)
+
 log_cache_events = click.option(
     "--log-cache-events/--no-log-cache-events",
     help="Enable verbose adapter cache logging.",
@@ -443,6 +471,8 @@ vars = click.option(
 def _version_callback(ctx, _param, value):
     if not value or ctx.resilient_parsing:
         return
+    from dbt.version import get_version_information
+
     click.echo(get_version_information())
     ctx.exit()
 
@@ -481,6 +511,21 @@ warn_error_options = click.option(
     type=WarnErrorOptionsType(),
 )
 
+artifact_compression = click.option(
+    "--artifact-compression",
+    envvar="DBT_ARTIFACT_COMPRESSION",
+    help="Compress the json artifacts written to the target directory. They are read back transparently for --state comparisons and docs serve. zstd requires the zstandard package.",
+    type=click.Choice(["none", "gzip", "zstd"], case_sensitive=False),
+    default="none",
+)
+
+shard_manifest = click.option(
+    "--shard-manifest/--no-shard-manifest",
+    envvar="DBT_SHARD_MANIFEST",
+    help="Write the manifest as a target/manifest directory with a file per resource type and an index.json, instead of a single manifest.json.",
+    default=False,
+)
+
 write_json = click.option(
     "--write-json/--no-write-json",
     envvar="DBT_WRITE_JSON",
@@ -488,6 +533,28 @@ write_json = click.option(
     default=True,
 )
 
+write_manifest_async = click.option(
+    "--write-manifest-async/--no-write-manifest-async",
+    envvar="DBT_WRITE_MANIFEST_ASYNC",
+    help="Write manifest.json on a background thread after parsing, while the command carries on.",
+    default=False,
+)
+
+write_run_results_jsonl = click.option(
+    "--write-run-results-jsonl/--no-write-run-results-jsonl",
+    envvar="DBT_WRITE_RUN_RESULTS_JSONL",
+    help="Also write run_results.jsonl, with one line per result written as each node finishes",
+    default=False,
+)
+
+validate_manifest_edges = click.option(
+    "--validate-manifest-edges/--no-validate-manifest-edges",
+    envvar="DBT_VALIDATE_MANIFEST_EDGES",
+    help="Check the parent and child maps that the manifest keeps up to date against a full rebuild before they're used, and fail if they differ.",
+    default=False,
+    hidden=True,
+)
+
 write_manifest = click.option(
     "--write-manifest/--no-write-manifest",
     envvar=None,
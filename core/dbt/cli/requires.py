@@ -1,23 +1,24 @@
-from dbt.version import installed as installed_version
-from dbt.adapters.factory import adapter_management, register_adapter
-from dbt.flags import set_flags, get_flag_dict
-from dbt.cli.flags import Flags
-from dbt.config import RuntimeConfig
-from dbt.config.runtime import load_project, load_profile, UnsetProfile
-from dbt.events.functions import setup_event_logger, fire_event, LOG_VERSION
-from dbt.events.types import MainReportVersion, MainReportArgs, MainTrackingUserState
-from dbt.exceptions import DbtProjectError
-from dbt.parser.manifest import ManifestLoader, write_manifest
-from dbt.profiler import profiler
-from dbt.tracking import active_user, initialize_from_flags, track_run
-from dbt.utils import cast_dict_to_dict_of_strings
-
 from click import Context
 from functools import update_wrapper
 
+# The dependencies of each decorator are imported when the decorated command
+# runs, rather than here: importing this module must stay cheap so that
+# `dbt --help`, `dbt --version` and commands that don't need an adapter or a
+# manifest don't load them.
+
 
 def preflight(func):
     def wrapper(*args, **kwargs):
+        from dbt.adapters.factory import adapter_management
+        from dbt.cli.flags import Flags
+        from dbt.events.functions import setup_event_logger, fire_event, LOG_VERSION
+        from dbt.events.types import MainReportVersion, MainReportArgs, MainTrackingUserState
+        from dbt.flags import set_flags, get_flag_dict
+        from dbt.profiler import profiler
+        from dbt.tracking import active_user, initialize_from_flags, track_run
+        from dbt.utils import cast_dict_to_dict_of_strings
+        from dbt.version import installed as installed_version
+
         ctx = args[0]
         assert isinstance(ctx, Context)
         ctx.obj = ctx.obj or {}
@@ -66,6 +67,8 @@ def unset_profile(func):
         assert isinstance(ctx, Context)
 
         if ctx.obj.get("profile") is None:
+            from dbt.config.runtime import UnsetProfile
+
             profile = UnsetProfile()
             ctx.obj["profile"] = profile
 
@@ -80,6 +83,8 @@ def profile(func):
         assert isinstance(ctx, Context)
 
         if ctx.obj.get("profile") is None:
+            from dbt.config.runtime import load_profile
+
             flags = ctx.obj["flags"]
             # TODO: Generalize safe access to flags.THREADS:
             # https://github.com/dbt-labs/dbt-core/issues/6259
@@ -96,6 +101,9 @@ def profile(func):
 
 def project(func):
     def wrapper(*args, **kwargs):
+        from dbt.config.runtime import load_project
+        from dbt.exceptions import DbtProjectError
+
         ctx = args[0]
         assert isinstance(ctx, Context)
 
@@ -122,6 +130,9 @@ def runtime_config(func):
     """
 
     def wrapper(*args, **kwargs):
+        from dbt.config import RuntimeConfig
+        from dbt.exceptions import DbtProjectError
+
         ctx = args[0]
         assert isinstance(ctx, Context)
 
@@ -150,6 +161,14 @@ def manifest(*args0, write=True, write_perf_info=False):
 
     def outer_wrapper(func):
         def wrapper(*args, **kwargs):
+            from dbt.adapters.factory import register_adapter
+            from dbt.exceptions import DbtProjectError
+            from dbt.parser.manifest import (
+                ManifestLoader,
+                wait_for_manifest_write,
+                write_manifest,
+            )
+
             ctx = args[0]
             assert isinstance(ctx, Context)
 
@@ -170,9 +189,17 @@ def manifest(*args0, write=True, write_perf_info=False):
 
                 ctx.obj["manifest"] = manifest
                 if write and ctx.obj["flags"].write_json:
-                    write_manifest(manifest, ctx.obj["runtime_config"].target_path)
-
-            return func(*args, **kwargs)
+                    write_manifest(
+                        manifest,
+                        ctx.obj["runtime_config"].target_path,
+                        background=getattr(ctx.obj["flags"], "WRITE_MANIFEST_ASYNC", False),
+                    )
+
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # a background manifest write must be done before the command exits
+                wait_for_manifest_write()
 
         return update_wrapper(wrapper, func)
 
@@ -1,6 +1,4 @@
 from pathlib import Path
-from dbt.config.project import PartialProject
-from dbt.exceptions import DbtProjectError
 
 
 def default_project_dir() -> Path:
@@ -20,6 +18,9 @@ def default_log_path(project_dir: Path, verify_version: bool = False) -> Path:
     2. Programmatic invocations of the cli via dbtRunner may pass a Project object directly,
        which is not being taken into consideration here to extract a log-path.
     """
+    from dbt.config.project import PartialProject
+    from dbt.exceptions import DbtProjectError
+
     default_log_path = Path("logs")
     try:
         partial = PartialProject.from_project_root(str(project_dir), verify_version=verify_version)
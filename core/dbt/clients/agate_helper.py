@@ -1,11 +1,13 @@
 from codecs import BOM_UTF8
 
 import agate
+import csv
 import datetime
+import itertools
 import isodate
 import json
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from typing import Iterable, Iterator, List, Dict, Union, Optional, Any, Sequence, Tuple
 
 from dbt.exceptions import DbtRuntimeError
 
@@ -123,6 +125,136 @@ def table_from_data_flat(data, column_names: Iterable[str]) -> agate.Table:
     )
 
 
+def _flatten_column(values: List[Any]) -> Tuple[List[Any], bool]:
+    """Apply the `table_from_data_flat` value rules to a single column.
+
+    Returns the (possibly converted) values and whether the column must be
+    treated as text only.
+    """
+    text_only = False
+    converted: Optional[List[Any]] = None
+    for idx, value in enumerate(values):
+        if isinstance(value, (dict, list, tuple)):
+            if converted is None:
+                converted = list(values)
+            # Represent container types as json strings
+            converted[idx] = json.dumps(value, cls=dbt.utils.JSONEncoder)
+            text_only = True
+        elif isinstance(value, str):
+            text_only = True
+    return (values if converted is None else converted), text_only
+
+
+def _cast_column(name: str, values: List[Any]) -> Tuple[agate.data_types.DataType, List[Any]]:
+    """Infer the agate type of a single column and cast its values, as
+    `table_from_data_flat` would for that column.
+    """
+    values, text_only = _flatten_column(values)
+    type_tester = build_type_tester([name] if text_only else [], string_null_values=())
+    (column_type,) = type_tester.run([(value,) for value in values], [name])
+    return column_type, [column_type.cast(value) for value in values]
+
+
+class ColumnarTable(agate.Table):
+    """A column-oriented query result that defers building the agate table.
+
+    Values are stored as one list per column, exactly as they were returned
+    by the cursor. They are type-cast one column at a time, following the
+    same rules as `table_from_data_flat`, the first time any of them is
+    read. The agate representation is only built when something requires
+    agate semantics: rows, aggregations, printing, etc. At that point the
+    table is converted in place and behaves exactly like a regular agate
+    table. Either way, the values read from the table are the same.
+    """
+
+    def __init__(
+        self, column_names: Iterable[str], columns: Optional[List[List[Any]]] = None
+    ) -> None:
+        # agate.Table.__init__ is deliberately not called, see _materialize
+        self._column_names = tuple(column_names)
+        if columns is None:
+            columns = [[] for _ in self._column_names]
+        elif len(columns) != len(self._column_names):
+            raise DbtRuntimeError(
+                f"Got {len(columns)} columns of data for {len(self._column_names)} column names"
+            )
+        self._columnar_data: Optional[List[List[Any]]] = columns
+        self._cast_columns: Optional[List[Tuple[agate.data_types.DataType, List[Any]]]] = None
+        self._num_rows = len(columns[0]) if columns else 0
+
+    @classmethod
+    def from_rows(
+        cls, column_names: Iterable[str], rows: Iterable[Sequence[Any]]
+    ) -> "ColumnarTable":
+        table = cls(column_names)
+        table.extend(rows)
+        return table
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._columnar_data is None
+
+    def extend(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Append a batch of row tuples (e.g. the result of fetchmany)."""
+        if self._columnar_data is None or self._cast_columns is not None:
+            raise DbtRuntimeError("Cannot extend a table whose values were already read")
+        batch = rows if isinstance(rows, list) else list(rows)
+        if not batch:
+            return
+        for column, values in zip(self._columnar_data, zip(*batch)):
+            column.extend(values)
+        self._num_rows += len(batch)
+
+    def _get_cast_columns(self) -> List[Tuple[agate.data_types.DataType, List[Any]]]:
+        if self._cast_columns is None:
+            if self._columnar_data is None:
+                raise DbtRuntimeError("Cannot cast the columns of a materialized table")
+            self._cast_columns = [
+                _cast_column(name, values)
+                for name, values in zip(self._column_names, self._columnar_data)
+            ]
+        return self._cast_columns
+
+    def column_values(self, name: str) -> List[Any]:
+        """Return the values of a single column without building the agate
+        table.
+        """
+        if self._columnar_data is None:
+            return list(self.columns[name].values())
+        return self._get_cast_columns()[self._column_names.index(name)][1]
+
+    def iter_rows(self) -> Iterator[Tuple[Any, ...]]:
+        if self._columnar_data is None:
+            return (tuple(row.values()) for row in self.rows)
+        return zip(*(values for _, values in self._get_cast_columns()))
+
+    def _materialize(self) -> None:
+        if self._columnar_data is None:
+            return
+        cast_columns = self._get_cast_columns()
+        table = agate.Table(
+            rows=list(zip(*(values for _, values in cast_columns))),
+            column_names=list(self._column_names),
+            column_types=[column_type for column_type, _ in cast_columns],
+        )
+        self.__dict__.update(table.__dict__)
+        self._columnar_data = None
+        self._cast_columns = None
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes that are not set yet: the agate
+        # internals of a table that has not been materialized.
+        if name.startswith("__") or self.__dict__.get("_columnar_data") is None:
+            raise AttributeError(name)
+        self._materialize()
+        return getattr(self, name)
+
+    def __len__(self) -> int:
+        if self._columnar_data is not None:
+            return self._num_rows
+        return super().__len__()
+
+
 def empty_table():
     "Returns an empty Agate table. To be used in place of None"
 
@@ -130,7 +262,13 @@ def empty_table():
 
 
 def as_matrix(table):
-    "Return an agate table as a matrix of data sans columns"
+    """Return an agate table as a matrix of data sans columns.
+
+    A ColumnarTable that has not been materialized is read column by column
+    instead of through agate rows. The values are the same either way.
+    """
+    if isinstance(table, ColumnarTable) and not table.is_materialized:
+        return list(table.iter_rows())
 
     return [r.values() for r in table.rows.values()]
 
@@ -143,6 +281,35 @@ def from_csv(abspath, text_columns):
         return agate.Table.from_csv(fp, column_types=type_tester)
 
 
+def sample_from_csv(abspath, text_columns, sample_size: int) -> Tuple[agate.Table, bool]:
+    """Build an agate table from at most the first `sample_size` rows of a
+    csv file, without reading the rest of it.
+
+    Returns the table and whether it contains every row of the file.
+    """
+    type_tester = build_type_tester(text_columns=text_columns)
+    with open(abspath, encoding="utf-8") as fp:
+        if fp.read(1) != BOM:
+            fp.seek(0)
+        reader = csv.reader(fp)
+        column_names: List[str] = next(reader, [])
+        rows = list(itertools.islice(reader, sample_size + 1))
+    complete = len(rows) <= sample_size
+    table = agate.Table(rows[:sample_size], column_names, column_types=type_tester)
+    return table, complete
+
+
+def iter_csv_rows(abspath) -> Iterator[List[str]]:
+    "Stream the data rows (without the header) of a csv file"
+
+    with open(abspath, encoding="utf-8") as fp:
+        if fp.read(1) != BOM:
+            fp.seek(0)
+        reader = csv.reader(fp)
+        next(reader, None)
+        yield from reader
+
+
 class _NullMarker:
     pass
 
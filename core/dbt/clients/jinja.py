@@ -566,6 +566,11 @@ def _requote_result(raw_value: str, rendered: str) -> str:
 _HAS_RENDER_CHARS_PAT = re.compile(r"({[{%#]|[#}%]})")
 
 
+def is_literal(string: Any) -> bool:
+    """Whether the string has no jinja in it, so it renders to itself."""
+    return isinstance(string, str) and _HAS_RENDER_CHARS_PAT.search(string) is None
+
+
 def get_rendered(
     string: str,
     ctx: Dict[str, Any],
@@ -579,7 +584,7 @@ def get_rendered(
     # If this is desirable in the native env as well, we could handle the
     # native=True case by passing the input string to ast.literal_eval, like
     # the native renderer does.
-    if not native and isinstance(string, str) and _HAS_RENDER_CHARS_PAT.search(string) is None:
+    if not native and is_literal(string):
         return string
     template = get_template(
         string,
@@ -1,6 +1,8 @@
 import errno
 import fnmatch
 import functools
+import gzip
+import io
 import json
 import os
 import os.path
@@ -11,7 +13,7 @@ import subprocess
 import sys
 import tarfile
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, Type, Union
+from typing import IO, Any, Callable, Dict, Iterable, List, NoReturn, Optional, Tuple, Type, Union
 
 import dbt.exceptions
 import requests
@@ -162,12 +164,79 @@ def supports_symlinks() -> bool:
     return getattr(os, "symlink", None) is not None
 
 
+# the file name suffix for each supported compression
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def compressed_path(path: str, compression: Optional[str]) -> str:
+    if compression is None:
+        return path
+    return path + COMPRESSION_SUFFIXES[compression]
+
+
+def find_compressed_file(path: str) -> Tuple[str, Optional[str]]:
+    """Find the file at path, or a compressed copy of it. Return the path of
+    the file that was found and its compression. If there is no such file,
+    return the path unchanged.
+    """
+    if os.path.exists(convert_path(path)):
+        for compression, suffix in COMPRESSION_SUFFIXES.items():
+            if path.endswith(suffix):
+                return path, compression
+        return path, None
+    for compression in COMPRESSION_SUFFIXES:
+        candidate = compressed_path(path, compression)
+        if os.path.exists(convert_path(candidate)):
+            return candidate, compression
+    return path, None
+
+
+def _open_text(path: str, mode: str, compression: Optional[str]) -> IO[str]:
+    if compression == "gzip":
+        # the default level of 9 is much slower for very little gain on json
+        return gzip.open(path, mode + "t", compresslevel=6, encoding="utf-8")  # type: ignore
+    elif compression == "zstd":
+        try:
+            import zstandard  # type: ignore
+        except ImportError:
+            raise dbt.exceptions.DbtRuntimeError(
+                "zstd compression requires the zstandard package: pip install zstandard"
+            )
+        return io.TextIOWrapper(zstandard.open(path, mode + "b"), encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
 def write_file(path: str, contents: str = "") -> bool:
+    return _write_chunks(path, [str(contents)], None)
+
+
+def write_file_chunks(path: str, chunks: Iterable[str], compression: Optional[str] = None) -> bool:
+    """Write the chunks to the file one after the other, so that the full
+    contents never have to be held in memory at once.
+
+    With a compression, the file is compressed and the compression's suffix
+    is added to its name. Copies of the file in any other format are removed,
+    so that they can't be read instead of it.
+    """
+    target = compressed_path(path, compression)
+    remove_compressed_files(path, keep=target)
+    return _write_chunks(target, chunks, compression)
+
+
+def remove_compressed_files(path: str, keep: Optional[str] = None) -> None:
+    """Remove the file at path and any compressed copies of it, except keep."""
+    for candidate in [path] + [compressed_path(path, c) for c in COMPRESSION_SUFFIXES]:
+        if candidate != keep and os.path.exists(convert_path(candidate)):
+            os.remove(convert_path(candidate))
+
+
+def _write_chunks(path: str, chunks: Iterable[str], compression: Optional[str]) -> bool:
     path = convert_path(path)
     try:
         make_directory(os.path.dirname(path))
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(str(contents))
+        with _open_text(path, "w", compression) as f:
+            for chunk in chunks:
+                f.write(chunk)
     except Exception as exc:
         # note that you can't just catch FileNotFound, because sometimes
         # windows apparently raises something else.
@@ -193,11 +262,16 @@ def write_file(path: str, contents: str = "") -> bool:
 
 
 def read_json(path: str) -> Dict[str, Any]:
-    return json.loads(load_file_contents(path))
+    """Read the json file at path, or a compressed copy of it."""
+    path, compression = find_compressed_file(path)
+    if compression is None:
+        return json.loads(load_file_contents(path))
+    with _open_text(convert_path(path), "r", compression) as f:
+        return json.load(f)
 
 
-def write_json(path: str, data: Dict[str, Any]) -> bool:
-    return write_file(path, json.dumps(data, cls=dbt.utils.JSONEncoder))
+def write_json(path: str, data: Dict[str, Any], compression: Optional[str] = None) -> bool:
+    return write_file_chunks(path, [json.dumps(data, cls=dbt.utils.JSONEncoder)], compression)
 
 
 def _windows_rmdir_readonly(func: Callable[[str], Any], path: str, exc: Tuple[Any, OSError, Any]):
@@ -421,7 +421,7 @@ class Compiler:
             raise RuntimeError("Found a cycle: {}".format(cycle))
 
         if add_test_edges:
-            manifest.build_parent_and_child_maps()
+            manifest.check_parent_and_child_maps()
             self.add_test_edges(linker, manifest)
 
     def add_test_edges(self, linker: Linker, manifest: Manifest) -> None:
@@ -1,7 +1,7 @@
 import itertools
 import os
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import (
     Any,
@@ -91,6 +91,8 @@ class RuntimeConfig(Project, Profile, AdapterRequiredConfig):
     profile_name: str
     cli_vars: Dict[str, Any]
     dependencies: Optional[Mapping[str, "RuntimeConfig"]] = None
+    # the merged project configs of each fqn prefix, see ProjectConfigTrie
+    project_config_tries: Dict[Any, Any] = field(default_factory=dict, repr=False, compare=False)
 
     def __post_init__(self):
         self.validate()
@@ -370,6 +372,7 @@ class RuntimeConfig(Project, Profile, AdapterRequiredConfig):
 
     def clear_dependencies(self):
         self.dependencies = None
+        self.project_config_tries = {}
 
     # Called by 'load_dependencies' in this class
     def load_projects(self, paths: Iterable[Path]) -> Iterator[Tuple[str, "RuntimeConfig"]]:
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import List, Iterator, Dict, Any, TypeVar, Generic
+from typing import List, Iterator, Dict, Any, TypeVar, Generic, Callable, Optional
 
 from dbt.config import RuntimeConfig, Project, IsFQNResource
 from dbt.contracts.graph.model_config import BaseConfig, get_config_for, _listify
@@ -77,6 +77,69 @@ class RenderedConfig(ConfigSource):
         return model_configs
 
 
+def _level_configs(level_config: Dict[str, Any]) -> Dict[str, Any]:
+    """The configs set at one level of a project's config tree: the keys that
+    start with "+", and the keys that aren't the name of a sublevel.
+    """
+    result = {}
+    for key, value in level_config.items():
+        if key.startswith("+"):
+            result[key[1:].strip()] = deepcopy(value)
+        elif not isinstance(value, dict):
+            result[key] = deepcopy(value)
+    return result
+
+
+class _ConfigTrieNode(Generic[T]):
+    def __init__(self, level_config: Dict[str, Any], result: T) -> None:
+        self.level_config = level_config
+        # the result of merging the configs of this level and all of the
+        # levels above it
+        self.result = result
+        self.children: Dict[str, "_ConfigTrieNode[T]"] = {}
+
+
+class ProjectConfigTrie(Generic[T]):
+    """The config tree of a project for one resource type, with the merged
+    result of the configs at each fqn prefix. Nodes that share a prefix, such
+    as all of the models in a directory, share the merging of the configs of
+    that prefix, and only the levels that no node has been under yet are
+    merged.
+    """
+
+    def __init__(
+        self,
+        config_dict: Dict[str, Any],
+        initial_result: T,
+        update: Callable[[T, Dict[str, Any]], T],
+    ) -> None:
+        self._update = update
+        self._root = self._make_node(config_dict, initial_result)
+
+    def _make_node(self, level_config: Dict[str, Any], parent_result: T) -> _ConfigTrieNode[T]:
+        # updating a result can modify it in place, and the parent's result is
+        # shared by all of its children
+        result = self._update(deepcopy(parent_result), _level_configs(level_config))
+        return _ConfigTrieNode(level_config, result)
+
+    def lookup(self, fqn: List[str]) -> T:
+        """The merged project configs for the fqn, the same as merging each of
+        the levels from fqn_search in order. The result is shared, so callers
+        must copy it before changing it.
+        """
+        node = self._root
+        for level in fqn:
+            child = node.children.get(level)
+            if child is None:
+                level_config = node.level_config.get(level, None)
+                if not isinstance(level_config, dict):
+                    break
+                child = self._make_node(level_config, node.result)
+                node.children[level] = child
+            node = child
+        return node.result
+
+
 class BaseContextConfigGenerator(Generic[T]):
     def __init__(self, active_project: RuntimeConfig):
         self._active_project = active_project
@@ -101,14 +164,27 @@ class BaseContextConfigGenerator(Generic[T]):
         src = self.get_config_source(project)
         model_configs = src.get_config_dict(resource_type)
         for level_config in fqn_search(model_configs, fqn):
-            result = {}
-            for key, value in level_config.items():
-                if key.startswith("+"):
-                    result[key[1:].strip()] = deepcopy(value)
-                elif not isinstance(value, dict):
-                    result[key] = deepcopy(value)
-
-            yield result
+            yield _level_configs(level_config)
+
+    def _project_config_trie(
+        self, project: Project, resource_type: NodeType, base: bool
+    ) -> ProjectConfigTrie[T]:
+        # the tries are kept on the active project, which lives as long as the
+        # project configs they were built from
+        tries: Optional[Dict[Any, Any]] = getattr(
+            self._active_project, "project_config_tries", None
+        )
+        key = (type(self), project.project_name, resource_type, base)
+        if tries is not None and key in tries:
+            return tries[key]
+        trie: ProjectConfigTrie[T] = ProjectConfigTrie(
+            self.get_config_source(project).get_config_dict(resource_type),
+            self.initial_result(resource_type=resource_type, base=base),
+            self._update_from_config,
+        )
+        if tries is not None:
+            tries[key] = trie
+        return trie
 
     def _active_project_configs(
         self, fqn: List[str], resource_type: NodeType
@@ -134,11 +210,10 @@ class BaseContextConfigGenerator(Generic[T]):
     ) -> BaseConfig:
         own_config = self.get_node_project(project_name)
 
-        result = self.initial_result(resource_type=resource_type, base=base)
-
-        project_configs = self._project_configs(own_config, fqn, resource_type)
-        for fqn_config in project_configs:
-            result = self._update_from_config(result, fqn_config)
+        # the defaults, updated with the configs of each level of the project
+        # config tree that the fqn is under
+        trie = self._project_config_trie(own_config, resource_type, base)
+        result = deepcopy(trie.lookup(fqn))
 
         # When schema files patch config, it has lower precedence than
         # config in the models (config_call_dict), so we add the patch_config_dict
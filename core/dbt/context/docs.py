@@ -1,9 +1,11 @@
-from typing import Any, Dict, Union
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from dbt.exceptions import (
     DocTargetNotFoundError,
     DocArgsError,
 )
+from dbt.clients.jinja import get_rendered, is_literal
 from dbt.config.runtime import RuntimeConfig
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import Macro, ResultNode
@@ -84,3 +86,71 @@ def generate_runtime_docs_context(
     ctx = DocsRuntimeContext(config, target, manifest, current_project)
     # This is not a Mashumaro to_dict call
     return ctx.to_dict()
+
+
+# a call to doc() with literal arguments, like {{ doc('orders') }}
+_DOC_CALL_PAT = re.compile(
+    r"""{{\s*doc\(\s*('[^'\\]*'|"[^"\\]*")\s*(?:,\s*('[^'\\]*'|"[^"\\]*")\s*)?\)\s*}}"""
+)
+
+
+class DocsRenderer:
+    """Renders the descriptions of resources. Most descriptions are plain
+    text, so the docs context, which is expensive to build, is only generated
+    for a resource when one of its descriptions has jinja in it.
+
+    A description whose only jinja is doc() calls renders the same for every
+    resource in a package, so it's rendered once per package. Each later use
+    still records the resource on the files of the docs it uses, for partial
+    parsing.
+    """
+
+    def __init__(self, config: RuntimeConfig, manifest: Manifest) -> None:
+        self.config = config
+        self.manifest = manifest
+        # (package name, description) -> (rendered description, doc file ids)
+        self._rendered_docs: Dict[Tuple[str, str], Tuple[str, List[str]]] = {}
+        self._target: Any = None
+        self._context: Optional[Dict[str, Any]] = None
+
+    def _get_context(self, target: Any) -> Dict[str, Any]:
+        if self._context is None or self._target is not target:
+            self._context = generate_runtime_docs_context(
+                self.config, target, self.manifest, self.config.project_name
+            )
+            self._target = target
+        return self._context
+
+    def _doc_file_ids(self, description: str, target: Any) -> Optional[List[str]]:
+        """The files of the docs used by a description whose only jinja is
+        doc() calls, or None if it has any other jinja.
+        """
+        doc_calls = list(_DOC_CALL_PAT.finditer(description))
+        if not doc_calls or not is_literal(_DOC_CALL_PAT.sub("", description)):
+            return None
+        file_ids = []
+        for doc_call in doc_calls:
+            args = [arg[1:-1] for arg in doc_call.groups() if arg is not None]
+            doc_package_name = args[0] if len(args) == 2 else None
+            target_doc = self.manifest.resolve_doc(
+                args[-1], doc_package_name, self.config.project_name, target.package_name
+            )
+            if target_doc is not None and target_doc.file_id in self.manifest.files:
+                file_ids.append(target_doc.file_id)
+        return file_ids
+
+    def render(self, description: str, target: Any) -> str:
+        if is_literal(description):
+            return description
+        key = (target.package_name, description)
+        if key in self._rendered_docs:
+            rendered, file_ids = self._rendered_docs[key]
+            for file_id in file_ids:
+                # TODO CT-211
+                self.manifest.files[file_id].add_node(target.unique_id)  # type: ignore[union-attr]
+            return rendered
+        rendered = get_rendered(description, self._get_context(target))
+        doc_file_ids = self._doc_file_ids(description, target)
+        if doc_file_ids is not None:
+            self._rendered_docs[key] = (rendered, doc_file_ids)
+        return rendered
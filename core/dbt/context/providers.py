@@ -785,17 +785,31 @@ class ProviderContext(ManifestContext):
             raise CompilationError(message_if_exception, self.model)
 
     @contextmember
-    def load_agate_table(self) -> agate.Table:
+    def load_agate_table(self, sample_size: Optional[int] = None) -> agate.Table:
+        """Load the seed file as an agate table.
+
+        If `sample_size` is set, only the first `sample_size` rows are read,
+        so that column types can be inferred without loading a large file
+        into memory. The total number of rows is then unknown until the seed
+        is loaded, and `original_row_count` is None.
+        """
         if not isinstance(self.model, SeedNode):
             raise LoadAgateTableNotSeedError(self.model.resource_type, node=self.model)
         assert self.model.root_path
         path = os.path.join(self.model.root_path, self.model.original_file_path)
         column_types = self.model.config.column_types
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types)
+            if sample_size is None:
+                table = agate_helper.from_csv(path, text_columns=column_types)
+                complete = True
+            else:
+                table, complete = agate_helper.sample_from_csv(
+                    path, text_columns=column_types, sample_size=sample_size
+                )
         except ValueError as e:
             raise LoadAgateTableValueError(e, node=self.model)
         table.original_abspath = os.path.abspath(path)
+        table.original_row_count = len(table) if complete else None
         return table
 
     @contextproperty
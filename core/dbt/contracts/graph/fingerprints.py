@@ -0,0 +1,200 @@
+"""Fingerprints of the parts of a resource that state:modified compares.
+
+Each fingerprint is a hash of exactly what one of the `same_*` methods of a
+resource compares, so that two resources with equal fingerprints are known to
+compare the same without deserializing the previous resource. Fingerprints that
+can't stand in for their comparison (such as for seeds too large to hash) are
+None, and the comparison has to be made on the resources themselves.
+"""
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+from dbt.contracts.files import FileHash
+from dbt.contracts.graph.nodes import Macro, ParsedNode, SeedNode, SourceDefinition
+from dbt.dataclass_schema import dbtClassMixin
+from dbt.utils import JSONEncoder
+
+# bumped whenever what a fingerprint covers changes, so that fingerprints from
+# older manifests are not compared with new ones
+FINGERPRINTS_VERSION = 1
+
+Fingerprint = Dict[str, Optional[str]]
+
+
+@dataclass
+class ManifestFingerprints(dbtClassMixin):
+    version: int
+    resources: Dict[str, Fingerprint]
+
+
+def _hash(value: Any) -> str:
+    return FileHash.from_contents(json.dumps(value, sort_keys=True, cls=JSONEncoder)).checksum
+
+
+class FingerprintBuilder:
+    """Computes the fingerprints of the resources of one manifest. The closure
+    of each macro's dependencies is computed once and shared by every resource
+    that depends on the macro.
+    """
+
+    def __init__(self, macros: Mapping[str, Macro]) -> None:
+        self.macros = macros
+        self._closures: Dict[str, FrozenSet[str]] = {}
+        self._macro_hashes: Dict[str, Optional[str]] = {}
+
+    def _macro_closure(self, unique_id: str) -> FrozenSet[str]:
+        if unique_id in self._closures:
+            return self._closures[unique_id]
+        closure: Set[str] = set()
+        stack = [unique_id]
+        while stack:
+            macro_id = stack.pop()
+            if macro_id in closure:
+                continue
+            if macro_id in self._closures:
+                closure.update(self._closures[macro_id])
+                continue
+            closure.add(macro_id)
+            macro = self.macros.get(macro_id)
+            if macro is not None:
+                stack.extend(macro.depends_on.macros)
+        # only closures that are complete are cached, which the closure of the
+        # macro this started from is, even if its dependencies have a cycle
+        self._closures[unique_id] = frozenset(closure)
+        return self._closures[unique_id]
+
+    def _macro_hash(self, unique_id: str) -> Optional[str]:
+        if unique_id not in self._macro_hashes:
+            macro = self.macros.get(unique_id)
+            self._macro_hashes[unique_id] = None if macro is None else _hash(macro.macro_sql)
+        return self._macro_hashes[unique_id]
+
+    def macros_fingerprint(self, macro_ids: Iterable[str]) -> str:
+        """A hash of the sql of every macro the given macros call, directly or
+        through other macros.
+        """
+        closure: Set[str] = set()
+        for macro_id in macro_ids:
+            closure.update(self._macro_closure(macro_id))
+        return _hash(sorted((macro_id, self._macro_hash(macro_id)) for macro_id in closure))
+
+    def fingerprint(self, resource: Any) -> Optional[Fingerprint]:
+        if isinstance(resource, ParsedNode):
+            return self._node_fingerprint(resource)
+        elif isinstance(resource, SourceDefinition):
+            return self._source_fingerprint(resource)
+        return None
+
+    def _node_fingerprint(self, node: ParsedNode) -> Fingerprint:
+        body: Optional[str]
+        if isinstance(node, SeedNode):
+            # same_seeds never matches a checksum named "none", and warns about
+            # seeds that were too large to hash
+            if node.checksum.name in ("none", "path"):
+                body = None
+            else:
+                body = _hash([node.checksum.name, node.checksum.checksum])
+        else:
+            body = _hash(node.raw_code)
+        return {
+            "body": body,
+            "config": _hash(node.unrendered_config),
+            "persisted_descriptions": _hash(
+                [node.description, {k: v.description for k, v in node.columns.items()}]
+            ),
+            "fqn": _hash(node.fqn),
+            "relation": _hash(
+                [node.unrendered_config.get(key) for key in ("database", "schema", "alias")]
+            ),
+            "macros": self.macros_fingerprint(
+                node.depends_on.macros if hasattr(node, "depends_on") else []  # type: ignore
+            ),
+        }
+
+    def _source_fingerprint(self, source: SourceDefinition) -> Fingerprint:
+        return {
+            "config": _hash(source.unrendered_config),
+            "fqn": _hash(source.fqn),
+            "relation": _hash([source.database, source.schema, source.identifier]),
+            "contents": _hash(
+                [
+                    source.quoting.to_dict(omit_none=False),
+                    source.freshness.to_dict(omit_none=False) if source.freshness else None,
+                    source.loaded_at_field,
+                    source.external.to_dict(omit_none=False) if source.external else None,
+                ]
+            ),
+        }
+
+
+class FingerprintCache:
+    """Keeps the fingerprints of a manifest's resources between writes of the
+    manifest, so that they're only computed again for resources that changed.
+    Resources are replaced rather than modified once a manifest is loaded, so a
+    fingerprint is reused as long as its resource is the same object and none
+    of the macros have been replaced.
+    """
+
+    def __init__(self) -> None:
+        self._macros: Dict[str, Macro] = {}
+        self._builder = FingerprintBuilder(self._macros)
+        self._resources: Dict[str, Tuple[Any, Optional[Fingerprint]]] = {}
+
+    def _check_macros(self, macros: Mapping[str, Macro]) -> None:
+        if len(macros) == len(self._macros) and all(
+            self._macros.get(unique_id) is macro for unique_id, macro in macros.items()
+        ):
+            return
+        self._macros = dict(macros)
+        self._builder = FingerprintBuilder(self._macros)
+        self._resources = {}
+
+    def build(
+        self, macros: Mapping[str, Macro], resources: Iterable[Mapping[str, Any]]
+    ) -> ManifestFingerprints:
+        self._check_macros(macros)
+        previous, self._resources = self._resources, {}
+        fingerprints: Dict[str, Fingerprint] = {}
+        for mapping in resources:
+            for unique_id, resource in mapping.items():
+                entry = previous.get(unique_id)
+                if entry is None or entry[0] is not resource:
+                    entry = (resource, self._builder.fingerprint(resource))
+                self._resources[unique_id] = entry
+                if entry[1] is not None:
+                    fingerprints[unique_id] = entry[1]
+        return ManifestFingerprints(version=FINGERPRINTS_VERSION, resources=fingerprints)
+
+
+def build_manifest_fingerprints(
+    macros: Mapping[str, Macro], resources: Iterable[Mapping[str, Any]]
+) -> ManifestFingerprints:
+    return FingerprintCache().build(macros, resources)
+
+
+# the fingerprint that proves each state selector doesn't match a resource. For
+# "modified", all of them have to be the same.
+STATE_SELECTOR_FINGERPRINTS: Dict[str, Optional[str]] = {
+    "modified": None,
+    "modified.body": "body",
+    "modified.configs": "config",
+    "modified.persisted_descriptions": "persisted_descriptions",
+    "modified.relation": "relation",
+    "modified.macros": "macros",
+}
+
+
+def is_unchanged(selector: str, old: Fingerprint, new: Fingerprint) -> bool:
+    """Whether the fingerprints prove that the state selector doesn't match the
+    resource. False means that the resources have to be compared.
+    """
+    keys: List[str]
+    key = STATE_SELECTOR_FINGERPRINTS[selector]
+    if key is None:
+        if old.keys() != new.keys():
+            return False
+        keys = list(new)
+    else:
+        keys = [key]
+    return all(new.get(k) is not None and new.get(k) == old.get(k) for k in keys)
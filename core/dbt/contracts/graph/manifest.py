@@ -1,8 +1,12 @@
+import copy as copy_module
 import enum
-from dataclasses import dataclass, field
+import os
+from bisect import insort
+from dataclasses import dataclass, field, fields
 from itertools import chain, islice
 from mashumaro.mixins.msgpack import DataClassMessagePackMixin
 from multiprocessing.synchronize import Lock
+from pathlib import Path
 from typing import (
     Dict,
     List,
@@ -18,6 +22,8 @@ from typing import (
     Generic,
     AbstractSet,
     ClassVar,
+    Iterator,
+    Iterable,
 )
 from typing_extensions import Protocol
 from uuid import UUID
@@ -36,15 +42,24 @@ from dbt.contracts.graph.nodes import (
     ResultNode,
     BaseNode,
 )
+from dbt.contracts.graph.fingerprints import FingerprintCache, ManifestFingerprints
+from dbt.clients.system import compressed_path, read_json, write_file_chunks, write_json
 from dbt.contracts.graph.unparsed import SourcePatch
 from dbt.contracts.files import SourceFile, SchemaSourceFile, FileHash, AnySourceFile
-from dbt.contracts.util import BaseArtifactMetadata, SourceKey, ArtifactMixin, schema_version
+from dbt.contracts.util import (
+    BaseArtifactMetadata,
+    SourceKey,
+    ArtifactMixin,
+    get_artifact_compression,
+    schema_version,
+)
 from dbt.dataclass_schema import dbtClassMixin
 from dbt.exceptions import (
     CompilationError,
     DuplicateResourceNameError,
     DuplicateMacroInPackageError,
     DuplicateMaterializationNameError,
+    DbtRuntimeError,
 )
 from dbt.helper_types import PathSet
 from dbt.events.functions import fire_event
@@ -60,6 +75,11 @@ DocName = str
 RefName = str
 UniqueID = str
 
+# where WritableManifest.write_shards puts its files in the target directory,
+# and the name of their index
+MANIFEST_SHARDS_DIR_NAME = "manifest"
+MANIFEST_SHARDS_INDEX_FILE_NAME = "index.json"
+
 
 def find_unique_id_for_package(storage, key, package: Optional[PackageName]):
     if key not in storage:
@@ -253,6 +273,181 @@ class AnalysisLookup(RefableLookup):
     _lookup_types: ClassVar[set] = set([NodeType.Analysis])
 
 
+class _TrieNode:
+    __slots__ = ("children", "unique_ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.unique_ids: Set[UniqueID] = set()
+
+
+class PrefixTrie:
+    """The unique ids of resources by each prefix of a sequence of parts, such
+    as an fqn or a path.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+
+    def add(self, parts: Iterable[str], unique_id: UniqueID):
+        node = self._root
+        node.unique_ids.add(unique_id)
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _TrieNode()
+            node = child
+            node.unique_ids.add(unique_id)
+
+    def find(self, prefix: Iterable[str]) -> AbstractSet[UniqueID]:
+        node = self._root
+        for part in prefix:
+            child = node.children.get(part)
+            if child is None:
+                return set()
+            node = child
+        return node.unique_ids
+
+
+def path_parts(path: str) -> Tuple[str, ...]:
+    # paths are compared the way that Path compares them on this platform
+    return tuple(os.path.normcase(part) for part in Path(path).parts)
+
+
+def flat_fqn(fqn: List[str]) -> List[str]:
+    # dots in model names act as namespace separators
+    return [item for segment in fqn for item in segment.split(".")]
+
+
+# Selecting resources by tag, path, package, etc.
+class SelectorLookup(dbtClassMixin):
+    """Inverted indexes of the resources that selectors can select. Selector
+    methods look up the resources that match in these instead of testing every
+    resource in the manifest.
+    """
+
+    def __init__(self, manifest: "Manifest"):
+        # nodes, sources, exposures and metrics
+        self.tags: Dict[str, Set[UniqueID]] = {}
+        self.packages: Dict[str, Set[UniqueID]] = {}
+        self.file_names: Dict[str, Set[UniqueID]] = {}
+        self.paths = PrefixTrie()
+        # nodes only
+        self.resource_types: Dict[NodeType, Set[UniqueID]] = {}
+        self.fqn_leaves: Dict[str, Set[UniqueID]] = {}
+        self.fqns = PrefixTrie()
+        self.unscoped_fqns = PrefixTrie()
+        # nodes and metrics
+        self.groups: Dict[str, Set[UniqueID]] = {}
+        # the values of the configs that have been selected on, built by the
+        # config selector method as they're needed
+        self.config_values: Dict[Tuple[str, ...], Any] = {}
+        self.populate(manifest)
+
+    def add_resource(self, resource: Union[ManifestNode, SourceDefinition, Exposure, Metric]):
+        unique_id = resource.unique_id
+        for tag in resource.tags:
+            self.tags.setdefault(tag, set()).add(unique_id)
+        self.packages.setdefault(resource.package_name, set()).add(unique_id)
+        self.file_names.setdefault(Path(resource.original_file_path).name, set()).add(unique_id)
+        self.paths.add(path_parts(resource.original_file_path), unique_id)
+
+    def add_node(self, node: ManifestNode):
+        self.add_resource(node)
+        self.resource_types.setdefault(node.resource_type, set()).add(node.unique_id)
+        self.fqn_leaves.setdefault(node.fqn[-1], set()).add(node.unique_id)
+        self.fqns.add(flat_fqn(node.fqn), node.unique_id)
+        self.unscoped_fqns.add(flat_fqn(node.fqn[1:]), node.unique_id)
+        self.add_group(node)
+
+    def add_group(self, node: Union[ManifestNode, Metric]):
+        group = node.config.get("group")
+        if group is not None:
+            self.groups.setdefault(group, set()).add(node.unique_id)
+
+    def populate(self, manifest: "Manifest"):
+        for node in manifest.nodes.values():
+            self.add_node(node)
+        for source in manifest.sources.values():
+            self.add_resource(source)
+        for exposure in manifest.exposures.values():
+            self.add_resource(exposure)
+        for metric in manifest.metrics.values():
+            self.add_resource(metric)
+            self.add_group(metric)
+
+
+class EdgeLookup(dbtClassMixin):
+    """The parent and child maps of the nodes, sources, exposures and metrics
+    in a manifest. The manifest keeps them up to date as its resources are
+    added, updated and removed and as their dependencies are resolved, so they
+    don't have to be rebuilt every time they're used.
+    """
+
+    def __init__(self, manifest: "Manifest"):
+        self.parent_map: NodeEdgeMap = {}
+        self.child_map: NodeEdgeMap = {}
+        # the children of unique ids that aren't in the manifest. They move
+        # to the child map if a resource with that unique id is added.
+        self.missing_parents: NodeEdgeMap = {}
+        self.populate(manifest)
+
+    def populate(self, manifest: "Manifest"):
+        edge_members: List[Any] = [
+            member
+            for member in chain(
+                manifest.nodes.values(),
+                manifest.sources.values(),
+                manifest.exposures.values(),
+                manifest.metrics.values(),
+            )
+        ]
+        self.child_map, self.parent_map = build_node_edges(edge_members)
+        for unique_id, parents in self.parent_map.items():
+            for parent in parents:
+                if parent not in self.child_map:
+                    self.missing_parents.setdefault(parent, []).append(unique_id)
+
+    def add_node(self, node: GraphMemberNode):
+        """Add the edges of a node, replacing any it had before."""
+        unique_id = node.unique_id
+        parents = sorted(node.depends_on_nodes)
+        if self.parent_map.get(unique_id) == parents:
+            return
+        self.remove_node(unique_id)
+        self.parent_map[unique_id] = parents
+        self.child_map[unique_id] = sorted(self.missing_parents.pop(unique_id, []))
+        for parent in parents:
+            if parent in self.child_map:
+                insort(self.child_map[parent], unique_id)
+            else:
+                self.missing_parents.setdefault(parent, []).append(unique_id)
+
+    def get_children(self, unique_id: UniqueID) -> List[UniqueID]:
+        """The unique ids of the resources that depend on a unique id, whether
+        or not it's still in the manifest.
+        """
+        if unique_id in self.child_map:
+            return list(self.child_map[unique_id])
+        return list(self.missing_parents.get(unique_id, []))
+
+    def remove_node(self, unique_id: UniqueID):
+        if unique_id not in self.parent_map:
+            return
+        for parent in self.parent_map.pop(unique_id):
+            if parent in self.child_map:
+                self.child_map[parent].remove(unique_id)
+            else:
+                children = self.missing_parents[parent]
+                children.remove(unique_id)
+                if not children:
+                    del self.missing_parents[parent]
+        # its children still depend on it
+        children = self.child_map.pop(unique_id)
+        if children:
+            self.missing_parents[unique_id] = children
+
+
 def _search_packages(
     current_project: str,
     node_package: str,
@@ -352,6 +547,10 @@ def _deepcopy(value):
     return value.from_dict(value.to_dict(omit_none=True))
 
 
+def _deepcopy_list(values):
+    return [_deepcopy(value) for value in values]
+
+
 class Locality(enum.IntEnum):
     Core = 1
     Imported = 2
@@ -636,6 +835,15 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         default_factory=MP_CONTEXT.Lock,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    _selector_lookup: Optional[SelectorLookup] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
+    _edge_lookup: Optional[EdgeLookup] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
+    _fingerprint_cache: Optional[FingerprintCache] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
 
     def __pre_serialize__(self):
         # serialization won't work with anything except an empty source_patches because
@@ -650,15 +858,62 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
 
     def update_exposure(self, new_exposure: Exposure):
         _update_into(self.exposures, new_exposure)
+        self._selector_lookup = None
+        self.update_edges(new_exposure)
 
     def update_metric(self, new_metric: Metric):
         _update_into(self.metrics, new_metric)
+        self._selector_lookup = None
+        self.update_edges(new_metric)
 
     def update_node(self, new_node: ManifestNode):
         _update_into(self.nodes, new_node)
+        self._selector_lookup = None
+        self.update_edges(new_node)
 
     def update_source(self, new_source: SourceDefinition):
         _update_into(self.sources, new_source)
+        self._selector_lookup = None
+        self.update_edges(new_source)
+
+    def update_edges(self, node: GraphMemberNode):
+        """Update the parent and child maps after the dependencies of a
+        resource in the manifest have changed.
+        """
+        if self._edge_lookup is not None:
+            self._edge_lookup.add_node(node)
+
+    def _remove_from(self, src: MutableMapping[str, Any], unique_id: str):
+        resource = src.pop(unique_id)
+        self._selector_lookup = None
+        if self._edge_lookup is not None:
+            self._edge_lookup.remove_node(unique_id)
+        return resource
+
+    def remove_node(self, unique_id: str) -> ManifestNode:
+        return self._remove_from(self.nodes, unique_id)
+
+    def remove_source(self, unique_id: str) -> SourceDefinition:
+        return self._remove_from(self.sources, unique_id)
+
+    def remove_exposure(self, unique_id: str) -> Exposure:
+        return self._remove_from(self.exposures, unique_id)
+
+    def remove_metric(self, unique_id: str) -> Metric:
+        return self._remove_from(self.metrics, unique_id)
+
+    def set_sources(self, sources: MutableMapping[str, SourceDefinition]):
+        """Replace the sources of the manifest, as when the parsed sources
+        replace the unpatched ones.
+        """
+        if self._edge_lookup is not None:
+            for unique_id in self.sources:
+                if unique_id not in sources:
+                    self._edge_lookup.remove_node(unique_id)
+            for source in sources.values():
+                self._edge_lookup.add_node(source)
+        self.sources = sources
+        self._selector_lookup = None
 
     def build_flat_graph(self):
         """This attribute is used in context.common by each node, so we want to
@@ -761,9 +1016,9 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             exposures={k: _deepcopy(v) for k, v in self.exposures.items()},
             metrics={k: _deepcopy(v) for k, v in self.metrics.items()},
             groups={k: _deepcopy(v) for k, v in self.groups.items()},
-            selectors={k: _deepcopy(v) for k, v in self.selectors.items()},
+            selectors=copy_module.deepcopy(self.selectors),
             metadata=self.metadata,
-            disabled={k: _deepcopy(v) for k, v in self.disabled.items()},
+            disabled={k: _deepcopy_list(v) for k, v in self.disabled.items()},
             files={k: _deepcopy(v) for k, v in self.files.items()},
             state_check=_deepcopy(self.state_check),
         )
@@ -771,17 +1026,53 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         return copy
 
     def build_parent_and_child_maps(self):
-        edge_members = list(
-            chain(
-                self.nodes.values(),
-                self.sources.values(),
-                self.exposures.values(),
-                self.metrics.values(),
-            )
-        )
-        forward_edges, backward_edges = build_node_edges(edge_members)
-        self.child_map = forward_edges
-        self.parent_map = backward_edges
+        """Rebuild the parent and child maps from scratch. This is only needed
+        after the dependencies of resources have been changed without going
+        through the methods of the manifest, which keep the maps up to date.
+        """
+        self._edge_lookup = EdgeLookup(self)
+
+    @property
+    def edge_lookup(self) -> EdgeLookup:
+        if self._edge_lookup is None:
+            self._edge_lookup = EdgeLookup(self)
+        return self._edge_lookup
+
+    @property
+    def child_map(self) -> NodeEdgeMap:
+        return self.edge_lookup.child_map
+
+    @property
+    def parent_map(self) -> NodeEdgeMap:
+        return self.edge_lookup.parent_map
+
+    def get_children(self, unique_id: UniqueID) -> List[UniqueID]:
+        """The children of a unique id. Unlike the child map, this includes
+        the children of resources that have been removed, which still depend
+        on them until they're parsed again.
+        """
+        return self.edge_lookup.get_children(unique_id)
+
+    def check_parent_and_child_maps(self) -> None:
+        """With --validate-manifest-edges, check the parent and child maps
+        against a full rebuild. This catches changes to dependencies that were
+        made without going through the methods of the manifest.
+        """
+        if self._edge_lookup is None or not getattr(get_flags(), "VALIDATE_MANIFEST_EDGES", False):
+            return
+        expected = EdgeLookup(self)
+        for name in ("parent_map", "child_map"):
+            actual_map = getattr(self._edge_lookup, name)
+            expected_map = getattr(expected, name)
+            if actual_map != expected_map:
+                differing = sorted(
+                    unique_id
+                    for unique_id in set(actual_map) | set(expected_map)
+                    if actual_map.get(unique_id) != expected_map.get(unique_id)
+                )
+                raise dbt.exceptions.DbtInternalError(
+                    f"The {name} of the manifest is out of date for: {', '.join(differing[:5])}"
+                )
 
     def build_macro_child_map(self):
         edge_members = list(
@@ -807,8 +1098,10 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         self.group_map = group_map
 
     def writable_manifest(self):
-        self.build_parent_and_child_maps()
+        self.check_parent_and_child_maps()
         self.build_group_map()
+        if self._fingerprint_cache is None:
+            self._fingerprint_cache = FingerprintCache()
         return WritableManifest(
             nodes=self.nodes,
             sources=self.sources,
@@ -820,9 +1113,13 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             selectors=self.selectors,
             metadata=self.metadata,
             disabled=self.disabled,
-            child_map=self.child_map,
-            parent_map=self.parent_map,
+            # copies, so the manifest can keep changing while this is written
+            child_map={k: list(v) for k, v in self.child_map.items()},
+            parent_map={k: list(v) for k, v in self.parent_map.items()},
             group_map=self.group_map,
+            fingerprints=self._fingerprint_cache.build(
+                self.macros, (self.nodes, self.sources, self.exposures, self.metrics)
+            ),
         )
 
     def write(self, path):
@@ -893,6 +1190,15 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self._analysis_lookup = AnalysisLookup(self)
         return self._analysis_lookup
 
+    @property
+    def selector_lookup(self) -> SelectorLookup:
+        """Built on first use, and rebuilt after the resources of the manifest
+        are added or updated through its methods.
+        """
+        if self._selector_lookup is None:
+            self._selector_lookup = SelectorLookup(self)
+        return self._selector_lookup
+
     # Called by dbt.parser.manifest._resolve_refs_for_exposure
     # and dbt.parser.manifest._process_refs_for_node
     def resolve_ref(
@@ -1010,12 +1316,16 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         """
         refables = set(NodeType.refable())
         merged = set()
-        for unique_id, node in other.nodes.items():
+        for unique_id in other.nodes:
             current = self.nodes.get(unique_id)
-            if current and (
+            # check the cheap conditions first: the other manifest may only
+            # deserialize its nodes when they're looked up
+            if not current or unique_id in selected:
+                continue
+            node = other.nodes[unique_id]
+            if (
                 node.resource_type in refables
                 and not node.is_ephemeral
-                and unique_id not in selected
                 and (
                     not adapter.get_relation(current.database, current.schema, current.identifier)
                     or favor_state
@@ -1023,6 +1333,9 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             ):
                 merged.add(unique_id)
                 self.nodes[unique_id] = node.replace(deferred=True)
+                self.update_edges(self.nodes[unique_id])
+        if merged:
+            self._selector_lookup = None
 
         # Rebuild the flat_graph, which powers the 'graph' context variable,
         # now that we've deferred some nodes
@@ -1056,11 +1369,16 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         _check_duplicates(source, self.sources)
         self.sources[source.unique_id] = source  # type: ignore
         source_file.sources.append(source.unique_id)
+        self._selector_lookup = None
+        # unpatched sources are added to the parent and child maps by
+        # set_sources, once they're parsed
 
     def add_node_nofile(self, node: ManifestNode):
         # nodes can't be overwritten!
         _check_duplicates(node, self.nodes)
         self.nodes[node.unique_id] = node
+        self._selector_lookup = None
+        self.update_edges(node)
 
     def add_node(self, source_file: AnySourceFile, node: ManifestNode, test_from=None):
         self.add_node_nofile(node)
@@ -1081,11 +1399,15 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         _check_duplicates(exposure, self.exposures)
         self.exposures[exposure.unique_id] = exposure
         source_file.exposures.append(exposure.unique_id)
+        self._selector_lookup = None
+        self.update_edges(exposure)
 
     def add_metric(self, source_file: SchemaSourceFile, metric: Metric):
         _check_duplicates(metric, self.metrics)
         self.metrics[metric.unique_id] = metric
         source_file.metrics.append(metric.unique_id)
+        self._selector_lookup = None
+        self.update_edges(metric)
 
     def add_group(self, source_file: SchemaSourceFile, group: Group):
         _check_duplicates(group, self.groups)
@@ -1165,6 +1487,9 @@ class MacroManifest(MacroMethods):
 AnyManifest = Union[Manifest, MacroManifest]
 
 
+# fingerprints was added to v9 without a new version, as it's optional: dbt
+# versions that don't write it still produce valid v9 manifests, and ones that
+# don't know about it ignore it when reading
 @dataclass
 @schema_version("manifest", 9)
 class WritableManifest(ArtifactMixin):
@@ -1217,6 +1542,12 @@ class WritableManifest(ArtifactMixin):
             description="Metadata about the manifest",
         )
     )
+    fingerprints: Optional[ManifestFingerprints] = field(
+        default=None,
+        metadata=dict(
+            description="Hashes of the parts of each resource that state:modified compares",
+        ),
+    )
 
     @classmethod
     def compatible_previous_versions(self):
@@ -1234,6 +1565,115 @@ class WritableManifest(ArtifactMixin):
                 del node["config_call_dict"]
         return dct
 
+    def write(self, path: str):
+        # Building the dict of the whole manifest with to_dict and then dumping
+        # it doubles the memory needed for a large project, so the json is
+        # written out one resource at a time instead. The output is the same.
+        write_file_chunks(path, self._json_chunks(), get_artifact_compression())
+
+    def write_shards(self, directory: str):
+        """Write the manifest to a directory, with a file for each resource type
+        of the nodes and for each of the other mappings, plus an index of them.
+        Consumers can then load only the parts that they need.
+        """
+        compression = get_artifact_compression()
+        shards: Dict[str, List[Dict[str, Optional[str]]]] = {}
+        for dataclass_field in fields(self):
+            name = dataclass_field.name
+            value = getattr(self, name)
+            if name == "metadata" or value is None:
+                continue
+            shards[name] = []
+            if not isinstance(value, Mapping):
+                path = compressed_path(f"{name}.json", compression)
+                write_json(
+                    os.path.join(directory, f"{name}.json"),
+                    _serialize_for_json(value),
+                    compression,
+                )
+                shards[name].append({"resource_type": None, "path": path})
+                continue
+            groups: Dict[Optional[str], List[Tuple[str, Any]]] = {}
+            for key, item in value.items():
+                resource_type = None
+                if name == "nodes":
+                    # the nodes may already be serialized, see write_manifest
+                    resource_type = str(
+                        item["resource_type"] if isinstance(item, dict) else item.resource_type
+                    )
+                groups.setdefault(resource_type, []).append((key, item))
+            for resource_type, items in groups.items():
+                file_name = name if resource_type is None else f"{name}.{resource_type}"
+                path = compressed_path(f"{file_name}.json", compression)
+                write_file_chunks(
+                    os.path.join(directory, f"{file_name}.json"),
+                    self._mapping_chunks(name, items),
+                    compression,
+                )
+                shards[name].append({"resource_type": resource_type, "path": path})
+        index = {
+            "metadata": self.metadata.to_dict(omit_none=False),
+            "compression": compression,
+            "shards": shards,
+        }
+        write_json(os.path.join(directory, MANIFEST_SHARDS_INDEX_FILE_NAME), index)
+
+    @classmethod
+    def read_shards_and_check_versions(cls, directory: str):
+        try:
+            data = read_manifest_shards(directory)
+        except (EnvironmentError, ValueError) as exc:
+            raise DbtRuntimeError(
+                f'Could not read {cls.__name__} shards at "{directory}" as JSON: {exc}'
+            ) from exc
+        return cls.from_dict_and_check_versions(data)
+
+    def _json_chunks(self) -> Iterator[str]:
+        encode = dbt.utils.JSONEncoder().encode
+        yield "{"
+        for index, dataclass_field in enumerate(fields(self)):
+            name = dataclass_field.name
+            value = getattr(self, name)
+            yield "{}{}: ".format(", " if index else "", encode(name))
+            if isinstance(value, Mapping):
+                yield from self._mapping_chunks(name, value.items())
+            else:
+                yield encode(_serialize_for_json(value))
+        yield "}"
+
+    def _mapping_chunks(self, name: str, items: Iterable[Tuple[str, Any]]) -> Iterator[str]:
+        encode = dbt.utils.JSONEncoder().encode
+        yield "{"
+        for index, (key, item) in enumerate(items):
+            dct = _serialize_for_json(item)
+            if name == "nodes":
+                # see __post_serialize__
+                dct.pop("config_call_dict", None)
+            yield "{}{}: {}".format(", " if index else "", encode(key), encode(dct))
+        yield "}"
+
+
+def read_manifest_shards(directory: str) -> Dict[str, Any]:
+    """Read a manifest written by WritableManifest.write_shards back into the
+    dictionary of a manifest.json.
+    """
+    index = read_json(os.path.join(directory, MANIFEST_SHARDS_INDEX_FILE_NAME))
+    data: Dict[str, Any] = {}
+    for name, shards in index["shards"].items():
+        data[name] = {}
+        for shard in shards:
+            data[name].update(read_json(os.path.join(directory, shard["path"])))
+    data["metadata"] = index["metadata"]
+    return data
+
+
+def _serialize_for_json(value: Any) -> Any:
+    if isinstance(value, dbtClassMixin):
+        return value.to_dict(omit_none=False)
+    elif isinstance(value, list):
+        return [_serialize_for_json(item) for item in value]
+    return value
+
 
 def _check_duplicates(value: BaseNode, src: Mapping[str, BaseNode]):
     if value.unique_id in src:
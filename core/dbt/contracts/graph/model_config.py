@@ -10,7 +10,7 @@ from dbt.dataclass_schema import (
 from dbt.contracts.graph.unparsed import AdditionalPropertiesAllowed, Docs
 from dbt.contracts.graph.utils import validate_color
 from dbt.exceptions import DbtInternalError, CompilationError
-from dbt.contracts.util import Replaceable, list_str
+from dbt.contracts.util import Replaceable, intern_string, list_str
 from dbt import hooks
 from dbt.node_types import NodeType
 
@@ -409,6 +409,14 @@ class NodeAndTestConfig(BaseConfig):
         metadata=CompareBehavior.Exclude.meta(),
     )
 
+    def __post_init__(self):
+        # most nodes share the same few materializations, schemas, severities
+        # and so on, so one copy of each value is kept
+        for field_name in self.__dataclass_fields__:
+            value = getattr(self, field_name)
+            if type(value) is str:
+                setattr(self, field_name, intern_string(value))
+
 
 @dataclass
 class NodeConfig(NodeAndTestConfig):
@@ -455,6 +463,7 @@ class NodeConfig(NodeAndTestConfig):
 
     # we validate that node_color has a suitable value to prevent dbt-docs from crashing
     def __post_init__(self):
+        super().__post_init__()
         if self.docs.node_color:
             node_color = self.docs.node_color
             if not validate_color(node_color):
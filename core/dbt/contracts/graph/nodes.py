@@ -34,7 +34,13 @@ from dbt.contracts.graph.unparsed import (
     MetricFilter,
     MetricTime,
 )
-from dbt.contracts.util import Replaceable, AdditionalPropertiesMixin
+from dbt.contracts.util import (
+    Replaceable,
+    AdditionalPropertiesMixin,
+    add_slots,
+    intern_string,
+    intern_strings,
+)
 from dbt.events.proto_types import NodeInfo
 from dbt.events.functions import warn_or_error
 from dbt.exceptions import ParsingError, InvalidAccessTypeError
@@ -136,6 +142,12 @@ class GraphNode(BaseNode):
 
     fqn: List[str]
 
+    def __post_init__(self):
+        # unique ids and fqn parts repeat across nodes and their dependencies
+        self.unique_id = intern_string(self.unique_id)
+        self.package_name = intern_string(self.package_name)
+        intern_strings(self.fqn)
+
     def same_fqn(self, other) -> bool:
         return self.fqn == other.fqn
 
@@ -178,19 +190,26 @@ class MacroDependsOn(dbtClassMixin, Replaceable):
 
     macros: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        intern_strings(self.macros)
+
     # 'in' on lists is O(n) so this is O(n^2) for # of macros
     def add_macro(self, value: str):
         if value not in self.macros:
-            self.macros.append(value)
+            self.macros.append(intern_string(value))
 
 
 @dataclass
 class DependsOn(MacroDependsOn):
     nodes: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        super().__post_init__()
+        intern_strings(self.nodes)
+
     def add_node(self, value: str):
         if value not in self.nodes:
-            self.nodes.append(value)
+            self.nodes.append(intern_string(value))
 
 
 @dataclass
@@ -199,6 +218,11 @@ class ParsedNodeMandatory(GraphNode, HasRelationMetadata, Replaceable):
     checksum: FileHash
     config: NodeConfig = field(default_factory=NodeConfig)
 
+    def __post_init__(self):
+        super().__post_init__()
+        self.database = intern_string(self.database)
+        self.schema = intern_string(self.schema)
+
     @property
     def identifier(self):
         return self.alias
@@ -472,17 +496,20 @@ class CompiledNode(ParsedNode):
 # ====================================
 
 
+@add_slots
 @dataclass
 class AnalysisNode(CompiledNode):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Analysis]})
 
 
+@add_slots
 @dataclass
 class HookNode(CompiledNode):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Operation]})
     index: Optional[int] = None
 
 
+@add_slots
 @dataclass
 class ModelNode(CompiledNode):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Model]})
@@ -490,11 +517,13 @@ class ModelNode(CompiledNode):
 
 
 # TODO: rm?
+@add_slots
 @dataclass
 class RPCNode(CompiledNode):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.RPCCall]})
 
 
+@add_slots
 @dataclass
 class SqlNode(CompiledNode):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.SqlOperation]})
@@ -505,6 +534,7 @@ class SqlNode(CompiledNode):
 # ====================================
 
 
+@add_slots
 @dataclass
 class SeedNode(ParsedNode):  # No SQLDefaults!
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Seed]})
@@ -630,6 +660,7 @@ class TestShouldStoreFailures:
         return False
 
 
+@add_slots
 @dataclass
 class SingularTestNode(TestShouldStoreFailures, CompiledNode):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Test]})
@@ -664,6 +695,7 @@ class HasTestMetadata(dbtClassMixin):
     test_metadata: TestMetadata
 
 
+@add_slots
 @dataclass
 class GenericTestNode(TestShouldStoreFailures, CompiledNode, HasTestMetadata):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Test]})
@@ -703,6 +735,7 @@ class IntermediateSnapshotNode(CompiledNode):
     config: EmptySnapshotConfig = field(default_factory=EmptySnapshotConfig)
 
 
+@add_slots
 @dataclass
 class SnapshotNode(CompiledNode):
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Snapshot]})
@@ -833,7 +866,13 @@ class ParsedSourceMandatory(GraphNode, HasRelationMetadata):
     identifier: str
     resource_type: NodeType = field(metadata={"restrict": [NodeType.Source]})
 
+    def __post_init__(self):
+        super().__post_init__()
+        self.database = intern_string(self.database)
+        self.schema = intern_string(self.schema)
+
 
+@add_slots
 @dataclass
 class SourceDefinition(NodeInfoMixin, ParsedSourceMandatory):
     quoting: Quoting = field(default_factory=Quoting)
@@ -5,6 +5,7 @@ from dbt.contracts.util import (
     ArtifactMixin,
     VersionedSchema,
     Replaceable,
+    get_artifact_compression,
     schema_version,
 )
 from dbt.exceptions import DbtInternalError
@@ -13,13 +14,22 @@ from dbt.events.types import TimingInfoCollected
 from dbt.events.proto_types import RunResultMsg, TimingInfoMsg
 from dbt.events.contextvars import get_node_info
 from dbt.logger import TimingProcessor
-from dbt.utils import lowercase, cast_to_str, cast_to_int, cast_dict_to_dict_of_strings
+from dbt.utils import (
+    lowercase,
+    cast_to_str,
+    cast_to_int,
+    cast_dict_to_dict_of_strings,
+    JSONEncoder,
+)
 from dbt.dataclass_schema import dbtClassMixin, StrEnum
 
 import agate
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+import json
+import os
+import threading
 from typing import (
     Union,
     Dict,
@@ -28,9 +38,12 @@ from typing import (
     Any,
     NamedTuple,
     Sequence,
+    Iterator,
+    Iterable,
+    Set,
 )
 
-from dbt.clients.system import write_json
+from dbt.clients.system import make_directory, read_json, write_file_chunks, write_json
 
 
 @dataclass
@@ -239,7 +252,83 @@ class RunResultsArtifact(ExecutionResult, ArtifactMixin):
         return cls(metadata=meta, results=processed_results, elapsed_time=elapsed_time, args=args)
 
     def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))
+        write_json(path, self.to_dict(omit_none=False), get_artifact_compression())
+
+
+class RunResultsWriter:
+    """Writes run_results.json incrementally. Each result is serialized when it
+    is added, as a line of a JSON lines file next to the artifact, so writing
+    the artifact at the end of the run only copies the serialized results into
+    place instead of building and serializing the whole artifact at once.
+
+    The output is the same as RunResultsArtifact.write.
+    """
+
+    def __init__(self, path: str, keep_jsonl: bool = False) -> None:
+        self.path = path
+        self.jsonl_path = os.path.splitext(path)[0] + ".jsonl"
+        self.keep_jsonl = keep_jsonl
+        self.count = 0
+        self._lock = threading.Lock()
+        make_directory(os.path.dirname(path))
+        self._file = open(self.jsonl_path, "w", encoding="utf-8")
+
+    def add(self, result: BaseResult) -> None:
+        if not isinstance(result, RunResult):
+            return
+        line = json.dumps(process_run_result(result).to_dict(omit_none=False), cls=JSONEncoder)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.count += 1
+
+    def finalize(self, execution_result: RunExecutionResult) -> bool:
+        """Write the artifact for a run from the results added so far. If they
+        are not the run's results, write nothing and return False.
+        """
+        self._file.close()
+        num_results = sum(1 for r in execution_result.results if isinstance(r, RunResult))
+        if num_results != self.count:
+            self.discard()
+            return False
+
+        metadata = RunResultsMetadata(
+            dbt_schema_version=str(RunResultsArtifact.dbt_schema_version),
+            generated_at=execution_result.generated_at,
+        )
+        write_file_chunks(
+            self.path,
+            self._json_chunks(metadata, execution_result),
+            get_artifact_compression(),
+        )
+        if not self.keep_jsonl:
+            os.remove(self.jsonl_path)
+        return True
+
+    def _json_chunks(
+        self, metadata: RunResultsMetadata, execution_result: RunExecutionResult
+    ) -> Iterator[str]:
+        # this must match the key order and separators of json.dumps on the
+        # artifact's dict
+        yield '{"metadata": '
+        yield json.dumps(metadata.to_dict(omit_none=False), cls=JSONEncoder)
+        yield ', "results": ['
+        with open(self.jsonl_path, encoding="utf-8") as lines:
+            for index, line in enumerate(lines):
+                if index:
+                    yield ", "
+                yield line.rstrip("\n")
+        yield '], "elapsed_time": '
+        yield json.dumps(execution_result.elapsed_time, cls=JSONEncoder)
+        yield ', "args": '
+        yield json.dumps(execution_result.args, cls=JSONEncoder)
+        yield "}"
+
+    def discard(self) -> None:
+        """Stop writing, and remove the JSON lines file unless it is kept."""
+        self._file.close()
+        if not self.keep_jsonl and os.path.exists(self.jsonl_path):
+            os.remove(self.jsonl_path)
 
 
 @dataclass
@@ -509,3 +598,103 @@ class CatalogArtifact(CatalogResults, ArtifactMixin):
             errors=errors,
             _compile_results=compile_results,
         )
+
+
+# where the nodes executed since the last catalog was generated are recorded,
+# for docs generate --incremental-catalog
+EXECUTION_LOG_FILE_NAME = "executed_nodes.json"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # artifacts are written with naive UTC datetimes, but are read back with
+    # a timezone
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+@dataclass
+class ExecutionLog(dbtClassMixin):
+    """The nodes executed by the invocations that started after `since`.
+    Every invocation that can build relations records itself here before it
+    executes anything, and generating the catalog starts a new log. Unlike
+    run_results.json, this covers every invocation since the last catalog.
+    The invocations are merged as they're recorded, so the log never grows
+    beyond the nodes of the project.
+    """
+
+    since: datetime
+    # None once an invocation could have changed any relation, as
+    # run-operation can
+    unique_ids: Optional[List[str]]
+    # when the first and the last of the recorded invocations started
+    first_started_at: Optional[datetime] = None
+    last_started_at: Optional[datetime] = None
+
+    @staticmethod
+    def path(target_path: str) -> str:
+        return os.path.join(target_path, EXECUTION_LOG_FILE_NAME)
+
+    @classmethod
+    def read(cls, target_path: str) -> Optional["ExecutionLog"]:
+        path = cls.path(target_path)
+        if not os.path.exists(path):
+            return None
+        try:
+            return cls.from_dict(read_json(path))
+        except (ValueError, LookupError, TypeError):
+            return None
+
+    def write(self, target_path: str) -> None:
+        # written to a temporary file first, so that an invocation reading the
+        # log never sees a partly written one
+        path = self.path(target_path)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        write_json(tmp_path, self.to_dict(omit_none=False))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def record(cls, target_path: str, unique_ids: Optional[Iterable[str]]) -> None:
+        started_at = datetime.utcnow()
+        log = cls.read(target_path)
+        if log is None:
+            # nothing is known about the invocations before this one
+            log = cls(since=started_at, unique_ids=[])
+        recorded = log.unique_ids
+        if recorded is None:
+            # the executed nodes are already unknown until the next catalog
+            return
+        log.unique_ids = None if unique_ids is None else sorted(set(recorded).union(unique_ids))
+        if log.first_started_at is None:
+            log.first_started_at = started_at
+        log.last_started_at = started_at
+        log.write(target_path)
+
+    @classmethod
+    def invalidate(cls, target_path: str) -> None:
+        path = cls.path(target_path)
+        if os.path.exists(path):
+            os.remove(path)
+
+    @classmethod
+    def restart(cls, target_path: str, since: datetime) -> None:
+        """Start a new log for a catalog whose generation started at `since`.
+        If an invocation recorded in the current log started after it, the
+        recorded nodes are kept, as the catalog may not include its changes.
+        """
+        log = cls.read(target_path)
+        if (
+            log is not None
+            and log.last_started_at is not None
+            and _as_utc(log.last_started_at) >= _as_utc(since)
+        ):
+            log.since = since
+        else:
+            log = cls(since=since, unique_ids=[])
+        log.write(target_path)
+
+    def executed_since(self, generated_at: datetime) -> Optional[Set[str]]:
+        """The unique ids of the nodes executed since a catalog was generated,
+        or None if they can't all be known.
+        """
+        if _as_utc(self.since) > _as_utc(generated_at) or self.unique_ids is None:
+            return None
+        return set(self.unique_ids)
@@ -1,52 +1,337 @@
+import json
+from dataclasses import dataclass
 from pathlib import Path
-from .graph.manifest import WritableManifest
+from .files import FileHash
+from .graph.fingerprints import ManifestFingerprints
+from .graph.manifest import (
+    ManifestMetadata,
+    WritableManifest,
+    MANIFEST_SHARDS_DIR_NAME,
+    MANIFEST_SHARDS_INDEX_FILE_NAME,
+    read_manifest_shards,
+)
+from .graph.nodes import (
+    Documentation,
+    Exposure,
+    GraphMemberNode,
+    Group,
+    Macro,
+    ManifestNode,
+    Metric,
+    SourceDefinition,
+)
 from .results import RunResultsArtifact
 from .results import FreshnessExecutionResultArtifact
-from typing import Optional
-from dbt.exceptions import IncompatibleSchemaError
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from dbt.clients.system import find_compressed_file, read_json
+from dbt.dataclass_schema import dbtClassMixin
+from dbt.exceptions import DbtRuntimeError, IncompatibleSchemaError
+from dbt.utils import JSONEncoder
+
+
+def _find_artifact(path: Path) -> Optional[Path]:
+    """Find the artifact at path, or a compressed copy of it."""
+    found = Path(find_compressed_file(str(path))[0])
+    if found.exists() and found.is_file():
+        return found
+    return None
+
+
+V = TypeVar("V")
+
+
+class LazyMapping(Mapping[str, V], Generic[V]):
+    """A read-only mapping over the json of the resources in an artifact. Each
+    resource is only deserialized the first time it's looked up, so that only
+    the resources a command actually uses are paid for.
+    """
+
+    def __init__(self, raw: Dict[str, Any], load: Callable[[Any], V]) -> None:
+        self._raw = raw
+        self._load = load
+        self._loaded: Dict[str, V] = {}
+
+    def __getitem__(self, key: str) -> V:
+        if key not in self._loaded:
+            self._loaded[key] = self._load(self._raw[key])
+        return self._loaded[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def raw_items(self) -> Iterable[Tuple[str, Any]]:
+        return self._raw.items()
+
+
+# mashumaro only deserializes a union such as ManifestNode as the field of a
+# dataclass, so each resource is loaded as the value of one of these
+@dataclass
+class _ManifestNodeValue(dbtClassMixin):
+    value: ManifestNode
+
+
+@dataclass
+class _SourceValue(dbtClassMixin):
+    value: SourceDefinition
+
+
+@dataclass
+class _MacroValue(dbtClassMixin):
+    value: Macro
+
+
+@dataclass
+class _DocumentationValue(dbtClassMixin):
+    value: Documentation
+
+
+@dataclass
+class _ExposureValue(dbtClassMixin):
+    value: Exposure
+
+
+@dataclass
+class _MetricValue(dbtClassMixin):
+    value: Metric
+
+
+@dataclass
+class _GroupValue(dbtClassMixin):
+    value: Group
+
+
+@dataclass
+class _DisabledValue(dbtClassMixin):
+    value: List[GraphMemberNode]
+
+
+_LAZY_MANIFEST_FIELDS = {
+    "nodes": _ManifestNodeValue,
+    "sources": _SourceValue,
+    "macros": _MacroValue,
+    "docs": _DocumentationValue,
+    "exposures": _ExposureValue,
+    "metrics": _MetricValue,
+    "groups": _GroupValue,
+    "disabled": _DisabledValue,
+}
+
+
+def _value_loader(holder: Any) -> Callable[[Any], Any]:
+    return lambda raw: holder.from_dict({"value": raw}).value
+
+
+def load_lazy_manifest(data: Dict[str, Any]) -> WritableManifest:
+    """Build a WritableManifest from the dict of a manifest.json, deserializing
+    its resources on demand.
+    """
+    data = WritableManifest.check_and_upgrade_versions(data)
+    resources: Dict[str, Any] = {}
+    for name, holder in _LAZY_MANIFEST_FIELDS.items():
+        raw = data.get(name)
+        if raw is None:
+            resources[name] = None if name == "disabled" else {}
+        else:
+            resources[name] = LazyMapping(raw, _value_loader(holder))
+    fingerprints = data.get("fingerprints")
+    return WritableManifest(
+        selectors=data.get("selectors") or {},
+        parent_map=data.get("parent_map"),
+        child_map=data.get("child_map"),
+        group_map=data.get("group_map"),
+        metadata=ManifestMetadata.from_dict(data["metadata"]),
+        fingerprints=ManifestFingerprints.from_dict(fingerprints) if fingerprints else None,
+        **resources,
+    )
+
+
+class PreviousResource(NamedTuple):
+    """What the state index knows about a resource of the previous manifest."""
+
+    resource_type: str
+    # the checksum of the resource's file, or of the sql of a macro
+    checksum: Optional[str]
+    # a hash of the resource's unrendered config
+    config_hash: Optional[str]
+    relation_name: Optional[str]
+    macros: Tuple[str, ...]
+
+
+def macro_checksum(macro_sql: str) -> str:
+    return FileHash.from_contents(macro_sql).checksum
+
+
+def _summarize(raw: Dict[str, Any]) -> PreviousResource:
+    checksum = raw.get("checksum")
+    if isinstance(checksum, dict):
+        checksum = checksum.get("checksum")
+    elif "macro_sql" in raw:
+        checksum = macro_checksum(raw["macro_sql"])
+    config_hash = None
+    if raw.get("unrendered_config") is not None:
+        config_json = json.dumps(raw["unrendered_config"], sort_keys=True, cls=JSONEncoder)
+        config_hash = FileHash.from_contents(config_json).checksum
+    depends_on = raw.get("depends_on") or {}
+    return PreviousResource(
+        resource_type=raw["resource_type"],
+        checksum=checksum,
+        config_hash=config_hash,
+        relation_name=raw.get("relation_name"),
+        macros=tuple(depends_on.get("macros", ())),
+    )
+
+
+def _raw_items(mapping: Mapping[str, Any]) -> Iterable[Tuple[str, Any]]:
+    if isinstance(mapping, LazyMapping):
+        return mapping.raw_items()
+    return ((key, value.to_dict(omit_none=False)) for key, value in mapping.items())
+
+
+def build_state_index(manifest: WritableManifest) -> Dict[str, PreviousResource]:
+    """Index the resources of a manifest by unique id. A lazily loaded manifest
+    is indexed from its json, so that none of its resources are deserialized.
+    """
+    index: Dict[str, PreviousResource] = {}
+    for mapping in (
+        manifest.nodes,
+        manifest.sources,
+        manifest.macros,
+        manifest.exposures,
+        manifest.metrics,
+    ):
+        for unique_id, raw in _raw_items(mapping):
+            index[unique_id] = _summarize(raw)
+    return index
 
 
 class PreviousState:
+    """The artifacts of a previous invocation, from --state. Each artifact is
+    only read when it's first used, and the resources of the manifest are only
+    deserialized as they're looked up.
+    """
+
     def __init__(self, path: Path, current_path: Path):
         self.path: Path = path
         self.current_path: Path = current_path
-        self.manifest: Optional[WritableManifest] = None
-        self.results: Optional[RunResultsArtifact] = None
-        self.sources: Optional[FreshnessExecutionResultArtifact] = None
-        self.sources_current: Optional[FreshnessExecutionResultArtifact] = None
-
-        manifest_path = self.path / "manifest.json"
-        if manifest_path.exists() and manifest_path.is_file():
-            try:
-                self.manifest = WritableManifest.read_and_check_versions(str(manifest_path))
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(manifest_path))
-                raise
-
-        results_path = self.path / "run_results.json"
-        if results_path.exists() and results_path.is_file():
-            try:
-                self.results = RunResultsArtifact.read_and_check_versions(str(results_path))
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(results_path))
-                raise
-
-        sources_path = self.path / "sources.json"
-        if sources_path.exists() and sources_path.is_file():
-            try:
-                self.sources = FreshnessExecutionResultArtifact.read_and_check_versions(
-                    str(sources_path)
-                )
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(sources_path))
-                raise
-
-        sources_current_path = self.current_path / "sources.json"
-        if sources_current_path.exists() and sources_current_path.is_file():
-            try:
-                self.sources_current = FreshnessExecutionResultArtifact.read_and_check_versions(
-                    str(sources_current_path)
-                )
-            except IncompatibleSchemaError as exc:
-                exc.add_filename(str(sources_current_path))
-                raise
+        self._manifest: Optional[WritableManifest] = None
+        self._results: Optional[RunResultsArtifact] = None
+        self._sources: Optional[FreshnessExecutionResultArtifact] = None
+        self._sources_current: Optional[FreshnessExecutionResultArtifact] = None
+        self._index: Optional[Dict[str, PreviousResource]] = None
+        # the names of the artifacts that have been read or set
+        self._loaded: Set[str] = set()
+
+    def _get(self, name: str, read: Callable[[], Any]) -> Any:
+        if name not in self._loaded:
+            setattr(self, f"_{name}", read())
+            self._loaded.add(name)
+        return getattr(self, f"_{name}")
+
+    def _set(self, name: str, value: Any) -> None:
+        setattr(self, f"_{name}", value)
+        self._loaded.add(name)
+
+    @property
+    def manifest(self) -> Optional[WritableManifest]:
+        return self._get("manifest", self._read_manifest)
+
+    @manifest.setter
+    def manifest(self, value: Optional[WritableManifest]) -> None:
+        self._set("manifest", value)
+        self._index = None
+
+    @property
+    def results(self) -> Optional[RunResultsArtifact]:
+        return self._get("results", self._read_results)
+
+    @results.setter
+    def results(self, value: Optional[RunResultsArtifact]) -> None:
+        self._set("results", value)
+
+    @property
+    def sources(self) -> Optional[FreshnessExecutionResultArtifact]:
+        return self._get("sources", lambda: self._read_sources(self.path))
+
+    @sources.setter
+    def sources(self, value: Optional[FreshnessExecutionResultArtifact]) -> None:
+        self._set("sources", value)
+
+    @property
+    def sources_current(self) -> Optional[FreshnessExecutionResultArtifact]:
+        return self._get("sources_current", lambda: self._read_sources(self.current_path))
+
+    @sources_current.setter
+    def sources_current(self, value: Optional[FreshnessExecutionResultArtifact]) -> None:
+        self._set("sources_current", value)
+
+    @property
+    def index(self) -> Optional[Dict[str, PreviousResource]]:
+        """The resources of the previous manifest by unique id, or None if there
+        is no previous manifest.
+        """
+        if self._index is None and self.manifest is not None:
+            self._index = build_state_index(self.manifest)
+        return self._index
+
+    def _read_manifest(self) -> Optional[WritableManifest]:
+        manifest_path = _find_artifact(self.path / "manifest.json")
+        shards_path = self.path / MANIFEST_SHARDS_DIR_NAME / MANIFEST_SHARDS_INDEX_FILE_NAME
+        try:
+            if manifest_path is not None:
+                path = manifest_path
+                data = read_json(str(path))
+            elif shards_path.is_file():
+                path = shards_path
+                data = read_manifest_shards(str(path.parent))
+            else:
+                return None
+        except (EnvironmentError, ValueError) as exc:
+            raise DbtRuntimeError(
+                f'Could not read WritableManifest at "{path}" as JSON: {exc}'
+            ) from exc
+
+        try:
+            return load_lazy_manifest(data)
+        except IncompatibleSchemaError as exc:
+            exc.add_filename(str(path))
+            raise
+
+    def _read_results(self) -> Optional[RunResultsArtifact]:
+        results_path = _find_artifact(self.path / "run_results.json")
+        if results_path is None:
+            return None
+        try:
+            return RunResultsArtifact.read_and_check_versions(str(results_path))
+        except IncompatibleSchemaError as exc:
+            exc.add_filename(str(results_path))
+            raise
+
+    def _read_sources(self, directory: Path) -> Optional[FreshnessExecutionResultArtifact]:
+        sources_path = _find_artifact(directory / "sources.json")
+        if sources_path is None:
+            return None
+        try:
+            return FreshnessExecutionResultArtifact.read_and_check_versions(str(sources_path))
+        except IncompatibleSchemaError as exc:
+            exc.add_filename(str(sources_path))
+            raise
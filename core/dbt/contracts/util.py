@@ -1,9 +1,12 @@
 import dataclasses
+import sys
+import types
 from datetime import datetime
 from typing import List, Tuple, ClassVar, Type, TypeVar, Dict, Any, Optional
 
 from dbt.clients.system import write_json, read_json
 from dbt import deprecations
+from dbt.flags import get_flags
 from dbt.exceptions import (
     DbtInternalError,
     DbtRuntimeError,
@@ -39,6 +42,59 @@ def list_str() -> List[str]:
     return []
 
 
+V = TypeVar("V")
+
+
+def intern_string(value: V) -> V:
+    """Intern strings that repeat across many resources, such as unique ids
+    and fqn parts, so that one copy of each is kept in memory.
+    """
+    if type(value) is str:
+        return sys.intern(value)  # type: ignore
+    return value
+
+
+def intern_strings(values: List[V]) -> List[V]:
+    """Intern the strings in a list in place, and return it."""
+    for index, value in enumerate(values):
+        values[index] = intern_string(value)
+    return values
+
+
+def add_slots(cls: Type[V]) -> Type[V]:
+    """Recreate the dataclass `cls` with a slot for each of its fields, as
+    dataclass(slots=True) does on python 3.10+. Instances of classes with
+    more than 30 attributes don't share the keys of their __dict__, so
+    slots make them a lot smaller. Bases without slots still give the
+    instances a __dict__, but it is only created when an attribute that
+    isn't a field is set.
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())}
+    names = tuple(
+        f.name for f in dataclasses.fields(cls) if f.name not in inherited  # type: ignore
+    )
+    cls_dict = dict(cls.__dict__)
+    for name in names:
+        # the defaults are kept by __init__ and the dataclass fields
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    cls_dict["__slots__"] = names
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)  # type: ignore
+    new_cls.__qualname__ = cls.__qualname__
+
+    # methods that call super() without arguments refer to the class they
+    # were defined in, which has to be the new class
+    for value in cls_dict.values():
+        if isinstance(value, property):
+            value = value.fget
+        value = getattr(value, "__func__", value)
+        if isinstance(value, types.FunctionType) and "__class__" in value.__code__.co_freevars:
+            index = value.__code__.co_freevars.index("__class__")
+            value.__closure__[index].cell_contents = new_cls  # type: ignore
+    return new_cls
+
+
 class Replaceable:
     def replace(self, **kwargs):
         return dataclasses.replace(self, **kwargs)
@@ -60,9 +116,17 @@ class Mergeable(Replaceable):
         return self.replace(**replacements)
 
 
+def get_artifact_compression() -> Optional[str]:
+    """The compression to write artifacts with, from --artifact-compression."""
+    compression = getattr(get_flags(), "ARTIFACT_COMPRESSION", None)
+    if compression is None or compression == "none":
+        return None
+    return compression
+
+
 class Writable:
     def write(self, path: str):
-        write_json(path, self.to_dict(omit_none=False))  # type: ignore
+        write_json(path, self.to_dict(omit_none=False), get_artifact_compression())  # type: ignore
 
 
 class AdditionalPropertiesMixin:
@@ -329,7 +393,14 @@ class VersionedSchema(dbtClassMixin):
             raise DbtRuntimeError(
                 f'Could not read {cls.__name__} at "{path}" as JSON: {exc}'
             ) from exc
+        return cls.from_dict_and_check_versions(data)
+
+    @classmethod
+    def from_dict_and_check_versions(cls, data: Dict[str, Any]):
+        return cls.from_dict(cls.check_and_upgrade_versions(data))  # type: ignore
 
+    @classmethod
+    def check_and_upgrade_versions(cls, data: Dict[str, Any]) -> Dict[str, Any]:
         # Check metadata version. There is a class variable 'dbt_schema_version', but
         # that doesn't show up in artifacts, where it only exists in the 'metadata'
         # dictionary.
@@ -344,7 +415,7 @@ class VersionedSchema(dbtClassMixin):
                     )
         if get_manifest_schema_version(data) <= 8:
             data = upgrade_manifest_json(data)
-        return cls.from_dict(data)  # type: ignore
+        return data
 
 
 T = TypeVar("T", bound="ArtifactMixin")
@@ -1,7 +1,9 @@
+import atexit
 import os
+import queue
+import sys
 from colorama import Style
 from dataclasses import dataclass
-from datetime import datetime
 from enum import Enum
 import json
 import logging
@@ -39,6 +41,11 @@ class LineFormat(Enum):
     Json = 3
 
 
+class BackPressure(Enum):
+    Block = 1
+    DropDebug = 2
+
+
 # Map from dbt event levels to python log levels
 _log_level_map = {
     EventLevel.DEBUG: 10,
@@ -90,6 +97,9 @@ class _Logger:
         self.level: EventLevel = config.level
         self.event_manager: EventManager = event_manager
         self._python_logger: Optional[logging.Logger] = config.logger
+        # loggers supplied by the caller (e.g. logbook) do their own level
+        # filtering, so they may want events of any level
+        self._filters_level: bool = False
 
         if config.output_stream is not None:
             stream_handler = logging.StreamHandler(config.output_stream)
@@ -110,8 +120,17 @@ class _Logger:
         handler.setFormatter(logging.Formatter(fmt="%(message)s"))
         log.handlers.clear()
         log.addHandler(handler)
+        self._filters_level = True
         return log
 
+    def accepts_level(self, level: EventLevel) -> bool:
+        """Whether this logger could write an event of the given level. Used to
+        skip building messages that no logger would write.
+        """
+        if self._python_logger is None:
+            return False
+        return not self._filters_level or _log_level_map[level] >= _log_level_map[self.level]
+
     def create_line(self, msg: EventMsg) -> str:
         raise NotImplementedError()
 
@@ -120,6 +139,22 @@ class _Logger:
         if self._python_logger is not None:
             send_to_logger(self._python_logger, msg.info.level, line)
 
+    def write_lines(self, msgs: List[EventMsg]):
+        """Write the lines for several events. Loggers which own their handler
+        write them as a single record, so the handler only writes once.
+        """
+        if self._python_logger is None:
+            return
+        if not self._filters_level:
+            for msg in msgs:
+                self.write_line(msg)
+            return
+        lines = [
+            self.create_line(msg) for msg in msgs if self.accepts_level(EventLevel(msg.info.level))
+        ]
+        if lines:
+            self._python_logger.log(_log_level_map[self.level], "\n".join(lines))
+
     def flush(self):
         if self._python_logger is not None:
             for handler in self._python_logger.handlers:
@@ -136,7 +171,7 @@ class _TextLogger(_Logger):
         return self.create_debug_line(msg) if self.use_debug_format else self.create_info_line(msg)
 
     def create_info_line(self, msg: EventMsg) -> str:
-        ts: str = datetime.utcnow().strftime("%H:%M:%S")
+        ts: str = msg.info.ts.strftime("%H:%M:%S")
         scrubbed_msg: str = self.scrubber(msg.info.msg)  # type: ignore
         return f"{self._get_color_tag()}{ts}  {scrubbed_msg}"
 
@@ -153,17 +188,17 @@ class _TextLogger(_Logger):
         scrubbed_msg: str = self.scrubber(msg.info.msg)  # type: ignore
         level = msg.info.level
         log_line += (
-            f"{self._get_color_tag()}{ts} [{level:<5}]{self._get_thread_name()} {scrubbed_msg}"
+            f"{self._get_color_tag()}{ts} [{level:<5}]{self._get_thread_name(msg)} {scrubbed_msg}"
         )
         return log_line
 
     def _get_color_tag(self) -> str:
         return "" if not self.use_colors else Style.RESET_ALL
 
-    def _get_thread_name(self) -> str:
+    def _get_thread_name(self, msg: EventMsg) -> str:
         thread_name = ""
-        if threading.current_thread().name:
-            thread_name = threading.current_thread().name
+        if msg.info.thread:
+            thread_name = msg.info.thread
             thread_name = thread_name[:10]
             thread_name = thread_name.ljust(10, " ")
             thread_name = f" [{thread_name}]:"
@@ -180,16 +215,133 @@ class _JsonLogger(_Logger):
         return line
 
 
+# The message put on the writer's queue to stop it
+_STOP_WRITER = object()
+
+
+class _AsyncWriter:
+    """Writes the lines for an EventManager's loggers on a background thread.
+
+    Events are taken through a bounded queue by a single thread, which writes
+    them in batches in the order they were fired. When the queue is full,
+    firing an event blocks until there is room, unless the back pressure
+    policy is DropDebug, in which case debug events are dropped instead.
+    """
+
+    def __init__(
+        self,
+        loggers: List["_Logger"],
+        max_queue_size: int,
+        batch_size: int,
+        back_pressure: BackPressure,
+    ) -> None:
+        self.loggers = loggers
+        self.batch_size = batch_size
+        self.back_pressure = back_pressure
+        self.dropped: int = 0
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def put(self, msg: EventMsg) -> None:
+        if (
+            self.back_pressure == BackPressure.DropDebug
+            and _log_level_map[EventLevel(msg.info.level)] <= _log_level_map[EventLevel.DEBUG]
+        ):
+            try:
+                self.queue.put_nowait(msg)
+            except queue.Full:
+                self.dropped += 1
+        else:
+            self.queue.put(msg)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            msgs = [msg for msg in batch if msg is not _STOP_WRITER]
+            stop = len(msgs) < len(batch)
+            try:
+                for logger in self.loggers:
+                    logger.write_lines([msg for msg in msgs if logger.filter(msg)])  # type: ignore
+            except Exception:
+                # there is nowhere left to log this, and the thread must keep
+                # draining the queue so that event producers do not block
+                traceback.print_exc(file=sys.stderr)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    def flush(self) -> None:
+        """Wait until every event put so far has been written."""
+        self.queue.join()
+
+    def stop(self) -> None:
+        """Write every remaining event, then stop the thread."""
+        self.queue.put(_STOP_WRITER)
+        self._thread.join()
+
+
 class EventManager:
     def __init__(self) -> None:
         self.loggers: List[_Logger] = []
         self.callbacks: List[Callable[[EventMsg], None]] = []
         self.invocation_id: str = str(uuid4())
+        self._writer: Optional[_AsyncWriter] = None
+        self._stop_writer_at_exit: bool = False
+
+    def start_async_writer(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        back_pressure: BackPressure = BackPressure.Block,
+    ) -> None:
+        """Write lines for the loggers on a background thread from now on.
+        Callbacks are still called on the thread firing the event.
+        """
+        self.stop_async_writer()
+        self._writer = _AsyncWriter(self.loggers, max_queue_size, batch_size, back_pressure)
+        if not self._stop_writer_at_exit:
+            atexit.register(self.stop_async_writer)
+            self._stop_writer_at_exit = True
+
+    def stop_async_writer(self) -> None:
+        """Write every queued line, then go back to writing lines on the
+        thread firing the event.
+        """
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        writer.stop()
+        if writer.dropped:
+            from dbt.events.types import Note
+
+            self.fire_event(
+                Note(msg=f"The log writer fell behind and dropped {writer.dropped} debug events"),
+                level=EventLevel.WARN,
+            )
+
+    def accepts_level(self, level: EventLevel) -> bool:
+        """Whether any logger or callback could receive an event of the given
+        level. Callbacks receive events of every level.
+        """
+        return bool(self.callbacks) or any(logger.accepts_level(level) for logger in self.loggers)
 
     def fire_event(self, e: BaseEvent, level: EventLevel = None) -> None:
+        test_binary_serialization = os.environ.get("DBT_TEST_BINARY_SERIALIZATION")
+        # building the message (and rendering its text) is the expensive
+        # part, so skip it when nothing would receive the event
+        if not test_binary_serialization and not self.accepts_level(level or e.level_tag()):
+            return
+
         msg = msg_from_base_event(e, level=level)
 
-        if os.environ.get("DBT_TEST_BINARY_SERIALIZATION"):
+        if test_binary_serialization:
             print(f"--- {msg.info.name}")
             try:
                 bytes(msg)
@@ -198,9 +350,12 @@ class EventManager:
                     f"{msg.info.name} is not serializable to binary. Originating exception: {exc}, {traceback.format_exc()}"
                 )
 
-        for logger in self.loggers:
-            if logger.filter(msg):  # type: ignore
-                logger.write_line(msg)
+        if self._writer is not None:
+            self._writer.put(msg)
+        else:
+            for logger in self.loggers:
+                if logger.filter(msg):  # type: ignore
+                    logger.write_line(msg)
 
         for callback in self.callbacks:
             callback(msg)
@@ -215,5 +370,7 @@ class EventManager:
         self.loggers.append(logger)
 
     def flush(self):
+        if self._writer is not None:
+            self._writer.flush()
         for logger in self.loggers:
             logger.flush()
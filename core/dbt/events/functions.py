@@ -1,8 +1,8 @@
-import betterproto
 from dbt.constants import METADATA_ENV_PREFIX
 from dbt.events.base_types import BaseEvent, Cache, EventLevel, NoFile, NoStdOut, EventMsg
-from dbt.events.eventmgr import EventManager, LoggerConfig, LineFormat, NoFilter
+from dbt.events.eventmgr import BackPressure, EventManager, LoggerConfig, LineFormat, NoFilter
 from dbt.events.helpers import env_secrets, scrub_secrets
+from dbt.events.serialization import message_to_dict
 from dbt.events.types import Formatting
 from dbt.flags import get_flags, ENABLE_LEGACY_LOGGER
 from dbt.logger import GLOBAL_LOGGER, make_log_dir_if_missing
@@ -59,6 +59,14 @@ def setup_event_logger(flags) -> None:
                 )
             )
 
+        if getattr(flags, "LOG_ASYNC", False):
+            back_pressure = (
+                BackPressure.DropDebug
+                if getattr(flags, "LOG_ASYNC_BACK_PRESSURE", "block") == "drop-debug"
+                else BackPressure.Block
+            )
+            EVENT_MANAGER.start_async_writer(back_pressure=back_pressure)
+
 
 def _line_format_from_str(format_str: str, default: LineFormat) -> LineFormat:
     if format_str == "text":
@@ -161,6 +169,7 @@ def cleanup_event_logger():
     # Reset to a no-op manager to release streams associated with logs. This is
     # especially important for tests, since pytest replaces the stdout stream
     # during test runs, and closes the stream after the test is over.
+    EVENT_MANAGER.stop_async_writer()
     EVENT_MANAGER.loggers.clear()
     EVENT_MANAGER.callbacks.clear()
 
@@ -203,8 +212,8 @@ def msg_to_json(msg: EventMsg) -> str:
 def msg_to_dict(msg: EventMsg) -> dict:
     msg_dict = dict()
     try:
-        msg_dict = msg.to_dict(casing=betterproto.Casing.SNAKE, include_default_values=True)  # type: ignore
-    except AttributeError as exc:
+        msg_dict = message_to_dict(msg)  # type: ignore
+    except (AttributeError, TypeError) as exc:
         event_type = type(msg).__name__
         raise Exception(f"type {event_type} is not serializable. {str(exc)}")
     # We don't want an empty NodeInfo in output
@@ -0,0 +1,92 @@
+"""Convert event messages to dictionaries without betterproto's generic
+`Message.to_dict`.
+
+The output matches `to_dict(casing=Casing.SNAKE, include_default_values=True)`,
+but the metadata of every field (its output name and how to convert its value)
+is worked out once per message class, instead of for every field of every
+message.
+"""
+from base64 import b64encode
+from datetime import datetime, timedelta
+import dataclasses
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+import betterproto
+
+# a converter takes the value of a field and returns its dict representation
+Converter = Callable[[Any], Any]
+FieldPlan = List[Tuple[str, str, Converter]]
+
+_plans: Dict[Type, FieldPlan] = {}
+
+
+def message_to_dict(message: betterproto.Message) -> Dict[str, Any]:
+    plan = _plans.get(type(message))
+    if plan is None:
+        plan = _plans[type(message)] = _build_plan(message)
+    return {out_name: convert(getattr(message, name)) for name, out_name, convert in plan}
+
+
+def _build_plan(message: betterproto.Message) -> FieldPlan:
+    plan: FieldPlan = []
+    for field in dataclasses.fields(message):
+        meta = betterproto.FieldMetadata.get(field)
+        out_name = betterproto.Casing.SNAKE(field.name).rstrip("_")  # type: ignore
+        plan.append((field.name, out_name, _converter(message, field.name, meta)))
+    return plan
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _convert_message(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return betterproto._Timestamp.timestamp_to_json(value)
+    elif isinstance(value, timedelta):
+        return betterproto._Duration.delta_to_json(value)
+    elif isinstance(value, list):
+        return [message_to_dict(item) for item in value]
+    else:
+        return message_to_dict(value)
+
+
+def _convert_map(value: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {k: message_to_dict(v) if hasattr(v, "to_dict") else v for k, v in value.items()}
+
+
+def _convert_int64(value: Any) -> Any:
+    if isinstance(value, list):
+        return [str(n) for n in value]
+    return str(value)
+
+
+def _convert_bytes(value: Any) -> Any:
+    if isinstance(value, list):
+        return [b64encode(b).decode("utf8") for b in value]
+    return b64encode(value).decode("utf8")
+
+
+def _enum_converter(enum_values: List[Any]) -> Converter:
+    def convert(value: Any) -> Any:
+        if isinstance(value, list):
+            return [enum_values[e].name for e in value]
+        return enum_values[value].name
+
+    return convert
+
+
+def _converter(message: betterproto.Message, name: str, meta: Any) -> Converter:
+    if meta.proto_type == "message":
+        # wrapped scalars are output as they are
+        return _identity if meta.wraps else _convert_message
+    elif meta.proto_type == "map":
+        return _convert_map
+    elif meta.proto_type in betterproto.INT_64_TYPES:
+        return _convert_int64
+    elif meta.proto_type == betterproto.TYPE_BYTES:
+        return _convert_bytes
+    elif meta.proto_type == betterproto.TYPE_ENUM:
+        return _enum_converter(list(message._betterproto.cls_by_field[name]))
+    else:
+        return _identity
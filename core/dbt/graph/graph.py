@@ -1,4 +1,4 @@
-from typing import Set, Iterable, Iterator, Optional, NewType
+from typing import Set, Iterable, Iterator, Mapping, Optional, NewType
 from itertools import product
 import networkx as nx  # type: ignore
 
@@ -39,6 +39,41 @@ class Graph:
             raise DbtInternalError(f"Node {node} not found in the graph!")
         return {child for _, child in nx.bfs_edges(self.graph, node, depth_limit=max_depth)}
 
+    def _reachable(
+        self,
+        selected: Set[UniqueId],
+        adjacency: Mapping[UniqueId, Iterable[UniqueId]],
+        max_depth: Optional[int],
+    ) -> Set[UniqueId]:
+        """Returns the nodes that are at most `max_depth` steps from any of the
+        selected nodes along `adjacency`, visiting each node at most once. A
+        selected node is only included if another selected node reaches it,
+        the same as taking the union of a breadth-first search from each one.
+        Like networkx's depth_limit, a `max_depth` below 1 (e.g. "model+0")
+        still includes the direct neighbors.
+        """
+        for node in selected:
+            if not self.graph.has_node(node):
+                raise DbtInternalError(f"Node {node} not found in the graph!")
+        if max_depth is not None:
+            max_depth = max(max_depth, 1)
+        reached: Set[UniqueId] = set()
+        frontier: Iterable[UniqueId] = selected
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbor in adjacency[node]:
+                    if neighbor not in reached:
+                        reached.add(neighbor)
+                        # selected nodes were already expanded from the start,
+                        # at a smaller depth
+                        if neighbor not in selected:
+                            next_frontier.append(neighbor)
+            frontier = next_frontier
+        return reached
+
     def select_childrens_parents(self, selected: Set[UniqueId]) -> Set[UniqueId]:
         ancestors_for = self.select_children(selected) | selected
         return self.select_parents(ancestors_for) | ancestors_for
@@ -46,18 +81,12 @@ class Graph:
     def select_children(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        descendants: Set[UniqueId] = set()
-        for node in selected:
-            descendants.update(self.descendants(node, max_depth))
-        return descendants
+        return self._reachable(selected, self.graph.succ, max_depth)
 
     def select_parents(
         self, selected: Set[UniqueId], max_depth: Optional[int] = None
     ) -> Set[UniqueId]:
-        ancestors: Set[UniqueId] = set()
-        for node in selected:
-            ancestors.update(self.ancestors(node, max_depth))
-        return ancestors
+        return self._reachable(selected, self.graph.pred, max_depth)
 
     def select_successors(self, selected: Set[UniqueId]) -> Set[UniqueId]:
         successors: Set[UniqueId] = set()
@@ -0,0 +1,216 @@
+"""A cache of selection results, kept in the target directory between
+invocations.
+
+An entry is keyed by everything the selected nodes depend on: the contents of
+the manifest, the selection spec (including its indirect selection modes), the
+selector that filters the selection and, for specs that compare against
+--state, the contents of the state artifacts. A cache hit resolves the
+selection without building or walking the graph.
+"""
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from dbt.clients.system import make_directory
+from dbt.contracts.graph.manifest import Manifest, MANIFEST_SHARDS_DIR_NAME
+from dbt.contracts.state import PreviousState
+from dbt.version import __version__
+
+from .graph import UniqueId
+from .selector_methods import MethodName
+from .selector_spec import BaseSelectionGroup, SelectionCriteria, SelectionSpec
+
+SELECTION_CACHE_DIR_NAME = "selection_cache"
+# the number of entries kept in the cache directory, least recently used first
+MAX_SELECTION_CACHE_ENTRIES = 64
+
+# methods that select based on the --state artifacts rather than the manifest
+STATE_METHODS = frozenset((MethodName.State, MethodName.Result, MethodName.SourceStatus))
+
+STATE_ARTIFACTS = ("manifest.json", "run_results.json", "sources.json")
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def spec_fingerprint(spec: SelectionSpec) -> Any:
+    """A json-serializable representation of everything in the spec that
+    affects which nodes it selects.
+    """
+    if isinstance(spec, SelectionCriteria):
+        return {
+            "method": str(spec.method),
+            "method_arguments": list(spec.method_arguments),
+            "value": str(spec.value),
+            "childrens_parents": spec.childrens_parents,
+            "parents": spec.parents,
+            "parents_depth": spec.parents_depth,
+            "children": spec.children,
+            "children_depth": spec.children_depth,
+            "indirect_selection": str(spec.indirect_selection),
+        }
+    assert isinstance(spec, BaseSelectionGroup)
+    return {
+        "type": type(spec).__name__,
+        "components": [spec_fingerprint(component) for component in spec],
+        "expect_exists": spec.expect_exists,
+        "raw": str(spec.raw),
+        "indirect_selection": str(spec.indirect_selection),
+    }
+
+
+def spec_methods(spec: SelectionSpec) -> Set[str]:
+    if isinstance(spec, SelectionCriteria):
+        return {str(spec.method)}
+    methods: Set[str] = set()
+    for component in spec:
+        methods.update(spec_methods(component))
+    return methods
+
+
+def manifest_fingerprint(manifest: Manifest) -> str:
+    """A hash of the inputs the manifest was parsed from. These are the same
+    inputs that partial parsing checks before reusing a manifest.
+    """
+    state_check = manifest.state_check
+    return _digest(
+        {
+            "dbt_version": __version__,
+            "files": sorted(
+                (file_id, source_file.checksum.name, source_file.checksum.checksum)
+                for file_id, source_file in manifest.files.items()
+            ),
+            "state_check": [
+                state_check.vars_hash.checksum,
+                state_check.project_env_vars_hash.checksum,
+                state_check.profile_env_vars_hash.checksum,
+                state_check.profile_hash.checksum,
+                sorted((k, v.checksum) for k, v in state_check.project_hashes.items()),
+            ],
+            "env_vars": sorted(manifest.env_vars.items()),
+            # nodes that aren't parsed from a file, like inline sql operations
+            "resources": sorted(
+                list(manifest.nodes)
+                + list(manifest.sources)
+                + list(manifest.exposures)
+                + list(manifest.metrics)
+            ),
+        }
+    )
+
+
+def _file_digest(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _artifact_files(directory: str) -> Iterable[str]:
+    if not os.path.isdir(directory):
+        return []
+    files: List[str] = []
+    for name in sorted(os.listdir(directory)):
+        # compressed copies, such as manifest.json.gz, are included
+        if any(name.startswith(artifact) for artifact in STATE_ARTIFACTS):
+            files.append(os.path.join(directory, name))
+    shards = os.path.join(directory, MANIFEST_SHARDS_DIR_NAME)
+    if os.path.isdir(shards):
+        files.extend(os.path.join(shards, name) for name in sorted(os.listdir(shards)))
+    return [path for path in files if os.path.isfile(path)]
+
+
+def state_fingerprint(previous_state: Optional[PreviousState]) -> Optional[str]:
+    """A hash of the contents of the state artifacts, and of the current
+    sources.json that source_status compares them with.
+    """
+    if previous_state is None:
+        return None
+    digests = []
+    for directory in (str(previous_state.path), str(previous_state.current_path)):
+        digests.append(
+            [(os.path.basename(path), _file_digest(path)) for path in _artifact_files(directory)]
+        )
+    return _digest(digests)
+
+
+class SelectionCache:
+    """Selection results stored as a json file per key in the given
+    directory.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def key(
+        self,
+        manifest: Manifest,
+        spec: SelectionSpec,
+        selector: Any,
+        previous_state: Optional[PreviousState],
+    ) -> str:
+        uses_state = bool(spec_methods(spec) & STATE_METHODS)
+        return _digest(
+            {
+                "manifest": manifest_fingerprint(manifest),
+                "spec": spec_fingerprint(spec),
+                "selector": type(selector).__qualname__,
+                "resource_types": sorted(
+                    str(t) for t in getattr(selector, "resource_types", None) or []
+                ),
+                # path and file selectors are relative to the working directory
+                "cwd": os.getcwd(),
+                "state": state_fingerprint(previous_state) if uses_state else None,
+            }
+        )
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        try:
+            with open(path) as fp:
+                entry = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("key") != key:
+            return None
+        try:
+            # used entries are kept the longest when the cache is pruned
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, selected: Iterable[UniqueId], warnings: List[str]) -> None:
+        entry = {"key": key, "selected": sorted(selected), "warnings": warnings}
+        path = self._entry_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            make_directory(self.path)
+            with open(tmp_path, "w") as fp:
+                json.dump(entry, fp)
+            os.replace(tmp_path, path)
+        except OSError:
+            # the cache is only ever an optimization
+            return
+        self.prune()
+
+    def prune(self, keep: int = MAX_SELECTION_CACHE_ENTRIES) -> None:
+        try:
+            entries = [
+                os.path.join(self.path, name)
+                for name in os.listdir(self.path)
+                if name.endswith(".json")
+            ]
+            if len(entries) <= keep:
+                return
+            entries.sort(key=os.path.getmtime, reverse=True)
+            for path in entries[keep:]:
+                os.remove(path)
+        except OSError:
+            pass
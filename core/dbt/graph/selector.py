@@ -2,11 +2,13 @@ from typing import Set, List, Optional, Tuple
 
 from .graph import Graph, UniqueId
 from .queue import GraphQueue
+from .selection_cache import SelectionCache
 from .selector_methods import MethodManager
 from .selector_spec import SelectionCriteria, SelectionSpec, IndirectSelection
 
 from dbt.events.functions import fire_event, warn_or_error
-from dbt.events.types import SelectorReportInvalidSelector, NoNodesForSelectionCriteria
+from dbt.events.base_types import EventLevel
+from dbt.events.types import Note, SelectorReportInvalidSelector, NoNodesForSelectionCriteria
 from dbt.node_types import NodeType
 from dbt.exceptions import (
     DbtInternalError,
@@ -46,13 +48,26 @@ class NodeSelector(MethodManager):
     ):
         super().__init__(manifest, previous_state)
         self.full_graph = graph
-
-        # build a subgraph containing only non-empty, enabled nodes and enabled
-        # sources.
-        graph_members = {
-            unique_id for unique_id in self.full_graph.nodes() if self._is_graph_member(unique_id)
-        }
-        self.graph = self.full_graph.subgraph(graph_members)
+        self._graph: Optional[Graph] = None
+        # set by tasks when selection results should be cached across invocations
+        self.selection_cache: Optional[SelectionCache] = None
+        # the raw specs that selected nothing and were reported, and whether an
+        # invalid selector was reported, during the current selection
+        self._empty_selections: List[str] = []
+        self._invalid_selector = False
+
+    @property
+    def graph(self) -> Graph:
+        # a subgraph containing only non-empty, enabled nodes and enabled
+        # sources. It's built on first use, which cached selections never get to.
+        if self._graph is None:
+            graph_members = {
+                unique_id
+                for unique_id in self.full_graph.nodes()
+                if self._is_graph_member(unique_id)
+            }
+            self._graph = self.full_graph.subgraph(graph_members)
+        return self._graph
 
     def select_included(
         self,
@@ -85,6 +100,7 @@ class NodeSelector(MethodManager):
                     valid_selectors=valid_selectors, spec_method=spec.method, raw_spec=spec.raw
                 )
             )
+            self._invalid_selector = True
             return set(), set()
 
         if spec.indirect_selection == IndirectSelection.Empty:
@@ -142,6 +158,7 @@ class NodeSelector(MethodManager):
             )
 
             if spec.expect_exists and len(direct_nodes) == 0:
+                self._empty_selections.append(str(spec.raw))
                 warn_or_error(NoNodesForSelectionCriteria(spec_raw=str(spec.raw)))
 
         return direct_nodes, indirect_nodes
@@ -290,11 +307,31 @@ class NodeSelector(MethodManager):
             - selectors can filter the nodes after all of them have been
               selected
         """
+        if self.selection_cache is not None:
+            return self._get_selected_cached(spec, self.selection_cache)
+
         selected_nodes, indirect_only = self.select_nodes(spec)
         filtered_nodes = self.filter_selection(selected_nodes)
 
         return filtered_nodes
 
+    def _get_selected_cached(self, spec: SelectionSpec, cache: SelectionCache) -> Set[UniqueId]:
+        key = cache.key(self.manifest, spec, self, self.previous_state)
+        entry = cache.get(key)
+        if entry is not None:
+            fire_event(Note(msg=f"Using cached selection {key}"), level=EventLevel.DEBUG)
+            for spec_raw in entry["warnings"]:
+                warn_or_error(NoNodesForSelectionCriteria(spec_raw=spec_raw))
+            return {UniqueId(unique_id) for unique_id in entry["selected"]}
+
+        self._empty_selections = []
+        self._invalid_selector = False
+        selected_nodes, indirect_only = self.select_nodes(spec)
+        filtered_nodes = self.filter_selection(selected_nodes)
+        if not self._invalid_selector:
+            cache.put(key, filtered_nodes, self._empty_selections)
+        return filtered_nodes
+
     def get_graph_queue(self, spec: SelectionSpec) -> GraphQueue:
         """Returns a queue over nodes in the graph that tracks progress of
         dependecies.
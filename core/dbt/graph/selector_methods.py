@@ -2,13 +2,36 @@ import abc
 from fnmatch import fnmatch
 from itertools import chain
 from pathlib import Path
-from typing import Set, List, Dict, Iterator, Tuple, Any, Union, Type, Optional, Callable
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from dbt.dataclass_schema import StrEnum
 
 from .graph import UniqueId
 
-from dbt.contracts.graph.manifest import Manifest, WritableManifest
+from dbt.contracts.graph.fingerprints import (
+    FINGERPRINTS_VERSION,
+    FingerprintBuilder,
+    is_unchanged,
+)
+from dbt.contracts.graph.manifest import (
+    Manifest,
+    SelectorLookup,
+    WritableManifest,
+    path_parts,
+)
 from dbt.contracts.graph.nodes import (
     SingularTestNode,
     Exposure,
@@ -18,7 +41,7 @@ from dbt.contracts.graph.nodes import (
     ResultNode,
     ManifestNode,
 )
-from dbt.contracts.state import PreviousState
+from dbt.contracts.state import PreviousState, macro_checksum
 from dbt.exceptions import (
     DbtInternalError,
     DbtRuntimeError,
@@ -168,6 +191,25 @@ class SelectorMethod(metaclass=abc.ABCMeta):
             self.metric_nodes(included_nodes),
         )
 
+    def test_nodes(self, included_nodes: Set[UniqueId]) -> Iterator[Tuple[UniqueId, ManifestNode]]:
+        tests = self.lookup.resource_types.get(NodeType.Test, set())
+        for unique_id in included_nodes & tests:
+            yield unique_id, self.manifest.nodes[unique_id]
+
+    @property
+    def lookup(self) -> SelectorLookup:
+        return self.manifest.selector_lookup
+
+    @staticmethod
+    def matching_postings(
+        postings: Mapping[str, AbstractSet[str]], selector: str
+    ) -> Iterator[AbstractSet[str]]:
+        # there are far fewer distinct tags, packages, etc. than resources, so
+        # matching the selector against each of them is cheap
+        for key, unique_ids in postings.items():
+            if fnmatch(key, selector):
+                yield unique_ids
+
     @abc.abstractmethod
     def search(
         self,
@@ -200,26 +242,36 @@ class QualifiedNameSelectorMethod(SelectorMethod):
 
         :param str selector: The selector or node name
         """
-        parsed_nodes = list(self.parsed_nodes(included_nodes))
-        for node, real_node in parsed_nodes:
-            if self.node_is_match(selector, real_node.fqn):
+        # a node can only match if its fqn, with or without its package, starts
+        # with the parts of the selector before any wildcard, or if its name is
+        # the selector
+        prefix = []
+        for part in selector.split("."):
+            if any(wildcard in part for wildcard in ("*", "?", "[", "]")):
+                break
+            prefix.append(part)
+        lookup = self.lookup
+        candidates = (
+            lookup.fqns.find(prefix)
+            | lookup.unscoped_fqns.find(prefix)
+            | lookup.fqn_leaves.get(selector, set())
+        )
+        for node in included_nodes & candidates:
+            if self.node_is_match(selector, self.manifest.nodes[node].fqn):
                 yield node
 
 
 class TagSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included that have the specified tag"""
-        for node, real_node in self.all_nodes(included_nodes):
-            if any(fnmatch(tag, selector) for tag in real_node.tags):
-                yield node
+        selected = set().union(*self.matching_postings(self.lookup.tags, selector))
+        yield from included_nodes & selected
 
 
 class GroupSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """yields nodes from included in the specified group"""
-        for node, real_node in self.groupable_nodes(included_nodes):
-            if selector == real_node.config.get("group"):
-                yield node
+        yield from included_nodes & self.lookup.groups.get(selector, set())
 
 
 class SourceSelectorMethod(SelectorMethod):
@@ -308,28 +360,25 @@ class PathSelectorMethod(SelectorMethod):
         # use '.' and not 'root' for easy comparison
         root = Path.cwd()
         paths = set(p.relative_to(root) for p in root.glob(selector))
-        for node, real_node in self.all_nodes(included_nodes):
-            ofp = Path(real_node.original_file_path)
-            if ofp in paths:
-                yield node
-            elif any(parent in paths for parent in ofp.parents):
-                yield node
+        # a node matches a path if its file is the path or is under it
+        selected: Set[str] = set()
+        for path in paths:
+            selected.update(self.lookup.paths.find(path_parts(str(path))))
+        yield from included_nodes & selected
 
 
 class FileSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that match the given file name."""
-        for node, real_node in self.all_nodes(included_nodes):
-            if fnmatch(Path(real_node.original_file_path).name, selector):
-                yield node
+        selected = set().union(*self.matching_postings(self.lookup.file_names, selector))
+        yield from included_nodes & selected
 
 
 class PackageSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         """Yields nodes from included that have the specified package"""
-        for node, real_node in self.all_nodes(included_nodes):
-            if fnmatch(real_node.package_name, selector):
-                yield node
+        selected = set().union(*self.matching_postings(self.lookup.packages, selector))
+        yield from included_nodes & selected
 
 
 def _getattr_descend(obj: Any, attrs: List[str]) -> Any:
@@ -356,7 +405,78 @@ class CaseInsensitive(str):
             return self.upper() == other
 
 
+def _config_value_matches(selector: Any, value: Any) -> bool:
+    if isinstance(value, list):
+        return (
+            (selector in value)
+            or (CaseInsensitive(selector) == "true" and True in value)
+            or (CaseInsensitive(selector) == "false" and False in value)
+        )
+    else:
+        return (
+            (selector == value)
+            or (CaseInsensitive(selector) == "true" and value is True)
+            or (CaseInsensitive(selector) == "false")
+            and value is False
+        )
+
+
+class ConfigValues:
+    """The value of one config of each configurable node that has it, with the
+    nodes by each value, or each item of a list value.
+    """
+
+    def __init__(self, values: Dict[UniqueId, Any]) -> None:
+        self.values = values
+        self.postings: Dict[Any, Set[UniqueId]] = {}
+        # nodes with values that can't be looked up
+        self.unhashable: Set[UniqueId] = set()
+        for unique_id, value in values.items():
+            for item in value if isinstance(value, list) else [value]:
+                try:
+                    self.postings.setdefault(item, set()).add(unique_id)
+                except TypeError:
+                    self.unhashable.add(unique_id)
+
+    def candidates(self, selector: Any) -> AbstractSet[UniqueId]:
+        """The nodes that may match the selector: every node whose value, or an
+        item of it, is equal to the selector or is a boolean it stands for.
+        """
+        if isinstance(selector, CaseInsensitive):
+            return self.values.keys()
+        try:
+            candidates = set(self.postings.get(selector, ()))
+        except TypeError:
+            return self.values.keys()
+        if CaseInsensitive(selector) == "true":
+            candidates.update(self.postings.get(True, ()))
+        elif CaseInsensitive(selector) == "false":
+            candidates.update(self.postings.get(False, ()))
+        return candidates | self.unhashable
+
+
 class ConfigSelectorMethod(SelectorMethod):
+    def config_values(self) -> ConfigValues:
+        key = tuple(self.arguments)
+        config_values = self.lookup.config_values
+        if key not in config_values:
+            # search sources is kind of useless now source configs only have
+            # 'enabled', which you can't really filter on anyway, but maybe
+            # we'll add more someday, so search them anyway.
+            values: Dict[UniqueId, Any] = {}
+            configurable: Iterator[Tuple[str, ResultNode]] = chain(
+                self.manifest.nodes.items(), self.manifest.sources.items()
+            )
+            for unique_id, real_node in configurable:
+                try:
+                    values[UniqueId(unique_id)] = _getattr_descend(
+                        real_node.config, self.arguments
+                    )
+                except AttributeError:
+                    continue
+            config_values[key] = ConfigValues(values)
+        return config_values[key]
+
     def search(
         self,
         included_nodes: Set[UniqueId],
@@ -368,30 +488,10 @@ class ConfigSelectorMethod(SelectorMethod):
         if parts == ["severity"]:
             selector = CaseInsensitive(selector)
 
-        # search sources is kind of useless now source configs only have
-        # 'enabled', which you can't really filter on anyway, but maybe we'll
-        # add more someday, so search them anyway.
-        for node, real_node in self.configurable_nodes(included_nodes):
-            try:
-                value = _getattr_descend(real_node.config, parts)
-            except AttributeError:
-                continue
-            else:
-                if isinstance(value, list):
-                    if (
-                        (selector in value)
-                        or (CaseInsensitive(selector) == "true" and True in value)
-                        or (CaseInsensitive(selector) == "false" and False in value)
-                    ):
-                        yield node
-                else:
-                    if (
-                        (selector == value)
-                        or (CaseInsensitive(selector) == "true" and value is True)
-                        or (CaseInsensitive(selector) == "false")
-                        and value is False
-                    ):
-                        yield node
+        config_values = self.config_values()
+        for node in included_nodes & config_values.candidates(selector):
+            if _config_value_matches(selector, config_values.values[node]):
+                yield node
 
 
 class ResourceTypeSelectorMethod(SelectorMethod):
@@ -400,15 +500,13 @@ class ResourceTypeSelectorMethod(SelectorMethod):
             resource_type = NodeType(selector)
         except ValueError as exc:
             raise DbtRuntimeError(f'Invalid resource_type selector "{selector}"') from exc
-        for node, real_node in self.parsed_nodes(included_nodes):
-            if real_node.resource_type == resource_type:
-                yield node
+        yield from included_nodes & self.lookup.resource_types.get(resource_type, set())
 
 
 class TestNameSelectorMethod(SelectorMethod):
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
-        for node, real_node in self.parsed_nodes(included_nodes):
-            if real_node.resource_type == NodeType.Test and hasattr(real_node, "test_metadata"):
+        for node, real_node in self.test_nodes(included_nodes):
+            if hasattr(real_node, "test_metadata"):
                 if fnmatch(real_node.test_metadata.name, selector):  # type: ignore[union-attr]
                     yield node
 
@@ -426,7 +524,7 @@ class TestTypeSelectorMethod(SelectorMethod):
                 f'Invalid test type selector {selector}: expected "generic" or ' '"singular"'
             )
 
-        for node, real_node in self.parsed_nodes(included_nodes):
+        for node, real_node in self.test_nodes(included_nodes):
             if isinstance(real_node, search_type):
                 yield node
 
@@ -434,71 +532,62 @@ class TestTypeSelectorMethod(SelectorMethod):
 class StateSelectorMethod(SelectorMethod):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.modified_macros: Optional[List[str]] = None
+        self.modified_macros: Optional[Set[str]] = None
+        self.fingerprint_builder: Optional[FingerprintBuilder] = None
 
     def _macros_modified(self) -> List[str]:
         # we checked in the caller!
-        if self.previous_state is None or self.previous_state.manifest is None:
+        if self.previous_state is None or self.previous_state.index is None:
             raise DbtInternalError("No comparison manifest in _macros_modified")
-        old_macros = self.previous_state.manifest.macros
+        # compare checksums from the state index, so that the old macros don't
+        # have to be deserialized
+        old_macros = {
+            uid: resource.checksum
+            for uid, resource in self.previous_state.index.items()
+            if resource.resource_type == NodeType.Macro
+        }
         new_macros = self.manifest.macros
 
         modified = []
         for uid, macro in new_macros.items():
             if uid in old_macros:
-                old_macro = old_macros[uid]
-                if macro.macro_sql != old_macro.macro_sql:
+                if macro_checksum(macro.macro_sql) != old_macros[uid]:
                     modified.append(uid)
             else:
                 modified.append(uid)
 
-        for uid, macro in old_macros.items():
+        for uid in old_macros:
             if uid not in new_macros:
                 modified.append(uid)
 
         return modified
 
-    def recursively_check_macros_modified(self, node, visited_macros):
-        if not hasattr(node, "depends_on"):
-            return False
-
-        for macro_uid in node.depends_on.macros:
-            if macro_uid in visited_macros:
-                continue
-            visited_macros.append(macro_uid)
-
-            if macro_uid in self.modified_macros:
-                return True
-
-            # this macro hasn't been modified, but depends on other
-            # macros which each need to be tested for modification
-            macro_node = self.manifest.macros[macro_uid]
-            if len(macro_node.depends_on.macros) > 0:
-                upstream_macros_changed = self.recursively_check_macros_modified(
-                    macro_node, visited_macros
-                )
-                if upstream_macros_changed:
-                    return True
-                continue
-
-            # this macro hasn't been modified, but we haven't checked
-            # the other macros the node depends on, so keep looking
-            if len(node.depends_on.macros) > len(visited_macros):
-                continue
-
-        return False
+    def _transitively_modified_macros(self) -> Set[str]:
+        """The macros that were modified, and every macro that calls one of
+        them, directly or through other macros. This is computed in one pass,
+        by following the macro child map from each modified macro, and shared
+        by all the nodes that are checked.
+        """
+        modified = set(self._macros_modified())
+        if not modified:
+            return modified
+        child_map = self.manifest.build_macro_child_map()
+        stack = list(modified)
+        while stack:
+            for child in child_map.get(stack.pop(), []):
+                if child in self.manifest.macros and child not in modified:
+                    modified.add(child)
+                    stack.append(child)
+        return modified
 
     def check_macros_modified(self, node):
-        # check if there are any changes in macros the first time
+        # find the modified macros and their callers the first time
         if self.modified_macros is None:
-            self.modified_macros = self._macros_modified()
+            self.modified_macros = self._transitively_modified_macros()
         # no macros have been modified, skip looping entirely
-        if not self.modified_macros:
+        if not self.modified_macros or not hasattr(node, "depends_on"):
             return False
-        # recursively loop through upstream macros to see if any is modified
-        else:
-            visited_macros = []
-            return self.recursively_check_macros_modified(node, visited_macros)
+        return any(macro_uid in self.modified_macros for macro_uid in node.depends_on.macros)
 
     # TODO check modifed_content and check_modified macro seems a bit redundent
     def check_modified_content(self, old: Optional[SelectorTarget], new: SelectorTarget) -> bool:
@@ -526,6 +615,23 @@ class StateSelectorMethod(SelectorMethod):
     def check_new(self, old: Optional[SelectorTarget], new: SelectorTarget) -> bool:
         return old is None
 
+    def is_unchanged(self, selector: str, unique_id: str, new: SelectorTarget) -> bool:
+        """Whether the fingerprints of the previous manifest prove that the
+        selector doesn't match the node, in which case the previous node doesn't
+        have to be loaded and compared.
+        """
+        assert self.previous_state is not None and self.previous_state.manifest is not None
+        previous = self.previous_state.manifest.fingerprints
+        if previous is None or previous.version != FINGERPRINTS_VERSION:
+            return False
+        old = previous.resources.get(unique_id)
+        if old is None:
+            return False
+        if self.fingerprint_builder is None:
+            self.fingerprint_builder = FingerprintBuilder(self.manifest.macros)
+        fingerprint = self.fingerprint_builder.fingerprint(new)
+        return fingerprint is not None and is_unchanged(selector, old, fingerprint)
+
     def search(self, included_nodes: Set[UniqueId], selector: str) -> Iterator[UniqueId]:
         if self.previous_state is None or self.previous_state.manifest is None:
             raise DbtRuntimeError("Got a state selector method, but no comparison manifest")
@@ -552,7 +658,23 @@ class StateSelectorMethod(SelectorMethod):
 
         manifest: WritableManifest = self.previous_state.manifest
 
+        if selector == "new":
+            # only which resources existed is needed, so none of the previous
+            # resources are deserialized
+            previous_mappings = (
+                manifest.nodes,
+                manifest.sources,
+                manifest.exposures,
+                manifest.metrics,
+            )
+            for node, real_node in self.all_nodes(included_nodes):
+                if not any(node in mapping for mapping in previous_mappings):
+                    yield node
+            return
+
         for node, real_node in self.all_nodes(included_nodes):
+            if self.is_unchanged(selector, node, real_node):
+                continue
             previous_node: Optional[SelectorTarget] = None
             if node in manifest.nodes:
                 previous_node = manifest.nodes[node]
@@ -65,6 +65,23 @@
 {% endmacro %}
 
 
+{#
+  -- LIST GRANTS IN SCHEMA
+  -- Return an agate table of (table_name, grantee, privilege_type) for every relation in a schema,
+  -- filtered the same way as get_show_grant_sql. dbt runs this once per schema before a run,
+  -- so that applying grants does not need to show the grants of each relation separately.
+  -- By default, return none: grants are then shown one relation at a time.
+#}
+
+{% macro list_grants_in_schema(schema_relation) %}
+    {{ return(adapter.dispatch('list_grants_in_schema', 'dbt')(schema_relation)) }}
+{% endmacro %}
+
+{% macro default__list_grants_in_schema(schema_relation) %}
+    {{ return(none) }}
+{% endmacro %}
+
+
 {% macro get_grant_sql(relation, privilege, grantees) %}
     {{ return(adapter.dispatch('get_grant_sql', 'dbt')(relation, privilege, grantees)) }}
 {% endmacro %}
@@ -142,8 +159,11 @@
         {% if should_revoke %}
             {#-- We think previous grants may have carried over --#}
             {#-- Show current grants and calculate diffs --#}
-            {% set current_grants_table = run_query(get_show_grant_sql(relation)) %}
-            {% set current_grants_dict = adapter.standardize_grants_dict(current_grants_table) %}
+            {% set current_grants_dict = adapter.get_cached_grants(relation) %}
+            {% if current_grants_dict is none %}
+                {% set current_grants_table = run_query(get_show_grant_sql(relation)) %}
+                {% set current_grants_dict = adapter.standardize_grants_dict(current_grants_table) %}
+            {% endif %}
             {% set needs_granting = diff_of_two_dicts(grant_config, current_grants_dict) %}
             {% set needs_revoking = diff_of_two_dicts(current_grants_dict, grant_config) %}
             {% if not (needs_granting or needs_revoking) %}
@@ -161,6 +181,7 @@
             {% set dcl_statement_list = revoke_statement_list + grant_statement_list %}
             {% if dcl_statement_list %}
                 {{ call_dcl_statements(dcl_statement_list) }}
+                {% do adapter.invalidate_cached_grants(relation) %}
             {% endif %}
         {% endif %}
     {% endif %}
@@ -14,3 +14,27 @@
   {% endcall %}
   {{ return(load_result('collect_freshness')) }}
 {% endmacro %}
+
+
+{% macro collect_freshness_batch(sources, filter) %}
+  {{ return(adapter.dispatch('collect_freshness_batch', 'dbt')(sources, filter))}}
+{% endmacro %}
+
+{#-- the timestamps are cast to strings, which keep their time zones, so that
+      the union works whatever the types of the loaded_at_fields are --#}
+{% macro default__collect_freshness_batch(sources, filter) %}
+  {% call statement('collect_freshness_batch', fetch_result=True, auto_begin=False) -%}
+    {% for source, loaded_at_field in sources %}
+    select
+      {{ loop.index0 }} as source_index,
+      cast(max({{ loaded_at_field }}) as {{ type_string() }}) as max_loaded_at,
+      cast({{ current_timestamp() }} as {{ type_string() }}) as snapshotted_at
+    from {{ source }}
+    {% if filter %}
+    where {{ filter }}
+    {% endif %}
+    {% if not loop.last %}union all{% endif %}
+    {% endfor %}
+  {% endcall %}
+  {{ return(load_result('collect_freshness_batch')) }}
+{% endmacro %}
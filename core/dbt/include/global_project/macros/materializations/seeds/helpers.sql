@@ -73,6 +73,16 @@
 {% endmacro %}
 
 
+{% macro get_seed_sample_size(model) -%}
+  {{ return(adapter.dispatch('get_seed_sample_size', 'dbt')(model)) }}
+{%- endmacro %}
+
+{% macro default__get_seed_sample_size(model) %}
+  {#-- none: load the whole file with load_agate_table --#}
+  {{ return(none) }}
+{% endmacro %}
+
+
 {% macro get_seed_column_quoted_csv(model, column_names) %}
   {%- set quote_seed_column = model['config'].get('quote_columns', None) -%}
     {% set quoted = [] %}
@@ -9,7 +9,7 @@
   {%- set exists_as_view = (old_relation is not none and old_relation.is_view) -%}
 
   {%- set grant_config = config.get('grants') -%}
-  {%- set agate_table = load_agate_table() -%}
+  {%- set agate_table = load_agate_table(sample_size=get_seed_sample_size(model)) -%}
   -- grab current tables grants config for comparision later on
 
   {%- do store_result('agate_table', response='OK', agate_table=agate_table) -%}
@@ -30,8 +30,11 @@
   {% endif %}
 
   {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set rows_affected = (agate_table.rows | length) %}
   {% set sql = load_csv_rows(model, agate_table) %}
+  {% set rows_affected = agate_table.original_row_count %}
+  {% if rows_affected is none %}
+    {% set rows_affected = (agate_table.rows | length) %}
+  {% endif %}
 
   {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
     {{ get_csv_sql(create_table_sql, sql) }};
@@ -1,8 +1,8 @@
-from copy import deepcopy
 from dataclasses import dataclass
-from dataclasses import field
+from dataclasses import field, fields
 from datetime import datetime
 import os
+import threading
 import traceback
 from typing import Dict, Optional, Mapping, Callable, Any, List, Type, Union, Tuple, Set
 from itertools import chain
@@ -38,11 +38,18 @@ from dbt.events.types import (
 )
 from dbt.logger import DbtProcessState
 from dbt.node_types import NodeType, AccessType
-from dbt.clients.jinja import get_rendered, MacroStack
+from dbt.clients.jinja import MacroStack
 from dbt.clients.jinja_static import statically_extract_macro_calls
-from dbt.clients.system import make_directory, path_exists, read_json, write_file
+from dbt.clients.system import (
+    make_directory,
+    path_exists,
+    read_json,
+    remove_compressed_files,
+    rmdir,
+    write_file,
+)
 from dbt.config import Project, RuntimeConfig
-from dbt.context.docs import generate_runtime_docs_context
+from dbt.context.docs import DocsRenderer
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.configured import generate_macro_context
 from dbt.context.providers import ParseProvider
@@ -58,8 +65,14 @@ from dbt.contracts.graph.manifest import (
     Manifest,
     Disabled,
     MacroManifest,
+    MaybeMetricNode,
+    MaybeNonSource,
+    MaybeParsedSource,
     ManifestStateCheck,
     ParsingInfo,
+    WritableManifest,
+    MANIFEST_SHARDS_DIR_NAME,
+    MANIFEST_SHARDS_INDEX_FILE_NAME,
 )
 from dbt.contracts.graph.nodes import (
     SourceDefinition,
@@ -139,6 +152,10 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     load_macros_elapsed: Optional[float] = None
     parse_project_elapsed: Optional[float] = None
     patch_sources_elapsed: Optional[float] = None
+    process_sources_elapsed: Optional[float] = None
+    process_refs_elapsed: Optional[float] = None
+    process_metrics_elapsed: Optional[float] = None
+    process_docs_elapsed: Optional[float] = None
     process_manifest_elapsed: Optional[float] = None
     load_all_elapsed: Optional[float] = None
     projects: List[ProjectLoaderInfo] = field(default_factory=list)
@@ -414,7 +431,7 @@ class ManifestLoader:
             start_patch = time.perf_counter()
             patcher = SourcePatcher(self.root_project, self.manifest)
             patcher.construct_sources()
-            self.manifest.sources = patcher.sources
+            self.manifest.set_sources(patcher.sources)
             self._perf_info.patch_sources_elapsed = time.perf_counter() - start_patch
 
             # We need to rebuild disabled in order to include disabled sources
@@ -427,10 +444,10 @@ class ManifestLoader:
             # These check the created_at time on the nodes to
             # determine whether they need processing.
             start_process = time.perf_counter()
-            self.process_sources(self.root_project.project_name)
-            self.process_refs(self.root_project.project_name)
+            self.process_depends_on(self.root_project.project_name)
+            start_process_docs = time.perf_counter()
             self.process_docs(self.root_project)
-            self.process_metrics(self.root_project)
+            self._perf_info.process_docs_elapsed = time.perf_counter() - start_process_docs
             self.check_valid_group_config()
 
             # update tracking data
@@ -886,112 +903,71 @@ class ManifestLoader:
             }
         )
 
-    # Takes references in 'refs' array of nodes and exposures, finds the target
-    # node, and updates 'depends_on.nodes' with the unique id
-    def process_refs(self, current_project: str):
+    # Resolves the 'sources', 'refs' and 'metrics' of the nodes, exposures and
+    # metrics parsed in this run in a single pass over the manifest, and adds
+    # the unique ids they resolve to to 'depends_on.nodes'. Each distinct
+    # reference is only looked up once.
+    def process_depends_on(self, current_project: str):
+        resolver = ReferenceResolver(self.manifest, current_project)
+        elapsed = {"sources": 0.0, "refs": 0.0, "metrics": 0.0}
+
+        def process(phase: str, process_for_node: Callable[..., None], node) -> None:
+            start = time.perf_counter()
+            process_for_node(self.manifest, current_project, node, resolver)
+            elapsed[phase] += time.perf_counter() - start
+
         for node in self.manifest.nodes.values():
             if node.created_at < self.started_at:
                 continue
-            _process_refs_for_node(self.manifest, current_project, node)
+            if node.resource_type != NodeType.Source:
+                assert not isinstance(node, SourceDefinition)
+                process("sources", _process_sources_for_node, node)
+            process("refs", _process_refs_for_node, node)
+            process("metrics", _process_metrics_for_node, node)
         for exposure in self.manifest.exposures.values():
             if exposure.created_at < self.started_at:
                 continue
-            _process_refs_for_exposure(self.manifest, current_project, exposure)
-        for metric in self.manifest.metrics.values():
-            if metric.created_at < self.started_at:
-                continue
-            _process_refs_for_metric(self.manifest, current_project, metric)
-
-    # Takes references in 'metrics' array of nodes and exposures, finds the target
-    # node, and updates 'depends_on.nodes' with the unique id
-    def process_metrics(self, config: RuntimeConfig):
-        current_project = config.project_name
-        for node in self.manifest.nodes.values():
-            if node.created_at < self.started_at:
-                continue
-            _process_metrics_for_node(self.manifest, current_project, node)
+            process("sources", _process_sources_for_exposure, exposure)
+            process("refs", _process_refs_for_exposure, exposure)
+            process("metrics", _process_metrics_for_node, exposure)
         for metric in self.manifest.metrics.values():
             # TODO: Can we do this if the metric is derived & depends on
             # some other metric for its definition? Maybe....
             if metric.created_at < self.started_at:
                 continue
-            _process_metrics_for_node(self.manifest, current_project, metric)
-        for exposure in self.manifest.exposures.values():
-            if exposure.created_at < self.started_at:
-                continue
-            _process_metrics_for_node(self.manifest, current_project, exposure)
+            process("refs", _process_refs_for_metric, metric)
+            process("metrics", _process_metrics_for_node, metric)
+
+        self._perf_info.process_sources_elapsed = elapsed["sources"]
+        self._perf_info.process_refs_elapsed = elapsed["refs"]
+        self._perf_info.process_metrics_elapsed = elapsed["metrics"]
 
     # nodes: node and column descriptions
     # sources: source and table descriptions, column descriptions
     # macros: macro argument descriptions
     # exposures: exposure descriptions
     def process_docs(self, config: RuntimeConfig):
+        renderer = DocsRenderer(config, self.manifest)
         for node in self.manifest.nodes.values():
             if node.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                node,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_node(ctx, node)
+            _process_docs_for_node(renderer, node)
         for source in self.manifest.sources.values():
             if source.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                source,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_source(ctx, source)
+            _process_docs_for_source(renderer, source)
         for macro in self.manifest.macros.values():
             if macro.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                macro,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_macro(ctx, macro)
+            _process_docs_for_macro(renderer, macro)
         for exposure in self.manifest.exposures.values():
             if exposure.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                exposure,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_exposure(ctx, exposure)
+            _process_docs_for_exposure(renderer, exposure)
         for metric in self.manifest.metrics.values():
             if metric.created_at < self.started_at:
                 continue
-            ctx = generate_runtime_docs_context(
-                config,
-                metric,
-                self.manifest,
-                config.project_name,
-            )
-            _process_docs_for_metrics(ctx, metric)
-
-    # Loops through all nodes and exposures, for each element in
-    # 'sources' array finds the source node and updates the
-    # 'depends_on.nodes' array with the unique id
-    def process_sources(self, current_project: str):
-        for node in self.manifest.nodes.values():
-            if node.resource_type == NodeType.Source:
-                continue
-            assert not isinstance(node, SourceDefinition)
-            if node.created_at < self.started_at:
-                continue
-            _process_sources_for_node(self.manifest, current_project, node)
-        for exposure in self.manifest.exposures.values():
-            if exposure.created_at < self.started_at:
-                continue
-            _process_sources_for_exposure(self.manifest, current_project, exposure)
+            _process_docs_for_metrics(renderer, metric)
 
     def process_nodes(self):
         # make sure the nodes are in the manifest.nodes or the disabled dict,
@@ -1002,9 +978,11 @@ class ManifestLoader:
                 disabled_nodes.append(node.unique_id)
                 self.manifest.add_disabled_nofile(node)
         for unique_id in disabled_nodes:
-            self.manifest.nodes.pop(unique_id)
+            self.manifest.remove_node(unique_id)
 
-        disabled_copy = deepcopy(self.manifest.disabled)
+        # the lists are copied so entries can be removed while iterating, the
+        # nodes themselves are moved to the manifest and don't need copies
+        disabled_copy = {k: list(v) for k, v in self.manifest.disabled.items()}
         for disabled in disabled_copy.values():
             for node in disabled:
                 if node.config.enabled:
@@ -1149,50 +1127,111 @@ DocsContextCallback = Callable[[ResultNode], Dict[str, Any]]
 
 # node and column descriptions
 def _process_docs_for_node(
-    context: Dict[str, Any],
+    renderer: DocsRenderer,
     node: ManifestNode,
 ):
-    node.description = get_rendered(node.description, context)
+    node.description = renderer.render(node.description, node)
     for column_name, column in node.columns.items():
-        column.description = get_rendered(column.description, context)
+        column.description = renderer.render(column.description, node)
 
 
 # source and table descriptions, column descriptions
 def _process_docs_for_source(
-    context: Dict[str, Any],
+    renderer: DocsRenderer,
     source: SourceDefinition,
 ):
     table_description = source.description
     source_description = source.source_description
-    table_description = get_rendered(table_description, context)
-    source_description = get_rendered(source_description, context)
+    table_description = renderer.render(table_description, source)
+    source_description = renderer.render(source_description, source)
     source.description = table_description
     source.source_description = source_description
 
     for column in source.columns.values():
         column_desc = column.description
-        column_desc = get_rendered(column_desc, context)
+        column_desc = renderer.render(column_desc, source)
         column.description = column_desc
 
 
 # macro argument descriptions
-def _process_docs_for_macro(context: Dict[str, Any], macro: Macro) -> None:
-    macro.description = get_rendered(macro.description, context)
+def _process_docs_for_macro(renderer: DocsRenderer, macro: Macro) -> None:
+    macro.description = renderer.render(macro.description, macro)
     for arg in macro.arguments:
-        arg.description = get_rendered(arg.description, context)
+        arg.description = renderer.render(arg.description, macro)
 
 
 # exposure descriptions
-def _process_docs_for_exposure(context: Dict[str, Any], exposure: Exposure) -> None:
-    exposure.description = get_rendered(exposure.description, context)
+def _process_docs_for_exposure(renderer: DocsRenderer, exposure: Exposure) -> None:
+    exposure.description = renderer.render(exposure.description, exposure)
+
 
+def _process_docs_for_metrics(renderer: DocsRenderer, metric: Metric) -> None:
+    metric.description = renderer.render(metric.description, metric)
+
+
+class ReferenceResolver:
+    """Resolves the refs, sources and metrics of the resources in a manifest,
+    looking up each distinct reference only once. The manifest's resources
+    mustn't be added, removed or enabled while it's in use.
+    """
+
+    def __init__(self, manifest: Manifest, current_project: str) -> None:
+        self.manifest = manifest
+        self.current_project = current_project
+        self._refs: Dict[Tuple[str, Optional[str], Optional[str]], MaybeNonSource] = {}
+        self._sources: Dict[Tuple[str, str, str], MaybeParsedSource] = {}
+        self._metrics: Dict[Tuple[str, Optional[str], Optional[str]], MaybeMetricNode] = {}
+
+    def resolve_ref(
+        self, target_model_name: str, target_model_package: Optional[str], node_package: str
+    ) -> MaybeNonSource:
+        # the package of the node only matters when the ref has no package
+        key = (
+            target_model_name,
+            target_model_package,
+            None if target_model_package else node_package,
+        )
+        if key not in self._refs:
+            self._refs[key] = self.manifest.resolve_ref(
+                target_model_name, target_model_package, self.current_project, node_package
+            )
+        return self._refs[key]
+
+    def resolve_source(
+        self, target_source_name: str, target_table_name: str, node_package: str
+    ) -> MaybeParsedSource:
+        key = (target_source_name, target_table_name, node_package)
+        if key not in self._sources:
+            self._sources[key] = self.manifest.resolve_source(
+                target_source_name, target_table_name, self.current_project, node_package
+            )
+        return self._sources[key]
 
-def _process_docs_for_metrics(context: Dict[str, Any], metric: Metric) -> None:
-    metric.description = get_rendered(metric.description, context)
+    def resolve_metric(
+        self, target_metric_name: str, target_metric_package: Optional[str], node_package: str
+    ) -> MaybeMetricNode:
+        key = (
+            target_metric_name,
+            target_metric_package,
+            None if target_metric_package else node_package,
+        )
+        if key not in self._metrics:
+            self._metrics[key] = self.manifest.resolve_metric(
+                target_metric_name, target_metric_package, self.current_project, node_package
+            )
+        return self._metrics[key]
 
 
-def _process_refs_for_exposure(manifest: Manifest, current_project: str, exposure: Exposure):
+def _process_refs_for_exposure(
+    manifest: Manifest,
+    current_project: str,
+    exposure: Exposure,
+    resolver: Optional[ReferenceResolver] = None,
+):
     """Given a manifest and exposure in that manifest, process its refs"""
+    if resolver is None:
+        resolver = ReferenceResolver(manifest, current_project)
+    depends_on: List[str] = []
     for ref in exposure.refs:
         target_model: Optional[Union[Disabled, ManifestNode]] = None
         target_model_name: str
@@ -1207,10 +1246,9 @@ def _process_refs_for_exposure(manifest: Manifest, current_project: str, exposur
                 f"Refs should always be 1 or 2 arguments - got {len(ref)}"
             )
 
-        target_model = manifest.resolve_ref(
+        target_model = resolver.resolve_ref(
             target_model_name,
             target_model_package,
-            current_project,
             exposure.package_name,
         )
 
@@ -1241,12 +1279,23 @@ def _process_refs_for_exposure(manifest: Manifest, current_project: str, exposur
 
         target_model_id = target_model.unique_id
 
-        exposure.depends_on.nodes.append(target_model_id)
+        depends_on.append(target_model_id)
+
+    if depends_on:
+        exposure.depends_on.nodes.extend(depends_on)
         manifest.update_exposure(exposure)
 
 
-def _process_refs_for_metric(manifest: Manifest, current_project: str, metric: Metric):
+def _process_refs_for_metric(
+    manifest: Manifest,
+    current_project: str,
+    metric: Metric,
+    resolver: Optional[ReferenceResolver] = None,
+):
     """Given a manifest and a metric in that manifest, process its refs"""
+    if resolver is None:
+        resolver = ReferenceResolver(manifest, current_project)
+    depends_on: List[str] = []
     for ref in metric.refs:
         target_model: Optional[Union[Disabled, ManifestNode]] = None
         target_model_name: str
@@ -1261,10 +1310,9 @@ def _process_refs_for_metric(manifest: Manifest, current_project: str, metric: M
                 f"Refs should always be 1 or 2 arguments - got {len(ref)}"
             )
 
-        target_model = manifest.resolve_ref(
+        target_model = resolver.resolve_ref(
             target_model_name,
             target_model_package,
-            current_project,
             metric.package_name,
         )
 
@@ -1294,7 +1342,10 @@ def _process_refs_for_metric(manifest: Manifest, current_project: str, metric: M
 
         target_model_id = target_model.unique_id
 
-        metric.depends_on.nodes.append(target_model_id)
+        depends_on.append(target_model_id)
+
+    if depends_on:
+        metric.depends_on.nodes.extend(depends_on)
         manifest.update_metric(metric)
 
 
@@ -1302,12 +1353,16 @@ def _process_metrics_for_node(
     manifest: Manifest,
     current_project: str,
     node: Union[ManifestNode, Metric, Exposure],
+    resolver: Optional[ReferenceResolver] = None,
 ):
     """Given a manifest and a node in that manifest, process its metrics"""
 
     if isinstance(node, SeedNode):
         return
 
+    if resolver is None:
+        resolver = ReferenceResolver(manifest, current_project)
+    depends_on: List[str] = []
     for metric in node.metrics:
         target_metric: Optional[Union[Disabled, Metric]] = None
         target_metric_name: str
@@ -1322,10 +1377,9 @@ def _process_metrics_for_node(
                 f"Metric references should always be 1 or 2 arguments - got {len(metric)}"
             )
 
-        target_metric = manifest.resolve_metric(
+        target_metric = resolver.resolve_metric(
             target_metric_name,
             target_metric_package,
-            current_project,
             node.package_name,
         )
 
@@ -1344,15 +1398,27 @@ def _process_metrics_for_node(
 
         target_metric_id = target_metric.unique_id
 
-        node.depends_on.nodes.append(target_metric_id)
+        depends_on.append(target_metric_id)
+
+    if depends_on:
+        node.depends_on.nodes.extend(depends_on)
+        manifest.update_edges(node)
 
 
-def _process_refs_for_node(manifest: Manifest, current_project: str, node: ManifestNode):
+def _process_refs_for_node(
+    manifest: Manifest,
+    current_project: str,
+    node: ManifestNode,
+    resolver: Optional[ReferenceResolver] = None,
+):
     """Given a manifest and a node in that manifest, process its refs"""
 
     if isinstance(node, SeedNode):
         return
 
+    if resolver is None:
+        resolver = ReferenceResolver(manifest, current_project)
+    depends_on: List[str] = []
     for ref in node.refs:
         target_model: Optional[Union[Disabled, ManifestNode]] = None
         target_model_name: str
@@ -1367,10 +1433,9 @@ def _process_refs_for_node(manifest: Manifest, current_project: str, node: Manif
                 f"Refs should always be 1 or 2 arguments - got {len(ref)}"
             )
 
-        target_model = manifest.resolve_ref(
+        target_model = resolver.resolve_ref(
             target_model_name,
             target_model_package,
-            current_project,
             node.package_name,
         )
 
@@ -1402,7 +1467,10 @@ def _process_refs_for_node(manifest: Manifest, current_project: str, node: Manif
 
         target_model_id = target_model.unique_id
 
-        node.depends_on.nodes.append(target_model_id)
+        depends_on.append(target_model_id)
+
+    if depends_on:
+        node.depends_on.nodes.extend(depends_on)
         # TODO: I think this is extraneous, node should already be the same
         # as manifest.nodes[node.unique_id] (we're mutating node here, not
         # making a new one)
@@ -1410,13 +1478,20 @@ def _process_refs_for_node(manifest: Manifest, current_project: str, node: Manif
         manifest.update_node(node)
 
 
-def _process_sources_for_exposure(manifest: Manifest, current_project: str, exposure: Exposure):
+def _process_sources_for_exposure(
+    manifest: Manifest,
+    current_project: str,
+    exposure: Exposure,
+    resolver: Optional[ReferenceResolver] = None,
+):
+    if resolver is None:
+        resolver = ReferenceResolver(manifest, current_project)
+    depends_on: List[str] = []
     target_source: Optional[Union[Disabled, SourceDefinition]] = None
     for source_name, table_name in exposure.sources:
-        target_source = manifest.resolve_source(
+        target_source = resolver.resolve_source(
             source_name,
             table_name,
-            current_project,
             exposure.package_name,
         )
         if target_source is None or isinstance(target_source, Disabled):
@@ -1429,17 +1504,27 @@ def _process_sources_for_exposure(manifest: Manifest, current_project: str, expo
             )
             continue
         target_source_id = target_source.unique_id
-        exposure.depends_on.nodes.append(target_source_id)
+        depends_on.append(target_source_id)
+
+    if depends_on:
+        exposure.depends_on.nodes.extend(depends_on)
         manifest.update_exposure(exposure)
 
 
-def _process_sources_for_metric(manifest: Manifest, current_project: str, metric: Metric):
+def _process_sources_for_metric(
+    manifest: Manifest,
+    current_project: str,
+    metric: Metric,
+    resolver: Optional[ReferenceResolver] = None,
+):
+    if resolver is None:
+        resolver = ReferenceResolver(manifest, current_project)
+    depends_on: List[str] = []
     target_source: Optional[Union[Disabled, SourceDefinition]] = None
     for source_name, table_name in metric.sources:
-        target_source = manifest.resolve_source(
+        target_source = resolver.resolve_source(
             source_name,
             table_name,
-            current_project,
             metric.package_name,
         )
         if target_source is None or isinstance(target_source, Disabled):
@@ -1452,21 +1537,30 @@ def _process_sources_for_metric(manifest: Manifest, current_project: str, metric
             )
             continue
         target_source_id = target_source.unique_id
-        metric.depends_on.nodes.append(target_source_id)
-        manifest.update_metric(metric)
+        depends_on.append(target_source_id)
 
+    if depends_on:
+        metric.depends_on.nodes.extend(depends_on)
+        manifest.update_metric(metric)
 
-def _process_sources_for_node(manifest: Manifest, current_project: str, node: ManifestNode):
 
+def _process_sources_for_node(
+    manifest: Manifest,
+    current_project: str,
+    node: ManifestNode,
+    resolver: Optional[ReferenceResolver] = None,
+):
     if isinstance(node, SeedNode):
         return
 
+    if resolver is None:
+        resolver = ReferenceResolver(manifest, current_project)
+    depends_on: List[str] = []
     target_source: Optional[Union[Disabled, SourceDefinition]] = None
     for source_name, table_name in node.sources:
-        target_source = manifest.resolve_source(
+        target_source = resolver.resolve_source(
             source_name,
             table_name,
-            current_project,
             node.package_name,
         )
 
@@ -1481,32 +1575,95 @@ def _process_sources_for_node(manifest: Manifest, current_project: str, node: Ma
             )
             continue
         target_source_id = target_source.unique_id
-        node.depends_on.nodes.append(target_source_id)
+        depends_on.append(target_source_id)
+
+    if depends_on:
+        node.depends_on.nodes.extend(depends_on)
         manifest.update_node(node)
 
 
 # This is called in task.rpc.sql_commands when a "dynamic" node is
 # created in the manifest, in 'add_refs'
 def process_macro(config: RuntimeConfig, manifest: Manifest, macro: Macro) -> None:
-    ctx = generate_runtime_docs_context(
-        config,
-        macro,
-        manifest,
-        config.project_name,
-    )
-    _process_docs_for_macro(ctx, macro)
+    _process_docs_for_macro(DocsRenderer(config, manifest), macro)
 
 
 # This is called in task.rpc.sql_commands when a "dynamic" node is
 # created in the manifest, in 'add_refs'
 def process_node(config: RuntimeConfig, manifest: Manifest, node: ManifestNode):
 
-    _process_sources_for_node(manifest, config.project_name, node)
-    _process_refs_for_node(manifest, config.project_name, node)
-    ctx = generate_runtime_docs_context(config, node, manifest, config.project_name)
-    _process_docs_for_node(ctx, node)
+    resolver = ReferenceResolver(manifest, config.project_name)
+    _process_sources_for_node(manifest, config.project_name, node, resolver)
+    _process_refs_for_node(manifest, config.project_name, node, resolver)
+    _process_docs_for_node(DocsRenderer(config, manifest), node)
+
+
+class ManifestWriteThread(threading.Thread):
+    """Write a manifest from a background thread, keeping any exception so that
+    it can be raised by whoever waits for the write to finish.
+    """
+
+    def __init__(self, writable: WritableManifest, target_path: str) -> None:
+        super().__init__(name="manifest-writer")
+        self.writable = writable
+        self.target_path = target_path
+        self.exc: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            _write_writable_manifest(self.writable, self.target_path)
+        except BaseException as exc:
+            self.exc = exc
+
 
+_manifest_write: Optional[ManifestWriteThread] = None
 
-def write_manifest(manifest: Manifest, target_path: str):
+
+def wait_for_manifest_write() -> None:
+    """Block until a manifest write started with background=True has finished,
+    and raise the exception it failed with, if any.
+    """
+    global _manifest_write
+    write, _manifest_write = _manifest_write, None
+    if write is None:
+        return
+    write.join()
+    if write.exc is not None:
+        raise write.exc
+
+
+def _write_writable_manifest(writable: WritableManifest, target_path: str) -> None:
     path = os.path.join(target_path, MANIFEST_FILE_NAME)
-    manifest.write(path)
+    shards_path = os.path.join(target_path, MANIFEST_SHARDS_DIR_NAME)
+    # only one layout is kept, so that a stale copy in the other can't be read
+    if getattr(get_flags(), "SHARD_MANIFEST", False):
+        writable.write_shards(shards_path)
+        remove_compressed_files(path)
+    else:
+        writable.write(path)
+        if path_exists(os.path.join(shards_path, MANIFEST_SHARDS_INDEX_FILE_NAME)):
+            rmdir(shards_path)
+
+
+def write_manifest(manifest: Manifest, target_path: str, background: bool = False):
+    # never let two writes of the same file overlap
+    wait_for_manifest_write()
+    writable = manifest.writable_manifest()
+    if not background:
+        _write_writable_manifest(writable, target_path)
+        return
+
+    global _manifest_write
+    # Copy the mappings, so that resources added or removed while the manifest
+    # is being written can't break iterating over them. The nodes are compiled
+    # while the manifest is written out, so they're serialized here instead of
+    # in the thread, and it only has to encode and write them.
+    for dataclass_field in fields(writable):
+        value = getattr(writable, dataclass_field.name)
+        if dataclass_field.name == "nodes":
+            value = {unique_id: node.to_dict(omit_none=False) for unique_id, node in value.items()}
+        elif isinstance(value, dict):
+            value = dict(value)
+        setattr(writable, dataclass_field.name, value)
+    _manifest_write = ManifestWriteThread(writable, target_path)
+    _manifest_write.start()
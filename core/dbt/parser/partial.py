@@ -318,7 +318,7 @@ class PartialParsing:
     def remove_node_in_saved(self, source_file, unique_id):
         if unique_id in self.saved_manifest.nodes:
             # delete node in saved
-            node = self.saved_manifest.nodes.pop(unique_id)
+            node = self.saved_manifest.remove_node(unique_id)
         elif (
             source_file.file_id in self.disabled_by_file_id
             and unique_id in self.saved_manifest.disabled
@@ -384,8 +384,7 @@ class PartialParsing:
     # We need to re-parse nodes that reference another removed node
     def schedule_referencing_nodes_for_parsing(self, unique_id):
         # Look at "children", i.e. nodes that reference this node
-        if unique_id in self.saved_manifest.child_map:
-            self.schedule_nodes_for_parsing(self.saved_manifest.child_map[unique_id])
+        self.schedule_nodes_for_parsing(self.saved_manifest.get_children(unique_id))
 
     def schedule_nodes_for_parsing(self, unique_ids):
         for unique_id in unique_ids:
@@ -845,7 +844,7 @@ class PartialParsing:
                 or elem_unique_id in self.saved_manifest.disabled
             ):
                 if elem_unique_id in self.saved_manifest.nodes:
-                    nodes = [self.saved_manifest.nodes.pop(elem_unique_id)]
+                    nodes = [self.saved_manifest.remove_node(elem_unique_id)]
                 else:
                     # The value of disabled items is a list of nodes
                     nodes = self.saved_manifest.disabled.pop(elem_unique_id)
@@ -870,7 +869,7 @@ class PartialParsing:
         tests = schema_file.get_tests(dict_key, name)
         for test_unique_id in tests:
             if test_unique_id in self.saved_manifest.nodes:
-                self.saved_manifest.nodes.pop(test_unique_id)
+                self.saved_manifest.remove_node(test_unique_id)
         schema_file.remove_tests(dict_key, name)
 
     def delete_schema_source(self, schema_file, source_dict):
@@ -884,7 +883,7 @@ class PartialParsing:
             if unique_id in self.saved_manifest.sources:
                 source = self.saved_manifest.sources[unique_id]
                 if source.source_name == source_name:
-                    source = self.saved_manifest.sources.pop(unique_id)
+                    source = self.saved_manifest.remove_source(unique_id)
                     schema_file.sources.remove(unique_id)
                     self.schedule_referencing_nodes_for_parsing(unique_id)
 
@@ -910,7 +909,7 @@ class PartialParsing:
             if unique_id in self.saved_manifest.exposures:
                 exposure = self.saved_manifest.exposures[unique_id]
                 if exposure.name == exposure_name:
-                    self.saved_manifest.exposures.pop(unique_id)
+                    self.saved_manifest.remove_exposure(unique_id)
                     schema_file.exposures.remove(unique_id)
             elif unique_id in self.saved_manifest.disabled:
                 self.delete_disabled(unique_id, schema_file.file_id)
@@ -936,9 +935,8 @@ class PartialParsing:
                 metric = self.saved_manifest.metrics[unique_id]
                 if metric.name == metric_name:
                     # Need to find everything that referenced this metric and schedule for parsing
-                    if unique_id in self.saved_manifest.child_map:
-                        self.schedule_nodes_for_parsing(self.saved_manifest.child_map[unique_id])
-                    self.saved_manifest.metrics.pop(unique_id)
+                    self.schedule_referencing_nodes_for_parsing(unique_id)
+                    self.saved_manifest.remove_metric(unique_id)
                     schema_file.metrics.remove(unique_id)
             elif unique_id in self.saved_manifest.disabled:
                 self.delete_disabled(unique_id, schema_file.file_id)
@@ -1,6 +1,8 @@
 import os
 import threading
 import time
+from dataclasses import dataclass
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
 from .base import BaseRunner
 from .printer import (
@@ -14,24 +16,54 @@ from dbt.contracts.results import (
     PartialSourceFreshnessResult,
     SourceFreshnessResult,
     FreshnessStatus,
+    TimingInfo,
+    collect_timing_info,
 )
+from dbt.adapters.base.impl import FRESHNESS_MACRO_NAME
+from dbt.adapters.factory import get_adapter_type_names
+from dbt.contracts.connection import AdapterResponse
 from dbt.exceptions import DbtRuntimeError, DbtInternalError
 from dbt.events.functions import fire_event
 from dbt.events.types import (
     FreshnessCheckComplete,
     LogStartLine,
     LogFreshnessResult,
+    Note,
 )
+from dbt.events.base_types import EventLevel
+from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.node_types import NodeType
+from dbt.utils import executor
 
 from dbt.graph import ResourceTypeSelector
 from dbt.contracts.graph.nodes import SourceDefinition
 
 
 RESULT_FILE_NAME = "sources.json"
+# the maximum number of sources checked by a single batched freshness query
+FRESHNESS_BATCH_SIZE = 100
+
+
+@dataclass
+class BatchedFreshness:
+    """The freshness of a source that was checked together with the other
+    sources of its batch.
+    """
+
+    adapter_response: AdapterResponse
+    freshness: Dict[str, Any]
+    # the query that checked the whole batch
+    timing: TimingInfo
+    batch_size: int
 
 
 class FreshnessRunner(BaseRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes):
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        # set by the task when the freshness of this source was already
+        # collected by a batched query
+        self.batched_freshness: Optional[BatchedFreshness] = None
+
     def on_skip(self):
         raise DbtRuntimeError("Freshness: nodes cannot be skipped!")
 
@@ -91,8 +123,18 @@ class FreshnessRunner(BaseRunner):
         )
 
     def from_run_result(self, result, start_time, timing_info):
-        result.execution_time = time.time() - start_time
-        result.timing.extend(timing_info)
+        if self.batched_freshness is None:
+            result.execution_time = time.time() - start_time
+            result.timing.extend(timing_info)
+            return result
+        # the time spent on this source can't be told apart from the rest of
+        # its batch, so report the timing of the query they shared
+        batch_timing = self.batched_freshness.timing
+        result.execution_time = (
+            batch_timing.completed_at - batch_timing.started_at
+        ).total_seconds()
+        result.timing.extend(t for t in timing_info if t.name != "execute")
+        result.timing.append(batch_timing)
         return result
 
     def execute(self, compiled_node, manifest):
@@ -104,16 +146,20 @@ class FreshnessRunner(BaseRunner):
                 "Got to execute for source freshness of a source that has no loaded_at_field!"
             )
 
-        relation = self.adapter.Relation.create_from_source(compiled_node)
-        # given a Source, calculate its freshness.
-        with self.adapter.connection_for(compiled_node):
-            self.adapter.clear_transaction()
-            adapter_response, freshness = self.adapter.calculate_freshness(
-                relation,
-                compiled_node.loaded_at_field,
-                compiled_node.freshness.filter,
-                manifest=manifest,
-            )
+        if self.batched_freshness is not None:
+            adapter_response = self.batched_freshness.adapter_response
+            freshness = self.batched_freshness.freshness
+        else:
+            relation = self.adapter.Relation.create_from_source(compiled_node)
+            # given a Source, calculate its freshness.
+            with self.adapter.connection_for(compiled_node):
+                self.adapter.clear_transaction()
+                adapter_response, freshness = self.adapter.calculate_freshness(
+                    relation,
+                    compiled_node.loaded_at_field,
+                    compiled_node.freshness.filter,
+                    manifest=manifest,
+                )
 
         status = compiled_node.freshness.status(freshness["age"])
 
@@ -124,11 +170,17 @@ class FreshnessRunner(BaseRunner):
             timing=[],
             execution_time=0,
             message=None,
-            adapter_response=adapter_response.to_dict(omit_none=True),
+            adapter_response=self._adapter_response_dict(adapter_response),
             failures=None,
             **freshness,
         )
 
+    def _adapter_response_dict(self, adapter_response: AdapterResponse) -> Dict[str, Any]:
+        response = adapter_response.to_dict(omit_none=True)
+        if self.batched_freshness is not None:
+            response["batch_size"] = self.batched_freshness.batch_size
+        return response
+
     def compile(self, manifest):
         if self.node.resource_type != NodeType.Source:
             # should be unreachable...
@@ -147,10 +199,113 @@ class FreshnessSelector(ResourceTypeSelector):
 
 
 class FreshnessTask(GraphRunnableTask):
+    def __init__(self, args, config, manifest):
+        super().__init__(args, config, manifest)
+        self._batched_freshness: Dict[str, BatchedFreshness] = {}
+
     def defer_to_manifest(self, adapter, selected_uids):
         # freshness don't defer
         return
 
+    def _collect_batched_freshness(
+        self, adapter, sources: List[SourceDefinition], filter: Optional[str]
+    ) -> Dict[str, BatchedFreshness]:
+        relations = [
+            (adapter.Relation.create_from_source(source), source.loaded_at_field)
+            for source in sources
+        ]
+        try:
+            adapter.clear_transaction()
+            with collect_timing_info("execute") as timing_info:
+                adapter_response, freshness = adapter.calculate_freshness_batch(
+                    relations, filter, manifest=self.manifest
+                )
+        except Exception as exc:
+            # these sources are checked one by one instead
+            fire_event(
+                Note(msg=f"Batched freshness check failed, falling back to per-source: {exc}"),
+                level=EventLevel.DEBUG,
+            )
+            return {}
+        return {
+            source.unique_id: BatchedFreshness(
+                adapter_response=adapter_response,
+                freshness=source_freshness,
+                timing=timing_info,
+                batch_size=len(sources),
+            )
+            for source, source_freshness in zip(sources, freshness)
+        }
+
+    def _uses_default_collect_freshness(self, adapter) -> bool:
+        """Whether collect_freshness resolves to the implementation in dbt's
+        global project. A batched query stands in for that implementation, so
+        sources are only batched when neither the project, a package nor the
+        adapter overrides it.
+        """
+        if self.manifest is None:
+            raise DbtInternalError("manifest was None in _uses_default_collect_freshness")
+        macro = self.manifest.find_macro_by_name(
+            FRESHNESS_MACRO_NAME, self.config.project_name, None
+        )
+        if macro is None or macro.package_name != GLOBAL_PROJECT_NAME:
+            return False
+        prefixes = get_adapter_type_names(adapter.type()) + ["default"]
+        implementations = {f"{prefix}__{FRESHNESS_MACRO_NAME}" for prefix in prefixes}
+        return [
+            macro.unique_id
+            for macro in self.manifest.macros.values()
+            if macro.name in implementations
+        ] == [f"macro.{GLOBAL_PROJECT_NAME}.default__{FRESHNESS_MACRO_NAME}"]
+
+    def populate_batched_freshness(self, adapter, selected_uids: AbstractSet[str]) -> None:
+        """Check the freshness of selected sources that live in the same
+        schema and share a filter with one query per group (in batches of
+        FRESHNESS_BATCH_SIZE), instead of one query per source.
+        """
+        if self.manifest is None:
+            raise DbtInternalError("manifest was None in populate_batched_freshness")
+        if not self._uses_default_collect_freshness(adapter):
+            return
+
+        groups: Dict[Tuple[Optional[str], str, Optional[str]], List[SourceDefinition]] = {}
+        for unique_id in sorted(selected_uids):
+            source = self.manifest.sources.get(unique_id)
+            if source is None or not source.has_freshness or source.freshness is None:
+                continue
+            key = (source.database, source.schema, source.freshness.filter)
+            groups.setdefault(key, []).append(source)
+
+        with executor(self.config) as tpe:
+            futures = []
+            for (database, schema, filter), sources in groups.items():
+                for start in range(0, len(sources), FRESHNESS_BATCH_SIZE):
+                    batch = sources[start : start + FRESHNESS_BATCH_SIZE]
+                    # a single source is checked by its own runner
+                    if len(batch) < 2:
+                        continue
+                    futures.append(
+                        tpe.submit_connected(
+                            adapter,
+                            f"freshness_{database}.{schema}_{start}",
+                            self._collect_batched_freshness,
+                            adapter,
+                            batch,
+                            filter,
+                        )
+                    )
+            for future in futures:
+                self._batched_freshness.update(future.result())
+
+    def before_run(self, adapter, selected_uids: AbstractSet[str]):
+        super().before_run(adapter, selected_uids)
+        self.populate_batched_freshness(adapter, selected_uids)
+
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        runner.batched_freshness = self._batched_freshness.get(node.unique_id)
+        return runner
+
     def result_path(self):
         if self.args.output:
             return os.path.realpath(self.args.output)
@@ -173,6 +328,10 @@ class FreshnessTask(GraphRunnableTask):
     def get_runner_type(self, _):
         return FreshnessRunner
 
+    def start_run_results_writer(self):
+        # sources.json is not written incrementally
+        pass
+
     def write_result(self, result):
         artifact = FreshnessExecutionResultArtifact.from_result(result)
         artifact.write(self.result_path())
@@ -7,6 +7,7 @@ from dbt.dataclass_schema import ValidationError
 
 from .compile import CompileTask
 
+from dbt.clients.system import find_compressed_file
 from dbt.adapters.factory import get_adapter
 from dbt.contracts.graph.nodes import ResultNode
 from dbt.contracts.graph.manifest import Manifest
@@ -21,8 +22,9 @@ from dbt.contracts.results import (
     StatsDict,
     ColumnMetadata,
     CatalogArtifact,
+    ExecutionLog,
 )
-from dbt.exceptions import DbtInternalError, AmbiguousCatalogMatchError
+from dbt.exceptions import DbtInternalError, DbtRuntimeError, AmbiguousCatalogMatchError
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
 from dbt.events.functions import fire_event
 from dbt.events.types import (
@@ -198,8 +200,82 @@ def get_unique_id_mapping(
     return node_map, source_map
 
 
+def get_changed_unique_ids(
+    previous_catalog: CatalogArtifact, execution_log: Optional[ExecutionLog]
+) -> Optional[Set[str]]:
+    """Return the unique IDs of the nodes that were executed after the
+    previous catalog was generated, according to `execution_log`.
+
+    None means that it can't be known, in which case nothing from the
+    previous catalog should be reused.
+    """
+    if previous_catalog.errors or execution_log is None:
+        return None
+    return execution_log.executed_since(previous_catalog.metadata.generated_at)
+
+
+def get_incremental_catalog_plan(
+    manifest: Manifest, previous_catalog: CatalogArtifact, changed_unique_ids: Set[str]
+) -> Tuple[Set[Tuple[Optional[str], str]], Dict[str, CatalogTable]]:
+    """Split the catalog of the manifest into the schemas that have to be
+    queried again and the node entries that can be reused from the previous
+    catalog.
+
+    A node's previous entry is reused if the node was not executed since the
+    previous catalog and its relation did not move. Sources are not built by
+    dbt, so their schemas are always queried again. Catalog queries are made
+    per schema, so any entry in a schema that is queried again is replaced by
+    the new results.
+    """
+    stale_schemas: Set[Tuple[Optional[str], str]] = set()
+    reusable: Dict[str, CatalogTable] = {}
+    for unique_id, node in manifest.nodes.items():
+        if not node.is_relational or node.is_ephemeral_model:
+            continue
+        key = mapping_key(node)
+        previous_table = previous_catalog.nodes.get(unique_id)
+        if (
+            unique_id in changed_unique_ids
+            or previous_table is None
+            or previous_table.key() != key
+        ):
+            stale_schemas.add((key.database, key.schema))
+        else:
+            reusable[unique_id] = previous_table
+
+    for source in manifest.sources.values():
+        key = mapping_key(source)
+        stale_schemas.add((key.database, key.schema))
+
+    reusable = {
+        unique_id: table
+        for unique_id, table in reusable.items()
+        if (table.key().database, table.key().schema) not in stale_schemas
+    }
+    return stale_schemas, reusable
+
+
 class GenerateTask(CompileTask):
+    def _read_previous_catalog(self) -> Optional[CatalogArtifact]:
+        path, _ = find_compressed_file(os.path.join(self.config.target_path, CATALOG_FILENAME))
+        if not os.path.exists(path):
+            return None
+        try:
+            return CatalogArtifact.read_and_check_versions(path)
+        except DbtRuntimeError:
+            return None
+
     def run(self) -> CatalogArtifact:
+        started_at = datetime.utcnow()
+        previous_catalog: Optional[CatalogArtifact] = None
+        changed_unique_ids: Optional[Set[str]] = None
+        if self.args.incremental_catalog:
+            previous_catalog = self._read_previous_catalog()
+            if previous_catalog is not None:
+                changed_unique_ids = get_changed_unique_ids(
+                    previous_catalog, ExecutionLog.read(self.config.target_path)
+                )
+
         compile_results = None
         if self.args.compile:
             compile_results = CompileTask.run(self)
@@ -227,10 +303,19 @@ class GenerateTask(CompileTask):
         if self.manifest is None:
             raise DbtInternalError("self.manifest was None in run!")
 
+        reused_nodes: Dict[str, CatalogTable] = {}
         adapter = get_adapter(self.config)
         with adapter.connection_named("generate_catalog"):
             fire_event(BuildingCatalog())
-            catalog_table, exceptions = adapter.get_catalog(self.manifest)
+            if previous_catalog is not None and changed_unique_ids is not None:
+                stale_schemas, reused_nodes = get_incremental_catalog_plan(
+                    self.manifest, previous_catalog, changed_unique_ids
+                )
+                catalog_table, exceptions = adapter.get_catalog(
+                    self.manifest, only_schemas=stale_schemas
+                )
+            else:
+                catalog_table, exceptions = adapter.get_catalog(self.manifest)
 
         catalog_data: List[PrimitiveDict] = [
             dict(zip(catalog_table.column_names, map(dbt.utils._coerce_decimal, row)))
@@ -244,6 +329,7 @@ class GenerateTask(CompileTask):
             errors = [str(e) for e in exceptions]
 
         nodes, sources = catalog.make_unique_id_map(self.manifest)
+        nodes = {**reused_nodes, **nodes}
         results = self.get_catalog_results(
             nodes=nodes,
             sources=sources,
@@ -254,6 +340,7 @@ class GenerateTask(CompileTask):
 
         path = os.path.join(self.config.target_path, CATALOG_FILENAME)
         results.write(path)
+        ExecutionLog.restart(self.config.target_path, started_at)
         if self.args.compile:
             write_manifest(self.manifest, self.config.target_path)
 
@@ -57,6 +57,7 @@ class ListTask(GraphRunnableTask):
 
     def _iterate_selected_nodes(self):
         selector = self.get_node_selector()
+        selector.selection_cache = self.get_selection_cache()
         spec = self.get_selection_spec()
         nodes = sorted(selector.get_selected(spec))
         if not nodes:
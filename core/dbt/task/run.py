@@ -19,7 +19,14 @@ from dbt.clients.jinja import MacroGenerator
 from dbt.context.providers import generate_runtime_model_context
 from dbt.contracts.graph.model_config import Hook
 from dbt.contracts.graph.nodes import HookNode, ResultNode
-from dbt.contracts.results import NodeStatus, RunResult, RunStatus, RunningStatus, BaseResult
+from dbt.contracts.results import (
+    BaseResult,
+    ExecutionLog,
+    NodeStatus,
+    RunningStatus,
+    RunResult,
+    RunStatus,
+)
 from dbt.exceptions import (
     CompilationError,
     DbtInternalError,
@@ -47,6 +54,7 @@ from dbt.logger import (
     DbtModelState,
 )
 from dbt.graph import ResourceTypeSelector
+from dbt.flags import get_flags
 from dbt.hooks import get_hook_dict
 from dbt.node_types import NodeType, RunHookType
 
@@ -298,6 +306,12 @@ class RunTask(CompileTask):
     def raise_on_first_error(self):
         return False
 
+    def record_execution(self, selected_uids: AbstractSet[str]) -> None:
+        if get_flags().WRITE_JSON:
+            ExecutionLog.record(self.config.target_path, selected_uids)
+        else:
+            ExecutionLog.invalidate(self.config.target_path)
+
     def get_hook_sql(self, adapter, hook, idx, num_hooks, extra_context):
         compiler = adapter.get_compiler()
         compiled = compiler.compile_node(hook, self.manifest, extra_context)
@@ -433,6 +447,8 @@ class RunTask(CompileTask):
             self.populate_adapter_cache(adapter, required_schemas)
             self.defer_to_manifest(adapter, selected_uids)
             self.safe_run_hooks(adapter, RunHookType.Start, {})
+            # after the start hooks, in case they change any grants
+            adapter.set_grants_cache(self.manifest, selected_uids)
 
     def after_run(self, adapter, results):
         # in on-run-end hooks, provide the value 'database_schemas', which is a
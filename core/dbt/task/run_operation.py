@@ -7,13 +7,14 @@ from .base import ConfiguredTask
 
 import dbt.exceptions
 from dbt.adapters.factory import get_adapter
-from dbt.contracts.results import RunOperationResultsArtifact
+from dbt.contracts.results import ExecutionLog, RunOperationResultsArtifact
 from dbt.events.functions import fire_event
 from dbt.events.types import (
     RunningOperationCaughtError,
     RunningOperationUncaughtError,
     LogDebugStackTrace,
 )
+from dbt.flags import get_flags
 
 
 class RunOperationTask(ConfiguredTask):
@@ -43,6 +44,11 @@ class RunOperationTask(ConfiguredTask):
     def run(self) -> RunOperationResultsArtifact:
         start = datetime.utcnow()
         self.compile_manifest()
+        # the macro could change any relation
+        if get_flags().WRITE_JSON:
+            ExecutionLog.record(self.config.target_path, None)
+        else:
+            ExecutionLog.invalidate(self.config.target_path)
         try:
             self._run_unsafe()
         except dbt.exceptions.Exception as exc:
@@ -38,7 +38,12 @@ from dbt.events.types import (
 )
 from dbt.events.contextvars import log_contextvars
 from dbt.contracts.graph.nodes import SourceDefinition, ResultNode
-from dbt.contracts.results import NodeStatus, RunExecutionResult, RunningStatus
+from dbt.contracts.results import (
+    NodeStatus,
+    RunExecutionResult,
+    RunningStatus,
+    RunResultsWriter,
+)
 from dbt.contracts.state import PreviousState
 from dbt.exceptions import (
     DbtInternalError,
@@ -48,6 +53,7 @@ from dbt.exceptions import (
 )
 
 from dbt.graph import GraphQueue, NodeSelector, SelectionSpec, parse_difference
+from dbt.graph.selection_cache import SELECTION_CACHE_DIR_NAME, SelectionCache
 from dbt.parser.manifest import write_manifest
 import dbt.tracking
 
@@ -71,6 +77,7 @@ class GraphRunnableTask(ConfiguredTask):
         self.run_count: int = 0
         self.num_nodes: int = 0
         self.node_results = []
+        self.run_results_writer: Optional[RunResultsWriter] = None
         self._skipped_children = {}
         self._raise_next_tick = None
         self.previous_state: Optional[PreviousState] = None
@@ -122,8 +129,14 @@ class GraphRunnableTask(ConfiguredTask):
     def defer_to_manifest(self, adapter, selected_uids: AbstractSet[str]):
         raise NotImplementedError(f"defer_to_manifest not implemented for task {type(self)}")
 
+    def get_selection_cache(self) -> Optional[SelectionCache]:
+        if not getattr(get_flags(), "CACHE_SELECTION", False):
+            return None
+        return SelectionCache(os.path.join(self.config.target_path, SELECTION_CACHE_DIR_NAME))
+
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
+        selector.selection_cache = self.get_selection_cache()
         spec = self.get_selection_spec()
         return selector.get_graph_queue(spec)
 
@@ -154,6 +167,12 @@ class GraphRunnableTask(ConfiguredTask):
     def get_runner_type(self, node):
         raise NotImplementedError("Not Implemented")
 
+    def record_execution(self, selected_uids: AbstractSet[str]) -> None:
+        """Record the nodes about to be executed in the execution log, if
+        executing them can change their relations.
+        """
+        pass
+
     def result_path(self):
         return os.path.join(self.config.target_path, RESULT_FILE_NAME)
 
@@ -289,6 +308,8 @@ class GraphRunnableTask(ConfiguredTask):
         is_ephemeral = result.node.is_ephemeral_model
         if not is_ephemeral:
             self.node_results.append(result)
+            if self.run_results_writer is not None:
+                self.run_results_writer.add(result)
 
         node = result.node
 
@@ -410,7 +431,24 @@ class GraphRunnableTask(ConfiguredTask):
 
         return result
 
+    def start_run_results_writer(self):
+        """Write each result to disk as it is handled, so that writing the
+        results at the end of the run doesn't have to serialize them all.
+        """
+        keep_jsonl = bool(getattr(get_flags(), "WRITE_RUN_RESULTS_JSONL", False))
+        self.run_results_writer = RunResultsWriter(self.result_path(), keep_jsonl=keep_jsonl)
+
+    def discard_run_results_writer(self):
+        if self.run_results_writer is not None:
+            self.run_results_writer.discard()
+            self.run_results_writer = None
+
     def write_result(self, result):
+        writer, self.run_results_writer = self.run_results_writer, None
+        if writer is not None:
+            if isinstance(result, RunExecutionResult) and writer.finalize(result):
+                return
+            writer.discard()
         result.write(self.result_path())
 
     def run(self):
@@ -435,7 +473,14 @@ class GraphRunnableTask(ConfiguredTask):
             with TextOnly():
                 fire_event(Formatting(""))
             selected_uids = frozenset(n.unique_id for n in self._flattened_nodes)
-            result = self.execute_with_hooks(selected_uids)
+            self.record_execution(selected_uids)
+            if get_flags().WRITE_JSON:
+                self.start_run_results_writer()
+            try:
+                result = self.execute_with_hooks(selected_uids)
+            except BaseException:
+                self.discard_run_results_writer()
+                raise
 
         # We have other result types here too, including FreshnessResult
         if isinstance(result, RunExecutionResult):
@@ -1,13 +1,56 @@
+import json
 import os
 import shutil
 import socketserver
 import webbrowser
+from http import HTTPStatus
 from http.server import SimpleHTTPRequestHandler
+from typing import Optional
 
 import click
 
+from dbt.clients.system import find_compressed_file, read_json
+from dbt.contracts.graph.manifest import (
+    MANIFEST_SHARDS_DIR_NAME,
+    MANIFEST_SHARDS_INDEX_FILE_NAME,
+    read_manifest_shards,
+)
 from dbt.include.global_project import DOCS_INDEX_FILE_PATH
 from dbt.task.base import ConfiguredTask
+import dbt.utils
+
+
+class ArtifactRequestHandler(SimpleHTTPRequestHandler):
+    """Serve the target directory. The docs site requests manifest.json and
+    catalog.json, so artifacts that were written compressed or sharded are
+    served as the plain json they would otherwise have been.
+    """
+
+    def do_GET(self):
+        body = self._read_artifact()
+        if body is None:
+            return super().do_GET()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_artifact(self) -> Optional[bytes]:
+        path = self.translate_path(self.path)
+        if not path.endswith(".json") or os.path.exists(path):
+            return None
+        shards_path = os.path.join(os.path.dirname(path), MANIFEST_SHARDS_DIR_NAME)
+        found, compression = find_compressed_file(path)
+        if compression is not None:
+            data = read_json(found)
+        elif os.path.basename(path) == "manifest.json" and os.path.exists(
+            os.path.join(shards_path, MANIFEST_SHARDS_INDEX_FILE_NAME)
+        ):
+            data = read_manifest_shards(shards_path)
+        else:
+            return None
+        return json.dumps(data, cls=dbt.utils.JSONEncoder).encode("utf-8")
 
 
 class ServeTask(ConfiguredTask):
@@ -20,7 +63,7 @@ class ServeTask(ConfiguredTask):
         if self.args.browser:
             webbrowser.open_new_tab(f"http://localhost:{port}")
 
-        with socketserver.TCPServer(("", port), SimpleHTTPRequestHandler) as httpd:
+        with socketserver.TCPServer(("", port), ArtifactRequestHandler) as httpd:
             click.echo(f"Serving docs at {port}")
             click.echo(f"To access from your browser, navigate to: http://localhost:{port}")
             click.echo("\n\n")
@@ -1,5 +1,8 @@
 import os
 import platform
+import queue
+import threading
+import time
 import traceback
 import uuid
 from contextlib import contextmanager
@@ -45,6 +48,59 @@ PARTIAL_PARSER = "iglu:com.dbt/partial_parser/jsonschema/1-0-1"
 RUNNABLE_TIMING = "iglu:com.dbt/runnable/jsonschema/1-0-0"
 DBT_INVOCATION_ENV = "DBT_INVOCATION_ENV"
 
+# The most batches of events waiting to be sent. Further batches are dropped.
+MAX_QUEUED_BATCHES = 10
+# The longest flush() waits for queued events to be sent, in seconds. Events
+# which aren't sent by then are dropped when the process exits.
+FLUSH_TIMEOUT = 1.0
+
+
+class BackgroundSender:
+    """Sends batches of events on a daemon thread, so that slow or unreachable
+    collectors never block the invocation.
+    """
+
+    def __init__(self, send, max_batches: int = MAX_QUEUED_BATCHES):
+        self.send = send
+        self.queue: queue.Queue = queue.Queue(maxsize=max_batches)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def put(self, batch) -> None:
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tracking-sender", daemon=True
+                )
+                self._thread.start()
+        try:
+            self.queue.put_nowait(batch)
+        except queue.Full:
+            fire_event(SendEventFailure())
+
+    def _run(self) -> None:
+        while True:
+            batch = self.queue.get()
+            try:
+                self.send(batch)
+            except Exception:
+                fire_event(SendEventFailure())
+            finally:
+                self.queue.task_done()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to `timeout` seconds for every queued batch to be sent.
+        Returns whether they were.
+        """
+        deadline = time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
 
 class TimeoutEmitter(Emitter):
     def __init__(self):
@@ -57,6 +113,18 @@ class TimeoutEmitter(Emitter):
             # don't set this.
             byte_limit=None,
         )
+        self.sender = BackgroundSender(self.send_events)
+
+    def flush(self):
+        """Hand the buffered events to the background sender, instead of
+        sending them before returning.
+        """
+        with self.lock:
+            if self.buffer:
+                self.sender.put(self.buffer)
+            self.buffer = []
+            if self.bytes_queued is not None:
+                self.bytes_queued = 0
 
     @staticmethod
     def handle_failure(num_ok, unsent):
@@ -396,7 +464,11 @@ def track_runnable_timing(options):
 def flush():
     fire_event(FlushEvents())
     try:
-        tracker.flush()
+        # hand the buffer to the background sender, then wait for it, but no
+        # longer than FLUSH_TIMEOUT
+        tracker.flush(asynchronous=True)
+        if not emitter.sender.wait(FLUSH_TIMEOUT):
+            fire_event(FlushEventsFailure())
     except Exception:
         fire_event(FlushEventsFailure())
 
@@ -0,0 +1,74 @@
+{% macro chain_0_0() %}{{ return(adapter.dispatch('chain_0_0')()) }}{% endmacro %}
+{% macro default__chain_0_0() %}{% if false %}{{ chain_1_1() }}{% endif %}{{ chain_0_1() }} + 1{% endmacro %}
+
+{% macro chain_0_1() %}{{ return(adapter.dispatch('chain_0_1')()) }}{% endmacro %}
+{% macro default__chain_0_1() %}{% if false %}{{ chain_1_2() }}{% endif %}{{ chain_0_2() }} + 1{% endmacro %}
+
+{% macro chain_0_2() %}{{ return(adapter.dispatch('chain_0_2')()) }}{% endmacro %}
+{% macro default__chain_0_2() %}{% if false %}{{ chain_1_3() }}{% endif %}{{ chain_0_3() }} + 1{% endmacro %}
+
+{% macro chain_0_3() %}{{ return(adapter.dispatch('chain_0_3')()) }}{% endmacro %}
+{% macro default__chain_0_3() %}{% if false %}{{ chain_1_4() }}{% endif %}{{ chain_0_4() }} + 1{% endmacro %}
+
+{% macro chain_0_4() %}{{ return(adapter.dispatch('chain_0_4')()) }}{% endmacro %}
+{% macro default__chain_0_4() %}{% if false %}{{ chain_1_5() }}{% endif %}{{ chain_0_5() }} + 1{% endmacro %}
+
+{% macro chain_0_5() %}{{ return(adapter.dispatch('chain_0_5')()) }}{% endmacro %}
+{% macro default__chain_0_5() %}{% if false %}{{ chain_1_6() }}{% endif %}{{ chain_0_6() }} + 1{% endmacro %}
+
+{% macro chain_0_6() %}{{ return(adapter.dispatch('chain_0_6')()) }}{% endmacro %}
+{% macro default__chain_0_6() %}{% if false %}{{ chain_1_7() }}{% endif %}{{ chain_0_7() }} + 1{% endmacro %}
+
+{% macro chain_0_7() %}{{ return(adapter.dispatch('chain_0_7')()) }}{% endmacro %}
+{% macro default__chain_0_7() %}{% if false %}{{ chain_1_8() }}{% endif %}{{ chain_0_8() }} + 1{% endmacro %}
+
+{% macro chain_0_8() %}{{ return(adapter.dispatch('chain_0_8')()) }}{% endmacro %}
+{% macro default__chain_0_8() %}{% if false %}{{ chain_1_9() }}{% endif %}{{ chain_0_9() }} + 1{% endmacro %}
+
+{% macro chain_0_9() %}{{ return(adapter.dispatch('chain_0_9')()) }}{% endmacro %}
+{% macro default__chain_0_9() %}{% if false %}{{ chain_1_10() }}{% endif %}{{ chain_0_10() }} + 1{% endmacro %}
+
+{% macro chain_0_10() %}{{ return(adapter.dispatch('chain_0_10')()) }}{% endmacro %}
+{% macro default__chain_0_10() %}{% if false %}{{ chain_1_11() }}{% endif %}{{ chain_0_11() }} + 1{% endmacro %}
+
+{% macro chain_0_11() %}{{ return(adapter.dispatch('chain_0_11')()) }}{% endmacro %}
+{% macro default__chain_0_11() %}{% if false %}{{ chain_1_12() }}{% endif %}{{ chain_0_12() }} + 1{% endmacro %}
+
+{% macro chain_0_12() %}{{ return(adapter.dispatch('chain_0_12')()) }}{% endmacro %}
+{% macro default__chain_0_12() %}{% if false %}{{ chain_1_13() }}{% endif %}{{ chain_0_13() }} + 1{% endmacro %}
+
+{% macro chain_0_13() %}{{ return(adapter.dispatch('chain_0_13')()) }}{% endmacro %}
+{% macro default__chain_0_13() %}{% if false %}{{ chain_1_14() }}{% endif %}{{ chain_0_14() }} + 1{% endmacro %}
+
+{% macro chain_0_14() %}{{ return(adapter.dispatch('chain_0_14')()) }}{% endmacro %}
+{% macro default__chain_0_14() %}{% if false %}{{ chain_1_15() }}{% endif %}{{ chain_0_15() }} + 1{% endmacro %}
+
+{% macro chain_0_15() %}{{ return(adapter.dispatch('chain_0_15')()) }}{% endmacro %}
+{% macro default__chain_0_15() %}{% if false %}{{ chain_1_16() }}{% endif %}{{ chain_0_16() }} + 1{% endmacro %}
+
+{% macro chain_0_16() %}{{ return(adapter.dispatch('chain_0_16')()) }}{% endmacro %}
+{% macro default__chain_0_16() %}{% if false %}{{ chain_1_17() }}{% endif %}{{ chain_0_17() }} + 1{% endmacro %}
+
+{% macro chain_0_17() %}{{ return(adapter.dispatch('chain_0_17')()) }}{% endmacro %}
+{% macro default__chain_0_17() %}{% if false %}{{ chain_1_18() }}{% endif %}{{ chain_0_18() }} + 1{% endmacro %}
+
+{% macro chain_0_18() %}{{ return(adapter.dispatch('chain_0_18')()) }}{% endmacro %}
+{% macro default__chain_0_18() %}{% if false %}{{ chain_1_19() }}{% endif %}{{ chain_0_19() }} + 1{% endmacro %}
+
+{% macro chain_0_19() %}{{ return(adapter.dispatch('chain_0_19')()) }}{% endmacro %}
+{% macro default__chain_0_19() %}{% if false %}{{ chain_1_20() }}{% endif %}{{ chain_0_20() }} + 1{% endmacro %}
+
+{% macro chain_0_20() %}{{ return(adapter.dispatch('chain_0_20')()) }}{% endmacro %}
+{% macro default__chain_0_20() %}{% if false %}{{ chain_1_21() }}{% endif %}{{ chain_0_21() }} + 1{% endmacro %}
+
+{% macro chain_0_21() %}{{ return(adapter.dispatch('chain_0_21')()) }}{% endmacro %}
+{% macro default__chain_0_21() %}{% if false %}{{ chain_1_22() }}{% endif %}{{ chain_0_22() }} + 1{% endmacro %}
+
+{% macro chain_0_22() %}{{ return(adapter.dispatch('chain_0_22')()) }}{% endmacro %}
+{% macro default__chain_0_22() %}{% if false %}{{ chain_1_23() }}{% endif %}{{ chain_0_23() }} + 1{% endmacro %}
+
+{% macro chain_0_23() %}{{ return(adapter.dispatch('chain_0_23')()) }}{% endmacro %}
+{% macro default__chain_0_23() %}{% if false %}{{ chain_1_24() }}{% endif %}{{ chain_0_24() }} + 1{% endmacro %}
+
+{% macro chain_0_24() %}{{ return(adapter.dispatch('chain_0_24')()) }}{% endmacro %}
+{% macro default__chain_0_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_1_0() %}{{ return(adapter.dispatch('chain_1_0')()) }}{% endmacro %}
+{% macro default__chain_1_0() %}{% if false %}{{ chain_2_1() }}{% endif %}{{ chain_1_1() }} + 1{% endmacro %}
+
+{% macro chain_1_1() %}{{ return(adapter.dispatch('chain_1_1')()) }}{% endmacro %}
+{% macro default__chain_1_1() %}{% if false %}{{ chain_2_2() }}{% endif %}{{ chain_1_2() }} + 1{% endmacro %}
+
+{% macro chain_1_2() %}{{ return(adapter.dispatch('chain_1_2')()) }}{% endmacro %}
+{% macro default__chain_1_2() %}{% if false %}{{ chain_2_3() }}{% endif %}{{ chain_1_3() }} + 1{% endmacro %}
+
+{% macro chain_1_3() %}{{ return(adapter.dispatch('chain_1_3')()) }}{% endmacro %}
+{% macro default__chain_1_3() %}{% if false %}{{ chain_2_4() }}{% endif %}{{ chain_1_4() }} + 1{% endmacro %}
+
+{% macro chain_1_4() %}{{ return(adapter.dispatch('chain_1_4')()) }}{% endmacro %}
+{% macro default__chain_1_4() %}{% if false %}{{ chain_2_5() }}{% endif %}{{ chain_1_5() }} + 1{% endmacro %}
+
+{% macro chain_1_5() %}{{ return(adapter.dispatch('chain_1_5')()) }}{% endmacro %}
+{% macro default__chain_1_5() %}{% if false %}{{ chain_2_6() }}{% endif %}{{ chain_1_6() }} + 1{% endmacro %}
+
+{% macro chain_1_6() %}{{ return(adapter.dispatch('chain_1_6')()) }}{% endmacro %}
+{% macro default__chain_1_6() %}{% if false %}{{ chain_2_7() }}{% endif %}{{ chain_1_7() }} + 1{% endmacro %}
+
+{% macro chain_1_7() %}{{ return(adapter.dispatch('chain_1_7')()) }}{% endmacro %}
+{% macro default__chain_1_7() %}{% if false %}{{ chain_2_8() }}{% endif %}{{ chain_1_8() }} + 1{% endmacro %}
+
+{% macro chain_1_8() %}{{ return(adapter.dispatch('chain_1_8')()) }}{% endmacro %}
+{% macro default__chain_1_8() %}{% if false %}{{ chain_2_9() }}{% endif %}{{ chain_1_9() }} + 1{% endmacro %}
+
+{% macro chain_1_9() %}{{ return(adapter.dispatch('chain_1_9')()) }}{% endmacro %}
+{% macro default__chain_1_9() %}{% if false %}{{ chain_2_10() }}{% endif %}{{ chain_1_10() }} + 1{% endmacro %}
+
+{% macro chain_1_10() %}{{ return(adapter.dispatch('chain_1_10')()) }}{% endmacro %}
+{% macro default__chain_1_10() %}{% if false %}{{ chain_2_11() }}{% endif %}{{ chain_1_11() }} + 1{% endmacro %}
+
+{% macro chain_1_11() %}{{ return(adapter.dispatch('chain_1_11')()) }}{% endmacro %}
+{% macro default__chain_1_11() %}{% if false %}{{ chain_2_12() }}{% endif %}{{ chain_1_12() }} + 1{% endmacro %}
+
+{% macro chain_1_12() %}{{ return(adapter.dispatch('chain_1_12')()) }}{% endmacro %}
+{% macro default__chain_1_12() %}{% if false %}{{ chain_2_13() }}{% endif %}{{ chain_1_13() }} + 1{% endmacro %}
+
+{% macro chain_1_13() %}{{ return(adapter.dispatch('chain_1_13')()) }}{% endmacro %}
+{% macro default__chain_1_13() %}{% if false %}{{ chain_2_14() }}{% endif %}{{ chain_1_14() }} + 1{% endmacro %}
+
+{% macro chain_1_14() %}{{ return(adapter.dispatch('chain_1_14')()) }}{% endmacro %}
+{% macro default__chain_1_14() %}{% if false %}{{ chain_2_15() }}{% endif %}{{ chain_1_15() }} + 1{% endmacro %}
+
+{% macro chain_1_15() %}{{ return(adapter.dispatch('chain_1_15')()) }}{% endmacro %}
+{% macro default__chain_1_15() %}{% if false %}{{ chain_2_16() }}{% endif %}{{ chain_1_16() }} + 1{% endmacro %}
+
+{% macro chain_1_16() %}{{ return(adapter.dispatch('chain_1_16')()) }}{% endmacro %}
+{% macro default__chain_1_16() %}{% if false %}{{ chain_2_17() }}{% endif %}{{ chain_1_17() }} + 1{% endmacro %}
+
+{% macro chain_1_17() %}{{ return(adapter.dispatch('chain_1_17')()) }}{% endmacro %}
+{% macro default__chain_1_17() %}{% if false %}{{ chain_2_18() }}{% endif %}{{ chain_1_18() }} + 1{% endmacro %}
+
+{% macro chain_1_18() %}{{ return(adapter.dispatch('chain_1_18')()) }}{% endmacro %}
+{% macro default__chain_1_18() %}{% if false %}{{ chain_2_19() }}{% endif %}{{ chain_1_19() }} + 1{% endmacro %}
+
+{% macro chain_1_19() %}{{ return(adapter.dispatch('chain_1_19')()) }}{% endmacro %}
+{% macro default__chain_1_19() %}{% if false %}{{ chain_2_20() }}{% endif %}{{ chain_1_20() }} + 1{% endmacro %}
+
+{% macro chain_1_20() %}{{ return(adapter.dispatch('chain_1_20')()) }}{% endmacro %}
+{% macro default__chain_1_20() %}{% if false %}{{ chain_2_21() }}{% endif %}{{ chain_1_21() }} + 1{% endmacro %}
+
+{% macro chain_1_21() %}{{ return(adapter.dispatch('chain_1_21')()) }}{% endmacro %}
+{% macro default__chain_1_21() %}{% if false %}{{ chain_2_22() }}{% endif %}{{ chain_1_22() }} + 1{% endmacro %}
+
+{% macro chain_1_22() %}{{ return(adapter.dispatch('chain_1_22')()) }}{% endmacro %}
+{% macro default__chain_1_22() %}{% if false %}{{ chain_2_23() }}{% endif %}{{ chain_1_23() }} + 1{% endmacro %}
+
+{% macro chain_1_23() %}{{ return(adapter.dispatch('chain_1_23')()) }}{% endmacro %}
+{% macro default__chain_1_23() %}{% if false %}{{ chain_2_24() }}{% endif %}{{ chain_1_24() }} + 1{% endmacro %}
+
+{% macro chain_1_24() %}{{ return(adapter.dispatch('chain_1_24')()) }}{% endmacro %}
+{% macro default__chain_1_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_10_0() %}{{ return(adapter.dispatch('chain_10_0')()) }}{% endmacro %}
+{% macro default__chain_10_0() %}{% if false %}{{ chain_11_1() }}{% endif %}{{ chain_10_1() }} + 1{% endmacro %}
+
+{% macro chain_10_1() %}{{ return(adapter.dispatch('chain_10_1')()) }}{% endmacro %}
+{% macro default__chain_10_1() %}{% if false %}{{ chain_11_2() }}{% endif %}{{ chain_10_2() }} + 1{% endmacro %}
+
+{% macro chain_10_2() %}{{ return(adapter.dispatch('chain_10_2')()) }}{% endmacro %}
+{% macro default__chain_10_2() %}{% if false %}{{ chain_11_3() }}{% endif %}{{ chain_10_3() }} + 1{% endmacro %}
+
+{% macro chain_10_3() %}{{ return(adapter.dispatch('chain_10_3')()) }}{% endmacro %}
+{% macro default__chain_10_3() %}{% if false %}{{ chain_11_4() }}{% endif %}{{ chain_10_4() }} + 1{% endmacro %}
+
+{% macro chain_10_4() %}{{ return(adapter.dispatch('chain_10_4')()) }}{% endmacro %}
+{% macro default__chain_10_4() %}{% if false %}{{ chain_11_5() }}{% endif %}{{ chain_10_5() }} + 1{% endmacro %}
+
+{% macro chain_10_5() %}{{ return(adapter.dispatch('chain_10_5')()) }}{% endmacro %}
+{% macro default__chain_10_5() %}{% if false %}{{ chain_11_6() }}{% endif %}{{ chain_10_6() }} + 1{% endmacro %}
+
+{% macro chain_10_6() %}{{ return(adapter.dispatch('chain_10_6')()) }}{% endmacro %}
+{% macro default__chain_10_6() %}{% if false %}{{ chain_11_7() }}{% endif %}{{ chain_10_7() }} + 1{% endmacro %}
+
+{% macro chain_10_7() %}{{ return(adapter.dispatch('chain_10_7')()) }}{% endmacro %}
+{% macro default__chain_10_7() %}{% if false %}{{ chain_11_8() }}{% endif %}{{ chain_10_8() }} + 1{% endmacro %}
+
+{% macro chain_10_8() %}{{ return(adapter.dispatch('chain_10_8')()) }}{% endmacro %}
+{% macro default__chain_10_8() %}{% if false %}{{ chain_11_9() }}{% endif %}{{ chain_10_9() }} + 1{% endmacro %}
+
+{% macro chain_10_9() %}{{ return(adapter.dispatch('chain_10_9')()) }}{% endmacro %}
+{% macro default__chain_10_9() %}{% if false %}{{ chain_11_10() }}{% endif %}{{ chain_10_10() }} + 1{% endmacro %}
+
+{% macro chain_10_10() %}{{ return(adapter.dispatch('chain_10_10')()) }}{% endmacro %}
+{% macro default__chain_10_10() %}{% if false %}{{ chain_11_11() }}{% endif %}{{ chain_10_11() }} + 1{% endmacro %}
+
+{% macro chain_10_11() %}{{ return(adapter.dispatch('chain_10_11')()) }}{% endmacro %}
+{% macro default__chain_10_11() %}{% if false %}{{ chain_11_12() }}{% endif %}{{ chain_10_12() }} + 1{% endmacro %}
+
+{% macro chain_10_12() %}{{ return(adapter.dispatch('chain_10_12')()) }}{% endmacro %}
+{% macro default__chain_10_12() %}{% if false %}{{ chain_11_13() }}{% endif %}{{ chain_10_13() }} + 1{% endmacro %}
+
+{% macro chain_10_13() %}{{ return(adapter.dispatch('chain_10_13')()) }}{% endmacro %}
+{% macro default__chain_10_13() %}{% if false %}{{ chain_11_14() }}{% endif %}{{ chain_10_14() }} + 1{% endmacro %}
+
+{% macro chain_10_14() %}{{ return(adapter.dispatch('chain_10_14')()) }}{% endmacro %}
+{% macro default__chain_10_14() %}{% if false %}{{ chain_11_15() }}{% endif %}{{ chain_10_15() }} + 1{% endmacro %}
+
+{% macro chain_10_15() %}{{ return(adapter.dispatch('chain_10_15')()) }}{% endmacro %}
+{% macro default__chain_10_15() %}{% if false %}{{ chain_11_16() }}{% endif %}{{ chain_10_16() }} + 1{% endmacro %}
+
+{% macro chain_10_16() %}{{ return(adapter.dispatch('chain_10_16')()) }}{% endmacro %}
+{% macro default__chain_10_16() %}{% if false %}{{ chain_11_17() }}{% endif %}{{ chain_10_17() }} + 1{% endmacro %}
+
+{% macro chain_10_17() %}{{ return(adapter.dispatch('chain_10_17')()) }}{% endmacro %}
+{% macro default__chain_10_17() %}{% if false %}{{ chain_11_18() }}{% endif %}{{ chain_10_18() }} + 1{% endmacro %}
+
+{% macro chain_10_18() %}{{ return(adapter.dispatch('chain_10_18')()) }}{% endmacro %}
+{% macro default__chain_10_18() %}{% if false %}{{ chain_11_19() }}{% endif %}{{ chain_10_19() }} + 1{% endmacro %}
+
+{% macro chain_10_19() %}{{ return(adapter.dispatch('chain_10_19')()) }}{% endmacro %}
+{% macro default__chain_10_19() %}{% if false %}{{ chain_11_20() }}{% endif %}{{ chain_10_20() }} + 1{% endmacro %}
+
+{% macro chain_10_20() %}{{ return(adapter.dispatch('chain_10_20')()) }}{% endmacro %}
+{% macro default__chain_10_20() %}{% if false %}{{ chain_11_21() }}{% endif %}{{ chain_10_21() }} + 1{% endmacro %}
+
+{% macro chain_10_21() %}{{ return(adapter.dispatch('chain_10_21')()) }}{% endmacro %}
+{% macro default__chain_10_21() %}{% if false %}{{ chain_11_22() }}{% endif %}{{ chain_10_22() }} + 1{% endmacro %}
+
+{% macro chain_10_22() %}{{ return(adapter.dispatch('chain_10_22')()) }}{% endmacro %}
+{% macro default__chain_10_22() %}{% if false %}{{ chain_11_23() }}{% endif %}{{ chain_10_23() }} + 1{% endmacro %}
+
+{% macro chain_10_23() %}{{ return(adapter.dispatch('chain_10_23')()) }}{% endmacro %}
+{% macro default__chain_10_23() %}{% if false %}{{ chain_11_24() }}{% endif %}{{ chain_10_24() }} + 1{% endmacro %}
+
+{% macro chain_10_24() %}{{ return(adapter.dispatch('chain_10_24')()) }}{% endmacro %}
+{% macro default__chain_10_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_11_0() %}{{ return(adapter.dispatch('chain_11_0')()) }}{% endmacro %}
+{% macro default__chain_11_0() %}{% if false %}{{ chain_12_1() }}{% endif %}{{ chain_11_1() }} + 1{% endmacro %}
+
+{% macro chain_11_1() %}{{ return(adapter.dispatch('chain_11_1')()) }}{% endmacro %}
+{% macro default__chain_11_1() %}{% if false %}{{ chain_12_2() }}{% endif %}{{ chain_11_2() }} + 1{% endmacro %}
+
+{% macro chain_11_2() %}{{ return(adapter.dispatch('chain_11_2')()) }}{% endmacro %}
+{% macro default__chain_11_2() %}{% if false %}{{ chain_12_3() }}{% endif %}{{ chain_11_3() }} + 1{% endmacro %}
+
+{% macro chain_11_3() %}{{ return(adapter.dispatch('chain_11_3')()) }}{% endmacro %}
+{% macro default__chain_11_3() %}{% if false %}{{ chain_12_4() }}{% endif %}{{ chain_11_4() }} + 1{% endmacro %}
+
+{% macro chain_11_4() %}{{ return(adapter.dispatch('chain_11_4')()) }}{% endmacro %}
+{% macro default__chain_11_4() %}{% if false %}{{ chain_12_5() }}{% endif %}{{ chain_11_5() }} + 1{% endmacro %}
+
+{% macro chain_11_5() %}{{ return(adapter.dispatch('chain_11_5')()) }}{% endmacro %}
+{% macro default__chain_11_5() %}{% if false %}{{ chain_12_6() }}{% endif %}{{ chain_11_6() }} + 1{% endmacro %}
+
+{% macro chain_11_6() %}{{ return(adapter.dispatch('chain_11_6')()) }}{% endmacro %}
+{% macro default__chain_11_6() %}{% if false %}{{ chain_12_7() }}{% endif %}{{ chain_11_7() }} + 1{% endmacro %}
+
+{% macro chain_11_7() %}{{ return(adapter.dispatch('chain_11_7')()) }}{% endmacro %}
+{% macro default__chain_11_7() %}{% if false %}{{ chain_12_8() }}{% endif %}{{ chain_11_8() }} + 1{% endmacro %}
+
+{% macro chain_11_8() %}{{ return(adapter.dispatch('chain_11_8')()) }}{% endmacro %}
+{% macro default__chain_11_8() %}{% if false %}{{ chain_12_9() }}{% endif %}{{ chain_11_9() }} + 1{% endmacro %}
+
+{% macro chain_11_9() %}{{ return(adapter.dispatch('chain_11_9')()) }}{% endmacro %}
+{% macro default__chain_11_9() %}{% if false %}{{ chain_12_10() }}{% endif %}{{ chain_11_10() }} + 1{% endmacro %}
+
+{% macro chain_11_10() %}{{ return(adapter.dispatch('chain_11_10')()) }}{% endmacro %}
+{% macro default__chain_11_10() %}{% if false %}{{ chain_12_11() }}{% endif %}{{ chain_11_11() }} + 1{% endmacro %}
+
+{% macro chain_11_11() %}{{ return(adapter.dispatch('chain_11_11')()) }}{% endmacro %}
+{% macro default__chain_11_11() %}{% if false %}{{ chain_12_12() }}{% endif %}{{ chain_11_12() }} + 1{% endmacro %}
+
+{% macro chain_11_12() %}{{ return(adapter.dispatch('chain_11_12')()) }}{% endmacro %}
+{% macro default__chain_11_12() %}{% if false %}{{ chain_12_13() }}{% endif %}{{ chain_11_13() }} + 1{% endmacro %}
+
+{% macro chain_11_13() %}{{ return(adapter.dispatch('chain_11_13')()) }}{% endmacro %}
+{% macro default__chain_11_13() %}{% if false %}{{ chain_12_14() }}{% endif %}{{ chain_11_14() }} + 1{% endmacro %}
+
+{% macro chain_11_14() %}{{ return(adapter.dispatch('chain_11_14')()) }}{% endmacro %}
+{% macro default__chain_11_14() %}{% if false %}{{ chain_12_15() }}{% endif %}{{ chain_11_15() }} + 1{% endmacro %}
+
+{% macro chain_11_15() %}{{ return(adapter.dispatch('chain_11_15')()) }}{% endmacro %}
+{% macro default__chain_11_15() %}{% if false %}{{ chain_12_16() }}{% endif %}{{ chain_11_16() }} + 1{% endmacro %}
+
+{% macro chain_11_16() %}{{ return(adapter.dispatch('chain_11_16')()) }}{% endmacro %}
+{% macro default__chain_11_16() %}{% if false %}{{ chain_12_17() }}{% endif %}{{ chain_11_17() }} + 1{% endmacro %}
+
+{% macro chain_11_17() %}{{ return(adapter.dispatch('chain_11_17')()) }}{% endmacro %}
+{% macro default__chain_11_17() %}{% if false %}{{ chain_12_18() }}{% endif %}{{ chain_11_18() }} + 1{% endmacro %}
+
+{% macro chain_11_18() %}{{ return(adapter.dispatch('chain_11_18')()) }}{% endmacro %}
+{% macro default__chain_11_18() %}{% if false %}{{ chain_12_19() }}{% endif %}{{ chain_11_19() }} + 1{% endmacro %}
+
+{% macro chain_11_19() %}{{ return(adapter.dispatch('chain_11_19')()) }}{% endmacro %}
+{% macro default__chain_11_19() %}{% if false %}{{ chain_12_20() }}{% endif %}{{ chain_11_20() }} + 1{% endmacro %}
+
+{% macro chain_11_20() %}{{ return(adapter.dispatch('chain_11_20')()) }}{% endmacro %}
+{% macro default__chain_11_20() %}{% if false %}{{ chain_12_21() }}{% endif %}{{ chain_11_21() }} + 1{% endmacro %}
+
+{% macro chain_11_21() %}{{ return(adapter.dispatch('chain_11_21')()) }}{% endmacro %}
+{% macro default__chain_11_21() %}{% if false %}{{ chain_12_22() }}{% endif %}{{ chain_11_22() }} + 1{% endmacro %}
+
+{% macro chain_11_22() %}{{ return(adapter.dispatch('chain_11_22')()) }}{% endmacro %}
+{% macro default__chain_11_22() %}{% if false %}{{ chain_12_23() }}{% endif %}{{ chain_11_23() }} + 1{% endmacro %}
+
+{% macro chain_11_23() %}{{ return(adapter.dispatch('chain_11_23')()) }}{% endmacro %}
+{% macro default__chain_11_23() %}{% if false %}{{ chain_12_24() }}{% endif %}{{ chain_11_24() }} + 1{% endmacro %}
+
+{% macro chain_11_24() %}{{ return(adapter.dispatch('chain_11_24')()) }}{% endmacro %}
+{% macro default__chain_11_24() %}1{% endmacro %}
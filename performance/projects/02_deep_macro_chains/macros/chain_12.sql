@@ -0,0 +1,74 @@
+{% macro chain_12_0() %}{{ return(adapter.dispatch('chain_12_0')()) }}{% endmacro %}
+{% macro default__chain_12_0() %}{% if false %}{{ chain_13_1() }}{% endif %}{{ chain_12_1() }} + 1{% endmacro %}
+
+{% macro chain_12_1() %}{{ return(adapter.dispatch('chain_12_1')()) }}{% endmacro %}
+{% macro default__chain_12_1() %}{% if false %}{{ chain_13_2() }}{% endif %}{{ chain_12_2() }} + 1{% endmacro %}
+
+{% macro chain_12_2() %}{{ return(adapter.dispatch('chain_12_2')()) }}{% endmacro %}
+{% macro default__chain_12_2() %}{% if false %}{{ chain_13_3() }}{% endif %}{{ chain_12_3() }} + 1{% endmacro %}
+
+{% macro chain_12_3() %}{{ return(adapter.dispatch('chain_12_3')()) }}{% endmacro %}
+{% macro default__chain_12_3() %}{% if false %}{{ chain_13_4() }}{% endif %}{{ chain_12_4() }} + 1{% endmacro %}
+
+{% macro chain_12_4() %}{{ return(adapter.dispatch('chain_12_4')()) }}{% endmacro %}
+{% macro default__chain_12_4() %}{% if false %}{{ chain_13_5() }}{% endif %}{{ chain_12_5() }} + 1{% endmacro %}
+
+{% macro chain_12_5() %}{{ return(adapter.dispatch('chain_12_5')()) }}{% endmacro %}
+{% macro default__chain_12_5() %}{% if false %}{{ chain_13_6() }}{% endif %}{{ chain_12_6() }} + 1{% endmacro %}
+
+{% macro chain_12_6() %}{{ return(adapter.dispatch('chain_12_6')()) }}{% endmacro %}
+{% macro default__chain_12_6() %}{% if false %}{{ chain_13_7() }}{% endif %}{{ chain_12_7() }} + 1{% endmacro %}
+
+{% macro chain_12_7() %}{{ return(adapter.dispatch('chain_12_7')()) }}{% endmacro %}
+{% macro default__chain_12_7() %}{% if false %}{{ chain_13_8() }}{% endif %}{{ chain_12_8() }} + 1{% endmacro %}
+
+{% macro chain_12_8() %}{{ return(adapter.dispatch('chain_12_8')()) }}{% endmacro %}
+{% macro default__chain_12_8() %}{% if false %}{{ chain_13_9() }}{% endif %}{{ chain_12_9() }} + 1{% endmacro %}
+
+{% macro chain_12_9() %}{{ return(adapter.dispatch('chain_12_9')()) }}{% endmacro %}
+{% macro default__chain_12_9() %}{% if false %}{{ chain_13_10() }}{% endif %}{{ chain_12_10() }} + 1{% endmacro %}
+
+{% macro chain_12_10() %}{{ return(adapter.dispatch('chain_12_10')()) }}{% endmacro %}
+{% macro default__chain_12_10() %}{% if false %}{{ chain_13_11() }}{% endif %}{{ chain_12_11() }} + 1{% endmacro %}
+
+{% macro chain_12_11() %}{{ return(adapter.dispatch('chain_12_11')()) }}{% endmacro %}
+{% macro default__chain_12_11() %}{% if false %}{{ chain_13_12() }}{% endif %}{{ chain_12_12() }} + 1{% endmacro %}
+
+{% macro chain_12_12() %}{{ return(adapter.dispatch('chain_12_12')()) }}{% endmacro %}
+{% macro default__chain_12_12() %}{% if false %}{{ chain_13_13() }}{% endif %}{{ chain_12_13() }} + 1{% endmacro %}
+
+{% macro chain_12_13() %}{{ return(adapter.dispatch('chain_12_13')()) }}{% endmacro %}
+{% macro default__chain_12_13() %}{% if false %}{{ chain_13_14() }}{% endif %}{{ chain_12_14() }} + 1{% endmacro %}
+
+{% macro chain_12_14() %}{{ return(adapter.dispatch('chain_12_14')()) }}{% endmacro %}
+{% macro default__chain_12_14() %}{% if false %}{{ chain_13_15() }}{% endif %}{{ chain_12_15() }} + 1{% endmacro %}
+
+{% macro chain_12_15() %}{{ return(adapter.dispatch('chain_12_15')()) }}{% endmacro %}
+{% macro default__chain_12_15() %}{% if false %}{{ chain_13_16() }}{% endif %}{{ chain_12_16() }} + 1{% endmacro %}
+
+{% macro chain_12_16() %}{{ return(adapter.dispatch('chain_12_16')()) }}{% endmacro %}
+{% macro default__chain_12_16() %}{% if false %}{{ chain_13_17() }}{% endif %}{{ chain_12_17() }} + 1{% endmacro %}
+
+{% macro chain_12_17() %}{{ return(adapter.dispatch('chain_12_17')()) }}{% endmacro %}
+{% macro default__chain_12_17() %}{% if false %}{{ chain_13_18() }}{% endif %}{{ chain_12_18() }} + 1{% endmacro %}
+
+{% macro chain_12_18() %}{{ return(adapter.dispatch('chain_12_18')()) }}{% endmacro %}
+{% macro default__chain_12_18() %}{% if false %}{{ chain_13_19() }}{% endif %}{{ chain_12_19() }} + 1{% endmacro %}
+
+{% macro chain_12_19() %}{{ return(adapter.dispatch('chain_12_19')()) }}{% endmacro %}
+{% macro default__chain_12_19() %}{% if false %}{{ chain_13_20() }}{% endif %}{{ chain_12_20() }} + 1{% endmacro %}
+
+{% macro chain_12_20() %}{{ return(adapter.dispatch('chain_12_20')()) }}{% endmacro %}
+{% macro default__chain_12_20() %}{% if false %}{{ chain_13_21() }}{% endif %}{{ chain_12_21() }} + 1{% endmacro %}
+
+{% macro chain_12_21() %}{{ return(adapter.dispatch('chain_12_21')()) }}{% endmacro %}
+{% macro default__chain_12_21() %}{% if false %}{{ chain_13_22() }}{% endif %}{{ chain_12_22() }} + 1{% endmacro %}
+
+{% macro chain_12_22() %}{{ return(adapter.dispatch('chain_12_22')()) }}{% endmacro %}
+{% macro default__chain_12_22() %}{% if false %}{{ chain_13_23() }}{% endif %}{{ chain_12_23() }} + 1{% endmacro %}
+
+{% macro chain_12_23() %}{{ return(adapter.dispatch('chain_12_23')()) }}{% endmacro %}
+{% macro default__chain_12_23() %}{% if false %}{{ chain_13_24() }}{% endif %}{{ chain_12_24() }} + 1{% endmacro %}
+
+{% macro chain_12_24() %}{{ return(adapter.dispatch('chain_12_24')()) }}{% endmacro %}
+{% macro default__chain_12_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_13_0() %}{{ return(adapter.dispatch('chain_13_0')()) }}{% endmacro %}
+{% macro default__chain_13_0() %}{% if false %}{{ chain_14_1() }}{% endif %}{{ chain_13_1() }} + 1{% endmacro %}
+
+{% macro chain_13_1() %}{{ return(adapter.dispatch('chain_13_1')()) }}{% endmacro %}
+{% macro default__chain_13_1() %}{% if false %}{{ chain_14_2() }}{% endif %}{{ chain_13_2() }} + 1{% endmacro %}
+
+{% macro chain_13_2() %}{{ return(adapter.dispatch('chain_13_2')()) }}{% endmacro %}
+{% macro default__chain_13_2() %}{% if false %}{{ chain_14_3() }}{% endif %}{{ chain_13_3() }} + 1{% endmacro %}
+
+{% macro chain_13_3() %}{{ return(adapter.dispatch('chain_13_3')()) }}{% endmacro %}
+{% macro default__chain_13_3() %}{% if false %}{{ chain_14_4() }}{% endif %}{{ chain_13_4() }} + 1{% endmacro %}
+
+{% macro chain_13_4() %}{{ return(adapter.dispatch('chain_13_4')()) }}{% endmacro %}
+{% macro default__chain_13_4() %}{% if false %}{{ chain_14_5() }}{% endif %}{{ chain_13_5() }} + 1{% endmacro %}
+
+{% macro chain_13_5() %}{{ return(adapter.dispatch('chain_13_5')()) }}{% endmacro %}
+{% macro default__chain_13_5() %}{% if false %}{{ chain_14_6() }}{% endif %}{{ chain_13_6() }} + 1{% endmacro %}
+
+{% macro chain_13_6() %}{{ return(adapter.dispatch('chain_13_6')()) }}{% endmacro %}
+{% macro default__chain_13_6() %}{% if false %}{{ chain_14_7() }}{% endif %}{{ chain_13_7() }} + 1{% endmacro %}
+
+{% macro chain_13_7() %}{{ return(adapter.dispatch('chain_13_7')()) }}{% endmacro %}
+{% macro default__chain_13_7() %}{% if false %}{{ chain_14_8() }}{% endif %}{{ chain_13_8() }} + 1{% endmacro %}
+
+{% macro chain_13_8() %}{{ return(adapter.dispatch('chain_13_8')()) }}{% endmacro %}
+{% macro default__chain_13_8() %}{% if false %}{{ chain_14_9() }}{% endif %}{{ chain_13_9() }} + 1{% endmacro %}
+
+{% macro chain_13_9() %}{{ return(adapter.dispatch('chain_13_9')()) }}{% endmacro %}
+{% macro default__chain_13_9() %}{% if false %}{{ chain_14_10() }}{% endif %}{{ chain_13_10() }} + 1{% endmacro %}
+
+{% macro chain_13_10() %}{{ return(adapter.dispatch('chain_13_10')()) }}{% endmacro %}
+{% macro default__chain_13_10() %}{% if false %}{{ chain_14_11() }}{% endif %}{{ chain_13_11() }} + 1{% endmacro %}
+
+{% macro chain_13_11() %}{{ return(adapter.dispatch('chain_13_11')()) }}{% endmacro %}
+{% macro default__chain_13_11() %}{% if false %}{{ chain_14_12() }}{% endif %}{{ chain_13_12() }} + 1{% endmacro %}
+
+{% macro chain_13_12() %}{{ return(adapter.dispatch('chain_13_12')()) }}{% endmacro %}
+{% macro default__chain_13_12() %}{% if false %}{{ chain_14_13() }}{% endif %}{{ chain_13_13() }} + 1{% endmacro %}
+
+{% macro chain_13_13() %}{{ return(adapter.dispatch('chain_13_13')()) }}{% endmacro %}
+{% macro default__chain_13_13() %}{% if false %}{{ chain_14_14() }}{% endif %}{{ chain_13_14() }} + 1{% endmacro %}
+
+{% macro chain_13_14() %}{{ return(adapter.dispatch('chain_13_14')()) }}{% endmacro %}
+{% macro default__chain_13_14() %}{% if false %}{{ chain_14_15() }}{% endif %}{{ chain_13_15() }} + 1{% endmacro %}
+
+{% macro chain_13_15() %}{{ return(adapter.dispatch('chain_13_15')()) }}{% endmacro %}
+{% macro default__chain_13_15() %}{% if false %}{{ chain_14_16() }}{% endif %}{{ chain_13_16() }} + 1{% endmacro %}
+
+{% macro chain_13_16() %}{{ return(adapter.dispatch('chain_13_16')()) }}{% endmacro %}
+{% macro default__chain_13_16() %}{% if false %}{{ chain_14_17() }}{% endif %}{{ chain_13_17() }} + 1{% endmacro %}
+
+{% macro chain_13_17() %}{{ return(adapter.dispatch('chain_13_17')()) }}{% endmacro %}
+{% macro default__chain_13_17() %}{% if false %}{{ chain_14_18() }}{% endif %}{{ chain_13_18() }} + 1{% endmacro %}
+
+{% macro chain_13_18() %}{{ return(adapter.dispatch('chain_13_18')()) }}{% endmacro %}
+{% macro default__chain_13_18() %}{% if false %}{{ chain_14_19() }}{% endif %}{{ chain_13_19() }} + 1{% endmacro %}
+
+{% macro chain_13_19() %}{{ return(adapter.dispatch('chain_13_19')()) }}{% endmacro %}
+{% macro default__chain_13_19() %}{% if false %}{{ chain_14_20() }}{% endif %}{{ chain_13_20() }} + 1{% endmacro %}
+
+{% macro chain_13_20() %}{{ return(adapter.dispatch('chain_13_20')()) }}{% endmacro %}
+{% macro default__chain_13_20() %}{% if false %}{{ chain_14_21() }}{% endif %}{{ chain_13_21() }} + 1{% endmacro %}
+
+{% macro chain_13_21() %}{{ return(adapter.dispatch('chain_13_21')()) }}{% endmacro %}
+{% macro default__chain_13_21() %}{% if false %}{{ chain_14_22() }}{% endif %}{{ chain_13_22() }} + 1{% endmacro %}
+
+{% macro chain_13_22() %}{{ return(adapter.dispatch('chain_13_22')()) }}{% endmacro %}
+{% macro default__chain_13_22() %}{% if false %}{{ chain_14_23() }}{% endif %}{{ chain_13_23() }} + 1{% endmacro %}
+
+{% macro chain_13_23() %}{{ return(adapter.dispatch('chain_13_23')()) }}{% endmacro %}
+{% macro default__chain_13_23() %}{% if false %}{{ chain_14_24() }}{% endif %}{{ chain_13_24() }} + 1{% endmacro %}
+
+{% macro chain_13_24() %}{{ return(adapter.dispatch('chain_13_24')()) }}{% endmacro %}
+{% macro default__chain_13_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_14_0() %}{{ return(adapter.dispatch('chain_14_0')()) }}{% endmacro %}
+{% macro default__chain_14_0() %}{% if false %}{{ chain_15_1() }}{% endif %}{{ chain_14_1() }} + 1{% endmacro %}
+
+{% macro chain_14_1() %}{{ return(adapter.dispatch('chain_14_1')()) }}{% endmacro %}
+{% macro default__chain_14_1() %}{% if false %}{{ chain_15_2() }}{% endif %}{{ chain_14_2() }} + 1{% endmacro %}
+
+{% macro chain_14_2() %}{{ return(adapter.dispatch('chain_14_2')()) }}{% endmacro %}
+{% macro default__chain_14_2() %}{% if false %}{{ chain_15_3() }}{% endif %}{{ chain_14_3() }} + 1{% endmacro %}
+
+{% macro chain_14_3() %}{{ return(adapter.dispatch('chain_14_3')()) }}{% endmacro %}
+{% macro default__chain_14_3() %}{% if false %}{{ chain_15_4() }}{% endif %}{{ chain_14_4() }} + 1{% endmacro %}
+
+{% macro chain_14_4() %}{{ return(adapter.dispatch('chain_14_4')()) }}{% endmacro %}
+{% macro default__chain_14_4() %}{% if false %}{{ chain_15_5() }}{% endif %}{{ chain_14_5() }} + 1{% endmacro %}
+
+{% macro chain_14_5() %}{{ return(adapter.dispatch('chain_14_5')()) }}{% endmacro %}
+{% macro default__chain_14_5() %}{% if false %}{{ chain_15_6() }}{% endif %}{{ chain_14_6() }} + 1{% endmacro %}
+
+{% macro chain_14_6() %}{{ return(adapter.dispatch('chain_14_6')()) }}{% endmacro %}
+{% macro default__chain_14_6() %}{% if false %}{{ chain_15_7() }}{% endif %}{{ chain_14_7() }} + 1{% endmacro %}
+
+{% macro chain_14_7() %}{{ return(adapter.dispatch('chain_14_7')()) }}{% endmacro %}
+{% macro default__chain_14_7() %}{% if false %}{{ chain_15_8() }}{% endif %}{{ chain_14_8() }} + 1{% endmacro %}
+
+{% macro chain_14_8() %}{{ return(adapter.dispatch('chain_14_8')()) }}{% endmacro %}
+{% macro default__chain_14_8() %}{% if false %}{{ chain_15_9() }}{% endif %}{{ chain_14_9() }} + 1{% endmacro %}
+
+{% macro chain_14_9() %}{{ return(adapter.dispatch('chain_14_9')()) }}{% endmacro %}
+{% macro default__chain_14_9() %}{% if false %}{{ chain_15_10() }}{% endif %}{{ chain_14_10() }} + 1{% endmacro %}
+
+{% macro chain_14_10() %}{{ return(adapter.dispatch('chain_14_10')()) }}{% endmacro %}
+{% macro default__chain_14_10() %}{% if false %}{{ chain_15_11() }}{% endif %}{{ chain_14_11() }} + 1{% endmacro %}
+
+{% macro chain_14_11() %}{{ return(adapter.dispatch('chain_14_11')()) }}{% endmacro %}
+{% macro default__chain_14_11() %}{% if false %}{{ chain_15_12() }}{% endif %}{{ chain_14_12() }} + 1{% endmacro %}
+
+{% macro chain_14_12() %}{{ return(adapter.dispatch('chain_14_12')()) }}{% endmacro %}
+{% macro default__chain_14_12() %}{% if false %}{{ chain_15_13() }}{% endif %}{{ chain_14_13() }} + 1{% endmacro %}
+
+{% macro chain_14_13() %}{{ return(adapter.dispatch('chain_14_13')()) }}{% endmacro %}
+{% macro default__chain_14_13() %}{% if false %}{{ chain_15_14() }}{% endif %}{{ chain_14_14() }} + 1{% endmacro %}
+
+{% macro chain_14_14() %}{{ return(adapter.dispatch('chain_14_14')()) }}{% endmacro %}
+{% macro default__chain_14_14() %}{% if false %}{{ chain_15_15() }}{% endif %}{{ chain_14_15() }} + 1{% endmacro %}
+
+{% macro chain_14_15() %}{{ return(adapter.dispatch('chain_14_15')()) }}{% endmacro %}
+{% macro default__chain_14_15() %}{% if false %}{{ chain_15_16() }}{% endif %}{{ chain_14_16() }} + 1{% endmacro %}
+
+{% macro chain_14_16() %}{{ return(adapter.dispatch('chain_14_16')()) }}{% endmacro %}
+{% macro default__chain_14_16() %}{% if false %}{{ chain_15_17() }}{% endif %}{{ chain_14_17() }} + 1{% endmacro %}
+
+{% macro chain_14_17() %}{{ return(adapter.dispatch('chain_14_17')()) }}{% endmacro %}
+{% macro default__chain_14_17() %}{% if false %}{{ chain_15_18() }}{% endif %}{{ chain_14_18() }} + 1{% endmacro %}
+
+{% macro chain_14_18() %}{{ return(adapter.dispatch('chain_14_18')()) }}{% endmacro %}
+{% macro default__chain_14_18() %}{% if false %}{{ chain_15_19() }}{% endif %}{{ chain_14_19() }} + 1{% endmacro %}
+
+{% macro chain_14_19() %}{{ return(adapter.dispatch('chain_14_19')()) }}{% endmacro %}
+{% macro default__chain_14_19() %}{% if false %}{{ chain_15_20() }}{% endif %}{{ chain_14_20() }} + 1{% endmacro %}
+
+{% macro chain_14_20() %}{{ return(adapter.dispatch('chain_14_20')()) }}{% endmacro %}
+{% macro default__chain_14_20() %}{% if false %}{{ chain_15_21() }}{% endif %}{{ chain_14_21() }} + 1{% endmacro %}
+
+{% macro chain_14_21() %}{{ return(adapter.dispatch('chain_14_21')()) }}{% endmacro %}
+{% macro default__chain_14_21() %}{% if false %}{{ chain_15_22() }}{% endif %}{{ chain_14_22() }} + 1{% endmacro %}
+
+{% macro chain_14_22() %}{{ return(adapter.dispatch('chain_14_22')()) }}{% endmacro %}
+{% macro default__chain_14_22() %}{% if false %}{{ chain_15_23() }}{% endif %}{{ chain_14_23() }} + 1{% endmacro %}
+
+{% macro chain_14_23() %}{{ return(adapter.dispatch('chain_14_23')()) }}{% endmacro %}
+{% macro default__chain_14_23() %}{% if false %}{{ chain_15_24() }}{% endif %}{{ chain_14_24() }} + 1{% endmacro %}
+
+{% macro chain_14_24() %}{{ return(adapter.dispatch('chain_14_24')()) }}{% endmacro %}
+{% macro default__chain_14_24() %}1{% endmacro %}
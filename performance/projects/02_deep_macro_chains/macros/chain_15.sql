@@ -0,0 +1,74 @@
+{% macro chain_15_0() %}{{ return(adapter.dispatch('chain_15_0')()) }}{% endmacro %}
+{% macro default__chain_15_0() %}{% if false %}{{ chain_16_1() }}{% endif %}{{ chain_15_1() }} + 1{% endmacro %}
+
+{% macro chain_15_1() %}{{ return(adapter.dispatch('chain_15_1')()) }}{% endmacro %}
+{% macro default__chain_15_1() %}{% if false %}{{ chain_16_2() }}{% endif %}{{ chain_15_2() }} + 1{% endmacro %}
+
+{% macro chain_15_2() %}{{ return(adapter.dispatch('chain_15_2')()) }}{% endmacro %}
+{% macro default__chain_15_2() %}{% if false %}{{ chain_16_3() }}{% endif %}{{ chain_15_3() }} + 1{% endmacro %}
+
+{% macro chain_15_3() %}{{ return(adapter.dispatch('chain_15_3')()) }}{% endmacro %}
+{% macro default__chain_15_3() %}{% if false %}{{ chain_16_4() }}{% endif %}{{ chain_15_4() }} + 1{% endmacro %}
+
+{% macro chain_15_4() %}{{ return(adapter.dispatch('chain_15_4')()) }}{% endmacro %}
+{% macro default__chain_15_4() %}{% if false %}{{ chain_16_5() }}{% endif %}{{ chain_15_5() }} + 1{% endmacro %}
+
+{% macro chain_15_5() %}{{ return(adapter.dispatch('chain_15_5')()) }}{% endmacro %}
+{% macro default__chain_15_5() %}{% if false %}{{ chain_16_6() }}{% endif %}{{ chain_15_6() }} + 1{% endmacro %}
+
+{% macro chain_15_6() %}{{ return(adapter.dispatch('chain_15_6')()) }}{% endmacro %}
+{% macro default__chain_15_6() %}{% if false %}{{ chain_16_7() }}{% endif %}{{ chain_15_7() }} + 1{% endmacro %}
+
+{% macro chain_15_7() %}{{ return(adapter.dispatch('chain_15_7')()) }}{% endmacro %}
+{% macro default__chain_15_7() %}{% if false %}{{ chain_16_8() }}{% endif %}{{ chain_15_8() }} + 1{% endmacro %}
+
+{% macro chain_15_8() %}{{ return(adapter.dispatch('chain_15_8')()) }}{% endmacro %}
+{% macro default__chain_15_8() %}{% if false %}{{ chain_16_9() }}{% endif %}{{ chain_15_9() }} + 1{% endmacro %}
+
+{% macro chain_15_9() %}{{ return(adapter.dispatch('chain_15_9')()) }}{% endmacro %}
+{% macro default__chain_15_9() %}{% if false %}{{ chain_16_10() }}{% endif %}{{ chain_15_10() }} + 1{% endmacro %}
+
+{% macro chain_15_10() %}{{ return(adapter.dispatch('chain_15_10')()) }}{% endmacro %}
+{% macro default__chain_15_10() %}{% if false %}{{ chain_16_11() }}{% endif %}{{ chain_15_11() }} + 1{% endmacro %}
+
+{% macro chain_15_11() %}{{ return(adapter.dispatch('chain_15_11')()) }}{% endmacro %}
+{% macro default__chain_15_11() %}{% if false %}{{ chain_16_12() }}{% endif %}{{ chain_15_12() }} + 1{% endmacro %}
+
+{% macro chain_15_12() %}{{ return(adapter.dispatch('chain_15_12')()) }}{% endmacro %}
+{% macro default__chain_15_12() %}{% if false %}{{ chain_16_13() }}{% endif %}{{ chain_15_13() }} + 1{% endmacro %}
+
+{% macro chain_15_13() %}{{ return(adapter.dispatch('chain_15_13')()) }}{% endmacro %}
+{% macro default__chain_15_13() %}{% if false %}{{ chain_16_14() }}{% endif %}{{ chain_15_14() }} + 1{% endmacro %}
+
+{% macro chain_15_14() %}{{ return(adapter.dispatch('chain_15_14')()) }}{% endmacro %}
+{% macro default__chain_15_14() %}{% if false %}{{ chain_16_15() }}{% endif %}{{ chain_15_15() }} + 1{% endmacro %}
+
+{% macro chain_15_15() %}{{ return(adapter.dispatch('chain_15_15')()) }}{% endmacro %}
+{% macro default__chain_15_15() %}{% if false %}{{ chain_16_16() }}{% endif %}{{ chain_15_16() }} + 1{% endmacro %}
+
+{% macro chain_15_16() %}{{ return(adapter.dispatch('chain_15_16')()) }}{% endmacro %}
+{% macro default__chain_15_16() %}{% if false %}{{ chain_16_17() }}{% endif %}{{ chain_15_17() }} + 1{% endmacro %}
+
+{% macro chain_15_17() %}{{ return(adapter.dispatch('chain_15_17')()) }}{% endmacro %}
+{% macro default__chain_15_17() %}{% if false %}{{ chain_16_18() }}{% endif %}{{ chain_15_18() }} + 1{% endmacro %}
+
+{% macro chain_15_18() %}{{ return(adapter.dispatch('chain_15_18')()) }}{% endmacro %}
+{% macro default__chain_15_18() %}{% if false %}{{ chain_16_19() }}{% endif %}{{ chain_15_19() }} + 1{% endmacro %}
+
+{% macro chain_15_19() %}{{ return(adapter.dispatch('chain_15_19')()) }}{% endmacro %}
+{% macro default__chain_15_19() %}{% if false %}{{ chain_16_20() }}{% endif %}{{ chain_15_20() }} + 1{% endmacro %}
+
+{% macro chain_15_20() %}{{ return(adapter.dispatch('chain_15_20')()) }}{% endmacro %}
+{% macro default__chain_15_20() %}{% if false %}{{ chain_16_21() }}{% endif %}{{ chain_15_21() }} + 1{% endmacro %}
+
+{% macro chain_15_21() %}{{ return(adapter.dispatch('chain_15_21')()) }}{% endmacro %}
+{% macro default__chain_15_21() %}{% if false %}{{ chain_16_22() }}{% endif %}{{ chain_15_22() }} + 1{% endmacro %}
+
+{% macro chain_15_22() %}{{ return(adapter.dispatch('chain_15_22')()) }}{% endmacro %}
+{% macro default__chain_15_22() %}{% if false %}{{ chain_16_23() }}{% endif %}{{ chain_15_23() }} + 1{% endmacro %}
+
+{% macro chain_15_23() %}{{ return(adapter.dispatch('chain_15_23')()) }}{% endmacro %}
+{% macro default__chain_15_23() %}{% if false %}{{ chain_16_24() }}{% endif %}{{ chain_15_24() }} + 1{% endmacro %}
+
+{% macro chain_15_24() %}{{ return(adapter.dispatch('chain_15_24')()) }}{% endmacro %}
+{% macro default__chain_15_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_16_0() %}{{ return(adapter.dispatch('chain_16_0')()) }}{% endmacro %}
+{% macro default__chain_16_0() %}{% if false %}{{ chain_17_1() }}{% endif %}{{ chain_16_1() }} + 1{% endmacro %}
+
+{% macro chain_16_1() %}{{ return(adapter.dispatch('chain_16_1')()) }}{% endmacro %}
+{% macro default__chain_16_1() %}{% if false %}{{ chain_17_2() }}{% endif %}{{ chain_16_2() }} + 1{% endmacro %}
+
+{% macro chain_16_2() %}{{ return(adapter.dispatch('chain_16_2')()) }}{% endmacro %}
+{% macro default__chain_16_2() %}{% if false %}{{ chain_17_3() }}{% endif %}{{ chain_16_3() }} + 1{% endmacro %}
+
+{% macro chain_16_3() %}{{ return(adapter.dispatch('chain_16_3')()) }}{% endmacro %}
+{% macro default__chain_16_3() %}{% if false %}{{ chain_17_4() }}{% endif %}{{ chain_16_4() }} + 1{% endmacro %}
+
+{% macro chain_16_4() %}{{ return(adapter.dispatch('chain_16_4')()) }}{% endmacro %}
+{% macro default__chain_16_4() %}{% if false %}{{ chain_17_5() }}{% endif %}{{ chain_16_5() }} + 1{% endmacro %}
+
+{% macro chain_16_5() %}{{ return(adapter.dispatch('chain_16_5')()) }}{% endmacro %}
+{% macro default__chain_16_5() %}{% if false %}{{ chain_17_6() }}{% endif %}{{ chain_16_6() }} + 1{% endmacro %}
+
+{% macro chain_16_6() %}{{ return(adapter.dispatch('chain_16_6')()) }}{% endmacro %}
+{% macro default__chain_16_6() %}{% if false %}{{ chain_17_7() }}{% endif %}{{ chain_16_7() }} + 1{% endmacro %}
+
+{% macro chain_16_7() %}{{ return(adapter.dispatch('chain_16_7')()) }}{% endmacro %}
+{% macro default__chain_16_7() %}{% if false %}{{ chain_17_8() }}{% endif %}{{ chain_16_8() }} + 1{% endmacro %}
+
+{% macro chain_16_8() %}{{ return(adapter.dispatch('chain_16_8')()) }}{% endmacro %}
+{% macro default__chain_16_8() %}{% if false %}{{ chain_17_9() }}{% endif %}{{ chain_16_9() }} + 1{% endmacro %}
+
+{% macro chain_16_9() %}{{ return(adapter.dispatch('chain_16_9')()) }}{% endmacro %}
+{% macro default__chain_16_9() %}{% if false %}{{ chain_17_10() }}{% endif %}{{ chain_16_10() }} + 1{% endmacro %}
+
+{% macro chain_16_10() %}{{ return(adapter.dispatch('chain_16_10')()) }}{% endmacro %}
+{% macro default__chain_16_10() %}{% if false %}{{ chain_17_11() }}{% endif %}{{ chain_16_11() }} + 1{% endmacro %}
+
+{% macro chain_16_11() %}{{ return(adapter.dispatch('chain_16_11')()) }}{% endmacro %}
+{% macro default__chain_16_11() %}{% if false %}{{ chain_17_12() }}{% endif %}{{ chain_16_12() }} + 1{% endmacro %}
+
+{% macro chain_16_12() %}{{ return(adapter.dispatch('chain_16_12')()) }}{% endmacro %}
+{% macro default__chain_16_12() %}{% if false %}{{ chain_17_13() }}{% endif %}{{ chain_16_13() }} + 1{% endmacro %}
+
+{% macro chain_16_13() %}{{ return(adapter.dispatch('chain_16_13')()) }}{% endmacro %}
+{% macro default__chain_16_13() %}{% if false %}{{ chain_17_14() }}{% endif %}{{ chain_16_14() }} + 1{% endmacro %}
+
+{% macro chain_16_14() %}{{ return(adapter.dispatch('chain_16_14')()) }}{% endmacro %}
+{% macro default__chain_16_14() %}{% if false %}{{ chain_17_15() }}{% endif %}{{ chain_16_15() }} + 1{% endmacro %}
+
+{% macro chain_16_15() %}{{ return(adapter.dispatch('chain_16_15')()) }}{% endmacro %}
+{% macro default__chain_16_15() %}{% if false %}{{ chain_17_16() }}{% endif %}{{ chain_16_16() }} + 1{% endmacro %}
+
+{% macro chain_16_16() %}{{ return(adapter.dispatch('chain_16_16')()) }}{% endmacro %}
+{% macro default__chain_16_16() %}{% if false %}{{ chain_17_17() }}{% endif %}{{ chain_16_17() }} + 1{% endmacro %}
+
+{% macro chain_16_17() %}{{ return(adapter.dispatch('chain_16_17')()) }}{% endmacro %}
+{% macro default__chain_16_17() %}{% if false %}{{ chain_17_18() }}{% endif %}{{ chain_16_18() }} + 1{% endmacro %}
+
+{% macro chain_16_18() %}{{ return(adapter.dispatch('chain_16_18')()) }}{% endmacro %}
+{% macro default__chain_16_18() %}{% if false %}{{ chain_17_19() }}{% endif %}{{ chain_16_19() }} + 1{% endmacro %}
+
+{% macro chain_16_19() %}{{ return(adapter.dispatch('chain_16_19')()) }}{% endmacro %}
+{% macro default__chain_16_19() %}{% if false %}{{ chain_17_20() }}{% endif %}{{ chain_16_20() }} + 1{% endmacro %}
+
+{% macro chain_16_20() %}{{ return(adapter.dispatch('chain_16_20')()) }}{% endmacro %}
+{% macro default__chain_16_20() %}{% if false %}{{ chain_17_21() }}{% endif %}{{ chain_16_21() }} + 1{% endmacro %}
+
+{% macro chain_16_21() %}{{ return(adapter.dispatch('chain_16_21')()) }}{% endmacro %}
+{% macro default__chain_16_21() %}{% if false %}{{ chain_17_22() }}{% endif %}{{ chain_16_22() }} + 1{% endmacro %}
+
+{% macro chain_16_22() %}{{ return(adapter.dispatch('chain_16_22')()) }}{% endmacro %}
+{% macro default__chain_16_22() %}{% if false %}{{ chain_17_23() }}{% endif %}{{ chain_16_23() }} + 1{% endmacro %}
+
+{% macro chain_16_23() %}{{ return(adapter.dispatch('chain_16_23')()) }}{% endmacro %}
+{% macro default__chain_16_23() %}{% if false %}{{ chain_17_24() }}{% endif %}{{ chain_16_24() }} + 1{% endmacro %}
+
+{% macro chain_16_24() %}{{ return(adapter.dispatch('chain_16_24')()) }}{% endmacro %}
+{% macro default__chain_16_24() %}1{% endmacro %}
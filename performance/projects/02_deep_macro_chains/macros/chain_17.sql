@@ -0,0 +1,74 @@
+{% macro chain_17_0() %}{{ return(adapter.dispatch('chain_17_0')()) }}{% endmacro %}
+{% macro default__chain_17_0() %}{% if false %}{{ chain_18_1() }}{% endif %}{{ chain_17_1() }} + 1{% endmacro %}
+
+{% macro chain_17_1() %}{{ return(adapter.dispatch('chain_17_1')()) }}{% endmacro %}
+{% macro default__chain_17_1() %}{% if false %}{{ chain_18_2() }}{% endif %}{{ chain_17_2() }} + 1{% endmacro %}
+
+{% macro chain_17_2() %}{{ return(adapter.dispatch('chain_17_2')()) }}{% endmacro %}
+{% macro default__chain_17_2() %}{% if false %}{{ chain_18_3() }}{% endif %}{{ chain_17_3() }} + 1{% endmacro %}
+
+{% macro chain_17_3() %}{{ return(adapter.dispatch('chain_17_3')()) }}{% endmacro %}
+{% macro default__chain_17_3() %}{% if false %}{{ chain_18_4() }}{% endif %}{{ chain_17_4() }} + 1{% endmacro %}
+
+{% macro chain_17_4() %}{{ return(adapter.dispatch('chain_17_4')()) }}{% endmacro %}
+{% macro default__chain_17_4() %}{% if false %}{{ chain_18_5() }}{% endif %}{{ chain_17_5() }} + 1{% endmacro %}
+
+{% macro chain_17_5() %}{{ return(adapter.dispatch('chain_17_5')()) }}{% endmacro %}
+{% macro default__chain_17_5() %}{% if false %}{{ chain_18_6() }}{% endif %}{{ chain_17_6() }} + 1{% endmacro %}
+
+{% macro chain_17_6() %}{{ return(adapter.dispatch('chain_17_6')()) }}{% endmacro %}
+{% macro default__chain_17_6() %}{% if false %}{{ chain_18_7() }}{% endif %}{{ chain_17_7() }} + 1{% endmacro %}
+
+{% macro chain_17_7() %}{{ return(adapter.dispatch('chain_17_7')()) }}{% endmacro %}
+{% macro default__chain_17_7() %}{% if false %}{{ chain_18_8() }}{% endif %}{{ chain_17_8() }} + 1{% endmacro %}
+
+{% macro chain_17_8() %}{{ return(adapter.dispatch('chain_17_8')()) }}{% endmacro %}
+{% macro default__chain_17_8() %}{% if false %}{{ chain_18_9() }}{% endif %}{{ chain_17_9() }} + 1{% endmacro %}
+
+{% macro chain_17_9() %}{{ return(adapter.dispatch('chain_17_9')()) }}{% endmacro %}
+{% macro default__chain_17_9() %}{% if false %}{{ chain_18_10() }}{% endif %}{{ chain_17_10() }} + 1{% endmacro %}
+
+{% macro chain_17_10() %}{{ return(adapter.dispatch('chain_17_10')()) }}{% endmacro %}
+{% macro default__chain_17_10() %}{% if false %}{{ chain_18_11() }}{% endif %}{{ chain_17_11() }} + 1{% endmacro %}
+
+{% macro chain_17_11() %}{{ return(adapter.dispatch('chain_17_11')()) }}{% endmacro %}
+{% macro default__chain_17_11() %}{% if false %}{{ chain_18_12() }}{% endif %}{{ chain_17_12() }} + 1{% endmacro %}
+
+{% macro chain_17_12() %}{{ return(adapter.dispatch('chain_17_12')()) }}{% endmacro %}
+{% macro default__chain_17_12() %}{% if false %}{{ chain_18_13() }}{% endif %}{{ chain_17_13() }} + 1{% endmacro %}
+
+{% macro chain_17_13() %}{{ return(adapter.dispatch('chain_17_13')()) }}{% endmacro %}
+{% macro default__chain_17_13() %}{% if false %}{{ chain_18_14() }}{% endif %}{{ chain_17_14() }} + 1{% endmacro %}
+
+{% macro chain_17_14() %}{{ return(adapter.dispatch('chain_17_14')()) }}{% endmacro %}
+{% macro default__chain_17_14() %}{% if false %}{{ chain_18_15() }}{% endif %}{{ chain_17_15() }} + 1{% endmacro %}
+
+{% macro chain_17_15() %}{{ return(adapter.dispatch('chain_17_15')()) }}{% endmacro %}
+{% macro default__chain_17_15() %}{% if false %}{{ chain_18_16() }}{% endif %}{{ chain_17_16() }} + 1{% endmacro %}
+
+{% macro chain_17_16() %}{{ return(adapter.dispatch('chain_17_16')()) }}{% endmacro %}
+{% macro default__chain_17_16() %}{% if false %}{{ chain_18_17() }}{% endif %}{{ chain_17_17() }} + 1{% endmacro %}
+
+{% macro chain_17_17() %}{{ return(adapter.dispatch('chain_17_17')()) }}{% endmacro %}
+{% macro default__chain_17_17() %}{% if false %}{{ chain_18_18() }}{% endif %}{{ chain_17_18() }} + 1{% endmacro %}
+
+{% macro chain_17_18() %}{{ return(adapter.dispatch('chain_17_18')()) }}{% endmacro %}
+{% macro default__chain_17_18() %}{% if false %}{{ chain_18_19() }}{% endif %}{{ chain_17_19() }} + 1{% endmacro %}
+
+{% macro chain_17_19() %}{{ return(adapter.dispatch('chain_17_19')()) }}{% endmacro %}
+{% macro default__chain_17_19() %}{% if false %}{{ chain_18_20() }}{% endif %}{{ chain_17_20() }} + 1{% endmacro %}
+
+{% macro chain_17_20() %}{{ return(adapter.dispatch('chain_17_20')()) }}{% endmacro %}
+{% macro default__chain_17_20() %}{% if false %}{{ chain_18_21() }}{% endif %}{{ chain_17_21() }} + 1{% endmacro %}
+
+{% macro chain_17_21() %}{{ return(adapter.dispatch('chain_17_21')()) }}{% endmacro %}
+{% macro default__chain_17_21() %}{% if false %}{{ chain_18_22() }}{% endif %}{{ chain_17_22() }} + 1{% endmacro %}
+
+{% macro chain_17_22() %}{{ return(adapter.dispatch('chain_17_22')()) }}{% endmacro %}
+{% macro default__chain_17_22() %}{% if false %}{{ chain_18_23() }}{% endif %}{{ chain_17_23() }} + 1{% endmacro %}
+
+{% macro chain_17_23() %}{{ return(adapter.dispatch('chain_17_23')()) }}{% endmacro %}
+{% macro default__chain_17_23() %}{% if false %}{{ chain_18_24() }}{% endif %}{{ chain_17_24() }} + 1{% endmacro %}
+
+{% macro chain_17_24() %}{{ return(adapter.dispatch('chain_17_24')()) }}{% endmacro %}
+{% macro default__chain_17_24() %}1{% endmacro %}
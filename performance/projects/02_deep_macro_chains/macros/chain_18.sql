@@ -0,0 +1,74 @@
+{% macro chain_18_0() %}{{ return(adapter.dispatch('chain_18_0')()) }}{% endmacro %}
+{% macro default__chain_18_0() %}{% if false %}{{ chain_19_1() }}{% endif %}{{ chain_18_1() }} + 1{% endmacro %}
+
+{% macro chain_18_1() %}{{ return(adapter.dispatch('chain_18_1')()) }}{% endmacro %}
+{% macro default__chain_18_1() %}{% if false %}{{ chain_19_2() }}{% endif %}{{ chain_18_2() }} + 1{% endmacro %}
+
+{% macro chain_18_2() %}{{ return(adapter.dispatch('chain_18_2')()) }}{% endmacro %}
+{% macro default__chain_18_2() %}{% if false %}{{ chain_19_3() }}{% endif %}{{ chain_18_3() }} + 1{% endmacro %}
+
+{% macro chain_18_3() %}{{ return(adapter.dispatch('chain_18_3')()) }}{% endmacro %}
+{% macro default__chain_18_3() %}{% if false %}{{ chain_19_4() }}{% endif %}{{ chain_18_4() }} + 1{% endmacro %}
+
+{% macro chain_18_4() %}{{ return(adapter.dispatch('chain_18_4')()) }}{% endmacro %}
+{% macro default__chain_18_4() %}{% if false %}{{ chain_19_5() }}{% endif %}{{ chain_18_5() }} + 1{% endmacro %}
+
+{% macro chain_18_5() %}{{ return(adapter.dispatch('chain_18_5')()) }}{% endmacro %}
+{% macro default__chain_18_5() %}{% if false %}{{ chain_19_6() }}{% endif %}{{ chain_18_6() }} + 1{% endmacro %}
+
+{% macro chain_18_6() %}{{ return(adapter.dispatch('chain_18_6')()) }}{% endmacro %}
+{% macro default__chain_18_6() %}{% if false %}{{ chain_19_7() }}{% endif %}{{ chain_18_7() }} + 1{% endmacro %}
+
+{% macro chain_18_7() %}{{ return(adapter.dispatch('chain_18_7')()) }}{% endmacro %}
+{% macro default__chain_18_7() %}{% if false %}{{ chain_19_8() }}{% endif %}{{ chain_18_8() }} + 1{% endmacro %}
+
+{% macro chain_18_8() %}{{ return(adapter.dispatch('chain_18_8')()) }}{% endmacro %}
+{% macro default__chain_18_8() %}{% if false %}{{ chain_19_9() }}{% endif %}{{ chain_18_9() }} + 1{% endmacro %}
+
+{% macro chain_18_9() %}{{ return(adapter.dispatch('chain_18_9')()) }}{% endmacro %}
+{% macro default__chain_18_9() %}{% if false %}{{ chain_19_10() }}{% endif %}{{ chain_18_10() }} + 1{% endmacro %}
+
+{% macro chain_18_10() %}{{ return(adapter.dispatch('chain_18_10')()) }}{% endmacro %}
+{% macro default__chain_18_10() %}{% if false %}{{ chain_19_11() }}{% endif %}{{ chain_18_11() }} + 1{% endmacro %}
+
+{% macro chain_18_11() %}{{ return(adapter.dispatch('chain_18_11')()) }}{% endmacro %}
+{% macro default__chain_18_11() %}{% if false %}{{ chain_19_12() }}{% endif %}{{ chain_18_12() }} + 1{% endmacro %}
+
+{% macro chain_18_12() %}{{ return(adapter.dispatch('chain_18_12')()) }}{% endmacro %}
+{% macro default__chain_18_12() %}{% if false %}{{ chain_19_13() }}{% endif %}{{ chain_18_13() }} + 1{% endmacro %}
+
+{% macro chain_18_13() %}{{ return(adapter.dispatch('chain_18_13')()) }}{% endmacro %}
+{% macro default__chain_18_13() %}{% if false %}{{ chain_19_14() }}{% endif %}{{ chain_18_14() }} + 1{% endmacro %}
+
+{% macro chain_18_14() %}{{ return(adapter.dispatch('chain_18_14')()) }}{% endmacro %}
+{% macro default__chain_18_14() %}{% if false %}{{ chain_19_15() }}{% endif %}{{ chain_18_15() }} + 1{% endmacro %}
+
+{% macro chain_18_15() %}{{ return(adapter.dispatch('chain_18_15')()) }}{% endmacro %}
+{% macro default__chain_18_15() %}{% if false %}{{ chain_19_16() }}{% endif %}{{ chain_18_16() }} + 1{% endmacro %}
+
+{% macro chain_18_16() %}{{ return(adapter.dispatch('chain_18_16')()) }}{% endmacro %}
+{% macro default__chain_18_16() %}{% if false %}{{ chain_19_17() }}{% endif %}{{ chain_18_17() }} + 1{% endmacro %}
+
+{% macro chain_18_17() %}{{ return(adapter.dispatch('chain_18_17')()) }}{% endmacro %}
+{% macro default__chain_18_17() %}{% if false %}{{ chain_19_18() }}{% endif %}{{ chain_18_18() }} + 1{% endmacro %}
+
+{% macro chain_18_18() %}{{ return(adapter.dispatch('chain_18_18')()) }}{% endmacro %}
+{% macro default__chain_18_18() %}{% if false %}{{ chain_19_19() }}{% endif %}{{ chain_18_19() }} + 1{% endmacro %}
+
+{% macro chain_18_19() %}{{ return(adapter.dispatch('chain_18_19')()) }}{% endmacro %}
+{% macro default__chain_18_19() %}{% if false %}{{ chain_19_20() }}{% endif %}{{ chain_18_20() }} + 1{% endmacro %}
+
+{% macro chain_18_20() %}{{ return(adapter.dispatch('chain_18_20')()) }}{% endmacro %}
+{% macro default__chain_18_20() %}{% if false %}{{ chain_19_21() }}{% endif %}{{ chain_18_21() }} + 1{% endmacro %}
+
+{% macro chain_18_21() %}{{ return(adapter.dispatch('chain_18_21')()) }}{% endmacro %}
+{% macro default__chain_18_21() %}{% if false %}{{ chain_19_22() }}{% endif %}{{ chain_18_22() }} + 1{% endmacro %}
+
+{% macro chain_18_22() %}{{ return(adapter.dispatch('chain_18_22')()) }}{% endmacro %}
+{% macro default__chain_18_22() %}{% if false %}{{ chain_19_23() }}{% endif %}{{ chain_18_23() }} + 1{% endmacro %}
+
+{% macro chain_18_23() %}{{ return(adapter.dispatch('chain_18_23')()) }}{% endmacro %}
+{% macro default__chain_18_23() %}{% if false %}{{ chain_19_24() }}{% endif %}{{ chain_18_24() }} + 1{% endmacro %}
+
+{% macro chain_18_24() %}{{ return(adapter.dispatch('chain_18_24')()) }}{% endmacro %}
+{% macro default__chain_18_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_19_0() %}{{ return(adapter.dispatch('chain_19_0')()) }}{% endmacro %}
+{% macro default__chain_19_0() %}{% if false %}{{ chain_20_1() }}{% endif %}{{ chain_19_1() }} + 1{% endmacro %}
+
+{% macro chain_19_1() %}{{ return(adapter.dispatch('chain_19_1')()) }}{% endmacro %}
+{% macro default__chain_19_1() %}{% if false %}{{ chain_20_2() }}{% endif %}{{ chain_19_2() }} + 1{% endmacro %}
+
+{% macro chain_19_2() %}{{ return(adapter.dispatch('chain_19_2')()) }}{% endmacro %}
+{% macro default__chain_19_2() %}{% if false %}{{ chain_20_3() }}{% endif %}{{ chain_19_3() }} + 1{% endmacro %}
+
+{% macro chain_19_3() %}{{ return(adapter.dispatch('chain_19_3')()) }}{% endmacro %}
+{% macro default__chain_19_3() %}{% if false %}{{ chain_20_4() }}{% endif %}{{ chain_19_4() }} + 1{% endmacro %}
+
+{% macro chain_19_4() %}{{ return(adapter.dispatch('chain_19_4')()) }}{% endmacro %}
+{% macro default__chain_19_4() %}{% if false %}{{ chain_20_5() }}{% endif %}{{ chain_19_5() }} + 1{% endmacro %}
+
+{% macro chain_19_5() %}{{ return(adapter.dispatch('chain_19_5')()) }}{% endmacro %}
+{% macro default__chain_19_5() %}{% if false %}{{ chain_20_6() }}{% endif %}{{ chain_19_6() }} + 1{% endmacro %}
+
+{% macro chain_19_6() %}{{ return(adapter.dispatch('chain_19_6')()) }}{% endmacro %}
+{% macro default__chain_19_6() %}{% if false %}{{ chain_20_7() }}{% endif %}{{ chain_19_7() }} + 1{% endmacro %}
+
+{% macro chain_19_7() %}{{ return(adapter.dispatch('chain_19_7')()) }}{% endmacro %}
+{% macro default__chain_19_7() %}{% if false %}{{ chain_20_8() }}{% endif %}{{ chain_19_8() }} + 1{% endmacro %}
+
+{% macro chain_19_8() %}{{ return(adapter.dispatch('chain_19_8')()) }}{% endmacro %}
+{% macro default__chain_19_8() %}{% if false %}{{ chain_20_9() }}{% endif %}{{ chain_19_9() }} + 1{% endmacro %}
+
+{% macro chain_19_9() %}{{ return(adapter.dispatch('chain_19_9')()) }}{% endmacro %}
+{% macro default__chain_19_9() %}{% if false %}{{ chain_20_10() }}{% endif %}{{ chain_19_10() }} + 1{% endmacro %}
+
+{% macro chain_19_10() %}{{ return(adapter.dispatch('chain_19_10')()) }}{% endmacro %}
+{% macro default__chain_19_10() %}{% if false %}{{ chain_20_11() }}{% endif %}{{ chain_19_11() }} + 1{% endmacro %}
+
+{% macro chain_19_11() %}{{ return(adapter.dispatch('chain_19_11')()) }}{% endmacro %}
+{% macro default__chain_19_11() %}{% if false %}{{ chain_20_12() }}{% endif %}{{ chain_19_12() }} + 1{% endmacro %}
+
+{% macro chain_19_12() %}{{ return(adapter.dispatch('chain_19_12')()) }}{% endmacro %}
+{% macro default__chain_19_12() %}{% if false %}{{ chain_20_13() }}{% endif %}{{ chain_19_13() }} + 1{% endmacro %}
+
+{% macro chain_19_13() %}{{ return(adapter.dispatch('chain_19_13')()) }}{% endmacro %}
+{% macro default__chain_19_13() %}{% if false %}{{ chain_20_14() }}{% endif %}{{ chain_19_14() }} + 1{% endmacro %}
+
+{% macro chain_19_14() %}{{ return(adapter.dispatch('chain_19_14')()) }}{% endmacro %}
+{% macro default__chain_19_14() %}{% if false %}{{ chain_20_15() }}{% endif %}{{ chain_19_15() }} + 1{% endmacro %}
+
+{% macro chain_19_15() %}{{ return(adapter.dispatch('chain_19_15')()) }}{% endmacro %}
+{% macro default__chain_19_15() %}{% if false %}{{ chain_20_16() }}{% endif %}{{ chain_19_16() }} + 1{% endmacro %}
+
+{% macro chain_19_16() %}{{ return(adapter.dispatch('chain_19_16')()) }}{% endmacro %}
+{% macro default__chain_19_16() %}{% if false %}{{ chain_20_17() }}{% endif %}{{ chain_19_17() }} + 1{% endmacro %}
+
+{% macro chain_19_17() %}{{ return(adapter.dispatch('chain_19_17')()) }}{% endmacro %}
+{% macro default__chain_19_17() %}{% if false %}{{ chain_20_18() }}{% endif %}{{ chain_19_18() }} + 1{% endmacro %}
+
+{% macro chain_19_18() %}{{ return(adapter.dispatch('chain_19_18')()) }}{% endmacro %}
+{% macro default__chain_19_18() %}{% if false %}{{ chain_20_19() }}{% endif %}{{ chain_19_19() }} + 1{% endmacro %}
+
+{% macro chain_19_19() %}{{ return(adapter.dispatch('chain_19_19')()) }}{% endmacro %}
+{% macro default__chain_19_19() %}{% if false %}{{ chain_20_20() }}{% endif %}{{ chain_19_20() }} + 1{% endmacro %}
+
+{% macro chain_19_20() %}{{ return(adapter.dispatch('chain_19_20')()) }}{% endmacro %}
+{% macro default__chain_19_20() %}{% if false %}{{ chain_20_21() }}{% endif %}{{ chain_19_21() }} + 1{% endmacro %}
+
+{% macro chain_19_21() %}{{ return(adapter.dispatch('chain_19_21')()) }}{% endmacro %}
+{% macro default__chain_19_21() %}{% if false %}{{ chain_20_22() }}{% endif %}{{ chain_19_22() }} + 1{% endmacro %}
+
+{% macro chain_19_22() %}{{ return(adapter.dispatch('chain_19_22')()) }}{% endmacro %}
+{% macro default__chain_19_22() %}{% if false %}{{ chain_20_23() }}{% endif %}{{ chain_19_23() }} + 1{% endmacro %}
+
+{% macro chain_19_23() %}{{ return(adapter.dispatch('chain_19_23')()) }}{% endmacro %}
+{% macro default__chain_19_23() %}{% if false %}{{ chain_20_24() }}{% endif %}{{ chain_19_24() }} + 1{% endmacro %}
+
+{% macro chain_19_24() %}{{ return(adapter.dispatch('chain_19_24')()) }}{% endmacro %}
+{% macro default__chain_19_24() %}1{% endmacro %}
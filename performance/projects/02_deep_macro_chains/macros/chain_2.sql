@@ -0,0 +1,74 @@
+{% macro chain_2_0() %}{{ return(adapter.dispatch('chain_2_0')()) }}{% endmacro %}
+{% macro default__chain_2_0() %}{% if false %}{{ chain_3_1() }}{% endif %}{{ chain_2_1() }} + 1{% endmacro %}
+
+{% macro chain_2_1() %}{{ return(adapter.dispatch('chain_2_1')()) }}{% endmacro %}
+{% macro default__chain_2_1() %}{% if false %}{{ chain_3_2() }}{% endif %}{{ chain_2_2() }} + 1{% endmacro %}
+
+{% macro chain_2_2() %}{{ return(adapter.dispatch('chain_2_2')()) }}{% endmacro %}
+{% macro default__chain_2_2() %}{% if false %}{{ chain_3_3() }}{% endif %}{{ chain_2_3() }} + 1{% endmacro %}
+
+{% macro chain_2_3() %}{{ return(adapter.dispatch('chain_2_3')()) }}{% endmacro %}
+{% macro default__chain_2_3() %}{% if false %}{{ chain_3_4() }}{% endif %}{{ chain_2_4() }} + 1{% endmacro %}
+
+{% macro chain_2_4() %}{{ return(adapter.dispatch('chain_2_4')()) }}{% endmacro %}
+{% macro default__chain_2_4() %}{% if false %}{{ chain_3_5() }}{% endif %}{{ chain_2_5() }} + 1{% endmacro %}
+
+{% macro chain_2_5() %}{{ return(adapter.dispatch('chain_2_5')()) }}{% endmacro %}
+{% macro default__chain_2_5() %}{% if false %}{{ chain_3_6() }}{% endif %}{{ chain_2_6() }} + 1{% endmacro %}
+
+{% macro chain_2_6() %}{{ return(adapter.dispatch('chain_2_6')()) }}{% endmacro %}
+{% macro default__chain_2_6() %}{% if false %}{{ chain_3_7() }}{% endif %}{{ chain_2_7() }} + 1{% endmacro %}
+
+{% macro chain_2_7() %}{{ return(adapter.dispatch('chain_2_7')()) }}{% endmacro %}
+{% macro default__chain_2_7() %}{% if false %}{{ chain_3_8() }}{% endif %}{{ chain_2_8() }} + 1{% endmacro %}
+
+{% macro chain_2_8() %}{{ return(adapter.dispatch('chain_2_8')()) }}{% endmacro %}
+{% macro default__chain_2_8() %}{% if false %}{{ chain_3_9() }}{% endif %}{{ chain_2_9() }} + 1{% endmacro %}
+
+{% macro chain_2_9() %}{{ return(adapter.dispatch('chain_2_9')()) }}{% endmacro %}
+{% macro default__chain_2_9() %}{% if false %}{{ chain_3_10() }}{% endif %}{{ chain_2_10() }} + 1{% endmacro %}
+
+{% macro chain_2_10() %}{{ return(adapter.dispatch('chain_2_10')()) }}{% endmacro %}
+{% macro default__chain_2_10() %}{% if false %}{{ chain_3_11() }}{% endif %}{{ chain_2_11() }} + 1{% endmacro %}
+
+{% macro chain_2_11() %}{{ return(adapter.dispatch('chain_2_11')()) }}{% endmacro %}
+{% macro default__chain_2_11() %}{% if false %}{{ chain_3_12() }}{% endif %}{{ chain_2_12() }} + 1{% endmacro %}
+
+{% macro chain_2_12() %}{{ return(adapter.dispatch('chain_2_12')()) }}{% endmacro %}
+{% macro default__chain_2_12() %}{% if false %}{{ chain_3_13() }}{% endif %}{{ chain_2_13() }} + 1{% endmacro %}
+
+{% macro chain_2_13() %}{{ return(adapter.dispatch('chain_2_13')()) }}{% endmacro %}
+{% macro default__chain_2_13() %}{% if false %}{{ chain_3_14() }}{% endif %}{{ chain_2_14() }} + 1{% endmacro %}
+
+{% macro chain_2_14() %}{{ return(adapter.dispatch('chain_2_14')()) }}{% endmacro %}
+{% macro default__chain_2_14() %}{% if false %}{{ chain_3_15() }}{% endif %}{{ chain_2_15() }} + 1{% endmacro %}
+
+{% macro chain_2_15() %}{{ return(adapter.dispatch('chain_2_15')()) }}{% endmacro %}
+{% macro default__chain_2_15() %}{% if false %}{{ chain_3_16() }}{% endif %}{{ chain_2_16() }} + 1{% endmacro %}
+
+{% macro chain_2_16() %}{{ return(adapter.dispatch('chain_2_16')()) }}{% endmacro %}
+{% macro default__chain_2_16() %}{% if false %}{{ chain_3_17() }}{% endif %}{{ chain_2_17() }} + 1{% endmacro %}
+
+{% macro chain_2_17() %}{{ return(adapter.dispatch('chain_2_17')()) }}{% endmacro %}
+{% macro default__chain_2_17() %}{% if false %}{{ chain_3_18() }}{% endif %}{{ chain_2_18() }} + 1{% endmacro %}
+
+{% macro chain_2_18() %}{{ return(adapter.dispatch('chain_2_18')()) }}{% endmacro %}
+{% macro default__chain_2_18() %}{% if false %}{{ chain_3_19() }}{% endif %}{{ chain_2_19() }} + 1{% endmacro %}
+
+{% macro chain_2_19() %}{{ return(adapter.dispatch('chain_2_19')()) }}{% endmacro %}
+{% macro default__chain_2_19() %}{% if false %}{{ chain_3_20() }}{% endif %}{{ chain_2_20() }} + 1{% endmacro %}
+
+{% macro chain_2_20() %}{{ return(adapter.dispatch('chain_2_20')()) }}{% endmacro %}
+{% macro default__chain_2_20() %}{% if false %}{{ chain_3_21() }}{% endif %}{{ chain_2_21() }} + 1{% endmacro %}
+
+{% macro chain_2_21() %}{{ return(adapter.dispatch('chain_2_21')()) }}{% endmacro %}
+{% macro default__chain_2_21() %}{% if false %}{{ chain_3_22() }}{% endif %}{{ chain_2_22() }} + 1{% endmacro %}
+
+{% macro chain_2_22() %}{{ return(adapter.dispatch('chain_2_22')()) }}{% endmacro %}
+{% macro default__chain_2_22() %}{% if false %}{{ chain_3_23() }}{% endif %}{{ chain_2_23() }} + 1{% endmacro %}
+
+{% macro chain_2_23() %}{{ return(adapter.dispatch('chain_2_23')()) }}{% endmacro %}
+{% macro default__chain_2_23() %}{% if false %}{{ chain_3_24() }}{% endif %}{{ chain_2_24() }} + 1{% endmacro %}
+
+{% macro chain_2_24() %}{{ return(adapter.dispatch('chain_2_24')()) }}{% endmacro %}
+{% macro default__chain_2_24() %}1{% endmacro %}
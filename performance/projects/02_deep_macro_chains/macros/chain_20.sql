@@ -0,0 +1,74 @@
+{% macro chain_20_0() %}{{ return(adapter.dispatch('chain_20_0')()) }}{% endmacro %}
+{% macro default__chain_20_0() %}{% if false %}{{ chain_21_1() }}{% endif %}{{ chain_20_1() }} + 1{% endmacro %}
+
+{% macro chain_20_1() %}{{ return(adapter.dispatch('chain_20_1')()) }}{% endmacro %}
+{% macro default__chain_20_1() %}{% if false %}{{ chain_21_2() }}{% endif %}{{ chain_20_2() }} + 1{% endmacro %}
+
+{% macro chain_20_2() %}{{ return(adapter.dispatch('chain_20_2')()) }}{% endmacro %}
+{% macro default__chain_20_2() %}{% if false %}{{ chain_21_3() }}{% endif %}{{ chain_20_3() }} + 1{% endmacro %}
+
+{% macro chain_20_3() %}{{ return(adapter.dispatch('chain_20_3')()) }}{% endmacro %}
+{% macro default__chain_20_3() %}{% if false %}{{ chain_21_4() }}{% endif %}{{ chain_20_4() }} + 1{% endmacro %}
+
+{% macro chain_20_4() %}{{ return(adapter.dispatch('chain_20_4')()) }}{% endmacro %}
+{% macro default__chain_20_4() %}{% if false %}{{ chain_21_5() }}{% endif %}{{ chain_20_5() }} + 1{% endmacro %}
+
+{% macro chain_20_5() %}{{ return(adapter.dispatch('chain_20_5')()) }}{% endmacro %}
+{% macro default__chain_20_5() %}{% if false %}{{ chain_21_6() }}{% endif %}{{ chain_20_6() }} + 1{% endmacro %}
+
+{% macro chain_20_6() %}{{ return(adapter.dispatch('chain_20_6')()) }}{% endmacro %}
+{% macro default__chain_20_6() %}{% if false %}{{ chain_21_7() }}{% endif %}{{ chain_20_7() }} + 1{% endmacro %}
+
+{% macro chain_20_7() %}{{ return(adapter.dispatch('chain_20_7')()) }}{% endmacro %}
+{% macro default__chain_20_7() %}{% if false %}{{ chain_21_8() }}{% endif %}{{ chain_20_8() }} + 1{% endmacro %}
+
+{% macro chain_20_8() %}{{ return(adapter.dispatch('chain_20_8')()) }}{% endmacro %}
+{% macro default__chain_20_8() %}{% if false %}{{ chain_21_9() }}{% endif %}{{ chain_20_9() }} + 1{% endmacro %}
+
+{% macro chain_20_9() %}{{ return(adapter.dispatch('chain_20_9')()) }}{% endmacro %}
+{% macro default__chain_20_9() %}{% if false %}{{ chain_21_10() }}{% endif %}{{ chain_20_10() }} + 1{% endmacro %}
+
+{% macro chain_20_10() %}{{ return(adapter.dispatch('chain_20_10')()) }}{% endmacro %}
+{% macro default__chain_20_10() %}{% if false %}{{ chain_21_11() }}{% endif %}{{ chain_20_11() }} + 1{% endmacro %}
+
+{% macro chain_20_11() %}{{ return(adapter.dispatch('chain_20_11')()) }}{% endmacro %}
+{% macro default__chain_20_11() %}{% if false %}{{ chain_21_12() }}{% endif %}{{ chain_20_12() }} + 1{% endmacro %}
+
+{% macro chain_20_12() %}{{ return(adapter.dispatch('chain_20_12')()) }}{% endmacro %}
+{% macro default__chain_20_12() %}{% if false %}{{ chain_21_13() }}{% endif %}{{ chain_20_13() }} + 1{% endmacro %}
+
+{% macro chain_20_13() %}{{ return(adapter.dispatch('chain_20_13')()) }}{% endmacro %}
+{% macro default__chain_20_13() %}{% if false %}{{ chain_21_14() }}{% endif %}{{ chain_20_14() }} + 1{% endmacro %}
+
+{% macro chain_20_14() %}{{ return(adapter.dispatch('chain_20_14')()) }}{% endmacro %}
+{% macro default__chain_20_14() %}{% if false %}{{ chain_21_15() }}{% endif %}{{ chain_20_15() }} + 1{% endmacro %}
+
+{% macro chain_20_15() %}{{ return(adapter.dispatch('chain_20_15')()) }}{% endmacro %}
+{% macro default__chain_20_15() %}{% if false %}{{ chain_21_16() }}{% endif %}{{ chain_20_16() }} + 1{% endmacro %}
+
+{% macro chain_20_16() %}{{ return(adapter.dispatch('chain_20_16')()) }}{% endmacro %}
+{% macro default__chain_20_16() %}{% if false %}{{ chain_21_17() }}{% endif %}{{ chain_20_17() }} + 1{% endmacro %}
+
+{% macro chain_20_17() %}{{ return(adapter.dispatch('chain_20_17')()) }}{% endmacro %}
+{% macro default__chain_20_17() %}{% if false %}{{ chain_21_18() }}{% endif %}{{ chain_20_18() }} + 1{% endmacro %}
+
+{% macro chain_20_18() %}{{ return(adapter.dispatch('chain_20_18')()) }}{% endmacro %}
+{% macro default__chain_20_18() %}{% if false %}{{ chain_21_19() }}{% endif %}{{ chain_20_19() }} + 1{% endmacro %}
+
+{% macro chain_20_19() %}{{ return(adapter.dispatch('chain_20_19')()) }}{% endmacro %}
+{% macro default__chain_20_19() %}{% if false %}{{ chain_21_20() }}{% endif %}{{ chain_20_20() }} + 1{% endmacro %}
+
+{% macro chain_20_20() %}{{ return(adapter.dispatch('chain_20_20')()) }}{% endmacro %}
+{% macro default__chain_20_20() %}{% if false %}{{ chain_21_21() }}{% endif %}{{ chain_20_21() }} + 1{% endmacro %}
+
+{% macro chain_20_21() %}{{ return(adapter.dispatch('chain_20_21')()) }}{% endmacro %}
+{% macro default__chain_20_21() %}{% if false %}{{ chain_21_22() }}{% endif %}{{ chain_20_22() }} + 1{% endmacro %}
+
+{% macro chain_20_22() %}{{ return(adapter.dispatch('chain_20_22')()) }}{% endmacro %}
+{% macro default__chain_20_22() %}{% if false %}{{ chain_21_23() }}{% endif %}{{ chain_20_23() }} + 1{% endmacro %}
+
+{% macro chain_20_23() %}{{ return(adapter.dispatch('chain_20_23')()) }}{% endmacro %}
+{% macro default__chain_20_23() %}{% if false %}{{ chain_21_24() }}{% endif %}{{ chain_20_24() }} + 1{% endmacro %}
+
+{% macro chain_20_24() %}{{ return(adapter.dispatch('chain_20_24')()) }}{% endmacro %}
+{% macro default__chain_20_24() %}1{% endmacro %}
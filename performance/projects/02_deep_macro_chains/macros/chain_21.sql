@@ -0,0 +1,74 @@
+{% macro chain_21_0() %}{{ return(adapter.dispatch('chain_21_0')()) }}{% endmacro %}
+{% macro default__chain_21_0() %}{% if false %}{{ chain_22_1() }}{% endif %}{{ chain_21_1() }} + 1{% endmacro %}
+
+{% macro chain_21_1() %}{{ return(adapter.dispatch('chain_21_1')()) }}{% endmacro %}
+{% macro default__chain_21_1() %}{% if false %}{{ chain_22_2() }}{% endif %}{{ chain_21_2() }} + 1{% endmacro %}
+
+{% macro chain_21_2() %}{{ return(adapter.dispatch('chain_21_2')()) }}{% endmacro %}
+{% macro default__chain_21_2() %}{% if false %}{{ chain_22_3() }}{% endif %}{{ chain_21_3() }} + 1{% endmacro %}
+
+{% macro chain_21_3() %}{{ return(adapter.dispatch('chain_21_3')()) }}{% endmacro %}
+{% macro default__chain_21_3() %}{% if false %}{{ chain_22_4() }}{% endif %}{{ chain_21_4() }} + 1{% endmacro %}
+
+{% macro chain_21_4() %}{{ return(adapter.dispatch('chain_21_4')()) }}{% endmacro %}
+{% macro default__chain_21_4() %}{% if false %}{{ chain_22_5() }}{% endif %}{{ chain_21_5() }} + 1{% endmacro %}
+
+{% macro chain_21_5() %}{{ return(adapter.dispatch('chain_21_5')()) }}{% endmacro %}
+{% macro default__chain_21_5() %}{% if false %}{{ chain_22_6() }}{% endif %}{{ chain_21_6() }} + 1{% endmacro %}
+
+{% macro chain_21_6() %}{{ return(adapter.dispatch('chain_21_6')()) }}{% endmacro %}
+{% macro default__chain_21_6() %}{% if false %}{{ chain_22_7() }}{% endif %}{{ chain_21_7() }} + 1{% endmacro %}
+
+{% macro chain_21_7() %}{{ return(adapter.dispatch('chain_21_7')()) }}{% endmacro %}
+{% macro default__chain_21_7() %}{% if false %}{{ chain_22_8() }}{% endif %}{{ chain_21_8() }} + 1{% endmacro %}
+
+{% macro chain_21_8() %}{{ return(adapter.dispatch('chain_21_8')()) }}{% endmacro %}
+{% macro default__chain_21_8() %}{% if false %}{{ chain_22_9() }}{% endif %}{{ chain_21_9() }} + 1{% endmacro %}
+
+{% macro chain_21_9() %}{{ return(adapter.dispatch('chain_21_9')()) }}{% endmacro %}
+{% macro default__chain_21_9() %}{% if false %}{{ chain_22_10() }}{% endif %}{{ chain_21_10() }} + 1{% endmacro %}
+
+{% macro chain_21_10() %}{{ return(adapter.dispatch('chain_21_10')()) }}{% endmacro %}
+{% macro default__chain_21_10() %}{% if false %}{{ chain_22_11() }}{% endif %}{{ chain_21_11() }} + 1{% endmacro %}
+
+{% macro chain_21_11() %}{{ return(adapter.dispatch('chain_21_11')()) }}{% endmacro %}
+{% macro default__chain_21_11() %}{% if false %}{{ chain_22_12() }}{% endif %}{{ chain_21_12() }} + 1{% endmacro %}
+
+{% macro chain_21_12() %}{{ return(adapter.dispatch('chain_21_12')()) }}{% endmacro %}
+{% macro default__chain_21_12() %}{% if false %}{{ chain_22_13() }}{% endif %}{{ chain_21_13() }} + 1{% endmacro %}
+
+{% macro chain_21_13() %}{{ return(adapter.dispatch('chain_21_13')()) }}{% endmacro %}
+{% macro default__chain_21_13() %}{% if false %}{{ chain_22_14() }}{% endif %}{{ chain_21_14() }} + 1{% endmacro %}
+
+{% macro chain_21_14() %}{{ return(adapter.dispatch('chain_21_14')()) }}{% endmacro %}
+{% macro default__chain_21_14() %}{% if false %}{{ chain_22_15() }}{% endif %}{{ chain_21_15() }} + 1{% endmacro %}
+
+{% macro chain_21_15() %}{{ return(adapter.dispatch('chain_21_15')()) }}{% endmacro %}
+{% macro default__chain_21_15() %}{% if false %}{{ chain_22_16() }}{% endif %}{{ chain_21_16() }} + 1{% endmacro %}
+
+{% macro chain_21_16() %}{{ return(adapter.dispatch('chain_21_16')()) }}{% endmacro %}
+{% macro default__chain_21_16() %}{% if false %}{{ chain_22_17() }}{% endif %}{{ chain_21_17() }} + 1{% endmacro %}
+
+{% macro chain_21_17() %}{{ return(adapter.dispatch('chain_21_17')()) }}{% endmacro %}
+{% macro default__chain_21_17() %}{% if false %}{{ chain_22_18() }}{% endif %}{{ chain_21_18() }} + 1{% endmacro %}
+
+{% macro chain_21_18() %}{{ return(adapter.dispatch('chain_21_18')()) }}{% endmacro %}
+{% macro default__chain_21_18() %}{% if false %}{{ chain_22_19() }}{% endif %}{{ chain_21_19() }} + 1{% endmacro %}
+
+{% macro chain_21_19() %}{{ return(adapter.dispatch('chain_21_19')()) }}{% endmacro %}
+{% macro default__chain_21_19() %}{% if false %}{{ chain_22_20() }}{% endif %}{{ chain_21_20() }} + 1{% endmacro %}
+
+{% macro chain_21_20() %}{{ return(adapter.dispatch('chain_21_20')()) }}{% endmacro %}
+{% macro default__chain_21_20() %}{% if false %}{{ chain_22_21() }}{% endif %}{{ chain_21_21() }} + 1{% endmacro %}
+
+{% macro chain_21_21() %}{{ return(adapter.dispatch('chain_21_21')()) }}{% endmacro %}
+{% macro default__chain_21_21() %}{% if false %}{{ chain_22_22() }}{% endif %}{{ chain_21_22() }} + 1{% endmacro %}
+
+{% macro chain_21_22() %}{{ return(adapter.dispatch('chain_21_22')()) }}{% endmacro %}
+{% macro default__chain_21_22() %}{% if false %}{{ chain_22_23() }}{% endif %}{{ chain_21_23() }} + 1{% endmacro %}
+
+{% macro chain_21_23() %}{{ return(adapter.dispatch('chain_21_23')()) }}{% endmacro %}
+{% macro default__chain_21_23() %}{% if false %}{{ chain_22_24() }}{% endif %}{{ chain_21_24() }} + 1{% endmacro %}
+
+{% macro chain_21_24() %}{{ return(adapter.dispatch('chain_21_24')()) }}{% endmacro %}
+{% macro default__chain_21_24() %}1{% endmacro %}
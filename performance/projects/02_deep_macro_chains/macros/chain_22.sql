@@ -0,0 +1,74 @@
+{% macro chain_22_0() %}{{ return(adapter.dispatch('chain_22_0')()) }}{% endmacro %}
+{% macro default__chain_22_0() %}{% if false %}{{ chain_23_1() }}{% endif %}{{ chain_22_1() }} + 1{% endmacro %}
+
+{% macro chain_22_1() %}{{ return(adapter.dispatch('chain_22_1')()) }}{% endmacro %}
+{% macro default__chain_22_1() %}{% if false %}{{ chain_23_2() }}{% endif %}{{ chain_22_2() }} + 1{% endmacro %}
+
+{% macro chain_22_2() %}{{ return(adapter.dispatch('chain_22_2')()) }}{% endmacro %}
+{% macro default__chain_22_2() %}{% if false %}{{ chain_23_3() }}{% endif %}{{ chain_22_3() }} + 1{% endmacro %}
+
+{% macro chain_22_3() %}{{ return(adapter.dispatch('chain_22_3')()) }}{% endmacro %}
+{% macro default__chain_22_3() %}{% if false %}{{ chain_23_4() }}{% endif %}{{ chain_22_4() }} + 1{% endmacro %}
+
+{% macro chain_22_4() %}{{ return(adapter.dispatch('chain_22_4')()) }}{% endmacro %}
+{% macro default__chain_22_4() %}{% if false %}{{ chain_23_5() }}{% endif %}{{ chain_22_5() }} + 1{% endmacro %}
+
+{% macro chain_22_5() %}{{ return(adapter.dispatch('chain_22_5')()) }}{% endmacro %}
+{% macro default__chain_22_5() %}{% if false %}{{ chain_23_6() }}{% endif %}{{ chain_22_6() }} + 1{% endmacro %}
+
+{% macro chain_22_6() %}{{ return(adapter.dispatch('chain_22_6')()) }}{% endmacro %}
+{% macro default__chain_22_6() %}{% if false %}{{ chain_23_7() }}{% endif %}{{ chain_22_7() }} + 1{% endmacro %}
+
+{% macro chain_22_7() %}{{ return(adapter.dispatch('chain_22_7')()) }}{% endmacro %}
+{% macro default__chain_22_7() %}{% if false %}{{ chain_23_8() }}{% endif %}{{ chain_22_8() }} + 1{% endmacro %}
+
+{% macro chain_22_8() %}{{ return(adapter.dispatch('chain_22_8')()) }}{% endmacro %}
+{% macro default__chain_22_8() %}{% if false %}{{ chain_23_9() }}{% endif %}{{ chain_22_9() }} + 1{% endmacro %}
+
+{% macro chain_22_9() %}{{ return(adapter.dispatch('chain_22_9')()) }}{% endmacro %}
+{% macro default__chain_22_9() %}{% if false %}{{ chain_23_10() }}{% endif %}{{ chain_22_10() }} + 1{% endmacro %}
+
+{% macro chain_22_10() %}{{ return(adapter.dispatch('chain_22_10')()) }}{% endmacro %}
+{% macro default__chain_22_10() %}{% if false %}{{ chain_23_11() }}{% endif %}{{ chain_22_11() }} + 1{% endmacro %}
+
+{% macro chain_22_11() %}{{ return(adapter.dispatch('chain_22_11')()) }}{% endmacro %}
+{% macro default__chain_22_11() %}{% if false %}{{ chain_23_12() }}{% endif %}{{ chain_22_12() }} + 1{% endmacro %}
+
+{% macro chain_22_12() %}{{ return(adapter.dispatch('chain_22_12')()) }}{% endmacro %}
+{% macro default__chain_22_12() %}{% if false %}{{ chain_23_13() }}{% endif %}{{ chain_22_13() }} + 1{% endmacro %}
+
+{% macro chain_22_13() %}{{ return(adapter.dispatch('chain_22_13')()) }}{% endmacro %}
+{% macro default__chain_22_13() %}{% if false %}{{ chain_23_14() }}{% endif %}{{ chain_22_14() }} + 1{% endmacro %}
+
+{% macro chain_22_14() %}{{ return(adapter.dispatch('chain_22_14')()) }}{% endmacro %}
+{% macro default__chain_22_14() %}{% if false %}{{ chain_23_15() }}{% endif %}{{ chain_22_15() }} + 1{% endmacro %}
+
+{% macro chain_22_15() %}{{ return(adapter.dispatch('chain_22_15')()) }}{% endmacro %}
+{% macro default__chain_22_15() %}{% if false %}{{ chain_23_16() }}{% endif %}{{ chain_22_16() }} + 1{% endmacro %}
+
+{% macro chain_22_16() %}{{ return(adapter.dispatch('chain_22_16')()) }}{% endmacro %}
+{% macro default__chain_22_16() %}{% if false %}{{ chain_23_17() }}{% endif %}{{ chain_22_17() }} + 1{% endmacro %}
+
+{% macro chain_22_17() %}{{ return(adapter.dispatch('chain_22_17')()) }}{% endmacro %}
+{% macro default__chain_22_17() %}{% if false %}{{ chain_23_18() }}{% endif %}{{ chain_22_18() }} + 1{% endmacro %}
+
+{% macro chain_22_18() %}{{ return(adapter.dispatch('chain_22_18')()) }}{% endmacro %}
+{% macro default__chain_22_18() %}{% if false %}{{ chain_23_19() }}{% endif %}{{ chain_22_19() }} + 1{% endmacro %}
+
+{% macro chain_22_19() %}{{ return(adapter.dispatch('chain_22_19')()) }}{% endmacro %}
+{% macro default__chain_22_19() %}{% if false %}{{ chain_23_20() }}{% endif %}{{ chain_22_20() }} + 1{% endmacro %}
+
+{% macro chain_22_20() %}{{ return(adapter.dispatch('chain_22_20')()) }}{% endmacro %}
+{% macro default__chain_22_20() %}{% if false %}{{ chain_23_21() }}{% endif %}{{ chain_22_21() }} + 1{% endmacro %}
+
+{% macro chain_22_21() %}{{ return(adapter.dispatch('chain_22_21')()) }}{% endmacro %}
+{% macro default__chain_22_21() %}{% if false %}{{ chain_23_22() }}{% endif %}{{ chain_22_22() }} + 1{% endmacro %}
+
+{% macro chain_22_22() %}{{ return(adapter.dispatch('chain_22_22')()) }}{% endmacro %}
+{% macro default__chain_22_22() %}{% if false %}{{ chain_23_23() }}{% endif %}{{ chain_22_23() }} + 1{% endmacro %}
+
+{% macro chain_22_23() %}{{ return(adapter.dispatch('chain_22_23')()) }}{% endmacro %}
+{% macro default__chain_22_23() %}{% if false %}{{ chain_23_24() }}{% endif %}{{ chain_22_24() }} + 1{% endmacro %}
+
+{% macro chain_22_24() %}{{ return(adapter.dispatch('chain_22_24')()) }}{% endmacro %}
+{% macro default__chain_22_24() %}1{% endmacro %}
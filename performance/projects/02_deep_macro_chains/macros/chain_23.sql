@@ -0,0 +1,74 @@
+{% macro chain_23_0() %}{{ return(adapter.dispatch('chain_23_0')()) }}{% endmacro %}
+{% macro default__chain_23_0() %}{% if false %}{{ chain_24_1() }}{% endif %}{{ chain_23_1() }} + 1{% endmacro %}
+
+{% macro chain_23_1() %}{{ return(adapter.dispatch('chain_23_1')()) }}{% endmacro %}
+{% macro default__chain_23_1() %}{% if false %}{{ chain_24_2() }}{% endif %}{{ chain_23_2() }} + 1{% endmacro %}
+
+{% macro chain_23_2() %}{{ return(adapter.dispatch('chain_23_2')()) }}{% endmacro %}
+{% macro default__chain_23_2() %}{% if false %}{{ chain_24_3() }}{% endif %}{{ chain_23_3() }} + 1{% endmacro %}
+
+{% macro chain_23_3() %}{{ return(adapter.dispatch('chain_23_3')()) }}{% endmacro %}
+{% macro default__chain_23_3() %}{% if false %}{{ chain_24_4() }}{% endif %}{{ chain_23_4() }} + 1{% endmacro %}
+
+{% macro chain_23_4() %}{{ return(adapter.dispatch('chain_23_4')()) }}{% endmacro %}
+{% macro default__chain_23_4() %}{% if false %}{{ chain_24_5() }}{% endif %}{{ chain_23_5() }} + 1{% endmacro %}
+
+{% macro chain_23_5() %}{{ return(adapter.dispatch('chain_23_5')()) }}{% endmacro %}
+{% macro default__chain_23_5() %}{% if false %}{{ chain_24_6() }}{% endif %}{{ chain_23_6() }} + 1{% endmacro %}
+
+{% macro chain_23_6() %}{{ return(adapter.dispatch('chain_23_6')()) }}{% endmacro %}
+{% macro default__chain_23_6() %}{% if false %}{{ chain_24_7() }}{% endif %}{{ chain_23_7() }} + 1{% endmacro %}
+
+{% macro chain_23_7() %}{{ return(adapter.dispatch('chain_23_7')()) }}{% endmacro %}
+{% macro default__chain_23_7() %}{% if false %}{{ chain_24_8() }}{% endif %}{{ chain_23_8() }} + 1{% endmacro %}
+
+{% macro chain_23_8() %}{{ return(adapter.dispatch('chain_23_8')()) }}{% endmacro %}
+{% macro default__chain_23_8() %}{% if false %}{{ chain_24_9() }}{% endif %}{{ chain_23_9() }} + 1{% endmacro %}
+
+{% macro chain_23_9() %}{{ return(adapter.dispatch('chain_23_9')()) }}{% endmacro %}
+{% macro default__chain_23_9() %}{% if false %}{{ chain_24_10() }}{% endif %}{{ chain_23_10() }} + 1{% endmacro %}
+
+{% macro chain_23_10() %}{{ return(adapter.dispatch('chain_23_10')()) }}{% endmacro %}
+{% macro default__chain_23_10() %}{% if false %}{{ chain_24_11() }}{% endif %}{{ chain_23_11() }} + 1{% endmacro %}
+
+{% macro chain_23_11() %}{{ return(adapter.dispatch('chain_23_11')()) }}{% endmacro %}
+{% macro default__chain_23_11() %}{% if false %}{{ chain_24_12() }}{% endif %}{{ chain_23_12() }} + 1{% endmacro %}
+
+{% macro chain_23_12() %}{{ return(adapter.dispatch('chain_23_12')()) }}{% endmacro %}
+{% macro default__chain_23_12() %}{% if false %}{{ chain_24_13() }}{% endif %}{{ chain_23_13() }} + 1{% endmacro %}
+
+{% macro chain_23_13() %}{{ return(adapter.dispatch('chain_23_13')()) }}{% endmacro %}
+{% macro default__chain_23_13() %}{% if false %}{{ chain_24_14() }}{% endif %}{{ chain_23_14() }} + 1{% endmacro %}
+
+{% macro chain_23_14() %}{{ return(adapter.dispatch('chain_23_14')()) }}{% endmacro %}
+{% macro default__chain_23_14() %}{% if false %}{{ chain_24_15() }}{% endif %}{{ chain_23_15() }} + 1{% endmacro %}
+
+{% macro chain_23_15() %}{{ return(adapter.dispatch('chain_23_15')()) }}{% endmacro %}
+{% macro default__chain_23_15() %}{% if false %}{{ chain_24_16() }}{% endif %}{{ chain_23_16() }} + 1{% endmacro %}
+
+{% macro chain_23_16() %}{{ return(adapter.dispatch('chain_23_16')()) }}{% endmacro %}
+{% macro default__chain_23_16() %}{% if false %}{{ chain_24_17() }}{% endif %}{{ chain_23_17() }} + 1{% endmacro %}
+
+{% macro chain_23_17() %}{{ return(adapter.dispatch('chain_23_17')()) }}{% endmacro %}
+{% macro default__chain_23_17() %}{% if false %}{{ chain_24_18() }}{% endif %}{{ chain_23_18() }} + 1{% endmacro %}
+
+{% macro chain_23_18() %}{{ return(adapter.dispatch('chain_23_18')()) }}{% endmacro %}
+{% macro default__chain_23_18() %}{% if false %}{{ chain_24_19() }}{% endif %}{{ chain_23_19() }} + 1{% endmacro %}
+
+{% macro chain_23_19() %}{{ return(adapter.dispatch('chain_23_19')()) }}{% endmacro %}
+{% macro default__chain_23_19() %}{% if false %}{{ chain_24_20() }}{% endif %}{{ chain_23_20() }} + 1{% endmacro %}
+
+{% macro chain_23_20() %}{{ return(adapter.dispatch('chain_23_20')()) }}{% endmacro %}
+{% macro default__chain_23_20() %}{% if false %}{{ chain_24_21() }}{% endif %}{{ chain_23_21() }} + 1{% endmacro %}
+
+{% macro chain_23_21() %}{{ return(adapter.dispatch('chain_23_21')()) }}{% endmacro %}
+{% macro default__chain_23_21() %}{% if false %}{{ chain_24_22() }}{% endif %}{{ chain_23_22() }} + 1{% endmacro %}
+
+{% macro chain_23_22() %}{{ return(adapter.dispatch('chain_23_22')()) }}{% endmacro %}
+{% macro default__chain_23_22() %}{% if false %}{{ chain_24_23() }}{% endif %}{{ chain_23_23() }} + 1{% endmacro %}
+
+{% macro chain_23_23() %}{{ return(adapter.dispatch('chain_23_23')()) }}{% endmacro %}
+{% macro default__chain_23_23() %}{% if false %}{{ chain_24_24() }}{% endif %}{{ chain_23_24() }} + 1{% endmacro %}
+
+{% macro chain_23_24() %}{{ return(adapter.dispatch('chain_23_24')()) }}{% endmacro %}
+{% macro default__chain_23_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_24_0() %}{{ return(adapter.dispatch('chain_24_0')()) }}{% endmacro %}
+{% macro default__chain_24_0() %}{% if false %}{{ chain_25_1() }}{% endif %}{{ chain_24_1() }} + 1{% endmacro %}
+
+{% macro chain_24_1() %}{{ return(adapter.dispatch('chain_24_1')()) }}{% endmacro %}
+{% macro default__chain_24_1() %}{% if false %}{{ chain_25_2() }}{% endif %}{{ chain_24_2() }} + 1{% endmacro %}
+
+{% macro chain_24_2() %}{{ return(adapter.dispatch('chain_24_2')()) }}{% endmacro %}
+{% macro default__chain_24_2() %}{% if false %}{{ chain_25_3() }}{% endif %}{{ chain_24_3() }} + 1{% endmacro %}
+
+{% macro chain_24_3() %}{{ return(adapter.dispatch('chain_24_3')()) }}{% endmacro %}
+{% macro default__chain_24_3() %}{% if false %}{{ chain_25_4() }}{% endif %}{{ chain_24_4() }} + 1{% endmacro %}
+
+{% macro chain_24_4() %}{{ return(adapter.dispatch('chain_24_4')()) }}{% endmacro %}
+{% macro default__chain_24_4() %}{% if false %}{{ chain_25_5() }}{% endif %}{{ chain_24_5() }} + 1{% endmacro %}
+
+{% macro chain_24_5() %}{{ return(adapter.dispatch('chain_24_5')()) }}{% endmacro %}
+{% macro default__chain_24_5() %}{% if false %}{{ chain_25_6() }}{% endif %}{{ chain_24_6() }} + 1{% endmacro %}
+
+{% macro chain_24_6() %}{{ return(adapter.dispatch('chain_24_6')()) }}{% endmacro %}
+{% macro default__chain_24_6() %}{% if false %}{{ chain_25_7() }}{% endif %}{{ chain_24_7() }} + 1{% endmacro %}
+
+{% macro chain_24_7() %}{{ return(adapter.dispatch('chain_24_7')()) }}{% endmacro %}
+{% macro default__chain_24_7() %}{% if false %}{{ chain_25_8() }}{% endif %}{{ chain_24_8() }} + 1{% endmacro %}
+
+{% macro chain_24_8() %}{{ return(adapter.dispatch('chain_24_8')()) }}{% endmacro %}
+{% macro default__chain_24_8() %}{% if false %}{{ chain_25_9() }}{% endif %}{{ chain_24_9() }} + 1{% endmacro %}
+
+{% macro chain_24_9() %}{{ return(adapter.dispatch('chain_24_9')()) }}{% endmacro %}
+{% macro default__chain_24_9() %}{% if false %}{{ chain_25_10() }}{% endif %}{{ chain_24_10() }} + 1{% endmacro %}
+
+{% macro chain_24_10() %}{{ return(adapter.dispatch('chain_24_10')()) }}{% endmacro %}
+{% macro default__chain_24_10() %}{% if false %}{{ chain_25_11() }}{% endif %}{{ chain_24_11() }} + 1{% endmacro %}
+
+{% macro chain_24_11() %}{{ return(adapter.dispatch('chain_24_11')()) }}{% endmacro %}
+{% macro default__chain_24_11() %}{% if false %}{{ chain_25_12() }}{% endif %}{{ chain_24_12() }} + 1{% endmacro %}
+
+{% macro chain_24_12() %}{{ return(adapter.dispatch('chain_24_12')()) }}{% endmacro %}
+{% macro default__chain_24_12() %}{% if false %}{{ chain_25_13() }}{% endif %}{{ chain_24_13() }} + 1{% endmacro %}
+
+{% macro chain_24_13() %}{{ return(adapter.dispatch('chain_24_13')()) }}{% endmacro %}
+{% macro default__chain_24_13() %}{% if false %}{{ chain_25_14() }}{% endif %}{{ chain_24_14() }} + 1{% endmacro %}
+
+{% macro chain_24_14() %}{{ return(adapter.dispatch('chain_24_14')()) }}{% endmacro %}
+{% macro default__chain_24_14() %}{% if false %}{{ chain_25_15() }}{% endif %}{{ chain_24_15() }} + 1{% endmacro %}
+
+{% macro chain_24_15() %}{{ return(adapter.dispatch('chain_24_15')()) }}{% endmacro %}
+{% macro default__chain_24_15() %}{% if false %}{{ chain_25_16() }}{% endif %}{{ chain_24_16() }} + 1{% endmacro %}
+
+{% macro chain_24_16() %}{{ return(adapter.dispatch('chain_24_16')()) }}{% endmacro %}
+{% macro default__chain_24_16() %}{% if false %}{{ chain_25_17() }}{% endif %}{{ chain_24_17() }} + 1{% endmacro %}
+
+{% macro chain_24_17() %}{{ return(adapter.dispatch('chain_24_17')()) }}{% endmacro %}
+{% macro default__chain_24_17() %}{% if false %}{{ chain_25_18() }}{% endif %}{{ chain_24_18() }} + 1{% endmacro %}
+
+{% macro chain_24_18() %}{{ return(adapter.dispatch('chain_24_18')()) }}{% endmacro %}
+{% macro default__chain_24_18() %}{% if false %}{{ chain_25_19() }}{% endif %}{{ chain_24_19() }} + 1{% endmacro %}
+
+{% macro chain_24_19() %}{{ return(adapter.dispatch('chain_24_19')()) }}{% endmacro %}
+{% macro default__chain_24_19() %}{% if false %}{{ chain_25_20() }}{% endif %}{{ chain_24_20() }} + 1{% endmacro %}
+
+{% macro chain_24_20() %}{{ return(adapter.dispatch('chain_24_20')()) }}{% endmacro %}
+{% macro default__chain_24_20() %}{% if false %}{{ chain_25_21() }}{% endif %}{{ chain_24_21() }} + 1{% endmacro %}
+
+{% macro chain_24_21() %}{{ return(adapter.dispatch('chain_24_21')()) }}{% endmacro %}
+{% macro default__chain_24_21() %}{% if false %}{{ chain_25_22() }}{% endif %}{{ chain_24_22() }} + 1{% endmacro %}
+
+{% macro chain_24_22() %}{{ return(adapter.dispatch('chain_24_22')()) }}{% endmacro %}
+{% macro default__chain_24_22() %}{% if false %}{{ chain_25_23() }}{% endif %}{{ chain_24_23() }} + 1{% endmacro %}
+
+{% macro chain_24_23() %}{{ return(adapter.dispatch('chain_24_23')()) }}{% endmacro %}
+{% macro default__chain_24_23() %}{% if false %}{{ chain_25_24() }}{% endif %}{{ chain_24_24() }} + 1{% endmacro %}
+
+{% macro chain_24_24() %}{{ return(adapter.dispatch('chain_24_24')()) }}{% endmacro %}
+{% macro default__chain_24_24() %}1{% endmacro %}
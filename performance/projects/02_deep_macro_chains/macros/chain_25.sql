@@ -0,0 +1,74 @@
+{% macro chain_25_0() %}{{ return(adapter.dispatch('chain_25_0')()) }}{% endmacro %}
+{% macro default__chain_25_0() %}{% if false %}{{ chain_26_1() }}{% endif %}{{ chain_25_1() }} + 1{% endmacro %}
+
+{% macro chain_25_1() %}{{ return(adapter.dispatch('chain_25_1')()) }}{% endmacro %}
+{% macro default__chain_25_1() %}{% if false %}{{ chain_26_2() }}{% endif %}{{ chain_25_2() }} + 1{% endmacro %}
+
+{% macro chain_25_2() %}{{ return(adapter.dispatch('chain_25_2')()) }}{% endmacro %}
+{% macro default__chain_25_2() %}{% if false %}{{ chain_26_3() }}{% endif %}{{ chain_25_3() }} + 1{% endmacro %}
+
+{% macro chain_25_3() %}{{ return(adapter.dispatch('chain_25_3')()) }}{% endmacro %}
+{% macro default__chain_25_3() %}{% if false %}{{ chain_26_4() }}{% endif %}{{ chain_25_4() }} + 1{% endmacro %}
+
+{% macro chain_25_4() %}{{ return(adapter.dispatch('chain_25_4')()) }}{% endmacro %}
+{% macro default__chain_25_4() %}{% if false %}{{ chain_26_5() }}{% endif %}{{ chain_25_5() }} + 1{% endmacro %}
+
+{% macro chain_25_5() %}{{ return(adapter.dispatch('chain_25_5')()) }}{% endmacro %}
+{% macro default__chain_25_5() %}{% if false %}{{ chain_26_6() }}{% endif %}{{ chain_25_6() }} + 1{% endmacro %}
+
+{% macro chain_25_6() %}{{ return(adapter.dispatch('chain_25_6')()) }}{% endmacro %}
+{% macro default__chain_25_6() %}{% if false %}{{ chain_26_7() }}{% endif %}{{ chain_25_7() }} + 1{% endmacro %}
+
+{% macro chain_25_7() %}{{ return(adapter.dispatch('chain_25_7')()) }}{% endmacro %}
+{% macro default__chain_25_7() %}{% if false %}{{ chain_26_8() }}{% endif %}{{ chain_25_8() }} + 1{% endmacro %}
+
+{% macro chain_25_8() %}{{ return(adapter.dispatch('chain_25_8')()) }}{% endmacro %}
+{% macro default__chain_25_8() %}{% if false %}{{ chain_26_9() }}{% endif %}{{ chain_25_9() }} + 1{% endmacro %}
+
+{% macro chain_25_9() %}{{ return(adapter.dispatch('chain_25_9')()) }}{% endmacro %}
+{% macro default__chain_25_9() %}{% if false %}{{ chain_26_10() }}{% endif %}{{ chain_25_10() }} + 1{% endmacro %}
+
+{% macro chain_25_10() %}{{ return(adapter.dispatch('chain_25_10')()) }}{% endmacro %}
+{% macro default__chain_25_10() %}{% if false %}{{ chain_26_11() }}{% endif %}{{ chain_25_11() }} + 1{% endmacro %}
+
+{% macro chain_25_11() %}{{ return(adapter.dispatch('chain_25_11')()) }}{% endmacro %}
+{% macro default__chain_25_11() %}{% if false %}{{ chain_26_12() }}{% endif %}{{ chain_25_12() }} + 1{% endmacro %}
+
+{% macro chain_25_12() %}{{ return(adapter.dispatch('chain_25_12')()) }}{% endmacro %}
+{% macro default__chain_25_12() %}{% if false %}{{ chain_26_13() }}{% endif %}{{ chain_25_13() }} + 1{% endmacro %}
+
+{% macro chain_25_13() %}{{ return(adapter.dispatch('chain_25_13')()) }}{% endmacro %}
+{% macro default__chain_25_13() %}{% if false %}{{ chain_26_14() }}{% endif %}{{ chain_25_14() }} + 1{% endmacro %}
+
+{% macro chain_25_14() %}{{ return(adapter.dispatch('chain_25_14')()) }}{% endmacro %}
+{% macro default__chain_25_14() %}{% if false %}{{ chain_26_15() }}{% endif %}{{ chain_25_15() }} + 1{% endmacro %}
+
+{% macro chain_25_15() %}{{ return(adapter.dispatch('chain_25_15')()) }}{% endmacro %}
+{% macro default__chain_25_15() %}{% if false %}{{ chain_26_16() }}{% endif %}{{ chain_25_16() }} + 1{% endmacro %}
+
+{% macro chain_25_16() %}{{ return(adapter.dispatch('chain_25_16')()) }}{% endmacro %}
+{% macro default__chain_25_16() %}{% if false %}{{ chain_26_17() }}{% endif %}{{ chain_25_17() }} + 1{% endmacro %}
+
+{% macro chain_25_17() %}{{ return(adapter.dispatch('chain_25_17')()) }}{% endmacro %}
+{% macro default__chain_25_17() %}{% if false %}{{ chain_26_18() }}{% endif %}{{ chain_25_18() }} + 1{% endmacro %}
+
+{% macro chain_25_18() %}{{ return(adapter.dispatch('chain_25_18')()) }}{% endmacro %}
+{% macro default__chain_25_18() %}{% if false %}{{ chain_26_19() }}{% endif %}{{ chain_25_19() }} + 1{% endmacro %}
+
+{% macro chain_25_19() %}{{ return(adapter.dispatch('chain_25_19')()) }}{% endmacro %}
+{% macro default__chain_25_19() %}{% if false %}{{ chain_26_20() }}{% endif %}{{ chain_25_20() }} + 1{% endmacro %}
+
+{% macro chain_25_20() %}{{ return(adapter.dispatch('chain_25_20')()) }}{% endmacro %}
+{% macro default__chain_25_20() %}{% if false %}{{ chain_26_21() }}{% endif %}{{ chain_25_21() }} + 1{% endmacro %}
+
+{% macro chain_25_21() %}{{ return(adapter.dispatch('chain_25_21')()) }}{% endmacro %}
+{% macro default__chain_25_21() %}{% if false %}{{ chain_26_22() }}{% endif %}{{ chain_25_22() }} + 1{% endmacro %}
+
+{% macro chain_25_22() %}{{ return(adapter.dispatch('chain_25_22')()) }}{% endmacro %}
+{% macro default__chain_25_22() %}{% if false %}{{ chain_26_23() }}{% endif %}{{ chain_25_23() }} + 1{% endmacro %}
+
+{% macro chain_25_23() %}{{ return(adapter.dispatch('chain_25_23')()) }}{% endmacro %}
+{% macro default__chain_25_23() %}{% if false %}{{ chain_26_24() }}{% endif %}{{ chain_25_24() }} + 1{% endmacro %}
+
+{% macro chain_25_24() %}{{ return(adapter.dispatch('chain_25_24')()) }}{% endmacro %}
+{% macro default__chain_25_24() %}1{% endmacro %}
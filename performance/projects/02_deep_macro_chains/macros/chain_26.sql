@@ -0,0 +1,74 @@
+{% macro chain_26_0() %}{{ return(adapter.dispatch('chain_26_0')()) }}{% endmacro %}
+{% macro default__chain_26_0() %}{% if false %}{{ chain_27_1() }}{% endif %}{{ chain_26_1() }} + 1{% endmacro %}
+
+{% macro chain_26_1() %}{{ return(adapter.dispatch('chain_26_1')()) }}{% endmacro %}
+{% macro default__chain_26_1() %}{% if false %}{{ chain_27_2() }}{% endif %}{{ chain_26_2() }} + 1{% endmacro %}
+
+{% macro chain_26_2() %}{{ return(adapter.dispatch('chain_26_2')()) }}{% endmacro %}
+{% macro default__chain_26_2() %}{% if false %}{{ chain_27_3() }}{% endif %}{{ chain_26_3() }} + 1{% endmacro %}
+
+{% macro chain_26_3() %}{{ return(adapter.dispatch('chain_26_3')()) }}{% endmacro %}
+{% macro default__chain_26_3() %}{% if false %}{{ chain_27_4() }}{% endif %}{{ chain_26_4() }} + 1{% endmacro %}
+
+{% macro chain_26_4() %}{{ return(adapter.dispatch('chain_26_4')()) }}{% endmacro %}
+{% macro default__chain_26_4() %}{% if false %}{{ chain_27_5() }}{% endif %}{{ chain_26_5() }} + 1{% endmacro %}
+
+{% macro chain_26_5() %}{{ return(adapter.dispatch('chain_26_5')()) }}{% endmacro %}
+{% macro default__chain_26_5() %}{% if false %}{{ chain_27_6() }}{% endif %}{{ chain_26_6() }} + 1{% endmacro %}
+
+{% macro chain_26_6() %}{{ return(adapter.dispatch('chain_26_6')()) }}{% endmacro %}
+{% macro default__chain_26_6() %}{% if false %}{{ chain_27_7() }}{% endif %}{{ chain_26_7() }} + 1{% endmacro %}
+
+{% macro chain_26_7() %}{{ return(adapter.dispatch('chain_26_7')()) }}{% endmacro %}
+{% macro default__chain_26_7() %}{% if false %}{{ chain_27_8() }}{% endif %}{{ chain_26_8() }} + 1{% endmacro %}
+
+{% macro chain_26_8() %}{{ return(adapter.dispatch('chain_26_8')()) }}{% endmacro %}
+{% macro default__chain_26_8() %}{% if false %}{{ chain_27_9() }}{% endif %}{{ chain_26_9() }} + 1{% endmacro %}
+
+{% macro chain_26_9() %}{{ return(adapter.dispatch('chain_26_9')()) }}{% endmacro %}
+{% macro default__chain_26_9() %}{% if false %}{{ chain_27_10() }}{% endif %}{{ chain_26_10() }} + 1{% endmacro %}
+
+{% macro chain_26_10() %}{{ return(adapter.dispatch('chain_26_10')()) }}{% endmacro %}
+{% macro default__chain_26_10() %}{% if false %}{{ chain_27_11() }}{% endif %}{{ chain_26_11() }} + 1{% endmacro %}
+
+{% macro chain_26_11() %}{{ return(adapter.dispatch('chain_26_11')()) }}{% endmacro %}
+{% macro default__chain_26_11() %}{% if false %}{{ chain_27_12() }}{% endif %}{{ chain_26_12() }} + 1{% endmacro %}
+
+{% macro chain_26_12() %}{{ return(adapter.dispatch('chain_26_12')()) }}{% endmacro %}
+{% macro default__chain_26_12() %}{% if false %}{{ chain_27_13() }}{% endif %}{{ chain_26_13() }} + 1{% endmacro %}
+
+{% macro chain_26_13() %}{{ return(adapter.dispatch('chain_26_13')()) }}{% endmacro %}
+{% macro default__chain_26_13() %}{% if false %}{{ chain_27_14() }}{% endif %}{{ chain_26_14() }} + 1{% endmacro %}
+
+{% macro chain_26_14() %}{{ return(adapter.dispatch('chain_26_14')()) }}{% endmacro %}
+{% macro default__chain_26_14() %}{% if false %}{{ chain_27_15() }}{% endif %}{{ chain_26_15() }} + 1{% endmacro %}
+
+{% macro chain_26_15() %}{{ return(adapter.dispatch('chain_26_15')()) }}{% endmacro %}
+{% macro default__chain_26_15() %}{% if false %}{{ chain_27_16() }}{% endif %}{{ chain_26_16() }} + 1{% endmacro %}
+
+{% macro chain_26_16() %}{{ return(adapter.dispatch('chain_26_16')()) }}{% endmacro %}
+{% macro default__chain_26_16() %}{% if false %}{{ chain_27_17() }}{% endif %}{{ chain_26_17() }} + 1{% endmacro %}
+
+{% macro chain_26_17() %}{{ return(adapter.dispatch('chain_26_17')()) }}{% endmacro %}
+{% macro default__chain_26_17() %}{% if false %}{{ chain_27_18() }}{% endif %}{{ chain_26_18() }} + 1{% endmacro %}
+
+{% macro chain_26_18() %}{{ return(adapter.dispatch('chain_26_18')()) }}{% endmacro %}
+{% macro default__chain_26_18() %}{% if false %}{{ chain_27_19() }}{% endif %}{{ chain_26_19() }} + 1{% endmacro %}
+
+{% macro chain_26_19() %}{{ return(adapter.dispatch('chain_26_19')()) }}{% endmacro %}
+{% macro default__chain_26_19() %}{% if false %}{{ chain_27_20() }}{% endif %}{{ chain_26_20() }} + 1{% endmacro %}
+
+{% macro chain_26_20() %}{{ return(adapter.dispatch('chain_26_20')()) }}{% endmacro %}
+{% macro default__chain_26_20() %}{% if false %}{{ chain_27_21() }}{% endif %}{{ chain_26_21() }} + 1{% endmacro %}
+
+{% macro chain_26_21() %}{{ return(adapter.dispatch('chain_26_21')()) }}{% endmacro %}
+{% macro default__chain_26_21() %}{% if false %}{{ chain_27_22() }}{% endif %}{{ chain_26_22() }} + 1{% endmacro %}
+
+{% macro chain_26_22() %}{{ return(adapter.dispatch('chain_26_22')()) }}{% endmacro %}
+{% macro default__chain_26_22() %}{% if false %}{{ chain_27_23() }}{% endif %}{{ chain_26_23() }} + 1{% endmacro %}
+
+{% macro chain_26_23() %}{{ return(adapter.dispatch('chain_26_23')()) }}{% endmacro %}
+{% macro default__chain_26_23() %}{% if false %}{{ chain_27_24() }}{% endif %}{{ chain_26_24() }} + 1{% endmacro %}
+
+{% macro chain_26_24() %}{{ return(adapter.dispatch('chain_26_24')()) }}{% endmacro %}
+{% macro default__chain_26_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_27_0() %}{{ return(adapter.dispatch('chain_27_0')()) }}{% endmacro %}
+{% macro default__chain_27_0() %}{% if false %}{{ chain_28_1() }}{% endif %}{{ chain_27_1() }} + 1{% endmacro %}
+
+{% macro chain_27_1() %}{{ return(adapter.dispatch('chain_27_1')()) }}{% endmacro %}
+{% macro default__chain_27_1() %}{% if false %}{{ chain_28_2() }}{% endif %}{{ chain_27_2() }} + 1{% endmacro %}
+
+{% macro chain_27_2() %}{{ return(adapter.dispatch('chain_27_2')()) }}{% endmacro %}
+{% macro default__chain_27_2() %}{% if false %}{{ chain_28_3() }}{% endif %}{{ chain_27_3() }} + 1{% endmacro %}
+
+{% macro chain_27_3() %}{{ return(adapter.dispatch('chain_27_3')()) }}{% endmacro %}
+{% macro default__chain_27_3() %}{% if false %}{{ chain_28_4() }}{% endif %}{{ chain_27_4() }} + 1{% endmacro %}
+
+{% macro chain_27_4() %}{{ return(adapter.dispatch('chain_27_4')()) }}{% endmacro %}
+{% macro default__chain_27_4() %}{% if false %}{{ chain_28_5() }}{% endif %}{{ chain_27_5() }} + 1{% endmacro %}
+
+{% macro chain_27_5() %}{{ return(adapter.dispatch('chain_27_5')()) }}{% endmacro %}
+{% macro default__chain_27_5() %}{% if false %}{{ chain_28_6() }}{% endif %}{{ chain_27_6() }} + 1{% endmacro %}
+
+{% macro chain_27_6() %}{{ return(adapter.dispatch('chain_27_6')()) }}{% endmacro %}
+{% macro default__chain_27_6() %}{% if false %}{{ chain_28_7() }}{% endif %}{{ chain_27_7() }} + 1{% endmacro %}
+
+{% macro chain_27_7() %}{{ return(adapter.dispatch('chain_27_7')()) }}{% endmacro %}
+{% macro default__chain_27_7() %}{% if false %}{{ chain_28_8() }}{% endif %}{{ chain_27_8() }} + 1{% endmacro %}
+
+{% macro chain_27_8() %}{{ return(adapter.dispatch('chain_27_8')()) }}{% endmacro %}
+{% macro default__chain_27_8() %}{% if false %}{{ chain_28_9() }}{% endif %}{{ chain_27_9() }} + 1{% endmacro %}
+
+{% macro chain_27_9() %}{{ return(adapter.dispatch('chain_27_9')()) }}{% endmacro %}
+{% macro default__chain_27_9() %}{% if false %}{{ chain_28_10() }}{% endif %}{{ chain_27_10() }} + 1{% endmacro %}
+
+{% macro chain_27_10() %}{{ return(adapter.dispatch('chain_27_10')()) }}{% endmacro %}
+{% macro default__chain_27_10() %}{% if false %}{{ chain_28_11() }}{% endif %}{{ chain_27_11() }} + 1{% endmacro %}
+
+{% macro chain_27_11() %}{{ return(adapter.dispatch('chain_27_11')()) }}{% endmacro %}
+{% macro default__chain_27_11() %}{% if false %}{{ chain_28_12() }}{% endif %}{{ chain_27_12() }} + 1{% endmacro %}
+
+{% macro chain_27_12() %}{{ return(adapter.dispatch('chain_27_12')()) }}{% endmacro %}
+{% macro default__chain_27_12() %}{% if false %}{{ chain_28_13() }}{% endif %}{{ chain_27_13() }} + 1{% endmacro %}
+
+{% macro chain_27_13() %}{{ return(adapter.dispatch('chain_27_13')()) }}{% endmacro %}
+{% macro default__chain_27_13() %}{% if false %}{{ chain_28_14() }}{% endif %}{{ chain_27_14() }} + 1{% endmacro %}
+
+{% macro chain_27_14() %}{{ return(adapter.dispatch('chain_27_14')()) }}{% endmacro %}
+{% macro default__chain_27_14() %}{% if false %}{{ chain_28_15() }}{% endif %}{{ chain_27_15() }} + 1{% endmacro %}
+
+{% macro chain_27_15() %}{{ return(adapter.dispatch('chain_27_15')()) }}{% endmacro %}
+{% macro default__chain_27_15() %}{% if false %}{{ chain_28_16() }}{% endif %}{{ chain_27_16() }} + 1{% endmacro %}
+
+{% macro chain_27_16() %}{{ return(adapter.dispatch('chain_27_16')()) }}{% endmacro %}
+{% macro default__chain_27_16() %}{% if false %}{{ chain_28_17() }}{% endif %}{{ chain_27_17() }} + 1{% endmacro %}
+
+{% macro chain_27_17() %}{{ return(adapter.dispatch('chain_27_17')()) }}{% endmacro %}
+{% macro default__chain_27_17() %}{% if false %}{{ chain_28_18() }}{% endif %}{{ chain_27_18() }} + 1{% endmacro %}
+
+{% macro chain_27_18() %}{{ return(adapter.dispatch('chain_27_18')()) }}{% endmacro %}
+{% macro default__chain_27_18() %}{% if false %}{{ chain_28_19() }}{% endif %}{{ chain_27_19() }} + 1{% endmacro %}
+
+{% macro chain_27_19() %}{{ return(adapter.dispatch('chain_27_19')()) }}{% endmacro %}
+{% macro default__chain_27_19() %}{% if false %}{{ chain_28_20() }}{% endif %}{{ chain_27_20() }} + 1{% endmacro %}
+
+{% macro chain_27_20() %}{{ return(adapter.dispatch('chain_27_20')()) }}{% endmacro %}
+{% macro default__chain_27_20() %}{% if false %}{{ chain_28_21() }}{% endif %}{{ chain_27_21() }} + 1{% endmacro %}
+
+{% macro chain_27_21() %}{{ return(adapter.dispatch('chain_27_21')()) }}{% endmacro %}
+{% macro default__chain_27_21() %}{% if false %}{{ chain_28_22() }}{% endif %}{{ chain_27_22() }} + 1{% endmacro %}
+
+{% macro chain_27_22() %}{{ return(adapter.dispatch('chain_27_22')()) }}{% endmacro %}
+{% macro default__chain_27_22() %}{% if false %}{{ chain_28_23() }}{% endif %}{{ chain_27_23() }} + 1{% endmacro %}
+
+{% macro chain_27_23() %}{{ return(adapter.dispatch('chain_27_23')()) }}{% endmacro %}
+{% macro default__chain_27_23() %}{% if false %}{{ chain_28_24() }}{% endif %}{{ chain_27_24() }} + 1{% endmacro %}
+
+{% macro chain_27_24() %}{{ return(adapter.dispatch('chain_27_24')()) }}{% endmacro %}
+{% macro default__chain_27_24() %}1{% endmacro %}
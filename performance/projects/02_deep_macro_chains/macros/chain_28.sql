@@ -0,0 +1,74 @@
+{% macro chain_28_0() %}{{ return(adapter.dispatch('chain_28_0')()) }}{% endmacro %}
+{% macro default__chain_28_0() %}{% if false %}{{ chain_29_1() }}{% endif %}{{ chain_28_1() }} + 1{% endmacro %}
+
+{% macro chain_28_1() %}{{ return(adapter.dispatch('chain_28_1')()) }}{% endmacro %}
+{% macro default__chain_28_1() %}{% if false %}{{ chain_29_2() }}{% endif %}{{ chain_28_2() }} + 1{% endmacro %}
+
+{% macro chain_28_2() %}{{ return(adapter.dispatch('chain_28_2')()) }}{% endmacro %}
+{% macro default__chain_28_2() %}{% if false %}{{ chain_29_3() }}{% endif %}{{ chain_28_3() }} + 1{% endmacro %}
+
+{% macro chain_28_3() %}{{ return(adapter.dispatch('chain_28_3')()) }}{% endmacro %}
+{% macro default__chain_28_3() %}{% if false %}{{ chain_29_4() }}{% endif %}{{ chain_28_4() }} + 1{% endmacro %}
+
+{% macro chain_28_4() %}{{ return(adapter.dispatch('chain_28_4')()) }}{% endmacro %}
+{% macro default__chain_28_4() %}{% if false %}{{ chain_29_5() }}{% endif %}{{ chain_28_5() }} + 1{% endmacro %}
+
+{% macro chain_28_5() %}{{ return(adapter.dispatch('chain_28_5')()) }}{% endmacro %}
+{% macro default__chain_28_5() %}{% if false %}{{ chain_29_6() }}{% endif %}{{ chain_28_6() }} + 1{% endmacro %}
+
+{% macro chain_28_6() %}{{ return(adapter.dispatch('chain_28_6')()) }}{% endmacro %}
+{% macro default__chain_28_6() %}{% if false %}{{ chain_29_7() }}{% endif %}{{ chain_28_7() }} + 1{% endmacro %}
+
+{% macro chain_28_7() %}{{ return(adapter.dispatch('chain_28_7')()) }}{% endmacro %}
+{% macro default__chain_28_7() %}{% if false %}{{ chain_29_8() }}{% endif %}{{ chain_28_8() }} + 1{% endmacro %}
+
+{% macro chain_28_8() %}{{ return(adapter.dispatch('chain_28_8')()) }}{% endmacro %}
+{% macro default__chain_28_8() %}{% if false %}{{ chain_29_9() }}{% endif %}{{ chain_28_9() }} + 1{% endmacro %}
+
+{% macro chain_28_9() %}{{ return(adapter.dispatch('chain_28_9')()) }}{% endmacro %}
+{% macro default__chain_28_9() %}{% if false %}{{ chain_29_10() }}{% endif %}{{ chain_28_10() }} + 1{% endmacro %}
+
+{% macro chain_28_10() %}{{ return(adapter.dispatch('chain_28_10')()) }}{% endmacro %}
+{% macro default__chain_28_10() %}{% if false %}{{ chain_29_11() }}{% endif %}{{ chain_28_11() }} + 1{% endmacro %}
+
+{% macro chain_28_11() %}{{ return(adapter.dispatch('chain_28_11')()) }}{% endmacro %}
+{% macro default__chain_28_11() %}{% if false %}{{ chain_29_12() }}{% endif %}{{ chain_28_12() }} + 1{% endmacro %}
+
+{% macro chain_28_12() %}{{ return(adapter.dispatch('chain_28_12')()) }}{% endmacro %}
+{% macro default__chain_28_12() %}{% if false %}{{ chain_29_13() }}{% endif %}{{ chain_28_13() }} + 1{% endmacro %}
+
+{% macro chain_28_13() %}{{ return(adapter.dispatch('chain_28_13')()) }}{% endmacro %}
+{% macro default__chain_28_13() %}{% if false %}{{ chain_29_14() }}{% endif %}{{ chain_28_14() }} + 1{% endmacro %}
+
+{% macro chain_28_14() %}{{ return(adapter.dispatch('chain_28_14')()) }}{% endmacro %}
+{% macro default__chain_28_14() %}{% if false %}{{ chain_29_15() }}{% endif %}{{ chain_28_15() }} + 1{% endmacro %}
+
+{% macro chain_28_15() %}{{ return(adapter.dispatch('chain_28_15')()) }}{% endmacro %}
+{% macro default__chain_28_15() %}{% if false %}{{ chain_29_16() }}{% endif %}{{ chain_28_16() }} + 1{% endmacro %}
+
+{% macro chain_28_16() %}{{ return(adapter.dispatch('chain_28_16')()) }}{% endmacro %}
+{% macro default__chain_28_16() %}{% if false %}{{ chain_29_17() }}{% endif %}{{ chain_28_17() }} + 1{% endmacro %}
+
+{% macro chain_28_17() %}{{ return(adapter.dispatch('chain_28_17')()) }}{% endmacro %}
+{% macro default__chain_28_17() %}{% if false %}{{ chain_29_18() }}{% endif %}{{ chain_28_18() }} + 1{% endmacro %}
+
+{% macro chain_28_18() %}{{ return(adapter.dispatch('chain_28_18')()) }}{% endmacro %}
+{% macro default__chain_28_18() %}{% if false %}{{ chain_29_19() }}{% endif %}{{ chain_28_19() }} + 1{% endmacro %}
+
+{% macro chain_28_19() %}{{ return(adapter.dispatch('chain_28_19')()) }}{% endmacro %}
+{% macro default__chain_28_19() %}{% if false %}{{ chain_29_20() }}{% endif %}{{ chain_28_20() }} + 1{% endmacro %}
+
+{% macro chain_28_20() %}{{ return(adapter.dispatch('chain_28_20')()) }}{% endmacro %}
+{% macro default__chain_28_20() %}{% if false %}{{ chain_29_21() }}{% endif %}{{ chain_28_21() }} + 1{% endmacro %}
+
+{% macro chain_28_21() %}{{ return(adapter.dispatch('chain_28_21')()) }}{% endmacro %}
+{% macro default__chain_28_21() %}{% if false %}{{ chain_29_22() }}{% endif %}{{ chain_28_22() }} + 1{% endmacro %}
+
+{% macro chain_28_22() %}{{ return(adapter.dispatch('chain_28_22')()) }}{% endmacro %}
+{% macro default__chain_28_22() %}{% if false %}{{ chain_29_23() }}{% endif %}{{ chain_28_23() }} + 1{% endmacro %}
+
+{% macro chain_28_23() %}{{ return(adapter.dispatch('chain_28_23')()) }}{% endmacro %}
+{% macro default__chain_28_23() %}{% if false %}{{ chain_29_24() }}{% endif %}{{ chain_28_24() }} + 1{% endmacro %}
+
+{% macro chain_28_24() %}{{ return(adapter.dispatch('chain_28_24')()) }}{% endmacro %}
+{% macro default__chain_28_24() %}1{% endmacro %}
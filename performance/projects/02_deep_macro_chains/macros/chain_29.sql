@@ -0,0 +1,74 @@
+{% macro chain_29_0() %}{{ return(adapter.dispatch('chain_29_0')()) }}{% endmacro %}
+{% macro default__chain_29_0() %}{% if false %}{{ chain_30_1() }}{% endif %}{{ chain_29_1() }} + 1{% endmacro %}
+
+{% macro chain_29_1() %}{{ return(adapter.dispatch('chain_29_1')()) }}{% endmacro %}
+{% macro default__chain_29_1() %}{% if false %}{{ chain_30_2() }}{% endif %}{{ chain_29_2() }} + 1{% endmacro %}
+
+{% macro chain_29_2() %}{{ return(adapter.dispatch('chain_29_2')()) }}{% endmacro %}
+{% macro default__chain_29_2() %}{% if false %}{{ chain_30_3() }}{% endif %}{{ chain_29_3() }} + 1{% endmacro %}
+
+{% macro chain_29_3() %}{{ return(adapter.dispatch('chain_29_3')()) }}{% endmacro %}
+{% macro default__chain_29_3() %}{% if false %}{{ chain_30_4() }}{% endif %}{{ chain_29_4() }} + 1{% endmacro %}
+
+{% macro chain_29_4() %}{{ return(adapter.dispatch('chain_29_4')()) }}{% endmacro %}
+{% macro default__chain_29_4() %}{% if false %}{{ chain_30_5() }}{% endif %}{{ chain_29_5() }} + 1{% endmacro %}
+
+{% macro chain_29_5() %}{{ return(adapter.dispatch('chain_29_5')()) }}{% endmacro %}
+{% macro default__chain_29_5() %}{% if false %}{{ chain_30_6() }}{% endif %}{{ chain_29_6() }} + 1{% endmacro %}
+
+{% macro chain_29_6() %}{{ return(adapter.dispatch('chain_29_6')()) }}{% endmacro %}
+{% macro default__chain_29_6() %}{% if false %}{{ chain_30_7() }}{% endif %}{{ chain_29_7() }} + 1{% endmacro %}
+
+{% macro chain_29_7() %}{{ return(adapter.dispatch('chain_29_7')()) }}{% endmacro %}
+{% macro default__chain_29_7() %}{% if false %}{{ chain_30_8() }}{% endif %}{{ chain_29_8() }} + 1{% endmacro %}
+
+{% macro chain_29_8() %}{{ return(adapter.dispatch('chain_29_8')()) }}{% endmacro %}
+{% macro default__chain_29_8() %}{% if false %}{{ chain_30_9() }}{% endif %}{{ chain_29_9() }} + 1{% endmacro %}
+
+{% macro chain_29_9() %}{{ return(adapter.dispatch('chain_29_9')()) }}{% endmacro %}
+{% macro default__chain_29_9() %}{% if false %}{{ chain_30_10() }}{% endif %}{{ chain_29_10() }} + 1{% endmacro %}
+
+{% macro chain_29_10() %}{{ return(adapter.dispatch('chain_29_10')()) }}{% endmacro %}
+{% macro default__chain_29_10() %}{% if false %}{{ chain_30_11() }}{% endif %}{{ chain_29_11() }} + 1{% endmacro %}
+
+{% macro chain_29_11() %}{{ return(adapter.dispatch('chain_29_11')()) }}{% endmacro %}
+{% macro default__chain_29_11() %}{% if false %}{{ chain_30_12() }}{% endif %}{{ chain_29_12() }} + 1{% endmacro %}
+
+{% macro chain_29_12() %}{{ return(adapter.dispatch('chain_29_12')()) }}{% endmacro %}
+{% macro default__chain_29_12() %}{% if false %}{{ chain_30_13() }}{% endif %}{{ chain_29_13() }} + 1{% endmacro %}
+
+{% macro chain_29_13() %}{{ return(adapter.dispatch('chain_29_13')()) }}{% endmacro %}
+{% macro default__chain_29_13() %}{% if false %}{{ chain_30_14() }}{% endif %}{{ chain_29_14() }} + 1{% endmacro %}
+
+{% macro chain_29_14() %}{{ return(adapter.dispatch('chain_29_14')()) }}{% endmacro %}
+{% macro default__chain_29_14() %}{% if false %}{{ chain_30_15() }}{% endif %}{{ chain_29_15() }} + 1{% endmacro %}
+
+{% macro chain_29_15() %}{{ return(adapter.dispatch('chain_29_15')()) }}{% endmacro %}
+{% macro default__chain_29_15() %}{% if false %}{{ chain_30_16() }}{% endif %}{{ chain_29_16() }} + 1{% endmacro %}
+
+{% macro chain_29_16() %}{{ return(adapter.dispatch('chain_29_16')()) }}{% endmacro %}
+{% macro default__chain_29_16() %}{% if false %}{{ chain_30_17() }}{% endif %}{{ chain_29_17() }} + 1{% endmacro %}
+
+{% macro chain_29_17() %}{{ return(adapter.dispatch('chain_29_17')()) }}{% endmacro %}
+{% macro default__chain_29_17() %}{% if false %}{{ chain_30_18() }}{% endif %}{{ chain_29_18() }} + 1{% endmacro %}
+
+{% macro chain_29_18() %}{{ return(adapter.dispatch('chain_29_18')()) }}{% endmacro %}
+{% macro default__chain_29_18() %}{% if false %}{{ chain_30_19() }}{% endif %}{{ chain_29_19() }} + 1{% endmacro %}
+
+{% macro chain_29_19() %}{{ return(adapter.dispatch('chain_29_19')()) }}{% endmacro %}
+{% macro default__chain_29_19() %}{% if false %}{{ chain_30_20() }}{% endif %}{{ chain_29_20() }} + 1{% endmacro %}
+
+{% macro chain_29_20() %}{{ return(adapter.dispatch('chain_29_20')()) }}{% endmacro %}
+{% macro default__chain_29_20() %}{% if false %}{{ chain_30_21() }}{% endif %}{{ chain_29_21() }} + 1{% endmacro %}
+
+{% macro chain_29_21() %}{{ return(adapter.dispatch('chain_29_21')()) }}{% endmacro %}
+{% macro default__chain_29_21() %}{% if false %}{{ chain_30_22() }}{% endif %}{{ chain_29_22() }} + 1{% endmacro %}
+
+{% macro chain_29_22() %}{{ return(adapter.dispatch('chain_29_22')()) }}{% endmacro %}
+{% macro default__chain_29_22() %}{% if false %}{{ chain_30_23() }}{% endif %}{{ chain_29_23() }} + 1{% endmacro %}
+
+{% macro chain_29_23() %}{{ return(adapter.dispatch('chain_29_23')()) }}{% endmacro %}
+{% macro default__chain_29_23() %}{% if false %}{{ chain_30_24() }}{% endif %}{{ chain_29_24() }} + 1{% endmacro %}
+
+{% macro chain_29_24() %}{{ return(adapter.dispatch('chain_29_24')()) }}{% endmacro %}
+{% macro default__chain_29_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_3_0() %}{{ return(adapter.dispatch('chain_3_0')()) }}{% endmacro %}
+{% macro default__chain_3_0() %}{% if false %}{{ chain_4_1() }}{% endif %}{{ chain_3_1() }} + 1{% endmacro %}
+
+{% macro chain_3_1() %}{{ return(adapter.dispatch('chain_3_1')()) }}{% endmacro %}
+{% macro default__chain_3_1() %}{% if false %}{{ chain_4_2() }}{% endif %}{{ chain_3_2() }} + 1{% endmacro %}
+
+{% macro chain_3_2() %}{{ return(adapter.dispatch('chain_3_2')()) }}{% endmacro %}
+{% macro default__chain_3_2() %}{% if false %}{{ chain_4_3() }}{% endif %}{{ chain_3_3() }} + 1{% endmacro %}
+
+{% macro chain_3_3() %}{{ return(adapter.dispatch('chain_3_3')()) }}{% endmacro %}
+{% macro default__chain_3_3() %}{% if false %}{{ chain_4_4() }}{% endif %}{{ chain_3_4() }} + 1{% endmacro %}
+
+{% macro chain_3_4() %}{{ return(adapter.dispatch('chain_3_4')()) }}{% endmacro %}
+{% macro default__chain_3_4() %}{% if false %}{{ chain_4_5() }}{% endif %}{{ chain_3_5() }} + 1{% endmacro %}
+
+{% macro chain_3_5() %}{{ return(adapter.dispatch('chain_3_5')()) }}{% endmacro %}
+{% macro default__chain_3_5() %}{% if false %}{{ chain_4_6() }}{% endif %}{{ chain_3_6() }} + 1{% endmacro %}
+
+{% macro chain_3_6() %}{{ return(adapter.dispatch('chain_3_6')()) }}{% endmacro %}
+{% macro default__chain_3_6() %}{% if false %}{{ chain_4_7() }}{% endif %}{{ chain_3_7() }} + 1{% endmacro %}
+
+{% macro chain_3_7() %}{{ return(adapter.dispatch('chain_3_7')()) }}{% endmacro %}
+{% macro default__chain_3_7() %}{% if false %}{{ chain_4_8() }}{% endif %}{{ chain_3_8() }} + 1{% endmacro %}
+
+{% macro chain_3_8() %}{{ return(adapter.dispatch('chain_3_8')()) }}{% endmacro %}
+{% macro default__chain_3_8() %}{% if false %}{{ chain_4_9() }}{% endif %}{{ chain_3_9() }} + 1{% endmacro %}
+
+{% macro chain_3_9() %}{{ return(adapter.dispatch('chain_3_9')()) }}{% endmacro %}
+{% macro default__chain_3_9() %}{% if false %}{{ chain_4_10() }}{% endif %}{{ chain_3_10() }} + 1{% endmacro %}
+
+{% macro chain_3_10() %}{{ return(adapter.dispatch('chain_3_10')()) }}{% endmacro %}
+{% macro default__chain_3_10() %}{% if false %}{{ chain_4_11() }}{% endif %}{{ chain_3_11() }} + 1{% endmacro %}
+
+{% macro chain_3_11() %}{{ return(adapter.dispatch('chain_3_11')()) }}{% endmacro %}
+{% macro default__chain_3_11() %}{% if false %}{{ chain_4_12() }}{% endif %}{{ chain_3_12() }} + 1{% endmacro %}
+
+{% macro chain_3_12() %}{{ return(adapter.dispatch('chain_3_12')()) }}{% endmacro %}
+{% macro default__chain_3_12() %}{% if false %}{{ chain_4_13() }}{% endif %}{{ chain_3_13() }} + 1{% endmacro %}
+
+{% macro chain_3_13() %}{{ return(adapter.dispatch('chain_3_13')()) }}{% endmacro %}
+{% macro default__chain_3_13() %}{% if false %}{{ chain_4_14() }}{% endif %}{{ chain_3_14() }} + 1{% endmacro %}
+
+{% macro chain_3_14() %}{{ return(adapter.dispatch('chain_3_14')()) }}{% endmacro %}
+{% macro default__chain_3_14() %}{% if false %}{{ chain_4_15() }}{% endif %}{{ chain_3_15() }} + 1{% endmacro %}
+
+{% macro chain_3_15() %}{{ return(adapter.dispatch('chain_3_15')()) }}{% endmacro %}
+{% macro default__chain_3_15() %}{% if false %}{{ chain_4_16() }}{% endif %}{{ chain_3_16() }} + 1{% endmacro %}
+
+{% macro chain_3_16() %}{{ return(adapter.dispatch('chain_3_16')()) }}{% endmacro %}
+{% macro default__chain_3_16() %}{% if false %}{{ chain_4_17() }}{% endif %}{{ chain_3_17() }} + 1{% endmacro %}
+
+{% macro chain_3_17() %}{{ return(adapter.dispatch('chain_3_17')()) }}{% endmacro %}
+{% macro default__chain_3_17() %}{% if false %}{{ chain_4_18() }}{% endif %}{{ chain_3_18() }} + 1{% endmacro %}
+
+{% macro chain_3_18() %}{{ return(adapter.dispatch('chain_3_18')()) }}{% endmacro %}
+{% macro default__chain_3_18() %}{% if false %}{{ chain_4_19() }}{% endif %}{{ chain_3_19() }} + 1{% endmacro %}
+
+{% macro chain_3_19() %}{{ return(adapter.dispatch('chain_3_19')()) }}{% endmacro %}
+{% macro default__chain_3_19() %}{% if false %}{{ chain_4_20() }}{% endif %}{{ chain_3_20() }} + 1{% endmacro %}
+
+{% macro chain_3_20() %}{{ return(adapter.dispatch('chain_3_20')()) }}{% endmacro %}
+{% macro default__chain_3_20() %}{% if false %}{{ chain_4_21() }}{% endif %}{{ chain_3_21() }} + 1{% endmacro %}
+
+{% macro chain_3_21() %}{{ return(adapter.dispatch('chain_3_21')()) }}{% endmacro %}
+{% macro default__chain_3_21() %}{% if false %}{{ chain_4_22() }}{% endif %}{{ chain_3_22() }} + 1{% endmacro %}
+
+{% macro chain_3_22() %}{{ return(adapter.dispatch('chain_3_22')()) }}{% endmacro %}
+{% macro default__chain_3_22() %}{% if false %}{{ chain_4_23() }}{% endif %}{{ chain_3_23() }} + 1{% endmacro %}
+
+{% macro chain_3_23() %}{{ return(adapter.dispatch('chain_3_23')()) }}{% endmacro %}
+{% macro default__chain_3_23() %}{% if false %}{{ chain_4_24() }}{% endif %}{{ chain_3_24() }} + 1{% endmacro %}
+
+{% macro chain_3_24() %}{{ return(adapter.dispatch('chain_3_24')()) }}{% endmacro %}
+{% macro default__chain_3_24() %}1{% endmacro %}
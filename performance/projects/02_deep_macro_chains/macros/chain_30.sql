@@ -0,0 +1,74 @@
+{% macro chain_30_0() %}{{ return(adapter.dispatch('chain_30_0')()) }}{% endmacro %}
+{% macro default__chain_30_0() %}{% if false %}{{ chain_31_1() }}{% endif %}{{ chain_30_1() }} + 1{% endmacro %}
+
+{% macro chain_30_1() %}{{ return(adapter.dispatch('chain_30_1')()) }}{% endmacro %}
+{% macro default__chain_30_1() %}{% if false %}{{ chain_31_2() }}{% endif %}{{ chain_30_2() }} + 1{% endmacro %}
+
+{% macro chain_30_2() %}{{ return(adapter.dispatch('chain_30_2')()) }}{% endmacro %}
+{% macro default__chain_30_2() %}{% if false %}{{ chain_31_3() }}{% endif %}{{ chain_30_3() }} + 1{% endmacro %}
+
+{% macro chain_30_3() %}{{ return(adapter.dispatch('chain_30_3')()) }}{% endmacro %}
+{% macro default__chain_30_3() %}{% if false %}{{ chain_31_4() }}{% endif %}{{ chain_30_4() }} + 1{% endmacro %}
+
+{% macro chain_30_4() %}{{ return(adapter.dispatch('chain_30_4')()) }}{% endmacro %}
+{% macro default__chain_30_4() %}{% if false %}{{ chain_31_5() }}{% endif %}{{ chain_30_5() }} + 1{% endmacro %}
+
+{% macro chain_30_5() %}{{ return(adapter.dispatch('chain_30_5')()) }}{% endmacro %}
+{% macro default__chain_30_5() %}{% if false %}{{ chain_31_6() }}{% endif %}{{ chain_30_6() }} + 1{% endmacro %}
+
+{% macro chain_30_6() %}{{ return(adapter.dispatch('chain_30_6')()) }}{% endmacro %}
+{% macro default__chain_30_6() %}{% if false %}{{ chain_31_7() }}{% endif %}{{ chain_30_7() }} + 1{% endmacro %}
+
+{% macro chain_30_7() %}{{ return(adapter.dispatch('chain_30_7')()) }}{% endmacro %}
+{% macro default__chain_30_7() %}{% if false %}{{ chain_31_8() }}{% endif %}{{ chain_30_8() }} + 1{% endmacro %}
+
+{% macro chain_30_8() %}{{ return(adapter.dispatch('chain_30_8')()) }}{% endmacro %}
+{% macro default__chain_30_8() %}{% if false %}{{ chain_31_9() }}{% endif %}{{ chain_30_9() }} + 1{% endmacro %}
+
+{% macro chain_30_9() %}{{ return(adapter.dispatch('chain_30_9')()) }}{% endmacro %}
+{% macro default__chain_30_9() %}{% if false %}{{ chain_31_10() }}{% endif %}{{ chain_30_10() }} + 1{% endmacro %}
+
+{% macro chain_30_10() %}{{ return(adapter.dispatch('chain_30_10')()) }}{% endmacro %}
+{% macro default__chain_30_10() %}{% if false %}{{ chain_31_11() }}{% endif %}{{ chain_30_11() }} + 1{% endmacro %}
+
+{% macro chain_30_11() %}{{ return(adapter.dispatch('chain_30_11')()) }}{% endmacro %}
+{% macro default__chain_30_11() %}{% if false %}{{ chain_31_12() }}{% endif %}{{ chain_30_12() }} + 1{% endmacro %}
+
+{% macro chain_30_12() %}{{ return(adapter.dispatch('chain_30_12')()) }}{% endmacro %}
+{% macro default__chain_30_12() %}{% if false %}{{ chain_31_13() }}{% endif %}{{ chain_30_13() }} + 1{% endmacro %}
+
+{% macro chain_30_13() %}{{ return(adapter.dispatch('chain_30_13')()) }}{% endmacro %}
+{% macro default__chain_30_13() %}{% if false %}{{ chain_31_14() }}{% endif %}{{ chain_30_14() }} + 1{% endmacro %}
+
+{% macro chain_30_14() %}{{ return(adapter.dispatch('chain_30_14')()) }}{% endmacro %}
+{% macro default__chain_30_14() %}{% if false %}{{ chain_31_15() }}{% endif %}{{ chain_30_15() }} + 1{% endmacro %}
+
+{% macro chain_30_15() %}{{ return(adapter.dispatch('chain_30_15')()) }}{% endmacro %}
+{% macro default__chain_30_15() %}{% if false %}{{ chain_31_16() }}{% endif %}{{ chain_30_16() }} + 1{% endmacro %}
+
+{% macro chain_30_16() %}{{ return(adapter.dispatch('chain_30_16')()) }}{% endmacro %}
+{% macro default__chain_30_16() %}{% if false %}{{ chain_31_17() }}{% endif %}{{ chain_30_17() }} + 1{% endmacro %}
+
+{% macro chain_30_17() %}{{ return(adapter.dispatch('chain_30_17')()) }}{% endmacro %}
+{% macro default__chain_30_17() %}{% if false %}{{ chain_31_18() }}{% endif %}{{ chain_30_18() }} + 1{% endmacro %}
+
+{% macro chain_30_18() %}{{ return(adapter.dispatch('chain_30_18')()) }}{% endmacro %}
+{% macro default__chain_30_18() %}{% if false %}{{ chain_31_19() }}{% endif %}{{ chain_30_19() }} + 1{% endmacro %}
+
+{% macro chain_30_19() %}{{ return(adapter.dispatch('chain_30_19')()) }}{% endmacro %}
+{% macro default__chain_30_19() %}{% if false %}{{ chain_31_20() }}{% endif %}{{ chain_30_20() }} + 1{% endmacro %}
+
+{% macro chain_30_20() %}{{ return(adapter.dispatch('chain_30_20')()) }}{% endmacro %}
+{% macro default__chain_30_20() %}{% if false %}{{ chain_31_21() }}{% endif %}{{ chain_30_21() }} + 1{% endmacro %}
+
+{% macro chain_30_21() %}{{ return(adapter.dispatch('chain_30_21')()) }}{% endmacro %}
+{% macro default__chain_30_21() %}{% if false %}{{ chain_31_22() }}{% endif %}{{ chain_30_22() }} + 1{% endmacro %}
+
+{% macro chain_30_22() %}{{ return(adapter.dispatch('chain_30_22')()) }}{% endmacro %}
+{% macro default__chain_30_22() %}{% if false %}{{ chain_31_23() }}{% endif %}{{ chain_30_23() }} + 1{% endmacro %}
+
+{% macro chain_30_23() %}{{ return(adapter.dispatch('chain_30_23')()) }}{% endmacro %}
+{% macro default__chain_30_23() %}{% if false %}{{ chain_31_24() }}{% endif %}{{ chain_30_24() }} + 1{% endmacro %}
+
+{% macro chain_30_24() %}{{ return(adapter.dispatch('chain_30_24')()) }}{% endmacro %}
+{% macro default__chain_30_24() %}1{% endmacro %}
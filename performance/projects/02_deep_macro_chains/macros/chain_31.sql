@@ -0,0 +1,74 @@
+{% macro chain_31_0() %}{{ return(adapter.dispatch('chain_31_0')()) }}{% endmacro %}
+{% macro default__chain_31_0() %}{% if false %}{{ chain_32_1() }}{% endif %}{{ chain_31_1() }} + 1{% endmacro %}
+
+{% macro chain_31_1() %}{{ return(adapter.dispatch('chain_31_1')()) }}{% endmacro %}
+{% macro default__chain_31_1() %}{% if false %}{{ chain_32_2() }}{% endif %}{{ chain_31_2() }} + 1{% endmacro %}
+
+{% macro chain_31_2() %}{{ return(adapter.dispatch('chain_31_2')()) }}{% endmacro %}
+{% macro default__chain_31_2() %}{% if false %}{{ chain_32_3() }}{% endif %}{{ chain_31_3() }} + 1{% endmacro %}
+
+{% macro chain_31_3() %}{{ return(adapter.dispatch('chain_31_3')()) }}{% endmacro %}
+{% macro default__chain_31_3() %}{% if false %}{{ chain_32_4() }}{% endif %}{{ chain_31_4() }} + 1{% endmacro %}
+
+{% macro chain_31_4() %}{{ return(adapter.dispatch('chain_31_4')()) }}{% endmacro %}
+{% macro default__chain_31_4() %}{% if false %}{{ chain_32_5() }}{% endif %}{{ chain_31_5() }} + 1{% endmacro %}
+
+{% macro chain_31_5() %}{{ return(adapter.dispatch('chain_31_5')()) }}{% endmacro %}
+{% macro default__chain_31_5() %}{% if false %}{{ chain_32_6() }}{% endif %}{{ chain_31_6() }} + 1{% endmacro %}
+
+{% macro chain_31_6() %}{{ return(adapter.dispatch('chain_31_6')()) }}{% endmacro %}
+{% macro default__chain_31_6() %}{% if false %}{{ chain_32_7() }}{% endif %}{{ chain_31_7() }} + 1{% endmacro %}
+
+{% macro chain_31_7() %}{{ return(adapter.dispatch('chain_31_7')()) }}{% endmacro %}
+{% macro default__chain_31_7() %}{% if false %}{{ chain_32_8() }}{% endif %}{{ chain_31_8() }} + 1{% endmacro %}
+
+{% macro chain_31_8() %}{{ return(adapter.dispatch('chain_31_8')()) }}{% endmacro %}
+{% macro default__chain_31_8() %}{% if false %}{{ chain_32_9() }}{% endif %}{{ chain_31_9() }} + 1{% endmacro %}
+
+{% macro chain_31_9() %}{{ return(adapter.dispatch('chain_31_9')()) }}{% endmacro %}
+{% macro default__chain_31_9() %}{% if false %}{{ chain_32_10() }}{% endif %}{{ chain_31_10() }} + 1{% endmacro %}
+
+{% macro chain_31_10() %}{{ return(adapter.dispatch('chain_31_10')()) }}{% endmacro %}
+{% macro default__chain_31_10() %}{% if false %}{{ chain_32_11() }}{% endif %}{{ chain_31_11() }} + 1{% endmacro %}
+
+{% macro chain_31_11() %}{{ return(adapter.dispatch('chain_31_11')()) }}{% endmacro %}
+{% macro default__chain_31_11() %}{% if false %}{{ chain_32_12() }}{% endif %}{{ chain_31_12() }} + 1{% endmacro %}
+
+{% macro chain_31_12() %}{{ return(adapter.dispatch('chain_31_12')()) }}{% endmacro %}
+{% macro default__chain_31_12() %}{% if false %}{{ chain_32_13() }}{% endif %}{{ chain_31_13() }} + 1{% endmacro %}
+
+{% macro chain_31_13() %}{{ return(adapter.dispatch('chain_31_13')()) }}{% endmacro %}
+{% macro default__chain_31_13() %}{% if false %}{{ chain_32_14() }}{% endif %}{{ chain_31_14() }} + 1{% endmacro %}
+
+{% macro chain_31_14() %}{{ return(adapter.dispatch('chain_31_14')()) }}{% endmacro %}
+{% macro default__chain_31_14() %}{% if false %}{{ chain_32_15() }}{% endif %}{{ chain_31_15() }} + 1{% endmacro %}
+
+{% macro chain_31_15() %}{{ return(adapter.dispatch('chain_31_15')()) }}{% endmacro %}
+{% macro default__chain_31_15() %}{% if false %}{{ chain_32_16() }}{% endif %}{{ chain_31_16() }} + 1{% endmacro %}
+
+{% macro chain_31_16() %}{{ return(adapter.dispatch('chain_31_16')()) }}{% endmacro %}
+{% macro default__chain_31_16() %}{% if false %}{{ chain_32_17() }}{% endif %}{{ chain_31_17() }} + 1{% endmacro %}
+
+{% macro chain_31_17() %}{{ return(adapter.dispatch('chain_31_17')()) }}{% endmacro %}
+{% macro default__chain_31_17() %}{% if false %}{{ chain_32_18() }}{% endif %}{{ chain_31_18() }} + 1{% endmacro %}
+
+{% macro chain_31_18() %}{{ return(adapter.dispatch('chain_31_18')()) }}{% endmacro %}
+{% macro default__chain_31_18() %}{% if false %}{{ chain_32_19() }}{% endif %}{{ chain_31_19() }} + 1{% endmacro %}
+
+{% macro chain_31_19() %}{{ return(adapter.dispatch('chain_31_19')()) }}{% endmacro %}
+{% macro default__chain_31_19() %}{% if false %}{{ chain_32_20() }}{% endif %}{{ chain_31_20() }} + 1{% endmacro %}
+
+{% macro chain_31_20() %}{{ return(adapter.dispatch('chain_31_20')()) }}{% endmacro %}
+{% macro default__chain_31_20() %}{% if false %}{{ chain_32_21() }}{% endif %}{{ chain_31_21() }} + 1{% endmacro %}
+
+{% macro chain_31_21() %}{{ return(adapter.dispatch('chain_31_21')()) }}{% endmacro %}
+{% macro default__chain_31_21() %}{% if false %}{{ chain_32_22() }}{% endif %}{{ chain_31_22() }} + 1{% endmacro %}
+
+{% macro chain_31_22() %}{{ return(adapter.dispatch('chain_31_22')()) }}{% endmacro %}
+{% macro default__chain_31_22() %}{% if false %}{{ chain_32_23() }}{% endif %}{{ chain_31_23() }} + 1{% endmacro %}
+
+{% macro chain_31_23() %}{{ return(adapter.dispatch('chain_31_23')()) }}{% endmacro %}
+{% macro default__chain_31_23() %}{% if false %}{{ chain_32_24() }}{% endif %}{{ chain_31_24() }} + 1{% endmacro %}
+
+{% macro chain_31_24() %}{{ return(adapter.dispatch('chain_31_24')()) }}{% endmacro %}
+{% macro default__chain_31_24() %}1{% endmacro %}
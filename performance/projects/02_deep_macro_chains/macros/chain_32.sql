@@ -0,0 +1,74 @@
+{% macro chain_32_0() %}{{ return(adapter.dispatch('chain_32_0')()) }}{% endmacro %}
+{% macro default__chain_32_0() %}{% if false %}{{ chain_33_1() }}{% endif %}{{ chain_32_1() }} + 1{% endmacro %}
+
+{% macro chain_32_1() %}{{ return(adapter.dispatch('chain_32_1')()) }}{% endmacro %}
+{% macro default__chain_32_1() %}{% if false %}{{ chain_33_2() }}{% endif %}{{ chain_32_2() }} + 1{% endmacro %}
+
+{% macro chain_32_2() %}{{ return(adapter.dispatch('chain_32_2')()) }}{% endmacro %}
+{% macro default__chain_32_2() %}{% if false %}{{ chain_33_3() }}{% endif %}{{ chain_32_3() }} + 1{% endmacro %}
+
+{% macro chain_32_3() %}{{ return(adapter.dispatch('chain_32_3')()) }}{% endmacro %}
+{% macro default__chain_32_3() %}{% if false %}{{ chain_33_4() }}{% endif %}{{ chain_32_4() }} + 1{% endmacro %}
+
+{% macro chain_32_4() %}{{ return(adapter.dispatch('chain_32_4')()) }}{% endmacro %}
+{% macro default__chain_32_4() %}{% if false %}{{ chain_33_5() }}{% endif %}{{ chain_32_5() }} + 1{% endmacro %}
+
+{% macro chain_32_5() %}{{ return(adapter.dispatch('chain_32_5')()) }}{% endmacro %}
+{% macro default__chain_32_5() %}{% if false %}{{ chain_33_6() }}{% endif %}{{ chain_32_6() }} + 1{% endmacro %}
+
+{% macro chain_32_6() %}{{ return(adapter.dispatch('chain_32_6')()) }}{% endmacro %}
+{% macro default__chain_32_6() %}{% if false %}{{ chain_33_7() }}{% endif %}{{ chain_32_7() }} + 1{% endmacro %}
+
+{% macro chain_32_7() %}{{ return(adapter.dispatch('chain_32_7')()) }}{% endmacro %}
+{% macro default__chain_32_7() %}{% if false %}{{ chain_33_8() }}{% endif %}{{ chain_32_8() }} + 1{% endmacro %}
+
+{% macro chain_32_8() %}{{ return(adapter.dispatch('chain_32_8')()) }}{% endmacro %}
+{% macro default__chain_32_8() %}{% if false %}{{ chain_33_9() }}{% endif %}{{ chain_32_9() }} + 1{% endmacro %}
+
+{% macro chain_32_9() %}{{ return(adapter.dispatch('chain_32_9')()) }}{% endmacro %}
+{% macro default__chain_32_9() %}{% if false %}{{ chain_33_10() }}{% endif %}{{ chain_32_10() }} + 1{% endmacro %}
+
+{% macro chain_32_10() %}{{ return(adapter.dispatch('chain_32_10')()) }}{% endmacro %}
+{% macro default__chain_32_10() %}{% if false %}{{ chain_33_11() }}{% endif %}{{ chain_32_11() }} + 1{% endmacro %}
+
+{% macro chain_32_11() %}{{ return(adapter.dispatch('chain_32_11')()) }}{% endmacro %}
+{% macro default__chain_32_11() %}{% if false %}{{ chain_33_12() }}{% endif %}{{ chain_32_12() }} + 1{% endmacro %}
+
+{% macro chain_32_12() %}{{ return(adapter.dispatch('chain_32_12')()) }}{% endmacro %}
+{% macro default__chain_32_12() %}{% if false %}{{ chain_33_13() }}{% endif %}{{ chain_32_13() }} + 1{% endmacro %}
+
+{% macro chain_32_13() %}{{ return(adapter.dispatch('chain_32_13')()) }}{% endmacro %}
+{% macro default__chain_32_13() %}{% if false %}{{ chain_33_14() }}{% endif %}{{ chain_32_14() }} + 1{% endmacro %}
+
+{% macro chain_32_14() %}{{ return(adapter.dispatch('chain_32_14')()) }}{% endmacro %}
+{% macro default__chain_32_14() %}{% if false %}{{ chain_33_15() }}{% endif %}{{ chain_32_15() }} + 1{% endmacro %}
+
+{% macro chain_32_15() %}{{ return(adapter.dispatch('chain_32_15')()) }}{% endmacro %}
+{% macro default__chain_32_15() %}{% if false %}{{ chain_33_16() }}{% endif %}{{ chain_32_16() }} + 1{% endmacro %}
+
+{% macro chain_32_16() %}{{ return(adapter.dispatch('chain_32_16')()) }}{% endmacro %}
+{% macro default__chain_32_16() %}{% if false %}{{ chain_33_17() }}{% endif %}{{ chain_32_17() }} + 1{% endmacro %}
+
+{% macro chain_32_17() %}{{ return(adapter.dispatch('chain_32_17')()) }}{% endmacro %}
+{% macro default__chain_32_17() %}{% if false %}{{ chain_33_18() }}{% endif %}{{ chain_32_18() }} + 1{% endmacro %}
+
+{% macro chain_32_18() %}{{ return(adapter.dispatch('chain_32_18')()) }}{% endmacro %}
+{% macro default__chain_32_18() %}{% if false %}{{ chain_33_19() }}{% endif %}{{ chain_32_19() }} + 1{% endmacro %}
+
+{% macro chain_32_19() %}{{ return(adapter.dispatch('chain_32_19')()) }}{% endmacro %}
+{% macro default__chain_32_19() %}{% if false %}{{ chain_33_20() }}{% endif %}{{ chain_32_20() }} + 1{% endmacro %}
+
+{% macro chain_32_20() %}{{ return(adapter.dispatch('chain_32_20')()) }}{% endmacro %}
+{% macro default__chain_32_20() %}{% if false %}{{ chain_33_21() }}{% endif %}{{ chain_32_21() }} + 1{% endmacro %}
+
+{% macro chain_32_21() %}{{ return(adapter.dispatch('chain_32_21')()) }}{% endmacro %}
+{% macro default__chain_32_21() %}{% if false %}{{ chain_33_22() }}{% endif %}{{ chain_32_22() }} + 1{% endmacro %}
+
+{% macro chain_32_22() %}{{ return(adapter.dispatch('chain_32_22')()) }}{% endmacro %}
+{% macro default__chain_32_22() %}{% if false %}{{ chain_33_23() }}{% endif %}{{ chain_32_23() }} + 1{% endmacro %}
+
+{% macro chain_32_23() %}{{ return(adapter.dispatch('chain_32_23')()) }}{% endmacro %}
+{% macro default__chain_32_23() %}{% if false %}{{ chain_33_24() }}{% endif %}{{ chain_32_24() }} + 1{% endmacro %}
+
+{% macro chain_32_24() %}{{ return(adapter.dispatch('chain_32_24')()) }}{% endmacro %}
+{% macro default__chain_32_24() %}1{% endmacro %}
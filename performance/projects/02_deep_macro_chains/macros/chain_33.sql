@@ -0,0 +1,74 @@
+{% macro chain_33_0() %}{{ return(adapter.dispatch('chain_33_0')()) }}{% endmacro %}
+{% macro default__chain_33_0() %}{% if false %}{{ chain_34_1() }}{% endif %}{{ chain_33_1() }} + 1{% endmacro %}
+
+{% macro chain_33_1() %}{{ return(adapter.dispatch('chain_33_1')()) }}{% endmacro %}
+{% macro default__chain_33_1() %}{% if false %}{{ chain_34_2() }}{% endif %}{{ chain_33_2() }} + 1{% endmacro %}
+
+{% macro chain_33_2() %}{{ return(adapter.dispatch('chain_33_2')()) }}{% endmacro %}
+{% macro default__chain_33_2() %}{% if false %}{{ chain_34_3() }}{% endif %}{{ chain_33_3() }} + 1{% endmacro %}
+
+{% macro chain_33_3() %}{{ return(adapter.dispatch('chain_33_3')()) }}{% endmacro %}
+{% macro default__chain_33_3() %}{% if false %}{{ chain_34_4() }}{% endif %}{{ chain_33_4() }} + 1{% endmacro %}
+
+{% macro chain_33_4() %}{{ return(adapter.dispatch('chain_33_4')()) }}{% endmacro %}
+{% macro default__chain_33_4() %}{% if false %}{{ chain_34_5() }}{% endif %}{{ chain_33_5() }} + 1{% endmacro %}
+
+{% macro chain_33_5() %}{{ return(adapter.dispatch('chain_33_5')()) }}{% endmacro %}
+{% macro default__chain_33_5() %}{% if false %}{{ chain_34_6() }}{% endif %}{{ chain_33_6() }} + 1{% endmacro %}
+
+{% macro chain_33_6() %}{{ return(adapter.dispatch('chain_33_6')()) }}{% endmacro %}
+{% macro default__chain_33_6() %}{% if false %}{{ chain_34_7() }}{% endif %}{{ chain_33_7() }} + 1{% endmacro %}
+
+{% macro chain_33_7() %}{{ return(adapter.dispatch('chain_33_7')()) }}{% endmacro %}
+{% macro default__chain_33_7() %}{% if false %}{{ chain_34_8() }}{% endif %}{{ chain_33_8() }} + 1{% endmacro %}
+
+{% macro chain_33_8() %}{{ return(adapter.dispatch('chain_33_8')()) }}{% endmacro %}
+{% macro default__chain_33_8() %}{% if false %}{{ chain_34_9() }}{% endif %}{{ chain_33_9() }} + 1{% endmacro %}
+
+{% macro chain_33_9() %}{{ return(adapter.dispatch('chain_33_9')()) }}{% endmacro %}
+{% macro default__chain_33_9() %}{% if false %}{{ chain_34_10() }}{% endif %}{{ chain_33_10() }} + 1{% endmacro %}
+
+{% macro chain_33_10() %}{{ return(adapter.dispatch('chain_33_10')()) }}{% endmacro %}
+{% macro default__chain_33_10() %}{% if false %}{{ chain_34_11() }}{% endif %}{{ chain_33_11() }} + 1{% endmacro %}
+
+{% macro chain_33_11() %}{{ return(adapter.dispatch('chain_33_11')()) }}{% endmacro %}
+{% macro default__chain_33_11() %}{% if false %}{{ chain_34_12() }}{% endif %}{{ chain_33_12() }} + 1{% endmacro %}
+
+{% macro chain_33_12() %}{{ return(adapter.dispatch('chain_33_12')()) }}{% endmacro %}
+{% macro default__chain_33_12() %}{% if false %}{{ chain_34_13() }}{% endif %}{{ chain_33_13() }} + 1{% endmacro %}
+
+{% macro chain_33_13() %}{{ return(adapter.dispatch('chain_33_13')()) }}{% endmacro %}
+{% macro default__chain_33_13() %}{% if false %}{{ chain_34_14() }}{% endif %}{{ chain_33_14() }} + 1{% endmacro %}
+
+{% macro chain_33_14() %}{{ return(adapter.dispatch('chain_33_14')()) }}{% endmacro %}
+{% macro default__chain_33_14() %}{% if false %}{{ chain_34_15() }}{% endif %}{{ chain_33_15() }} + 1{% endmacro %}
+
+{% macro chain_33_15() %}{{ return(adapter.dispatch('chain_33_15')()) }}{% endmacro %}
+{% macro default__chain_33_15() %}{% if false %}{{ chain_34_16() }}{% endif %}{{ chain_33_16() }} + 1{% endmacro %}
+
+{% macro chain_33_16() %}{{ return(adapter.dispatch('chain_33_16')()) }}{% endmacro %}
+{% macro default__chain_33_16() %}{% if false %}{{ chain_34_17() }}{% endif %}{{ chain_33_17() }} + 1{% endmacro %}
+
+{% macro chain_33_17() %}{{ return(adapter.dispatch('chain_33_17')()) }}{% endmacro %}
+{% macro default__chain_33_17() %}{% if false %}{{ chain_34_18() }}{% endif %}{{ chain_33_18() }} + 1{% endmacro %}
+
+{% macro chain_33_18() %}{{ return(adapter.dispatch('chain_33_18')()) }}{% endmacro %}
+{% macro default__chain_33_18() %}{% if false %}{{ chain_34_19() }}{% endif %}{{ chain_33_19() }} + 1{% endmacro %}
+
+{% macro chain_33_19() %}{{ return(adapter.dispatch('chain_33_19')()) }}{% endmacro %}
+{% macro default__chain_33_19() %}{% if false %}{{ chain_34_20() }}{% endif %}{{ chain_33_20() }} + 1{% endmacro %}
+
+{% macro chain_33_20() %}{{ return(adapter.dispatch('chain_33_20')()) }}{% endmacro %}
+{% macro default__chain_33_20() %}{% if false %}{{ chain_34_21() }}{% endif %}{{ chain_33_21() }} + 1{% endmacro %}
+
+{% macro chain_33_21() %}{{ return(adapter.dispatch('chain_33_21')()) }}{% endmacro %}
+{% macro default__chain_33_21() %}{% if false %}{{ chain_34_22() }}{% endif %}{{ chain_33_22() }} + 1{% endmacro %}
+
+{% macro chain_33_22() %}{{ return(adapter.dispatch('chain_33_22')()) }}{% endmacro %}
+{% macro default__chain_33_22() %}{% if false %}{{ chain_34_23() }}{% endif %}{{ chain_33_23() }} + 1{% endmacro %}
+
+{% macro chain_33_23() %}{{ return(adapter.dispatch('chain_33_23')()) }}{% endmacro %}
+{% macro default__chain_33_23() %}{% if false %}{{ chain_34_24() }}{% endif %}{{ chain_33_24() }} + 1{% endmacro %}
+
+{% macro chain_33_24() %}{{ return(adapter.dispatch('chain_33_24')()) }}{% endmacro %}
+{% macro default__chain_33_24() %}1{% endmacro %}
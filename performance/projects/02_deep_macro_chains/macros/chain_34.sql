@@ -0,0 +1,74 @@
+{% macro chain_34_0() %}{{ return(adapter.dispatch('chain_34_0')()) }}{% endmacro %}
+{% macro default__chain_34_0() %}{% if false %}{{ chain_35_1() }}{% endif %}{{ chain_34_1() }} + 1{% endmacro %}
+
+{% macro chain_34_1() %}{{ return(adapter.dispatch('chain_34_1')()) }}{% endmacro %}
+{% macro default__chain_34_1() %}{% if false %}{{ chain_35_2() }}{% endif %}{{ chain_34_2() }} + 1{% endmacro %}
+
+{% macro chain_34_2() %}{{ return(adapter.dispatch('chain_34_2')()) }}{% endmacro %}
+{% macro default__chain_34_2() %}{% if false %}{{ chain_35_3() }}{% endif %}{{ chain_34_3() }} + 1{% endmacro %}
+
+{% macro chain_34_3() %}{{ return(adapter.dispatch('chain_34_3')()) }}{% endmacro %}
+{% macro default__chain_34_3() %}{% if false %}{{ chain_35_4() }}{% endif %}{{ chain_34_4() }} + 1{% endmacro %}
+
+{% macro chain_34_4() %}{{ return(adapter.dispatch('chain_34_4')()) }}{% endmacro %}
+{% macro default__chain_34_4() %}{% if false %}{{ chain_35_5() }}{% endif %}{{ chain_34_5() }} + 1{% endmacro %}
+
+{% macro chain_34_5() %}{{ return(adapter.dispatch('chain_34_5')()) }}{% endmacro %}
+{% macro default__chain_34_5() %}{% if false %}{{ chain_35_6() }}{% endif %}{{ chain_34_6() }} + 1{% endmacro %}
+
+{% macro chain_34_6() %}{{ return(adapter.dispatch('chain_34_6')()) }}{% endmacro %}
+{% macro default__chain_34_6() %}{% if false %}{{ chain_35_7() }}{% endif %}{{ chain_34_7() }} + 1{% endmacro %}
+
+{% macro chain_34_7() %}{{ return(adapter.dispatch('chain_34_7')()) }}{% endmacro %}
+{% macro default__chain_34_7() %}{% if false %}{{ chain_35_8() }}{% endif %}{{ chain_34_8() }} + 1{% endmacro %}
+
+{% macro chain_34_8() %}{{ return(adapter.dispatch('chain_34_8')()) }}{% endmacro %}
+{% macro default__chain_34_8() %}{% if false %}{{ chain_35_9() }}{% endif %}{{ chain_34_9() }} + 1{% endmacro %}
+
+{% macro chain_34_9() %}{{ return(adapter.dispatch('chain_34_9')()) }}{% endmacro %}
+{% macro default__chain_34_9() %}{% if false %}{{ chain_35_10() }}{% endif %}{{ chain_34_10() }} + 1{% endmacro %}
+
+{% macro chain_34_10() %}{{ return(adapter.dispatch('chain_34_10')()) }}{% endmacro %}
+{% macro default__chain_34_10() %}{% if false %}{{ chain_35_11() }}{% endif %}{{ chain_34_11() }} + 1{% endmacro %}
+
+{% macro chain_34_11() %}{{ return(adapter.dispatch('chain_34_11')()) }}{% endmacro %}
+{% macro default__chain_34_11() %}{% if false %}{{ chain_35_12() }}{% endif %}{{ chain_34_12() }} + 1{% endmacro %}
+
+{% macro chain_34_12() %}{{ return(adapter.dispatch('chain_34_12')()) }}{% endmacro %}
+{% macro default__chain_34_12() %}{% if false %}{{ chain_35_13() }}{% endif %}{{ chain_34_13() }} + 1{% endmacro %}
+
+{% macro chain_34_13() %}{{ return(adapter.dispatch('chain_34_13')()) }}{% endmacro %}
+{% macro default__chain_34_13() %}{% if false %}{{ chain_35_14() }}{% endif %}{{ chain_34_14() }} + 1{% endmacro %}
+
+{% macro chain_34_14() %}{{ return(adapter.dispatch('chain_34_14')()) }}{% endmacro %}
+{% macro default__chain_34_14() %}{% if false %}{{ chain_35_15() }}{% endif %}{{ chain_34_15() }} + 1{% endmacro %}
+
+{% macro chain_34_15() %}{{ return(adapter.dispatch('chain_34_15')()) }}{% endmacro %}
+{% macro default__chain_34_15() %}{% if false %}{{ chain_35_16() }}{% endif %}{{ chain_34_16() }} + 1{% endmacro %}
+
+{% macro chain_34_16() %}{{ return(adapter.dispatch('chain_34_16')()) }}{% endmacro %}
+{% macro default__chain_34_16() %}{% if false %}{{ chain_35_17() }}{% endif %}{{ chain_34_17() }} + 1{% endmacro %}
+
+{% macro chain_34_17() %}{{ return(adapter.dispatch('chain_34_17')()) }}{% endmacro %}
+{% macro default__chain_34_17() %}{% if false %}{{ chain_35_18() }}{% endif %}{{ chain_34_18() }} + 1{% endmacro %}
+
+{% macro chain_34_18() %}{{ return(adapter.dispatch('chain_34_18')()) }}{% endmacro %}
+{% macro default__chain_34_18() %}{% if false %}{{ chain_35_19() }}{% endif %}{{ chain_34_19() }} + 1{% endmacro %}
+
+{% macro chain_34_19() %}{{ return(adapter.dispatch('chain_34_19')()) }}{% endmacro %}
+{% macro default__chain_34_19() %}{% if false %}{{ chain_35_20() }}{% endif %}{{ chain_34_20() }} + 1{% endmacro %}
+
+{% macro chain_34_20() %}{{ return(adapter.dispatch('chain_34_20')()) }}{% endmacro %}
+{% macro default__chain_34_20() %}{% if false %}{{ chain_35_21() }}{% endif %}{{ chain_34_21() }} + 1{% endmacro %}
+
+{% macro chain_34_21() %}{{ return(adapter.dispatch('chain_34_21')()) }}{% endmacro %}
+{% macro default__chain_34_21() %}{% if false %}{{ chain_35_22() }}{% endif %}{{ chain_34_22() }} + 1{% endmacro %}
+
+{% macro chain_34_22() %}{{ return(adapter.dispatch('chain_34_22')()) }}{% endmacro %}
+{% macro default__chain_34_22() %}{% if false %}{{ chain_35_23() }}{% endif %}{{ chain_34_23() }} + 1{% endmacro %}
+
+{% macro chain_34_23() %}{{ return(adapter.dispatch('chain_34_23')()) }}{% endmacro %}
+{% macro default__chain_34_23() %}{% if false %}{{ chain_35_24() }}{% endif %}{{ chain_34_24() }} + 1{% endmacro %}
+
+{% macro chain_34_24() %}{{ return(adapter.dispatch('chain_34_24')()) }}{% endmacro %}
+{% macro default__chain_34_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_35_0() %}{{ return(adapter.dispatch('chain_35_0')()) }}{% endmacro %}
+{% macro default__chain_35_0() %}{% if false %}{{ chain_36_1() }}{% endif %}{{ chain_35_1() }} + 1{% endmacro %}
+
+{% macro chain_35_1() %}{{ return(adapter.dispatch('chain_35_1')()) }}{% endmacro %}
+{% macro default__chain_35_1() %}{% if false %}{{ chain_36_2() }}{% endif %}{{ chain_35_2() }} + 1{% endmacro %}
+
+{% macro chain_35_2() %}{{ return(adapter.dispatch('chain_35_2')()) }}{% endmacro %}
+{% macro default__chain_35_2() %}{% if false %}{{ chain_36_3() }}{% endif %}{{ chain_35_3() }} + 1{% endmacro %}
+
+{% macro chain_35_3() %}{{ return(adapter.dispatch('chain_35_3')()) }}{% endmacro %}
+{% macro default__chain_35_3() %}{% if false %}{{ chain_36_4() }}{% endif %}{{ chain_35_4() }} + 1{% endmacro %}
+
+{% macro chain_35_4() %}{{ return(adapter.dispatch('chain_35_4')()) }}{% endmacro %}
+{% macro default__chain_35_4() %}{% if false %}{{ chain_36_5() }}{% endif %}{{ chain_35_5() }} + 1{% endmacro %}
+
+{% macro chain_35_5() %}{{ return(adapter.dispatch('chain_35_5')()) }}{% endmacro %}
+{% macro default__chain_35_5() %}{% if false %}{{ chain_36_6() }}{% endif %}{{ chain_35_6() }} + 1{% endmacro %}
+
+{% macro chain_35_6() %}{{ return(adapter.dispatch('chain_35_6')()) }}{% endmacro %}
+{% macro default__chain_35_6() %}{% if false %}{{ chain_36_7() }}{% endif %}{{ chain_35_7() }} + 1{% endmacro %}
+
+{% macro chain_35_7() %}{{ return(adapter.dispatch('chain_35_7')()) }}{% endmacro %}
+{% macro default__chain_35_7() %}{% if false %}{{ chain_36_8() }}{% endif %}{{ chain_35_8() }} + 1{% endmacro %}
+
+{% macro chain_35_8() %}{{ return(adapter.dispatch('chain_35_8')()) }}{% endmacro %}
+{% macro default__chain_35_8() %}{% if false %}{{ chain_36_9() }}{% endif %}{{ chain_35_9() }} + 1{% endmacro %}
+
+{% macro chain_35_9() %}{{ return(adapter.dispatch('chain_35_9')()) }}{% endmacro %}
+{% macro default__chain_35_9() %}{% if false %}{{ chain_36_10() }}{% endif %}{{ chain_35_10() }} + 1{% endmacro %}
+
+{% macro chain_35_10() %}{{ return(adapter.dispatch('chain_35_10')()) }}{% endmacro %}
+{% macro default__chain_35_10() %}{% if false %}{{ chain_36_11() }}{% endif %}{{ chain_35_11() }} + 1{% endmacro %}
+
+{% macro chain_35_11() %}{{ return(adapter.dispatch('chain_35_11')()) }}{% endmacro %}
+{% macro default__chain_35_11() %}{% if false %}{{ chain_36_12() }}{% endif %}{{ chain_35_12() }} + 1{% endmacro %}
+
+{% macro chain_35_12() %}{{ return(adapter.dispatch('chain_35_12')()) }}{% endmacro %}
+{% macro default__chain_35_12() %}{% if false %}{{ chain_36_13() }}{% endif %}{{ chain_35_13() }} + 1{% endmacro %}
+
+{% macro chain_35_13() %}{{ return(adapter.dispatch('chain_35_13')()) }}{% endmacro %}
+{% macro default__chain_35_13() %}{% if false %}{{ chain_36_14() }}{% endif %}{{ chain_35_14() }} + 1{% endmacro %}
+
+{% macro chain_35_14() %}{{ return(adapter.dispatch('chain_35_14')()) }}{% endmacro %}
+{% macro default__chain_35_14() %}{% if false %}{{ chain_36_15() }}{% endif %}{{ chain_35_15() }} + 1{% endmacro %}
+
+{% macro chain_35_15() %}{{ return(adapter.dispatch('chain_35_15')()) }}{% endmacro %}
+{% macro default__chain_35_15() %}{% if false %}{{ chain_36_16() }}{% endif %}{{ chain_35_16() }} + 1{% endmacro %}
+
+{% macro chain_35_16() %}{{ return(adapter.dispatch('chain_35_16')()) }}{% endmacro %}
+{% macro default__chain_35_16() %}{% if false %}{{ chain_36_17() }}{% endif %}{{ chain_35_17() }} + 1{% endmacro %}
+
+{% macro chain_35_17() %}{{ return(adapter.dispatch('chain_35_17')()) }}{% endmacro %}
+{% macro default__chain_35_17() %}{% if false %}{{ chain_36_18() }}{% endif %}{{ chain_35_18() }} + 1{% endmacro %}
+
+{% macro chain_35_18() %}{{ return(adapter.dispatch('chain_35_18')()) }}{% endmacro %}
+{% macro default__chain_35_18() %}{% if false %}{{ chain_36_19() }}{% endif %}{{ chain_35_19() }} + 1{% endmacro %}
+
+{% macro chain_35_19() %}{{ return(adapter.dispatch('chain_35_19')()) }}{% endmacro %}
+{% macro default__chain_35_19() %}{% if false %}{{ chain_36_20() }}{% endif %}{{ chain_35_20() }} + 1{% endmacro %}
+
+{% macro chain_35_20() %}{{ return(adapter.dispatch('chain_35_20')()) }}{% endmacro %}
+{% macro default__chain_35_20() %}{% if false %}{{ chain_36_21() }}{% endif %}{{ chain_35_21() }} + 1{% endmacro %}
+
+{% macro chain_35_21() %}{{ return(adapter.dispatch('chain_35_21')()) }}{% endmacro %}
+{% macro default__chain_35_21() %}{% if false %}{{ chain_36_22() }}{% endif %}{{ chain_35_22() }} + 1{% endmacro %}
+
+{% macro chain_35_22() %}{{ return(adapter.dispatch('chain_35_22')()) }}{% endmacro %}
+{% macro default__chain_35_22() %}{% if false %}{{ chain_36_23() }}{% endif %}{{ chain_35_23() }} + 1{% endmacro %}
+
+{% macro chain_35_23() %}{{ return(adapter.dispatch('chain_35_23')()) }}{% endmacro %}
+{% macro default__chain_35_23() %}{% if false %}{{ chain_36_24() }}{% endif %}{{ chain_35_24() }} + 1{% endmacro %}
+
+{% macro chain_35_24() %}{{ return(adapter.dispatch('chain_35_24')()) }}{% endmacro %}
+{% macro default__chain_35_24() %}1{% endmacro %}
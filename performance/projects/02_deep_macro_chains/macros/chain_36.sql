@@ -0,0 +1,74 @@
+{% macro chain_36_0() %}{{ return(adapter.dispatch('chain_36_0')()) }}{% endmacro %}
+{% macro default__chain_36_0() %}{% if false %}{{ chain_37_1() }}{% endif %}{{ chain_36_1() }} + 1{% endmacro %}
+
+{% macro chain_36_1() %}{{ return(adapter.dispatch('chain_36_1')()) }}{% endmacro %}
+{% macro default__chain_36_1() %}{% if false %}{{ chain_37_2() }}{% endif %}{{ chain_36_2() }} + 1{% endmacro %}
+
+{% macro chain_36_2() %}{{ return(adapter.dispatch('chain_36_2')()) }}{% endmacro %}
+{% macro default__chain_36_2() %}{% if false %}{{ chain_37_3() }}{% endif %}{{ chain_36_3() }} + 1{% endmacro %}
+
+{% macro chain_36_3() %}{{ return(adapter.dispatch('chain_36_3')()) }}{% endmacro %}
+{% macro default__chain_36_3() %}{% if false %}{{ chain_37_4() }}{% endif %}{{ chain_36_4() }} + 1{% endmacro %}
+
+{% macro chain_36_4() %}{{ return(adapter.dispatch('chain_36_4')()) }}{% endmacro %}
+{% macro default__chain_36_4() %}{% if false %}{{ chain_37_5() }}{% endif %}{{ chain_36_5() }} + 1{% endmacro %}
+
+{% macro chain_36_5() %}{{ return(adapter.dispatch('chain_36_5')()) }}{% endmacro %}
+{% macro default__chain_36_5() %}{% if false %}{{ chain_37_6() }}{% endif %}{{ chain_36_6() }} + 1{% endmacro %}
+
+{% macro chain_36_6() %}{{ return(adapter.dispatch('chain_36_6')()) }}{% endmacro %}
+{% macro default__chain_36_6() %}{% if false %}{{ chain_37_7() }}{% endif %}{{ chain_36_7() }} + 1{% endmacro %}
+
+{% macro chain_36_7() %}{{ return(adapter.dispatch('chain_36_7')()) }}{% endmacro %}
+{% macro default__chain_36_7() %}{% if false %}{{ chain_37_8() }}{% endif %}{{ chain_36_8() }} + 1{% endmacro %}
+
+{% macro chain_36_8() %}{{ return(adapter.dispatch('chain_36_8')()) }}{% endmacro %}
+{% macro default__chain_36_8() %}{% if false %}{{ chain_37_9() }}{% endif %}{{ chain_36_9() }} + 1{% endmacro %}
+
+{% macro chain_36_9() %}{{ return(adapter.dispatch('chain_36_9')()) }}{% endmacro %}
+{% macro default__chain_36_9() %}{% if false %}{{ chain_37_10() }}{% endif %}{{ chain_36_10() }} + 1{% endmacro %}
+
+{% macro chain_36_10() %}{{ return(adapter.dispatch('chain_36_10')()) }}{% endmacro %}
+{% macro default__chain_36_10() %}{% if false %}{{ chain_37_11() }}{% endif %}{{ chain_36_11() }} + 1{% endmacro %}
+
+{% macro chain_36_11() %}{{ return(adapter.dispatch('chain_36_11')()) }}{% endmacro %}
+{% macro default__chain_36_11() %}{% if false %}{{ chain_37_12() }}{% endif %}{{ chain_36_12() }} + 1{% endmacro %}
+
+{% macro chain_36_12() %}{{ return(adapter.dispatch('chain_36_12')()) }}{% endmacro %}
+{% macro default__chain_36_12() %}{% if false %}{{ chain_37_13() }}{% endif %}{{ chain_36_13() }} + 1{% endmacro %}
+
+{% macro chain_36_13() %}{{ return(adapter.dispatch('chain_36_13')()) }}{% endmacro %}
+{% macro default__chain_36_13() %}{% if false %}{{ chain_37_14() }}{% endif %}{{ chain_36_14() }} + 1{% endmacro %}
+
+{% macro chain_36_14() %}{{ return(adapter.dispatch('chain_36_14')()) }}{% endmacro %}
+{% macro default__chain_36_14() %}{% if false %}{{ chain_37_15() }}{% endif %}{{ chain_36_15() }} + 1{% endmacro %}
+
+{% macro chain_36_15() %}{{ return(adapter.dispatch('chain_36_15')()) }}{% endmacro %}
+{% macro default__chain_36_15() %}{% if false %}{{ chain_37_16() }}{% endif %}{{ chain_36_16() }} + 1{% endmacro %}
+
+{% macro chain_36_16() %}{{ return(adapter.dispatch('chain_36_16')()) }}{% endmacro %}
+{% macro default__chain_36_16() %}{% if false %}{{ chain_37_17() }}{% endif %}{{ chain_36_17() }} + 1{% endmacro %}
+
+{% macro chain_36_17() %}{{ return(adapter.dispatch('chain_36_17')()) }}{% endmacro %}
+{% macro default__chain_36_17() %}{% if false %}{{ chain_37_18() }}{% endif %}{{ chain_36_18() }} + 1{% endmacro %}
+
+{% macro chain_36_18() %}{{ return(adapter.dispatch('chain_36_18')()) }}{% endmacro %}
+{% macro default__chain_36_18() %}{% if false %}{{ chain_37_19() }}{% endif %}{{ chain_36_19() }} + 1{% endmacro %}
+
+{% macro chain_36_19() %}{{ return(adapter.dispatch('chain_36_19')()) }}{% endmacro %}
+{% macro default__chain_36_19() %}{% if false %}{{ chain_37_20() }}{% endif %}{{ chain_36_20() }} + 1{% endmacro %}
+
+{% macro chain_36_20() %}{{ return(adapter.dispatch('chain_36_20')()) }}{% endmacro %}
+{% macro default__chain_36_20() %}{% if false %}{{ chain_37_21() }}{% endif %}{{ chain_36_21() }} + 1{% endmacro %}
+
+{% macro chain_36_21() %}{{ return(adapter.dispatch('chain_36_21')()) }}{% endmacro %}
+{% macro default__chain_36_21() %}{% if false %}{{ chain_37_22() }}{% endif %}{{ chain_36_22() }} + 1{% endmacro %}
+
+{% macro chain_36_22() %}{{ return(adapter.dispatch('chain_36_22')()) }}{% endmacro %}
+{% macro default__chain_36_22() %}{% if false %}{{ chain_37_23() }}{% endif %}{{ chain_36_23() }} + 1{% endmacro %}
+
+{% macro chain_36_23() %}{{ return(adapter.dispatch('chain_36_23')()) }}{% endmacro %}
+{% macro default__chain_36_23() %}{% if false %}{{ chain_37_24() }}{% endif %}{{ chain_36_24() }} + 1{% endmacro %}
+
+{% macro chain_36_24() %}{{ return(adapter.dispatch('chain_36_24')()) }}{% endmacro %}
+{% macro default__chain_36_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_37_0() %}{{ return(adapter.dispatch('chain_37_0')()) }}{% endmacro %}
+{% macro default__chain_37_0() %}{% if false %}{{ chain_38_1() }}{% endif %}{{ chain_37_1() }} + 1{% endmacro %}
+
+{% macro chain_37_1() %}{{ return(adapter.dispatch('chain_37_1')()) }}{% endmacro %}
+{% macro default__chain_37_1() %}{% if false %}{{ chain_38_2() }}{% endif %}{{ chain_37_2() }} + 1{% endmacro %}
+
+{% macro chain_37_2() %}{{ return(adapter.dispatch('chain_37_2')()) }}{% endmacro %}
+{% macro default__chain_37_2() %}{% if false %}{{ chain_38_3() }}{% endif %}{{ chain_37_3() }} + 1{% endmacro %}
+
+{% macro chain_37_3() %}{{ return(adapter.dispatch('chain_37_3')()) }}{% endmacro %}
+{% macro default__chain_37_3() %}{% if false %}{{ chain_38_4() }}{% endif %}{{ chain_37_4() }} + 1{% endmacro %}
+
+{% macro chain_37_4() %}{{ return(adapter.dispatch('chain_37_4')()) }}{% endmacro %}
+{% macro default__chain_37_4() %}{% if false %}{{ chain_38_5() }}{% endif %}{{ chain_37_5() }} + 1{% endmacro %}
+
+{% macro chain_37_5() %}{{ return(adapter.dispatch('chain_37_5')()) }}{% endmacro %}
+{% macro default__chain_37_5() %}{% if false %}{{ chain_38_6() }}{% endif %}{{ chain_37_6() }} + 1{% endmacro %}
+
+{% macro chain_37_6() %}{{ return(adapter.dispatch('chain_37_6')()) }}{% endmacro %}
+{% macro default__chain_37_6() %}{% if false %}{{ chain_38_7() }}{% endif %}{{ chain_37_7() }} + 1{% endmacro %}
+
+{% macro chain_37_7() %}{{ return(adapter.dispatch('chain_37_7')()) }}{% endmacro %}
+{% macro default__chain_37_7() %}{% if false %}{{ chain_38_8() }}{% endif %}{{ chain_37_8() }} + 1{% endmacro %}
+
+{% macro chain_37_8() %}{{ return(adapter.dispatch('chain_37_8')()) }}{% endmacro %}
+{% macro default__chain_37_8() %}{% if false %}{{ chain_38_9() }}{% endif %}{{ chain_37_9() }} + 1{% endmacro %}
+
+{% macro chain_37_9() %}{{ return(adapter.dispatch('chain_37_9')()) }}{% endmacro %}
+{% macro default__chain_37_9() %}{% if false %}{{ chain_38_10() }}{% endif %}{{ chain_37_10() }} + 1{% endmacro %}
+
+{% macro chain_37_10() %}{{ return(adapter.dispatch('chain_37_10')()) }}{% endmacro %}
+{% macro default__chain_37_10() %}{% if false %}{{ chain_38_11() }}{% endif %}{{ chain_37_11() }} + 1{% endmacro %}
+
+{% macro chain_37_11() %}{{ return(adapter.dispatch('chain_37_11')()) }}{% endmacro %}
+{% macro default__chain_37_11() %}{% if false %}{{ chain_38_12() }}{% endif %}{{ chain_37_12() }} + 1{% endmacro %}
+
+{% macro chain_37_12() %}{{ return(adapter.dispatch('chain_37_12')()) }}{% endmacro %}
+{% macro default__chain_37_12() %}{% if false %}{{ chain_38_13() }}{% endif %}{{ chain_37_13() }} + 1{% endmacro %}
+
+{% macro chain_37_13() %}{{ return(adapter.dispatch('chain_37_13')()) }}{% endmacro %}
+{% macro default__chain_37_13() %}{% if false %}{{ chain_38_14() }}{% endif %}{{ chain_37_14() }} + 1{% endmacro %}
+
+{% macro chain_37_14() %}{{ return(adapter.dispatch('chain_37_14')()) }}{% endmacro %}
+{% macro default__chain_37_14() %}{% if false %}{{ chain_38_15() }}{% endif %}{{ chain_37_15() }} + 1{% endmacro %}
+
+{% macro chain_37_15() %}{{ return(adapter.dispatch('chain_37_15')()) }}{% endmacro %}
+{% macro default__chain_37_15() %}{% if false %}{{ chain_38_16() }}{% endif %}{{ chain_37_16() }} + 1{% endmacro %}
+
+{% macro chain_37_16() %}{{ return(adapter.dispatch('chain_37_16')()) }}{% endmacro %}
+{% macro default__chain_37_16() %}{% if false %}{{ chain_38_17() }}{% endif %}{{ chain_37_17() }} + 1{% endmacro %}
+
+{% macro chain_37_17() %}{{ return(adapter.dispatch('chain_37_17')()) }}{% endmacro %}
+{% macro default__chain_37_17() %}{% if false %}{{ chain_38_18() }}{% endif %}{{ chain_37_18() }} + 1{% endmacro %}
+
+{% macro chain_37_18() %}{{ return(adapter.dispatch('chain_37_18')()) }}{% endmacro %}
+{% macro default__chain_37_18() %}{% if false %}{{ chain_38_19() }}{% endif %}{{ chain_37_19() }} + 1{% endmacro %}
+
+{% macro chain_37_19() %}{{ return(adapter.dispatch('chain_37_19')()) }}{% endmacro %}
+{% macro default__chain_37_19() %}{% if false %}{{ chain_38_20() }}{% endif %}{{ chain_37_20() }} + 1{% endmacro %}
+
+{% macro chain_37_20() %}{{ return(adapter.dispatch('chain_37_20')()) }}{% endmacro %}
+{% macro default__chain_37_20() %}{% if false %}{{ chain_38_21() }}{% endif %}{{ chain_37_21() }} + 1{% endmacro %}
+
+{% macro chain_37_21() %}{{ return(adapter.dispatch('chain_37_21')()) }}{% endmacro %}
+{% macro default__chain_37_21() %}{% if false %}{{ chain_38_22() }}{% endif %}{{ chain_37_22() }} + 1{% endmacro %}
+
+{% macro chain_37_22() %}{{ return(adapter.dispatch('chain_37_22')()) }}{% endmacro %}
+{% macro default__chain_37_22() %}{% if false %}{{ chain_38_23() }}{% endif %}{{ chain_37_23() }} + 1{% endmacro %}
+
+{% macro chain_37_23() %}{{ return(adapter.dispatch('chain_37_23')()) }}{% endmacro %}
+{% macro default__chain_37_23() %}{% if false %}{{ chain_38_24() }}{% endif %}{{ chain_37_24() }} + 1{% endmacro %}
+
+{% macro chain_37_24() %}{{ return(adapter.dispatch('chain_37_24')()) }}{% endmacro %}
+{% macro default__chain_37_24() %}1{% endmacro %}
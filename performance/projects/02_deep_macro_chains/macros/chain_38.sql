@@ -0,0 +1,74 @@
+{% macro chain_38_0() %}{{ return(adapter.dispatch('chain_38_0')()) }}{% endmacro %}
+{% macro default__chain_38_0() %}{% if false %}{{ chain_39_1() }}{% endif %}{{ chain_38_1() }} + 1{% endmacro %}
+
+{% macro chain_38_1() %}{{ return(adapter.dispatch('chain_38_1')()) }}{% endmacro %}
+{% macro default__chain_38_1() %}{% if false %}{{ chain_39_2() }}{% endif %}{{ chain_38_2() }} + 1{% endmacro %}
+
+{% macro chain_38_2() %}{{ return(adapter.dispatch('chain_38_2')()) }}{% endmacro %}
+{% macro default__chain_38_2() %}{% if false %}{{ chain_39_3() }}{% endif %}{{ chain_38_3() }} + 1{% endmacro %}
+
+{% macro chain_38_3() %}{{ return(adapter.dispatch('chain_38_3')()) }}{% endmacro %}
+{% macro default__chain_38_3() %}{% if false %}{{ chain_39_4() }}{% endif %}{{ chain_38_4() }} + 1{% endmacro %}
+
+{% macro chain_38_4() %}{{ return(adapter.dispatch('chain_38_4')()) }}{% endmacro %}
+{% macro default__chain_38_4() %}{% if false %}{{ chain_39_5() }}{% endif %}{{ chain_38_5() }} + 1{% endmacro %}
+
+{% macro chain_38_5() %}{{ return(adapter.dispatch('chain_38_5')()) }}{% endmacro %}
+{% macro default__chain_38_5() %}{% if false %}{{ chain_39_6() }}{% endif %}{{ chain_38_6() }} + 1{% endmacro %}
+
+{% macro chain_38_6() %}{{ return(adapter.dispatch('chain_38_6')()) }}{% endmacro %}
+{% macro default__chain_38_6() %}{% if false %}{{ chain_39_7() }}{% endif %}{{ chain_38_7() }} + 1{% endmacro %}
+
+{% macro chain_38_7() %}{{ return(adapter.dispatch('chain_38_7')()) }}{% endmacro %}
+{% macro default__chain_38_7() %}{% if false %}{{ chain_39_8() }}{% endif %}{{ chain_38_8() }} + 1{% endmacro %}
+
+{% macro chain_38_8() %}{{ return(adapter.dispatch('chain_38_8')()) }}{% endmacro %}
+{% macro default__chain_38_8() %}{% if false %}{{ chain_39_9() }}{% endif %}{{ chain_38_9() }} + 1{% endmacro %}
+
+{% macro chain_38_9() %}{{ return(adapter.dispatch('chain_38_9')()) }}{% endmacro %}
+{% macro default__chain_38_9() %}{% if false %}{{ chain_39_10() }}{% endif %}{{ chain_38_10() }} + 1{% endmacro %}
+
+{% macro chain_38_10() %}{{ return(adapter.dispatch('chain_38_10')()) }}{% endmacro %}
+{% macro default__chain_38_10() %}{% if false %}{{ chain_39_11() }}{% endif %}{{ chain_38_11() }} + 1{% endmacro %}
+
+{% macro chain_38_11() %}{{ return(adapter.dispatch('chain_38_11')()) }}{% endmacro %}
+{% macro default__chain_38_11() %}{% if false %}{{ chain_39_12() }}{% endif %}{{ chain_38_12() }} + 1{% endmacro %}
+
+{% macro chain_38_12() %}{{ return(adapter.dispatch('chain_38_12')()) }}{% endmacro %}
+{% macro default__chain_38_12() %}{% if false %}{{ chain_39_13() }}{% endif %}{{ chain_38_13() }} + 1{% endmacro %}
+
+{% macro chain_38_13() %}{{ return(adapter.dispatch('chain_38_13')()) }}{% endmacro %}
+{% macro default__chain_38_13() %}{% if false %}{{ chain_39_14() }}{% endif %}{{ chain_38_14() }} + 1{% endmacro %}
+
+{% macro chain_38_14() %}{{ return(adapter.dispatch('chain_38_14')()) }}{% endmacro %}
+{% macro default__chain_38_14() %}{% if false %}{{ chain_39_15() }}{% endif %}{{ chain_38_15() }} + 1{% endmacro %}
+
+{% macro chain_38_15() %}{{ return(adapter.dispatch('chain_38_15')()) }}{% endmacro %}
+{% macro default__chain_38_15() %}{% if false %}{{ chain_39_16() }}{% endif %}{{ chain_38_16() }} + 1{% endmacro %}
+
+{% macro chain_38_16() %}{{ return(adapter.dispatch('chain_38_16')()) }}{% endmacro %}
+{% macro default__chain_38_16() %}{% if false %}{{ chain_39_17() }}{% endif %}{{ chain_38_17() }} + 1{% endmacro %}
+
+{% macro chain_38_17() %}{{ return(adapter.dispatch('chain_38_17')()) }}{% endmacro %}
+{% macro default__chain_38_17() %}{% if false %}{{ chain_39_18() }}{% endif %}{{ chain_38_18() }} + 1{% endmacro %}
+
+{% macro chain_38_18() %}{{ return(adapter.dispatch('chain_38_18')()) }}{% endmacro %}
+{% macro default__chain_38_18() %}{% if false %}{{ chain_39_19() }}{% endif %}{{ chain_38_19() }} + 1{% endmacro %}
+
+{% macro chain_38_19() %}{{ return(adapter.dispatch('chain_38_19')()) }}{% endmacro %}
+{% macro default__chain_38_19() %}{% if false %}{{ chain_39_20() }}{% endif %}{{ chain_38_20() }} + 1{% endmacro %}
+
+{% macro chain_38_20() %}{{ return(adapter.dispatch('chain_38_20')()) }}{% endmacro %}
+{% macro default__chain_38_20() %}{% if false %}{{ chain_39_21() }}{% endif %}{{ chain_38_21() }} + 1{% endmacro %}
+
+{% macro chain_38_21() %}{{ return(adapter.dispatch('chain_38_21')()) }}{% endmacro %}
+{% macro default__chain_38_21() %}{% if false %}{{ chain_39_22() }}{% endif %}{{ chain_38_22() }} + 1{% endmacro %}
+
+{% macro chain_38_22() %}{{ return(adapter.dispatch('chain_38_22')()) }}{% endmacro %}
+{% macro default__chain_38_22() %}{% if false %}{{ chain_39_23() }}{% endif %}{{ chain_38_23() }} + 1{% endmacro %}
+
+{% macro chain_38_23() %}{{ return(adapter.dispatch('chain_38_23')()) }}{% endmacro %}
+{% macro default__chain_38_23() %}{% if false %}{{ chain_39_24() }}{% endif %}{{ chain_38_24() }} + 1{% endmacro %}
+
+{% macro chain_38_24() %}{{ return(adapter.dispatch('chain_38_24')()) }}{% endmacro %}
+{% macro default__chain_38_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_39_0() %}{{ return(adapter.dispatch('chain_39_0')()) }}{% endmacro %}
+{% macro default__chain_39_0() %}{% if false %}{{ chain_0_1() }}{% endif %}{{ chain_39_1() }} + 1{% endmacro %}
+
+{% macro chain_39_1() %}{{ return(adapter.dispatch('chain_39_1')()) }}{% endmacro %}
+{% macro default__chain_39_1() %}{% if false %}{{ chain_0_2() }}{% endif %}{{ chain_39_2() }} + 1{% endmacro %}
+
+{% macro chain_39_2() %}{{ return(adapter.dispatch('chain_39_2')()) }}{% endmacro %}
+{% macro default__chain_39_2() %}{% if false %}{{ chain_0_3() }}{% endif %}{{ chain_39_3() }} + 1{% endmacro %}
+
+{% macro chain_39_3() %}{{ return(adapter.dispatch('chain_39_3')()) }}{% endmacro %}
+{% macro default__chain_39_3() %}{% if false %}{{ chain_0_4() }}{% endif %}{{ chain_39_4() }} + 1{% endmacro %}
+
+{% macro chain_39_4() %}{{ return(adapter.dispatch('chain_39_4')()) }}{% endmacro %}
+{% macro default__chain_39_4() %}{% if false %}{{ chain_0_5() }}{% endif %}{{ chain_39_5() }} + 1{% endmacro %}
+
+{% macro chain_39_5() %}{{ return(adapter.dispatch('chain_39_5')()) }}{% endmacro %}
+{% macro default__chain_39_5() %}{% if false %}{{ chain_0_6() }}{% endif %}{{ chain_39_6() }} + 1{% endmacro %}
+
+{% macro chain_39_6() %}{{ return(adapter.dispatch('chain_39_6')()) }}{% endmacro %}
+{% macro default__chain_39_6() %}{% if false %}{{ chain_0_7() }}{% endif %}{{ chain_39_7() }} + 1{% endmacro %}
+
+{% macro chain_39_7() %}{{ return(adapter.dispatch('chain_39_7')()) }}{% endmacro %}
+{% macro default__chain_39_7() %}{% if false %}{{ chain_0_8() }}{% endif %}{{ chain_39_8() }} + 1{% endmacro %}
+
+{% macro chain_39_8() %}{{ return(adapter.dispatch('chain_39_8')()) }}{% endmacro %}
+{% macro default__chain_39_8() %}{% if false %}{{ chain_0_9() }}{% endif %}{{ chain_39_9() }} + 1{% endmacro %}
+
+{% macro chain_39_9() %}{{ return(adapter.dispatch('chain_39_9')()) }}{% endmacro %}
+{% macro default__chain_39_9() %}{% if false %}{{ chain_0_10() }}{% endif %}{{ chain_39_10() }} + 1{% endmacro %}
+
+{% macro chain_39_10() %}{{ return(adapter.dispatch('chain_39_10')()) }}{% endmacro %}
+{% macro default__chain_39_10() %}{% if false %}{{ chain_0_11() }}{% endif %}{{ chain_39_11() }} + 1{% endmacro %}
+
+{% macro chain_39_11() %}{{ return(adapter.dispatch('chain_39_11')()) }}{% endmacro %}
+{% macro default__chain_39_11() %}{% if false %}{{ chain_0_12() }}{% endif %}{{ chain_39_12() }} + 1{% endmacro %}
+
+{% macro chain_39_12() %}{{ return(adapter.dispatch('chain_39_12')()) }}{% endmacro %}
+{% macro default__chain_39_12() %}{% if false %}{{ chain_0_13() }}{% endif %}{{ chain_39_13() }} + 1{% endmacro %}
+
+{% macro chain_39_13() %}{{ return(adapter.dispatch('chain_39_13')()) }}{% endmacro %}
+{% macro default__chain_39_13() %}{% if false %}{{ chain_0_14() }}{% endif %}{{ chain_39_14() }} + 1{% endmacro %}
+
+{% macro chain_39_14() %}{{ return(adapter.dispatch('chain_39_14')()) }}{% endmacro %}
+{% macro default__chain_39_14() %}{% if false %}{{ chain_0_15() }}{% endif %}{{ chain_39_15() }} + 1{% endmacro %}
+
+{% macro chain_39_15() %}{{ return(adapter.dispatch('chain_39_15')()) }}{% endmacro %}
+{% macro default__chain_39_15() %}{% if false %}{{ chain_0_16() }}{% endif %}{{ chain_39_16() }} + 1{% endmacro %}
+
+{% macro chain_39_16() %}{{ return(adapter.dispatch('chain_39_16')()) }}{% endmacro %}
+{% macro default__chain_39_16() %}{% if false %}{{ chain_0_17() }}{% endif %}{{ chain_39_17() }} + 1{% endmacro %}
+
+{% macro chain_39_17() %}{{ return(adapter.dispatch('chain_39_17')()) }}{% endmacro %}
+{% macro default__chain_39_17() %}{% if false %}{{ chain_0_18() }}{% endif %}{{ chain_39_18() }} + 1{% endmacro %}
+
+{% macro chain_39_18() %}{{ return(adapter.dispatch('chain_39_18')()) }}{% endmacro %}
+{% macro default__chain_39_18() %}{% if false %}{{ chain_0_19() }}{% endif %}{{ chain_39_19() }} + 1{% endmacro %}
+
+{% macro chain_39_19() %}{{ return(adapter.dispatch('chain_39_19')()) }}{% endmacro %}
+{% macro default__chain_39_19() %}{% if false %}{{ chain_0_20() }}{% endif %}{{ chain_39_20() }} + 1{% endmacro %}
+
+{% macro chain_39_20() %}{{ return(adapter.dispatch('chain_39_20')()) }}{% endmacro %}
+{% macro default__chain_39_20() %}{% if false %}{{ chain_0_21() }}{% endif %}{{ chain_39_21() }} + 1{% endmacro %}
+
+{% macro chain_39_21() %}{{ return(adapter.dispatch('chain_39_21')()) }}{% endmacro %}
+{% macro default__chain_39_21() %}{% if false %}{{ chain_0_22() }}{% endif %}{{ chain_39_22() }} + 1{% endmacro %}
+
+{% macro chain_39_22() %}{{ return(adapter.dispatch('chain_39_22')()) }}{% endmacro %}
+{% macro default__chain_39_22() %}{% if false %}{{ chain_0_23() }}{% endif %}{{ chain_39_23() }} + 1{% endmacro %}
+
+{% macro chain_39_23() %}{{ return(adapter.dispatch('chain_39_23')()) }}{% endmacro %}
+{% macro default__chain_39_23() %}{% if false %}{{ chain_0_24() }}{% endif %}{{ chain_39_24() }} + 1{% endmacro %}
+
+{% macro chain_39_24() %}{{ return(adapter.dispatch('chain_39_24')()) }}{% endmacro %}
+{% macro default__chain_39_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_4_0() %}{{ return(adapter.dispatch('chain_4_0')()) }}{% endmacro %}
+{% macro default__chain_4_0() %}{% if false %}{{ chain_5_1() }}{% endif %}{{ chain_4_1() }} + 1{% endmacro %}
+
+{% macro chain_4_1() %}{{ return(adapter.dispatch('chain_4_1')()) }}{% endmacro %}
+{% macro default__chain_4_1() %}{% if false %}{{ chain_5_2() }}{% endif %}{{ chain_4_2() }} + 1{% endmacro %}
+
+{% macro chain_4_2() %}{{ return(adapter.dispatch('chain_4_2')()) }}{% endmacro %}
+{% macro default__chain_4_2() %}{% if false %}{{ chain_5_3() }}{% endif %}{{ chain_4_3() }} + 1{% endmacro %}
+
+{% macro chain_4_3() %}{{ return(adapter.dispatch('chain_4_3')()) }}{% endmacro %}
+{% macro default__chain_4_3() %}{% if false %}{{ chain_5_4() }}{% endif %}{{ chain_4_4() }} + 1{% endmacro %}
+
+{% macro chain_4_4() %}{{ return(adapter.dispatch('chain_4_4')()) }}{% endmacro %}
+{% macro default__chain_4_4() %}{% if false %}{{ chain_5_5() }}{% endif %}{{ chain_4_5() }} + 1{% endmacro %}
+
+{% macro chain_4_5() %}{{ return(adapter.dispatch('chain_4_5')()) }}{% endmacro %}
+{% macro default__chain_4_5() %}{% if false %}{{ chain_5_6() }}{% endif %}{{ chain_4_6() }} + 1{% endmacro %}
+
+{% macro chain_4_6() %}{{ return(adapter.dispatch('chain_4_6')()) }}{% endmacro %}
+{% macro default__chain_4_6() %}{% if false %}{{ chain_5_7() }}{% endif %}{{ chain_4_7() }} + 1{% endmacro %}
+
+{% macro chain_4_7() %}{{ return(adapter.dispatch('chain_4_7')()) }}{% endmacro %}
+{% macro default__chain_4_7() %}{% if false %}{{ chain_5_8() }}{% endif %}{{ chain_4_8() }} + 1{% endmacro %}
+
+{% macro chain_4_8() %}{{ return(adapter.dispatch('chain_4_8')()) }}{% endmacro %}
+{% macro default__chain_4_8() %}{% if false %}{{ chain_5_9() }}{% endif %}{{ chain_4_9() }} + 1{% endmacro %}
+
+{% macro chain_4_9() %}{{ return(adapter.dispatch('chain_4_9')()) }}{% endmacro %}
+{% macro default__chain_4_9() %}{% if false %}{{ chain_5_10() }}{% endif %}{{ chain_4_10() }} + 1{% endmacro %}
+
+{% macro chain_4_10() %}{{ return(adapter.dispatch('chain_4_10')()) }}{% endmacro %}
+{% macro default__chain_4_10() %}{% if false %}{{ chain_5_11() }}{% endif %}{{ chain_4_11() }} + 1{% endmacro %}
+
+{% macro chain_4_11() %}{{ return(adapter.dispatch('chain_4_11')()) }}{% endmacro %}
+{% macro default__chain_4_11() %}{% if false %}{{ chain_5_12() }}{% endif %}{{ chain_4_12() }} + 1{% endmacro %}
+
+{% macro chain_4_12() %}{{ return(adapter.dispatch('chain_4_12')()) }}{% endmacro %}
+{% macro default__chain_4_12() %}{% if false %}{{ chain_5_13() }}{% endif %}{{ chain_4_13() }} + 1{% endmacro %}
+
+{% macro chain_4_13() %}{{ return(adapter.dispatch('chain_4_13')()) }}{% endmacro %}
+{% macro default__chain_4_13() %}{% if false %}{{ chain_5_14() }}{% endif %}{{ chain_4_14() }} + 1{% endmacro %}
+
+{% macro chain_4_14() %}{{ return(adapter.dispatch('chain_4_14')()) }}{% endmacro %}
+{% macro default__chain_4_14() %}{% if false %}{{ chain_5_15() }}{% endif %}{{ chain_4_15() }} + 1{% endmacro %}
+
+{% macro chain_4_15() %}{{ return(adapter.dispatch('chain_4_15')()) }}{% endmacro %}
+{% macro default__chain_4_15() %}{% if false %}{{ chain_5_16() }}{% endif %}{{ chain_4_16() }} + 1{% endmacro %}
+
+{% macro chain_4_16() %}{{ return(adapter.dispatch('chain_4_16')()) }}{% endmacro %}
+{% macro default__chain_4_16() %}{% if false %}{{ chain_5_17() }}{% endif %}{{ chain_4_17() }} + 1{% endmacro %}
+
+{% macro chain_4_17() %}{{ return(adapter.dispatch('chain_4_17')()) }}{% endmacro %}
+{% macro default__chain_4_17() %}{% if false %}{{ chain_5_18() }}{% endif %}{{ chain_4_18() }} + 1{% endmacro %}
+
+{% macro chain_4_18() %}{{ return(adapter.dispatch('chain_4_18')()) }}{% endmacro %}
+{% macro default__chain_4_18() %}{% if false %}{{ chain_5_19() }}{% endif %}{{ chain_4_19() }} + 1{% endmacro %}
+
+{% macro chain_4_19() %}{{ return(adapter.dispatch('chain_4_19')()) }}{% endmacro %}
+{% macro default__chain_4_19() %}{% if false %}{{ chain_5_20() }}{% endif %}{{ chain_4_20() }} + 1{% endmacro %}
+
+{% macro chain_4_20() %}{{ return(adapter.dispatch('chain_4_20')()) }}{% endmacro %}
+{% macro default__chain_4_20() %}{% if false %}{{ chain_5_21() }}{% endif %}{{ chain_4_21() }} + 1{% endmacro %}
+
+{% macro chain_4_21() %}{{ return(adapter.dispatch('chain_4_21')()) }}{% endmacro %}
+{% macro default__chain_4_21() %}{% if false %}{{ chain_5_22() }}{% endif %}{{ chain_4_22() }} + 1{% endmacro %}
+
+{% macro chain_4_22() %}{{ return(adapter.dispatch('chain_4_22')()) }}{% endmacro %}
+{% macro default__chain_4_22() %}{% if false %}{{ chain_5_23() }}{% endif %}{{ chain_4_23() }} + 1{% endmacro %}
+
+{% macro chain_4_23() %}{{ return(adapter.dispatch('chain_4_23')()) }}{% endmacro %}
+{% macro default__chain_4_23() %}{% if false %}{{ chain_5_24() }}{% endif %}{{ chain_4_24() }} + 1{% endmacro %}
+
+{% macro chain_4_24() %}{{ return(adapter.dispatch('chain_4_24')()) }}{% endmacro %}
+{% macro default__chain_4_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_5_0() %}{{ return(adapter.dispatch('chain_5_0')()) }}{% endmacro %}
+{% macro default__chain_5_0() %}{% if false %}{{ chain_6_1() }}{% endif %}{{ chain_5_1() }} + 1{% endmacro %}
+
+{% macro chain_5_1() %}{{ return(adapter.dispatch('chain_5_1')()) }}{% endmacro %}
+{% macro default__chain_5_1() %}{% if false %}{{ chain_6_2() }}{% endif %}{{ chain_5_2() }} + 1{% endmacro %}
+
+{% macro chain_5_2() %}{{ return(adapter.dispatch('chain_5_2')()) }}{% endmacro %}
+{% macro default__chain_5_2() %}{% if false %}{{ chain_6_3() }}{% endif %}{{ chain_5_3() }} + 1{% endmacro %}
+
+{% macro chain_5_3() %}{{ return(adapter.dispatch('chain_5_3')()) }}{% endmacro %}
+{% macro default__chain_5_3() %}{% if false %}{{ chain_6_4() }}{% endif %}{{ chain_5_4() }} + 1{% endmacro %}
+
+{% macro chain_5_4() %}{{ return(adapter.dispatch('chain_5_4')()) }}{% endmacro %}
+{% macro default__chain_5_4() %}{% if false %}{{ chain_6_5() }}{% endif %}{{ chain_5_5() }} + 1{% endmacro %}
+
+{% macro chain_5_5() %}{{ return(adapter.dispatch('chain_5_5')()) }}{% endmacro %}
+{% macro default__chain_5_5() %}{% if false %}{{ chain_6_6() }}{% endif %}{{ chain_5_6() }} + 1{% endmacro %}
+
+{% macro chain_5_6() %}{{ return(adapter.dispatch('chain_5_6')()) }}{% endmacro %}
+{% macro default__chain_5_6() %}{% if false %}{{ chain_6_7() }}{% endif %}{{ chain_5_7() }} + 1{% endmacro %}
+
+{% macro chain_5_7() %}{{ return(adapter.dispatch('chain_5_7')()) }}{% endmacro %}
+{% macro default__chain_5_7() %}{% if false %}{{ chain_6_8() }}{% endif %}{{ chain_5_8() }} + 1{% endmacro %}
+
+{% macro chain_5_8() %}{{ return(adapter.dispatch('chain_5_8')()) }}{% endmacro %}
+{% macro default__chain_5_8() %}{% if false %}{{ chain_6_9() }}{% endif %}{{ chain_5_9() }} + 1{% endmacro %}
+
+{% macro chain_5_9() %}{{ return(adapter.dispatch('chain_5_9')()) }}{% endmacro %}
+{% macro default__chain_5_9() %}{% if false %}{{ chain_6_10() }}{% endif %}{{ chain_5_10() }} + 1{% endmacro %}
+
+{% macro chain_5_10() %}{{ return(adapter.dispatch('chain_5_10')()) }}{% endmacro %}
+{% macro default__chain_5_10() %}{% if false %}{{ chain_6_11() }}{% endif %}{{ chain_5_11() }} + 1{% endmacro %}
+
+{% macro chain_5_11() %}{{ return(adapter.dispatch('chain_5_11')()) }}{% endmacro %}
+{% macro default__chain_5_11() %}{% if false %}{{ chain_6_12() }}{% endif %}{{ chain_5_12() }} + 1{% endmacro %}
+
+{% macro chain_5_12() %}{{ return(adapter.dispatch('chain_5_12')()) }}{% endmacro %}
+{% macro default__chain_5_12() %}{% if false %}{{ chain_6_13() }}{% endif %}{{ chain_5_13() }} + 1{% endmacro %}
+
+{% macro chain_5_13() %}{{ return(adapter.dispatch('chain_5_13')()) }}{% endmacro %}
+{% macro default__chain_5_13() %}{% if false %}{{ chain_6_14() }}{% endif %}{{ chain_5_14() }} + 1{% endmacro %}
+
+{% macro chain_5_14() %}{{ return(adapter.dispatch('chain_5_14')()) }}{% endmacro %}
+{% macro default__chain_5_14() %}{% if false %}{{ chain_6_15() }}{% endif %}{{ chain_5_15() }} + 1{% endmacro %}
+
+{% macro chain_5_15() %}{{ return(adapter.dispatch('chain_5_15')()) }}{% endmacro %}
+{% macro default__chain_5_15() %}{% if false %}{{ chain_6_16() }}{% endif %}{{ chain_5_16() }} + 1{% endmacro %}
+
+{% macro chain_5_16() %}{{ return(adapter.dispatch('chain_5_16')()) }}{% endmacro %}
+{% macro default__chain_5_16() %}{% if false %}{{ chain_6_17() }}{% endif %}{{ chain_5_17() }} + 1{% endmacro %}
+
+{% macro chain_5_17() %}{{ return(adapter.dispatch('chain_5_17')()) }}{% endmacro %}
+{% macro default__chain_5_17() %}{% if false %}{{ chain_6_18() }}{% endif %}{{ chain_5_18() }} + 1{% endmacro %}
+
+{% macro chain_5_18() %}{{ return(adapter.dispatch('chain_5_18')()) }}{% endmacro %}
+{% macro default__chain_5_18() %}{% if false %}{{ chain_6_19() }}{% endif %}{{ chain_5_19() }} + 1{% endmacro %}
+
+{% macro chain_5_19() %}{{ return(adapter.dispatch('chain_5_19')()) }}{% endmacro %}
+{% macro default__chain_5_19() %}{% if false %}{{ chain_6_20() }}{% endif %}{{ chain_5_20() }} + 1{% endmacro %}
+
+{% macro chain_5_20() %}{{ return(adapter.dispatch('chain_5_20')()) }}{% endmacro %}
+{% macro default__chain_5_20() %}{% if false %}{{ chain_6_21() }}{% endif %}{{ chain_5_21() }} + 1{% endmacro %}
+
+{% macro chain_5_21() %}{{ return(adapter.dispatch('chain_5_21')()) }}{% endmacro %}
+{% macro default__chain_5_21() %}{% if false %}{{ chain_6_22() }}{% endif %}{{ chain_5_22() }} + 1{% endmacro %}
+
+{% macro chain_5_22() %}{{ return(adapter.dispatch('chain_5_22')()) }}{% endmacro %}
+{% macro default__chain_5_22() %}{% if false %}{{ chain_6_23() }}{% endif %}{{ chain_5_23() }} + 1{% endmacro %}
+
+{% macro chain_5_23() %}{{ return(adapter.dispatch('chain_5_23')()) }}{% endmacro %}
+{% macro default__chain_5_23() %}{% if false %}{{ chain_6_24() }}{% endif %}{{ chain_5_24() }} + 1{% endmacro %}
+
+{% macro chain_5_24() %}{{ return(adapter.dispatch('chain_5_24')()) }}{% endmacro %}
+{% macro default__chain_5_24() %}1{% endmacro %}
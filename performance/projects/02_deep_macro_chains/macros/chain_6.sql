@@ -0,0 +1,74 @@
+{% macro chain_6_0() %}{{ return(adapter.dispatch('chain_6_0')()) }}{% endmacro %}
+{% macro default__chain_6_0() %}{% if false %}{{ chain_7_1() }}{% endif %}{{ chain_6_1() }} + 1{% endmacro %}
+
+{% macro chain_6_1() %}{{ return(adapter.dispatch('chain_6_1')()) }}{% endmacro %}
+{% macro default__chain_6_1() %}{% if false %}{{ chain_7_2() }}{% endif %}{{ chain_6_2() }} + 1{% endmacro %}
+
+{% macro chain_6_2() %}{{ return(adapter.dispatch('chain_6_2')()) }}{% endmacro %}
+{% macro default__chain_6_2() %}{% if false %}{{ chain_7_3() }}{% endif %}{{ chain_6_3() }} + 1{% endmacro %}
+
+{% macro chain_6_3() %}{{ return(adapter.dispatch('chain_6_3')()) }}{% endmacro %}
+{% macro default__chain_6_3() %}{% if false %}{{ chain_7_4() }}{% endif %}{{ chain_6_4() }} + 1{% endmacro %}
+
+{% macro chain_6_4() %}{{ return(adapter.dispatch('chain_6_4')()) }}{% endmacro %}
+{% macro default__chain_6_4() %}{% if false %}{{ chain_7_5() }}{% endif %}{{ chain_6_5() }} + 1{% endmacro %}
+
+{% macro chain_6_5() %}{{ return(adapter.dispatch('chain_6_5')()) }}{% endmacro %}
+{% macro default__chain_6_5() %}{% if false %}{{ chain_7_6() }}{% endif %}{{ chain_6_6() }} + 1{% endmacro %}
+
+{% macro chain_6_6() %}{{ return(adapter.dispatch('chain_6_6')()) }}{% endmacro %}
+{% macro default__chain_6_6() %}{% if false %}{{ chain_7_7() }}{% endif %}{{ chain_6_7() }} + 1{% endmacro %}
+
+{% macro chain_6_7() %}{{ return(adapter.dispatch('chain_6_7')()) }}{% endmacro %}
+{% macro default__chain_6_7() %}{% if false %}{{ chain_7_8() }}{% endif %}{{ chain_6_8() }} + 1{% endmacro %}
+
+{% macro chain_6_8() %}{{ return(adapter.dispatch('chain_6_8')()) }}{% endmacro %}
+{% macro default__chain_6_8() %}{% if false %}{{ chain_7_9() }}{% endif %}{{ chain_6_9() }} + 1{% endmacro %}
+
+{% macro chain_6_9() %}{{ return(adapter.dispatch('chain_6_9')()) }}{% endmacro %}
+{% macro default__chain_6_9() %}{% if false %}{{ chain_7_10() }}{% endif %}{{ chain_6_10() }} + 1{% endmacro %}
+
+{% macro chain_6_10() %}{{ return(adapter.dispatch('chain_6_10')()) }}{% endmacro %}
+{% macro default__chain_6_10() %}{% if false %}{{ chain_7_11() }}{% endif %}{{ chain_6_11() }} + 1{% endmacro %}
+
+{% macro chain_6_11() %}{{ return(adapter.dispatch('chain_6_11')()) }}{% endmacro %}
+{% macro default__chain_6_11() %}{% if false %}{{ chain_7_12() }}{% endif %}{{ chain_6_12() }} + 1{% endmacro %}
+
+{% macro chain_6_12() %}{{ return(adapter.dispatch('chain_6_12')()) }}{% endmacro %}
+{% macro default__chain_6_12() %}{% if false %}{{ chain_7_13() }}{% endif %}{{ chain_6_13() }} + 1{% endmacro %}
+
+{% macro chain_6_13() %}{{ return(adapter.dispatch('chain_6_13')()) }}{% endmacro %}
+{% macro default__chain_6_13() %}{% if false %}{{ chain_7_14() }}{% endif %}{{ chain_6_14() }} + 1{% endmacro %}
+
+{% macro chain_6_14() %}{{ return(adapter.dispatch('chain_6_14')()) }}{% endmacro %}
+{% macro default__chain_6_14() %}{% if false %}{{ chain_7_15() }}{% endif %}{{ chain_6_15() }} + 1{% endmacro %}
+
+{% macro chain_6_15() %}{{ return(adapter.dispatch('chain_6_15')()) }}{% endmacro %}
+{% macro default__chain_6_15() %}{% if false %}{{ chain_7_16() }}{% endif %}{{ chain_6_16() }} + 1{% endmacro %}
+
+{% macro chain_6_16() %}{{ return(adapter.dispatch('chain_6_16')()) }}{% endmacro %}
+{% macro default__chain_6_16() %}{% if false %}{{ chain_7_17() }}{% endif %}{{ chain_6_17() }} + 1{% endmacro %}
+
+{% macro chain_6_17() %}{{ return(adapter.dispatch('chain_6_17')()) }}{% endmacro %}
+{% macro default__chain_6_17() %}{% if false %}{{ chain_7_18() }}{% endif %}{{ chain_6_18() }} + 1{% endmacro %}
+
+{% macro chain_6_18() %}{{ return(adapter.dispatch('chain_6_18')()) }}{% endmacro %}
+{% macro default__chain_6_18() %}{% if false %}{{ chain_7_19() }}{% endif %}{{ chain_6_19() }} + 1{% endmacro %}
+
+{% macro chain_6_19() %}{{ return(adapter.dispatch('chain_6_19')()) }}{% endmacro %}
+{% macro default__chain_6_19() %}{% if false %}{{ chain_7_20() }}{% endif %}{{ chain_6_20() }} + 1{% endmacro %}
+
+{% macro chain_6_20() %}{{ return(adapter.dispatch('chain_6_20')()) }}{% endmacro %}
+{% macro default__chain_6_20() %}{% if false %}{{ chain_7_21() }}{% endif %}{{ chain_6_21() }} + 1{% endmacro %}
+
+{% macro chain_6_21() %}{{ return(adapter.dispatch('chain_6_21')()) }}{% endmacro %}
+{% macro default__chain_6_21() %}{% if false %}{{ chain_7_22() }}{% endif %}{{ chain_6_22() }} + 1{% endmacro %}
+
+{% macro chain_6_22() %}{{ return(adapter.dispatch('chain_6_22')()) }}{% endmacro %}
+{% macro default__chain_6_22() %}{% if false %}{{ chain_7_23() }}{% endif %}{{ chain_6_23() }} + 1{% endmacro %}
+
+{% macro chain_6_23() %}{{ return(adapter.dispatch('chain_6_23')()) }}{% endmacro %}
+{% macro default__chain_6_23() %}{% if false %}{{ chain_7_24() }}{% endif %}{{ chain_6_24() }} + 1{% endmacro %}
+
+{% macro chain_6_24() %}{{ return(adapter.dispatch('chain_6_24')()) }}{% endmacro %}
+{% macro default__chain_6_24() %}1{% endmacro %}
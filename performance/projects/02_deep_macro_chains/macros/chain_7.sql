@@ -0,0 +1,74 @@
+{% macro chain_7_0() %}{{ return(adapter.dispatch('chain_7_0')()) }}{% endmacro %}
+{% macro default__chain_7_0() %}{% if false %}{{ chain_8_1() }}{% endif %}{{ chain_7_1() }} + 1{% endmacro %}
+
+{% macro chain_7_1() %}{{ return(adapter.dispatch('chain_7_1')()) }}{% endmacro %}
+{% macro default__chain_7_1() %}{% if false %}{{ chain_8_2() }}{% endif %}{{ chain_7_2() }} + 1{% endmacro %}
+
+{% macro chain_7_2() %}{{ return(adapter.dispatch('chain_7_2')()) }}{% endmacro %}
+{% macro default__chain_7_2() %}{% if false %}{{ chain_8_3() }}{% endif %}{{ chain_7_3() }} + 1{% endmacro %}
+
+{% macro chain_7_3() %}{{ return(adapter.dispatch('chain_7_3')()) }}{% endmacro %}
+{% macro default__chain_7_3() %}{% if false %}{{ chain_8_4() }}{% endif %}{{ chain_7_4() }} + 1{% endmacro %}
+
+{% macro chain_7_4() %}{{ return(adapter.dispatch('chain_7_4')()) }}{% endmacro %}
+{% macro default__chain_7_4() %}{% if false %}{{ chain_8_5() }}{% endif %}{{ chain_7_5() }} + 1{% endmacro %}
+
+{% macro chain_7_5() %}{{ return(adapter.dispatch('chain_7_5')()) }}{% endmacro %}
+{% macro default__chain_7_5() %}{% if false %}{{ chain_8_6() }}{% endif %}{{ chain_7_6() }} + 1{% endmacro %}
+
+{% macro chain_7_6() %}{{ return(adapter.dispatch('chain_7_6')()) }}{% endmacro %}
+{% macro default__chain_7_6() %}{% if false %}{{ chain_8_7() }}{% endif %}{{ chain_7_7() }} + 1{% endmacro %}
+
+{% macro chain_7_7() %}{{ return(adapter.dispatch('chain_7_7')()) }}{% endmacro %}
+{% macro default__chain_7_7() %}{% if false %}{{ chain_8_8() }}{% endif %}{{ chain_7_8() }} + 1{% endmacro %}
+
+{% macro chain_7_8() %}{{ return(adapter.dispatch('chain_7_8')()) }}{% endmacro %}
+{% macro default__chain_7_8() %}{% if false %}{{ chain_8_9() }}{% endif %}{{ chain_7_9() }} + 1{% endmacro %}
+
+{% macro chain_7_9() %}{{ return(adapter.dispatch('chain_7_9')()) }}{% endmacro %}
+{% macro default__chain_7_9() %}{% if false %}{{ chain_8_10() }}{% endif %}{{ chain_7_10() }} + 1{% endmacro %}
+
+{% macro chain_7_10() %}{{ return(adapter.dispatch('chain_7_10')()) }}{% endmacro %}
+{% macro default__chain_7_10() %}{% if false %}{{ chain_8_11() }}{% endif %}{{ chain_7_11() }} + 1{% endmacro %}
+
+{% macro chain_7_11() %}{{ return(adapter.dispatch('chain_7_11')()) }}{% endmacro %}
+{% macro default__chain_7_11() %}{% if false %}{{ chain_8_12() }}{% endif %}{{ chain_7_12() }} + 1{% endmacro %}
+
+{% macro chain_7_12() %}{{ return(adapter.dispatch('chain_7_12')()) }}{% endmacro %}
+{% macro default__chain_7_12() %}{% if false %}{{ chain_8_13() }}{% endif %}{{ chain_7_13() }} + 1{% endmacro %}
+
+{% macro chain_7_13() %}{{ return(adapter.dispatch('chain_7_13')()) }}{% endmacro %}
+{% macro default__chain_7_13() %}{% if false %}{{ chain_8_14() }}{% endif %}{{ chain_7_14() }} + 1{% endmacro %}
+
+{% macro chain_7_14() %}{{ return(adapter.dispatch('chain_7_14')()) }}{% endmacro %}
+{% macro default__chain_7_14() %}{% if false %}{{ chain_8_15() }}{% endif %}{{ chain_7_15() }} + 1{% endmacro %}
+
+{% macro chain_7_15() %}{{ return(adapter.dispatch('chain_7_15')()) }}{% endmacro %}
+{% macro default__chain_7_15() %}{% if false %}{{ chain_8_16() }}{% endif %}{{ chain_7_16() }} + 1{% endmacro %}
+
+{% macro chain_7_16() %}{{ return(adapter.dispatch('chain_7_16')()) }}{% endmacro %}
+{% macro default__chain_7_16() %}{% if false %}{{ chain_8_17() }}{% endif %}{{ chain_7_17() }} + 1{% endmacro %}
+
+{% macro chain_7_17() %}{{ return(adapter.dispatch('chain_7_17')()) }}{% endmacro %}
+{% macro default__chain_7_17() %}{% if false %}{{ chain_8_18() }}{% endif %}{{ chain_7_18() }} + 1{% endmacro %}
+
+{% macro chain_7_18() %}{{ return(adapter.dispatch('chain_7_18')()) }}{% endmacro %}
+{% macro default__chain_7_18() %}{% if false %}{{ chain_8_19() }}{% endif %}{{ chain_7_19() }} + 1{% endmacro %}
+
+{% macro chain_7_19() %}{{ return(adapter.dispatch('chain_7_19')()) }}{% endmacro %}
+{% macro default__chain_7_19() %}{% if false %}{{ chain_8_20() }}{% endif %}{{ chain_7_20() }} + 1{% endmacro %}
+
+{% macro chain_7_20() %}{{ return(adapter.dispatch('chain_7_20')()) }}{% endmacro %}
+{% macro default__chain_7_20() %}{% if false %}{{ chain_8_21() }}{% endif %}{{ chain_7_21() }} + 1{% endmacro %}
+
+{% macro chain_7_21() %}{{ return(adapter.dispatch('chain_7_21')()) }}{% endmacro %}
+{% macro default__chain_7_21() %}{% if false %}{{ chain_8_22() }}{% endif %}{{ chain_7_22() }} + 1{% endmacro %}
+
+{% macro chain_7_22() %}{{ return(adapter.dispatch('chain_7_22')()) }}{% endmacro %}
+{% macro default__chain_7_22() %}{% if false %}{{ chain_8_23() }}{% endif %}{{ chain_7_23() }} + 1{% endmacro %}
+
+{% macro chain_7_23() %}{{ return(adapter.dispatch('chain_7_23')()) }}{% endmacro %}
+{% macro default__chain_7_23() %}{% if false %}{{ chain_8_24() }}{% endif %}{{ chain_7_24() }} + 1{% endmacro %}
+
+{% macro chain_7_24() %}{{ return(adapter.dispatch('chain_7_24')()) }}{% endmacro %}
+{% macro default__chain_7_24() %}1{% endmacro %}
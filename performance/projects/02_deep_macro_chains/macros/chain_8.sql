@@ -0,0 +1,74 @@
+{% macro chain_8_0() %}{{ return(adapter.dispatch('chain_8_0')()) }}{% endmacro %}
+{% macro default__chain_8_0() %}{% if false %}{{ chain_9_1() }}{% endif %}{{ chain_8_1() }} + 1{% endmacro %}
+
+{% macro chain_8_1() %}{{ return(adapter.dispatch('chain_8_1')()) }}{% endmacro %}
+{% macro default__chain_8_1() %}{% if false %}{{ chain_9_2() }}{% endif %}{{ chain_8_2() }} + 1{% endmacro %}
+
+{% macro chain_8_2() %}{{ return(adapter.dispatch('chain_8_2')()) }}{% endmacro %}
+{% macro default__chain_8_2() %}{% if false %}{{ chain_9_3() }}{% endif %}{{ chain_8_3() }} + 1{% endmacro %}
+
+{% macro chain_8_3() %}{{ return(adapter.dispatch('chain_8_3')()) }}{% endmacro %}
+{% macro default__chain_8_3() %}{% if false %}{{ chain_9_4() }}{% endif %}{{ chain_8_4() }} + 1{% endmacro %}
+
+{% macro chain_8_4() %}{{ return(adapter.dispatch('chain_8_4')()) }}{% endmacro %}
+{% macro default__chain_8_4() %}{% if false %}{{ chain_9_5() }}{% endif %}{{ chain_8_5() }} + 1{% endmacro %}
+
+{% macro chain_8_5() %}{{ return(adapter.dispatch('chain_8_5')()) }}{% endmacro %}
+{% macro default__chain_8_5() %}{% if false %}{{ chain_9_6() }}{% endif %}{{ chain_8_6() }} + 1{% endmacro %}
+
+{% macro chain_8_6() %}{{ return(adapter.dispatch('chain_8_6')()) }}{% endmacro %}
+{% macro default__chain_8_6() %}{% if false %}{{ chain_9_7() }}{% endif %}{{ chain_8_7() }} + 1{% endmacro %}
+
+{% macro chain_8_7() %}{{ return(adapter.dispatch('chain_8_7')()) }}{% endmacro %}
+{% macro default__chain_8_7() %}{% if false %}{{ chain_9_8() }}{% endif %}{{ chain_8_8() }} + 1{% endmacro %}
+
+{% macro chain_8_8() %}{{ return(adapter.dispatch('chain_8_8')()) }}{% endmacro %}
+{% macro default__chain_8_8() %}{% if false %}{{ chain_9_9() }}{% endif %}{{ chain_8_9() }} + 1{% endmacro %}
+
+{% macro chain_8_9() %}{{ return(adapter.dispatch('chain_8_9')()) }}{% endmacro %}
+{% macro default__chain_8_9() %}{% if false %}{{ chain_9_10() }}{% endif %}{{ chain_8_10() }} + 1{% endmacro %}
+
+{% macro chain_8_10() %}{{ return(adapter.dispatch('chain_8_10')()) }}{% endmacro %}
+{% macro default__chain_8_10() %}{% if false %}{{ chain_9_11() }}{% endif %}{{ chain_8_11() }} + 1{% endmacro %}
+
+{% macro chain_8_11() %}{{ return(adapter.dispatch('chain_8_11')()) }}{% endmacro %}
+{% macro default__chain_8_11() %}{% if false %}{{ chain_9_12() }}{% endif %}{{ chain_8_12() }} + 1{% endmacro %}
+
+{% macro chain_8_12() %}{{ return(adapter.dispatch('chain_8_12')()) }}{% endmacro %}
+{% macro default__chain_8_12() %}{% if false %}{{ chain_9_13() }}{% endif %}{{ chain_8_13() }} + 1{% endmacro %}
+
+{% macro chain_8_13() %}{{ return(adapter.dispatch('chain_8_13')()) }}{% endmacro %}
+{% macro default__chain_8_13() %}{% if false %}{{ chain_9_14() }}{% endif %}{{ chain_8_14() }} + 1{% endmacro %}
+
+{% macro chain_8_14() %}{{ return(adapter.dispatch('chain_8_14')()) }}{% endmacro %}
+{% macro default__chain_8_14() %}{% if false %}{{ chain_9_15() }}{% endif %}{{ chain_8_15() }} + 1{% endmacro %}
+
+{% macro chain_8_15() %}{{ return(adapter.dispatch('chain_8_15')()) }}{% endmacro %}
+{% macro default__chain_8_15() %}{% if false %}{{ chain_9_16() }}{% endif %}{{ chain_8_16() }} + 1{% endmacro %}
+
+{% macro chain_8_16() %}{{ return(adapter.dispatch('chain_8_16')()) }}{% endmacro %}
+{% macro default__chain_8_16() %}{% if false %}{{ chain_9_17() }}{% endif %}{{ chain_8_17() }} + 1{% endmacro %}
+
+{% macro chain_8_17() %}{{ return(adapter.dispatch('chain_8_17')()) }}{% endmacro %}
+{% macro default__chain_8_17() %}{% if false %}{{ chain_9_18() }}{% endif %}{{ chain_8_18() }} + 1{% endmacro %}
+
+{% macro chain_8_18() %}{{ return(adapter.dispatch('chain_8_18')()) }}{% endmacro %}
+{% macro default__chain_8_18() %}{% if false %}{{ chain_9_19() }}{% endif %}{{ chain_8_19() }} + 1{% endmacro %}
+
+{% macro chain_8_19() %}{{ return(adapter.dispatch('chain_8_19')()) }}{% endmacro %}
+{% macro default__chain_8_19() %}{% if false %}{{ chain_9_20() }}{% endif %}{{ chain_8_20() }} + 1{% endmacro %}
+
+{% macro chain_8_20() %}{{ return(adapter.dispatch('chain_8_20')()) }}{% endmacro %}
+{% macro default__chain_8_20() %}{% if false %}{{ chain_9_21() }}{% endif %}{{ chain_8_21() }} + 1{% endmacro %}
+
+{% macro chain_8_21() %}{{ return(adapter.dispatch('chain_8_21')()) }}{% endmacro %}
+{% macro default__chain_8_21() %}{% if false %}{{ chain_9_22() }}{% endif %}{{ chain_8_22() }} + 1{% endmacro %}
+
+{% macro chain_8_22() %}{{ return(adapter.dispatch('chain_8_22')()) }}{% endmacro %}
+{% macro default__chain_8_22() %}{% if false %}{{ chain_9_23() }}{% endif %}{{ chain_8_23() }} + 1{% endmacro %}
+
+{% macro chain_8_23() %}{{ return(adapter.dispatch('chain_8_23')()) }}{% endmacro %}
+{% macro default__chain_8_23() %}{% if false %}{{ chain_9_24() }}{% endif %}{{ chain_8_24() }} + 1{% endmacro %}
+
+{% macro chain_8_24() %}{{ return(adapter.dispatch('chain_8_24')()) }}{% endmacro %}
+{% macro default__chain_8_24() %}1{% endmacro %}
@@ -0,0 +1,74 @@
+{% macro chain_9_0() %}{{ return(adapter.dispatch('chain_9_0')()) }}{% endmacro %}
+{% macro default__chain_9_0() %}{% if false %}{{ chain_10_1() }}{% endif %}{{ chain_9_1() }} + 1{% endmacro %}
+
+{% macro chain_9_1() %}{{ return(adapter.dispatch('chain_9_1')()) }}{% endmacro %}
+{% macro default__chain_9_1() %}{% if false %}{{ chain_10_2() }}{% endif %}{{ chain_9_2() }} + 1{% endmacro %}
+
+{% macro chain_9_2() %}{{ return(adapter.dispatch('chain_9_2')()) }}{% endmacro %}
+{% macro default__chain_9_2() %}{% if false %}{{ chain_10_3() }}{% endif %}{{ chain_9_3() }} + 1{% endmacro %}
+
+{% macro chain_9_3() %}{{ return(adapter.dispatch('chain_9_3')()) }}{% endmacro %}
+{% macro default__chain_9_3() %}{% if false %}{{ chain_10_4() }}{% endif %}{{ chain_9_4() }} + 1{% endmacro %}
+
+{% macro chain_9_4() %}{{ return(adapter.dispatch('chain_9_4')()) }}{% endmacro %}
+{% macro default__chain_9_4() %}{% if false %}{{ chain_10_5() }}{% endif %}{{ chain_9_5() }} + 1{% endmacro %}
+
+{% macro chain_9_5() %}{{ return(adapter.dispatch('chain_9_5')()) }}{% endmacro %}
+{% macro default__chain_9_5() %}{% if false %}{{ chain_10_6() }}{% endif %}{{ chain_9_6() }} + 1{% endmacro %}
+
+{% macro chain_9_6() %}{{ return(adapter.dispatch('chain_9_6')()) }}{% endmacro %}
+{% macro default__chain_9_6() %}{% if false %}{{ chain_10_7() }}{% endif %}{{ chain_9_7() }} + 1{% endmacro %}
+
+{% macro chain_9_7() %}{{ return(adapter.dispatch('chain_9_7')()) }}{% endmacro %}
+{% macro default__chain_9_7() %}{% if false %}{{ chain_10_8() }}{% endif %}{{ chain_9_8() }} + 1{% endmacro %}
+
+{% macro chain_9_8() %}{{ return(adapter.dispatch('chain_9_8')()) }}{% endmacro %}
+{% macro default__chain_9_8() %}{% if false %}{{ chain_10_9() }}{% endif %}{{ chain_9_9() }} + 1{% endmacro %}
+
+{% macro chain_9_9() %}{{ return(adapter.dispatch('chain_9_9')()) }}{% endmacro %}
+{% macro default__chain_9_9() %}{% if false %}{{ chain_10_10() }}{% endif %}{{ chain_9_10() }} + 1{% endmacro %}
+
+{% macro chain_9_10() %}{{ return(adapter.dispatch('chain_9_10')()) }}{% endmacro %}
+{% macro default__chain_9_10() %}{% if false %}{{ chain_10_11() }}{% endif %}{{ chain_9_11() }} + 1{% endmacro %}
+
+{% macro chain_9_11() %}{{ return(adapter.dispatch('chain_9_11')()) }}{% endmacro %}
+{% macro default__chain_9_11() %}{% if false %}{{ chain_10_12() }}{% endif %}{{ chain_9_12() }} + 1{% endmacro %}
+
+{% macro chain_9_12() %}{{ return(adapter.dispatch('chain_9_12')()) }}{% endmacro %}
+{% macro default__chain_9_12() %}{% if false %}{{ chain_10_13() }}{% endif %}{{ chain_9_13() }} + 1{% endmacro %}
+
+{% macro chain_9_13() %}{{ return(adapter.dispatch('chain_9_13')()) }}{% endmacro %}
+{% macro default__chain_9_13() %}{% if false %}{{ chain_10_14() }}{% endif %}{{ chain_9_14() }} + 1{% endmacro %}
+
+{% macro chain_9_14() %}{{ return(adapter.dispatch('chain_9_14')()) }}{% endmacro %}
+{% macro default__chain_9_14() %}{% if false %}{{ chain_10_15() }}{% endif %}{{ chain_9_15() }} + 1{% endmacro %}
+
+{% macro chain_9_15() %}{{ return(adapter.dispatch('chain_9_15')()) }}{% endmacro %}
+{% macro default__chain_9_15() %}{% if false %}{{ chain_10_16() }}{% endif %}{{ chain_9_16() }} + 1{% endmacro %}
+
+{% macro chain_9_16() %}{{ return(adapter.dispatch('chain_9_16')()) }}{% endmacro %}
+{% macro default__chain_9_16() %}{% if false %}{{ chain_10_17() }}{% endif %}{{ chain_9_17() }} + 1{% endmacro %}
+
+{% macro chain_9_17() %}{{ return(adapter.dispatch('chain_9_17')()) }}{% endmacro %}
+{% macro default__chain_9_17() %}{% if false %}{{ chain_10_18() }}{% endif %}{{ chain_9_18() }} + 1{% endmacro %}
+
+{% macro chain_9_18() %}{{ return(adapter.dispatch('chain_9_18')()) }}{% endmacro %}
+{% macro default__chain_9_18() %}{% if false %}{{ chain_10_19() }}{% endif %}{{ chain_9_19() }} + 1{% endmacro %}
+
+{% macro chain_9_19() %}{{ return(adapter.dispatch('chain_9_19')()) }}{% endmacro %}
+{% macro default__chain_9_19() %}{% if false %}{{ chain_10_20() }}{% endif %}{{ chain_9_20() }} + 1{% endmacro %}
+
+{% macro chain_9_20() %}{{ return(adapter.dispatch('chain_9_20')()) }}{% endmacro %}
+{% macro default__chain_9_20() %}{% if false %}{{ chain_10_21() }}{% endif %}{{ chain_9_21() }} + 1{% endmacro %}
+
+{% macro chain_9_21() %}{{ return(adapter.dispatch('chain_9_21')()) }}{% endmacro %}
+{% macro default__chain_9_21() %}{% if false %}{{ chain_10_22() }}{% endif %}{{ chain_9_22() }} + 1{% endmacro %}
+
+{% macro chain_9_22() %}{{ return(adapter.dispatch('chain_9_22')()) }}{% endmacro %}
+{% macro default__chain_9_22() %}{% if false %}{{ chain_10_23() }}{% endif %}{{ chain_9_23() }} + 1{% endmacro %}
+
+{% macro chain_9_23() %}{{ return(adapter.dispatch('chain_9_23')()) }}{% endmacro %}
+{% macro default__chain_9_23() %}{% if false %}{{ chain_10_24() }}{% endif %}{{ chain_9_24() }} + 1{% endmacro %}
+
+{% macro chain_9_24() %}{{ return(adapter.dispatch('chain_9_24')()) }}{% endmacro %}
+{% macro default__chain_9_24() %}1{% endmacro %}
@@ -0,0 +1 @@
+select {{ chain_0_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_1_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_39_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_5_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_11_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_16_0() }} as id
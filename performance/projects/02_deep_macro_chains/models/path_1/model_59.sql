@@ -0,0 +1 @@
+select {{ chain_19_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_21_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_30_0() }} as id
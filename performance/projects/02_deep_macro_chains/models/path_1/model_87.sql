@@ -0,0 +1 @@
+select {{ chain_7_0() }} as id
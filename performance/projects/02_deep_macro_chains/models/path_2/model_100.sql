@@ -0,0 +1 @@
+select {{ chain_20_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_32_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_35_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_2_0() }} as id
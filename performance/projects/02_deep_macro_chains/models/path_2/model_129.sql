@@ -0,0 +1 @@
+select {{ chain_9_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_8_0() }} as id
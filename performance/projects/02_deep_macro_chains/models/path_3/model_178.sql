@@ -0,0 +1 @@
+select {{ chain_18_0() }} as id
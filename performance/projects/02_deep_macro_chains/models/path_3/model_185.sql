@@ -0,0 +1 @@
+select {{ chain_25_0() }} as id
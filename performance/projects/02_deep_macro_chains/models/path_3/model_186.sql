@@ -0,0 +1 @@
+select {{ chain_26_0() }} as id
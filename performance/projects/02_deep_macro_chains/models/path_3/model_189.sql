@@ -0,0 +1 @@
+select {{ chain_29_0() }} as id
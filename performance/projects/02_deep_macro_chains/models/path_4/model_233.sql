@@ -0,0 +1 @@
+select {{ chain_33_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_24_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_34_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_4_0() }} as id
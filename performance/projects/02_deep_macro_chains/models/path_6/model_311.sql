@@ -0,0 +1 @@
+select {{ chain_31_0() }} as id
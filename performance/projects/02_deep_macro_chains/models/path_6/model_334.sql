@@ -0,0 +1 @@
+select {{ chain_14_0() }} as id
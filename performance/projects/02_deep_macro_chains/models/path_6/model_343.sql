@@ -0,0 +1 @@
+select {{ chain_23_0() }} as id
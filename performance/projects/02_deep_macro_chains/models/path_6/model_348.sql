@@ -0,0 +1 @@
+select {{ chain_28_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_3_0() }} as id
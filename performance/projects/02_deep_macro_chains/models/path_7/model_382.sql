@@ -0,0 +1 @@
+select {{ chain_22_0() }} as id
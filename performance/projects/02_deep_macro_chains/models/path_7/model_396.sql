@@ -0,0 +1 @@
+select {{ chain_36_0() }} as id
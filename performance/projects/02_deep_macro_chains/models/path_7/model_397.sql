@@ -0,0 +1 @@
+select {{ chain_37_0() }} as id
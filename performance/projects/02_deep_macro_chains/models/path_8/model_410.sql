@@ -0,0 +1 @@
+select {{ chain_10_0() }} as id
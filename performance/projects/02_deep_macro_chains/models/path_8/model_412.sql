@@ -0,0 +1 @@
+select {{ chain_12_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_17_0() }} as id
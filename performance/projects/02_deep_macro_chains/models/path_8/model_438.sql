@@ -0,0 +1 @@
+select {{ chain_38_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_13_0() }} as id
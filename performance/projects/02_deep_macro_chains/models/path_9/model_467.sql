@@ -0,0 +1 @@
+select {{ chain_27_0() }} as id
@@ -0,0 +1 @@
+select {{ chain_6_0() }} as id
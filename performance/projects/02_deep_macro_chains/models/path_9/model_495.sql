@@ -0,0 +1 @@
+select {{ chain_15_0() }} as id
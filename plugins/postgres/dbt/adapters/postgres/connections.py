@@ -1,3 +1,4 @@
+import time
 from contextlib import contextmanager
 
 import psycopg2
@@ -8,10 +9,14 @@ from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
 from dbt.contracts.connection import AdapterResponse
 from dbt.events import AdapterLogger
+from dbt.events.contextvars import get_node_info
+from dbt.events.functions import fire_event
+from dbt.events.types import ConnectionUsed, SQLQuery, SQLQueryStatus
+from dbt.utils import cast_to_str
 
 from dbt.helper_types import Port
 from dataclasses import dataclass
-from typing import Optional
+from typing import IO, Optional
 
 
 logger = AdapterLogger("Postgres")
@@ -59,6 +64,8 @@ class PostgresCredentials(Credentials):
 
 class PostgresConnectionManager(SQLConnectionManager):
     TYPE = "postgres"
+    # the number of characters read from the data stream per chunk during COPY
+    COPY_BUFFER_SIZE = 1024 * 1024
 
     @contextmanager
     def exception_handler(self, sql):
@@ -179,6 +186,44 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         logger.debug("Cancel query '{}': {}".format(connection_name, res))
 
+    def copy_from_stream(
+        self, sql: str, stream: IO[str], auto_begin: bool = True
+    ) -> AdapterResponse:
+        """Run a `COPY ... FROM STDIN` statement, reading its data from the
+        given file-like object in chunks of COPY_BUFFER_SIZE characters.
+        """
+        connection = self.get_thread_connection()
+        if auto_begin and connection.transaction_open is False:
+            self.begin()
+        fire_event(
+            ConnectionUsed(
+                conn_type=self.TYPE,
+                conn_name=cast_to_str(connection.name),
+                node_info=get_node_info(),
+            )
+        )
+
+        with self.exception_handler(sql):
+            fire_event(
+                SQLQuery(
+                    conn_name=cast_to_str(connection.name), sql=sql, node_info=get_node_info()
+                )
+            )
+            pre = time.time()
+
+            cursor = connection.handle.cursor()
+            cursor.copy_expert(sql, stream, size=self.COPY_BUFFER_SIZE)
+            response = self.get_response(cursor)
+
+            fire_event(
+                SQLQueryStatus(
+                    status=str(response),
+                    elapsed=round((time.time() - pre)),
+                    node_info=get_node_info(),
+                )
+            )
+            return response
+
     @classmethod
     def get_credentials(cls, credentials):
         return credentials
@@ -1,11 +1,18 @@
+import csv
+import datetime as dt
+import io
+import itertools
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, Set, List, Any
+from typing import Optional, Set, List, Any, Iterator, Sequence
+
+import agate
 from dbt.adapters.base.meta import available
 from dbt.adapters.base.impl import AdapterConfig
 from dbt.adapters.sql import SQLAdapter
 from dbt.adapters.postgres import PostgresConnectionManager
 from dbt.adapters.postgres.column import PostgresColumn
+from dbt.clients import agate_helper
 from dbt.adapters.postgres import PostgresRelation
 from dbt.dataclass_schema import dbtClassMixin, ValidationError
 from dbt.exceptions import (
@@ -55,6 +62,96 @@ class PostgresIndexConfig(dbtClassMixin):
 class PostgresConfig(AdapterConfig):
     unlogged: Optional[bool] = None
     indexes: Optional[List[PostgresIndexConfig]] = None
+    use_copy: Optional[bool] = None
+
+
+def _copy_value(value: Any) -> Any:
+    # render agate-cast values the way postgres parses them in csv COPY input
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    elif isinstance(value, (dt.date, dt.datetime)):
+        return value.isoformat()
+    return value
+
+
+class CsvCopyStream:
+    """A minimal read-only file-like object that renders csv rows as
+    `COPY ... FROM STDIN WITH (FORMAT csv)` input.
+
+    Raw values are cast with the given agate column types, so the data sent
+    to the database is rendered the way load_agate_table would have cast it,
+    and rendered `batch_size` rows at a time so memory use stays bounded
+    regardless of the size of the file.
+
+    The types are usually inferred from a sample of the file, so a later
+    value may not fit them. The error is kept in `error`, since the driver
+    reports errors raised while reading as a failed COPY.
+    """
+
+    def __init__(
+        self,
+        rows: Iterator[Sequence[str]],
+        column_types: Sequence[agate.data_types.DataType],
+        batch_size: int = 10000,
+        column_names: Optional[Sequence[str]] = None,
+        seed_name: str = "seed",
+    ) -> None:
+        self._rows = rows
+        self._column_types = column_types
+        self._column_names = column_names
+        self._seed_name = seed_name
+        self._batch_size = batch_size
+        self._current = io.StringIO()
+        self.row_count = 0
+        self.error: Optional[DbtRuntimeError] = None
+
+    def _cast(self, row_number: int, index: int, value: Optional[str]) -> Any:
+        column_type = self._column_types[index]
+        try:
+            return column_type.cast(value)
+        except agate.CastError:
+            column = self._column_names[index] if self._column_names else str(index + 1)
+            raise DbtRuntimeError(
+                f'Could not load {self._seed_name} with COPY: the value "{value}" in column '
+                f'"{column}" of row {row_number} is not a valid '
+                f"{type(column_type).__name__}. The column types are inferred from the first "
+                f'rows of the file, so set column_types for "{column}" in the seed config.'
+            )
+
+    def _render_batch(self) -> Optional[str]:
+        batch = list(itertools.islice(self._rows, self._batch_size))
+        if not batch:
+            return None
+
+        num_columns = len(self._column_types)
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator="\n")
+        for row_number, row in enumerate(batch, start=self.row_count + 1):
+            if len(row) > num_columns:
+                raise DbtRuntimeError(
+                    f"Row {row_number} has {len(row)} values, but the seed only has "
+                    f"{num_columns} columns."
+                )
+            values = itertools.chain(row, [None] * (num_columns - len(row)))
+            writer.writerow(
+                [_copy_value(self._cast(row_number, i, v)) for i, v in enumerate(values)]
+            )
+        self.row_count += len(batch)
+        return out.getvalue()
+
+    def read(self, size: int = -1) -> str:
+        try:
+            data = self._current.read(size)
+            while not data:
+                rendered = self._render_batch()
+                if rendered is None:
+                    return ""
+                self._current = io.StringIO(rendered)
+                data = self._current.read(size)
+            return data
+        except DbtRuntimeError as exc:
+            self.error = exc
+            raise
 
 
 class PostgresAdapter(SQLAdapter):
@@ -82,6 +179,34 @@ class PostgresAdapter(SQLAdapter):
     def parse_index(self, raw_index: Any) -> Optional[PostgresIndexConfig]:
         return PostgresIndexConfig.parse(raw_index)
 
+    @available
+    def copy_csv_rows(
+        self, relation: PostgresRelation, agate_table: agate.Table, column_names_sql: str
+    ) -> str:
+        """Load a seed file into `relation` with `COPY ... FROM STDIN`,
+        streaming it from disk rather than inserting the rows of the agate
+        table. The agate table (usually a sample of the file) provides the
+        column types. Sets the table's `original_row_count` and returns the
+        COPY statement.
+        """
+        sql = f"copy {relation} ({column_names_sql}) from stdin with (format csv)"
+        stream = CsvCopyStream(
+            agate_helper.iter_csv_rows(agate_table.original_abspath),
+            agate_table.column_types,
+            column_names=agate_table.column_names,
+            seed_name=f'seed "{agate_table.original_abspath}"',
+        )
+        try:
+            self.connections.copy_from_stream(sql, stream)
+        except Exception as exc:
+            # the driver fails the COPY with its own message when reading the
+            # file does, so raise the error that caused it instead
+            if stream.error is not None:
+                raise stream.error from exc
+            raise
+        agate_table.original_row_count = stream.row_count
+        return sql
+
     def _link_cached_database_relations(self, schemas: Set[str]):
         """
         :param schemas: The set of schemas that should have links added.
@@ -204,6 +204,17 @@
         and table_name = '{{ relation.identifier }}'
 {%- endmacro -%}
 
+{% macro postgres__list_grants_in_schema(schema_relation) %}
+  {% call statement('list_grants_in_schema', fetch_result=True) -%}
+    select table_name, grantee, privilege_type
+    from {{ schema_relation.information_schema('role_table_grants') }}
+        where grantor = current_role
+          and grantee != current_role
+          and table_schema = '{{ schema_relation.schema }}'
+  {%- endcall %}
+  {{ return(load_result('list_grants_in_schema').table) }}
+{% endmacro %}
+
 {% macro postgres__copy_grants() %}
     {{ return(False) }}
 {% endmacro %}
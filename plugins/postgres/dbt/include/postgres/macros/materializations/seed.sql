@@ -0,0 +1,18 @@
+{% macro postgres__get_seed_sample_size(model) %}
+  {#-- with COPY, column types are inferred from a bounded sample of the file --#}
+  {% if model['config'].get('use_copy', false) %}
+    {{ return(10000) }}
+  {% else %}
+    {{ return(none) }}
+  {% endif %}
+{% endmacro %}
+
+
+{% macro postgres__load_csv_rows(model, agate_table) %}
+  {% if model['config'].get('use_copy', false) %}
+    {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+    {{ return(adapter.copy_csv_rows(this, agate_table, cols_sql)) }}
+  {% else %}
+    {{ return(default__load_csv_rows(model, agate_table)) }}
+  {% endif %}
+{% endmacro %}
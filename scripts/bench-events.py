@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""Measure how many events per second the event manager handles, for events of
+each level fired at a file logger of each level.
+"""
+from argparse import ArgumentParser
+import os
+import tempfile
+import time
+
+from dbt.events.base_types import EventLevel
+from dbt.events.eventmgr import EventManager, LineFormat, LoggerConfig
+from dbt.events.types import AdapterEventDebug, AdapterEventInfo, AdapterEventWarning
+
+
+EVENTS = {
+    EventLevel.DEBUG: AdapterEventDebug,
+    EventLevel.INFO: AdapterEventInfo,
+    EventLevel.WARN: AdapterEventWarning,
+}
+
+
+def events_per_second(
+    logger_level: EventLevel,
+    event_level: EventLevel,
+    count: int,
+    log_async: bool,
+    line_format: LineFormat,
+) -> float:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = EventManager()
+        manager.add_logger(
+            LoggerConfig(
+                name=f"bench_{logger_level.value}_{event_level.value}",
+                level=logger_level,
+                line_format=line_format,
+                output_file_name=os.path.join(tmpdir, "dbt.log"),
+            )
+        )
+        if log_async:
+            manager.start_async_writer()
+        event_cls = EVENTS[event_level]
+        start = time.perf_counter()
+        for i in range(count):
+            manager.fire_event(event_cls(name="bench", base_msg="event {}", args=(i,)))
+        fired = time.perf_counter()
+        manager.stop_async_writer()
+        manager.flush()
+        # with the async writer, this is the rate seen by the threads firing events
+        return count / (fired - start)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20000, help="events fired per case")
+    parser.add_argument("--json", action="store_true", help="write json lines")
+    parser.add_argument(
+        "--log-async", action="store_true", help="write lines on a background thread"
+    )
+    args = parser.parse_args()
+
+    for logger_level in EVENTS:
+        for event_level in EVENTS:
+            line_format = LineFormat.Json if args.json else LineFormat.DebugText
+            rate = events_per_second(
+                logger_level, event_level, args.count, args.log_async, line_format
+            )
+            print(
+                f"logger={logger_level.value:<5} event={event_level.value:<5} "
+                f"{rate:>12,.0f} events/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""Measure the memory retained by manifest nodes deserialized from json, with
+tracemalloc, and optionally the peak RSS of `dbt parse` on a project.
+"""
+from argparse import ArgumentParser
+import copy
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import tracemalloc
+from typing import Any, Dict, List
+
+from dbt.contracts.graph.nodes import ParsedNode
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# a manifest with a model and a generic test to use as templates for the nodes
+TEMPLATE_MANIFEST = os.path.join(
+    REPO_ROOT, "tests", "functional", "artifacts", "data", "state", "v9", "manifest.json"
+)
+PROFILES_DIR = os.path.join(REPO_ROOT, "performance", "project_config")
+
+
+def build_raw_nodes(models: int, tests_per_model: int) -> List[Dict[str, Any]]:
+    with open(TEMPLATE_MANIFEST) as fp:
+        manifest = json.load(fp)
+    nodes = manifest["nodes"].values()
+    model = next(n for n in nodes if n["resource_type"] == "model")
+    test = next(n for n in nodes if n["resource_type"] == "test" and "test_metadata" in n)
+
+    raw = []
+    for i in range(models):
+        node = copy.deepcopy(model)
+        node["name"] = f"model_{i}"
+        node["unique_id"] = f"model.test.model_{i}"
+        node["fqn"] = ["test", f"dir_{i % 50}", f"model_{i}"]
+        node["path"] = f"dir_{i % 50}/model_{i}.sql"
+        node["original_file_path"] = f"models/{node['path']}"
+        node["raw_code"] = f'select * from {{{{ ref("model_{i // 2}") }}}}'
+        node["depends_on"]["nodes"] = [f"model.test.model_{i // 2}"]
+        raw.append(node)
+    for i in range(models * tests_per_model):
+        node = copy.deepcopy(test)
+        model_index = i // tests_per_model
+        node["name"] = f"not_null_model_{model_index}_id_{i}"
+        node["unique_id"] = f"test.test.{node['name']}"
+        node["fqn"] = ["test", f"dir_{model_index % 50}", node["name"]]
+        node["depends_on"]["nodes"] = [f"model.test.model_{model_index}"]
+        raw.append(node)
+    return raw
+
+
+def retained_bytes_per_node(raw: List[Dict[str, Any]]) -> float:
+    # the json is parsed while tracing, so that the strings the nodes keep are
+    # counted, and then dropped, so that only what the nodes keep is left
+    text = json.dumps(raw)
+    gc.collect()
+    tracemalloc.start()
+    nodes = [ParsedNode._deserialize(node) for node in json.loads(text)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(nodes)
+
+
+def parse_peak_rss_mib(project_dir: str) -> float:
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from dbt.cli.main import cli; cli()",
+            "--no-version-check",
+            "--no-partial-parse",
+            "parse",
+        ],
+        cwd=project_dir,
+        env={**os.environ, "DBT_PROFILES_DIR": PROFILES_DIR},
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    # ru_maxrss is in KiB on linux
+    return resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("--models", type=int, default=2000, help="models to deserialize")
+    parser.add_argument(
+        "--tests-per-model", type=int, default=4, help="generic tests to deserialize per model"
+    )
+    parser.add_argument(
+        "--project-dir",
+        help="also report the peak RSS of parsing this project, such as "
+        "performance/projects/01_2000_simple_models",
+    )
+    args = parser.parse_args()
+
+    raw = build_raw_nodes(args.models, args.tests_per_model)
+    per_node = retained_bytes_per_node(raw)
+    print(f"{len(raw)} nodes {per_node:>10,.0f} bytes per node retained")
+    if args.project_dir:
+        print(f"dbt parse {parse_peak_rss_mib(args.project_dir):>10,.0f} MiB peak RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -71,6 +71,26 @@ class TestAgateHelper(unittest.TestCase):
         for expected, row in zip(EXPECTED_STRINGS, tbl):
             self.assertEqual(list(row), expected)
 
+    def test_sample_from_csv(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        tbl, complete = agate_helper.sample_from_csv(path, (), sample_size=1)
+        self.assertFalse(complete)
+        self.assertEqual(tbl.column_names, tuple('abcdefg'))
+        self.assertEqual([list(row) for row in tbl], EXPECTED[:1])
+
+        tbl, complete = agate_helper.sample_from_csv(path, (), sample_size=2)
+        self.assertTrue(complete)
+        self.assertEqual([list(row) for row in tbl], EXPECTED)
+
+    def test_iter_csv_rows(self):
+        path = os.path.join(self.tempdir, 'input.csv')
+        with open(path, 'wb') as fp:
+            fp.write(SAMPLE_CSV_BOM_DATA.encode('utf-8'))
+        rows = list(agate_helper.iter_csv_rows(path))
+        self.assertEqual(rows, [line.split(',') for line in SAMPLE_CSV_DATA.split('\n')[1:]])
+
     def test_from_data(self):
         column_names = ['a', 'b', 'c', 'd', 'e', 'f', 'g']
         data = [
@@ -179,3 +199,49 @@ class TestAgateHelper(unittest.TestCase):
         for i, row in enumerate(tbl):
             self.assertEqual(list(row), expected[i])
 
+
+    def test_columnar_table_lazy_agate(self):
+        column_names = ['a', 'b', 'c', 'd']
+        rows = [
+            ('0005', 10, {'x': 1}, True),
+            ('0006', 11, [1, 2], False),
+        ]
+        tbl = agate_helper.ColumnarTable.from_rows(column_names, rows)
+        self.assertIsInstance(tbl, agate.Table)
+        self.assertEqual(len(tbl), 2)
+        self.assertFalse(tbl.is_materialized)
+        # values are cast as agate would, without building the agate table
+        self.assertEqual(tbl.column_values('b'), [Decimal(10), Decimal(11)])
+        matrix = [('0005', Decimal(10), '{"x": 1}', True), ('0006', Decimal(11), '[1, 2]', False)]
+        self.assertEqual(list(tbl.iter_rows()), matrix)
+        self.assertEqual(agate_helper.as_matrix(tbl), matrix)
+        self.assertFalse(tbl.is_materialized)
+
+        # the agate view follows the same rules as table_from_data_flat
+        expected = agate_helper.table_from_data_flat(
+            [dict(zip(column_names, row)) for row in rows], column_names
+        )
+        self.assertEqual(
+            [type(t) for t in tbl.column_types], [type(t) for t in expected.column_types]
+        )
+        self.assertEqual([list(r) for r in tbl], [list(r) for r in expected])
+        self.assertTrue(tbl.is_materialized)
+        self.assertEqual(tbl.column_values('b'), [Decimal(10), Decimal(11)])
+        self.assertEqual(agate_helper.as_matrix(tbl), matrix)
+
+    def test_columnar_table_as_matrix_is_deterministic(self):
+        column_names = ['a', 'b', 'c', 'd']
+        rows = [(1, 1.5, 'null', None), (2, None, '', datetime(2023, 1, 1))]
+        lazy = agate_helper.ColumnarTable.from_rows(column_names, rows)
+        materialized = agate_helper.ColumnarTable.from_rows(column_names, rows)
+        materialized.column_types
+        self.assertTrue(materialized.is_materialized)
+        self.assertEqual(agate_helper.as_matrix(lazy), agate_helper.as_matrix(materialized))
+        self.assertFalse(lazy.is_materialized)
+
+    def test_columnar_table_merge(self):
+        t1 = agate_helper.ColumnarTable.from_rows(['a', 'b'], [(1, 'x')])
+        t2 = agate_helper.ColumnarTable.from_rows(['a', 'b'], [(2, 'y')])
+        result = agate_helper.merge_tables([t1, t2])
+        self.assertEqual(result.column_names, ('a', 'b'))
+        self.assertEqual(len(result), 2)
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from dbt.adapters.cache import RelationsCache
+from dbt.adapters.cache import GrantsCache, RelationsCache
 from dbt.adapters.base.relation import BaseRelation
 from multiprocessing.dummy import Pool as ThreadPool
 import dbt.exceptions
@@ -489,3 +489,39 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations('dbt', 'bar')), 1)
         self.assertEqual(len(self.cache.get_relations('dbt_2', 'foo')), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+class TestGrantsCache(TestCase):
+    def setUp(self):
+        self.cache = GrantsCache()
+        self.cache.add_schema('DBT', 'Foo', {'Table1': {'select': ['reporter']}})
+
+    def test_get(self):
+        self.assertEqual(
+            self.cache.get(make_relation('dbt', 'foo', 'table1')), {'select': ['reporter']}
+        )
+        # relations in a cached schema without grants have none
+        self.assertEqual(self.cache.get(make_relation('dbt', 'foo', 'table2')), {})
+        # relations in other schemas are not cached
+        self.assertIsNone(self.cache.get(make_relation('dbt', 'bar', 'table1')))
+
+    def test_get_returns_copy(self):
+        self.cache.get(make_relation('dbt', 'foo', 'table1'))['select'].append('other')
+        self.assertEqual(
+            self.cache.get(make_relation('dbt', 'foo', 'table1')), {'select': ['reporter']}
+        )
+
+    def test_invalidate(self):
+        self.cache.invalidate(make_relation('dbt', 'foo', 'table1'))
+        self.cache.invalidate(make_relation('dbt', 'foo', 'table2'))
+        self.assertIsNone(self.cache.get(make_relation('dbt', 'foo', 'table1')))
+        self.assertIsNone(self.cache.get(make_relation('dbt', 'foo', 'table2')))
+
+        # caching the schema again makes them valid
+        self.cache.add_schema('dbt', 'foo', {})
+        self.assertEqual(self.cache.get(make_relation('dbt', 'foo', 'table1')), {})
+        self.assertEqual(self.cache.get(make_relation('dbt', 'foo', 'table2')), {})
+
+    def test_clear(self):
+        self.cache.clear()
+        self.assertIsNone(self.cache.get(make_relation('dbt', 'foo', 'table1')))
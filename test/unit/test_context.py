@@ -459,6 +459,35 @@ def test_docs_runtime_context(config_postgres):
     assert_has_keys(REQUIRED_DOCS_KEYS, MAYBE_KEYS, ctx)
 
 
+def test_docs_renderer(config_postgres):
+    doc_file = mock.MagicMock()
+    manifest = mock.MagicMock(files={"root://models/docs.md": doc_file})
+    manifest.resolve_doc.return_value = mock.MagicMock(file_id="root://models/docs.md")
+    context = {"doc": lambda *args: "the orders table"}
+    model_one = mock_model()
+    model_two = mock_model()
+    model_two.unique_id = "model.root.model_two"
+    renderer = docs.DocsRenderer(config_postgres, manifest)
+
+    with mock.patch.object(docs, "generate_runtime_docs_context", return_value=context) as gen:
+        # plain descriptions never need a context
+        assert renderer.render("a plain description", model_one) == "a plain description"
+        gen.assert_not_called()
+
+        description = "Orders: {{ doc('orders') }}"
+        assert renderer.render(description, model_one) == "Orders: the orders table"
+        assert renderer.render(description, model_two) == "Orders: the orders table"
+        # rendered once, but both models are recorded on the doc file
+        assert gen.call_count == 1
+        doc_file.add_node.assert_called_with("model.root.model_two")
+
+        # other jinja is rendered for each resource, reusing model_one's context
+        other = "{{ doc('orders') }} {{ 1 + 1 }}"
+        assert renderer.render(other, model_one) == "the orders table 2"
+        assert renderer.render(other, model_two) == "the orders table 2"
+        assert gen.call_count == 2
+
+
 def test_macro_namespace_duplicates(config_postgres, manifest_fx):
     mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
     mn.add_macros(manifest_fx.macros.values(), {})
@@ -0,0 +1,127 @@
+import unittest
+from argparse import Namespace
+
+from dbt import flags
+from dbt.context.context_config import (
+    ContextConfigGenerator,
+    ProjectConfigTrie,
+    UnrenderedConfigGenerator,
+)
+from dbt.node_types import NodeType
+
+from .utils import config_from_parts_or_dicts, normalize
+
+
+PROFILE_DATA = {
+    'target': 'test',
+    'quoting': {},
+    'outputs': {
+        'test': {
+            'type': 'postgres',
+            'host': 'localhost',
+            'schema': 'analytics',
+            'user': 'test',
+            'pass': 'test',
+            'dbname': 'test',
+            'port': 1,
+        }
+    }
+}
+
+
+class TestProjectConfigTrie(unittest.TestCase):
+    def setUp(self):
+        flags.set_from_args(Namespace(MACRO_DEBUGGING=False), None)
+        project = {
+            'name': 'root',
+            'version': '0.1',
+            'profile': 'test',
+            'project-root': normalize('/usr/src/app'),
+            'config-version': 2,
+            'models': {
+                '+materialized': 'view',
+                'root': {
+                    '+tags': ['root'],
+                    'staging': {
+                        '+schema': 'staging',
+                        '+tags': ['staging'],
+                        'events': {
+                            '+materialized': 'table',
+                            '+meta': {'owner': 'events'},
+                        },
+                    },
+                    'marts': {
+                        'enabled': False,
+                    },
+                },
+            },
+        }
+        self.config = config_from_parts_or_dicts(project=project, profile=PROFILE_DATA)
+        self.config.dependencies = {'root': self.config}
+
+    def _merged_levels(self, generator, fqn):
+        result = generator.initial_result(resource_type=NodeType.Model, base=False)
+        for level in generator._project_configs(self.config, fqn, NodeType.Model):
+            result = generator._update_from_config(result, level)
+        return result
+
+    def test_lookup_matches_merging_levels(self):
+        fqns = [
+            ['root', 'staging', 'events', 'page_views'],
+            ['root', 'staging', 'events', 'sessions'],
+            ['root', 'staging', 'orders'],
+            ['root', 'marts', 'revenue'],
+            ['root', 'other'],
+            ['root', 'staging', 'events', 'deeper', 'model'],
+        ]
+        for generator_cls in (ContextConfigGenerator, UnrenderedConfigGenerator):
+            generator = generator_cls(self.config)
+            trie = generator._project_config_trie(self.config, NodeType.Model, False)
+            for fqn in fqns:
+                self.assertEqual(trie.lookup(fqn), self._merged_levels(generator, fqn))
+
+    def test_trie_shared_between_generators(self):
+        trie = ContextConfigGenerator(self.config)._project_config_trie(
+            self.config, NodeType.Model, False
+        )
+        other = ContextConfigGenerator(self.config)._project_config_trie(
+            self.config, NodeType.Model, False
+        )
+        self.assertIs(trie, other)
+        self.assertIsNot(
+            trie,
+            UnrenderedConfigGenerator(self.config)._project_config_trie(
+                self.config, NodeType.Model, False
+            ),
+        )
+        self.config.clear_dependencies()
+        self.assertEqual(self.config.project_config_tries, {})
+
+    def test_node_configs_are_not_shared(self):
+        generator = UnrenderedConfigGenerator(self.config)
+        fqn = ['root', 'staging', 'events', 'page_views']
+        config = generator.calculate_node_config_dict({}, fqn, NodeType.Model, 'root', False)
+        config['meta']['owner'] = 'someone else'
+        config['tags'].append('changed')
+
+        other = generator.calculate_node_config_dict(
+            {'materialized': 'incremental'}, fqn, NodeType.Model, 'root', False
+        )
+        self.assertEqual(
+            other,
+            {
+                'materialized': 'incremental',
+                'tags': ['staging'],
+                'schema': 'staging',
+                'meta': {'owner': 'events'},
+            },
+        )
+
+    def test_non_dict_level_stops_lookup(self):
+        trie = ProjectConfigTrie(
+            {'+a': 1, 'pkg': {'+b': 2, 'leaf': 'not a level'}},
+            {},
+            lambda result, partial: {**result, **partial},
+        )
+        self.assertEqual(trie.lookup(['pkg', 'leaf', 'x']), {'a': 1, 'b': 2, 'leaf': 'not a level'})
+        self.assertEqual(trie.lookup([]), {'a': 1})
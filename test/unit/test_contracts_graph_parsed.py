@@ -1,8 +1,12 @@
+import copy
+import dataclasses
+import json
 import pickle
 import pytest
 
 from dbt.node_types import NodeType, AccessType
 from dbt.contracts.files import FileHash
+from dbt.contracts.util import add_slots
 from dbt.contracts.graph.model_config import (
     NodeConfig,
     SeedConfig,
@@ -342,6 +346,45 @@ def test_model_basic(basic_parsed_model_object, base_parsed_model_dict, minimal_
     pickle.loads(pickle.dumps(node))
 
 
+def test_model_compact(base_parsed_model_dict):
+    # json copies of the dict have their own copies of each string
+    node = ModelNode.from_dict(json.loads(json.dumps(base_parsed_model_dict)))
+    other = ModelNode.from_dict(json.loads(json.dumps(base_parsed_model_dict)))
+    assert 'unique_id' in ModelNode.__slots__
+    assert node.unique_id is other.unique_id
+    assert all(a is b for a, b in zip(node.fqn, other.fqn))
+    assert node.config.materialized is other.config.materialized
+    assert node.depends_on.macros == []
+
+    node.depends_on.add_node(''.join(['model.test', '.other']))
+    other.depends_on.add_node(''.join(['model.test', '.other']))
+    assert node.depends_on.nodes[0] is other.depends_on.nodes[0]
+
+    assert copy.deepcopy(node) == node
+    assert pickle.loads(pickle.dumps(node)) == node
+    assert node.replace(name='renamed').name == 'renamed'
+    assert node.to_dict() == other.to_dict()
+
+
+def test_add_slots_keeps_super():
+    @dataclasses.dataclass
+    class Base:
+        def describe(self):
+            return 'base'
+
+    @add_slots
+    @dataclasses.dataclass
+    class Leaf(Base):
+        value: int = 1
+
+        def describe(self):
+            return f'{super().describe()} {self.value}'
+
+    assert Leaf.__slots__ == ('value',)
+    assert Leaf().describe() == 'base 1'
+    assert Leaf(value=2).value == 2
+
+
 def test_model_complex(complex_parsed_model_object, complex_parsed_model_dict):
     node = complex_parsed_model_object
     node_dict = complex_parsed_model_dict
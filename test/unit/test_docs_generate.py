@@ -1,9 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
 from unittest import mock
+import os
+import tempfile
 import unittest
 
 import dbt.flags
+from dbt.contracts import results
 from dbt.task import generate
 
 
@@ -352,3 +355,122 @@ class GenerateTest(unittest.TestCase):
 
         self.mock_get_unique_id_mapping.assert_called_once_with(self.manifest)
         self.assertEqual(result, expected)
+
+
+def _catalog_table(database, schema, name, unique_id):
+    return generate.CatalogTable(
+        metadata=generate.TableMetadata(type='BASE TABLE', database=database, schema=schema, name=name),
+        columns={},
+        stats={},
+        unique_id=unique_id,
+    )
+
+
+def _node(database, schema, identifier, relational=True):
+    node = mock.MagicMock()
+    node.database = database
+    node.schema = schema
+    node.identifier = identifier
+    node.is_relational = relational
+    node.is_ephemeral_model = False
+    return node
+
+
+class IncrementalCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.previous = generate.CatalogArtifact.from_results(
+            generated_at=datetime(2023, 1, 1, 12),
+            nodes={
+                'model.a': _catalog_table('db', 'analytics', 'a', 'model.a'),
+                'model.b': _catalog_table('db', 'analytics', 'b', 'model.b'),
+                'model.c': _catalog_table('db', 'marts', 'c', 'model.c'),
+                'model.d': _catalog_table('db', 'other', 'd', 'model.d'),
+            },
+            sources={},
+            compile_results=None,
+            errors=None,
+        )
+        self.manifest = mock.MagicMock()
+        self.manifest.nodes = {
+            'model.a': _node('db', 'analytics', 'a'),
+            'model.b': _node('db', 'analytics', 'b'),
+            'model.c': _node('DB', 'Marts', 'C'),
+            # moved to a new schema since the previous catalog
+            'model.d': _node('db', 'moved', 'd'),
+            'test.t': _node('db', 'tests', 't', relational=False),
+        }
+        self.manifest.sources = {
+            'source.raw.e': _node('db', 'raw', 'e'),
+        }
+
+    def test_changed_unique_ids(self):
+        ExecutionLog = results.ExecutionLog
+        # no log: the invocations since the previous catalog are unknown
+        self.assertIsNone(generate.get_changed_unique_ids(self.previous, None))
+
+        log = ExecutionLog(since=datetime(2023, 1, 1, 11), unique_ids=[])
+        self.assertEqual(generate.get_changed_unique_ids(self.previous, log), set())
+        log.unique_ids = ['model.a', 'model.b', 'test.t']
+        self.assertEqual(
+            generate.get_changed_unique_ids(self.previous, log), {'model.a', 'model.b', 'test.t'}
+        )
+
+        # an invocation that could have changed anything
+        log.unique_ids = None
+        self.assertIsNone(generate.get_changed_unique_ids(self.previous, log))
+
+        # the log started after the previous catalog was generated
+        log = ExecutionLog(since=datetime(2023, 1, 1, 13), unique_ids=[])
+        self.assertIsNone(generate.get_changed_unique_ids(self.previous, log))
+
+        log = ExecutionLog(since=datetime(2023, 1, 1, 11), unique_ids=[])
+        self.previous.errors = ['something went wrong']
+        self.assertIsNone(generate.get_changed_unique_ids(self.previous, log))
+
+    def test_execution_log(self):
+        ExecutionLog = results.ExecutionLog
+        with tempfile.TemporaryDirectory() as target_path:
+            self.assertIsNone(ExecutionLog.read(target_path))
+            ExecutionLog.record(target_path, {'model.b', 'model.a'})
+            # a run followed by a test: both are counted, not just the last one
+            ExecutionLog.record(target_path, {'model.c', 'model.a'})
+            log = ExecutionLog.read(target_path)
+            self.assertEqual(log.unique_ids, ['model.a', 'model.b', 'model.c'])
+            self.assertEqual(os.listdir(target_path), [results.EXECUTION_LOG_FILE_NAME])
+            # a log started by a recording has nothing from before it
+            self.assertIsNone(log.executed_since(log.since - timedelta(seconds=1)))
+            self.assertEqual(log.executed_since(log.since), {'model.a', 'model.b', 'model.c'})
+
+            # invocations recorded after the catalog started are kept
+            ExecutionLog.restart(target_path, log.since)
+            self.assertEqual(
+                ExecutionLog.read(target_path).unique_ids, ['model.a', 'model.b', 'model.c']
+            )
+            ExecutionLog.restart(target_path, datetime.utcnow())
+            log = ExecutionLog.read(target_path)
+            self.assertEqual(log.unique_ids, [])
+            self.assertEqual(log.executed_since(datetime.utcnow()), set())
+
+            # once anything could have changed, nothing more is recorded
+            ExecutionLog.record(target_path, None)
+            with mock.patch.object(ExecutionLog, 'write') as write:
+                ExecutionLog.record(target_path, {'model.a'})
+                write.assert_not_called()
+            self.assertIsNone(ExecutionLog.read(target_path).executed_since(datetime.utcnow()))
+
+            ExecutionLog.invalidate(target_path)
+            self.assertIsNone(ExecutionLog.read(target_path))
+
+    def test_incremental_catalog_plan(self):
+        stale_schemas, reused = generate.get_incremental_catalog_plan(
+            self.manifest, self.previous, {'model.a'}
+        )
+        self.assertEqual(stale_schemas, {('db', 'analytics'), ('db', 'moved'), ('db', 'raw')})
+        self.assertEqual(list(reused), ['model.c'])
+
+    def test_incremental_catalog_plan_nothing_changed(self):
+        stale_schemas, reused = generate.get_incremental_catalog_plan(
+            self.manifest, self.previous, set()
+        )
+        self.assertEqual(stale_schemas, {('db', 'moved'), ('db', 'raw')})
+        self.assertEqual(set(reused), {'model.a', 'model.b', 'model.c'})
@@ -16,7 +16,7 @@ import dbt.utils
 import dbt.parser.manifest
 from dbt import tracking
 from dbt.contracts.files import SourceFile, FileHash, FilePath
-from dbt.contracts.graph.manifest import MacroManifest, ManifestStateCheck
+from dbt.contracts.graph.manifest import MacroManifest, Manifest, ManifestStateCheck
 from dbt.graph import NodeSelector, parse_difference
 
 try:
@@ -288,7 +288,7 @@ class GraphTest(unittest.TestCase):
         models = ('model_1', 'model_2', 'model_3', 'model_4')
         model_ids = ['model.test_models_compile.{}'.format(m) for m in models]
 
-        manifest = MagicMock(nodes={
+        manifest = Manifest(nodes={
             n: MagicMock(
                 unique_id=n,
                 name=n.split('.')[-1],
@@ -296,10 +296,10 @@ class GraphTest(unittest.TestCase):
                 fqn=['test_models_compile', n],
                 empty=False,
                 config=MagicMock(enabled=True),
+                original_file_path=f'models/{n}.sql',
             )
             for n in model_ids
         })
-        manifest.expect.side_effect = lambda n: MagicMock(unique_id=n)
         selector = NodeSelector(graph, manifest)
         # TODO:  The "eager" string below needs to be replaced with programatic access
         #  to the default value for the indirect selection parameter in 
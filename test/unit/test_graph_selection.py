@@ -7,6 +7,7 @@ import string
 import dbt.exceptions
 import dbt.graph.selector as graph_selector
 import dbt.graph.cli as graph_cli
+from dbt.contracts.graph.manifest import Manifest
 from dbt.node_types import NodeType
 
 import networkx as nx
@@ -39,6 +40,7 @@ def _get_manifest(graph):
             unique_id=unique_id,
             fqn=fqn,
             package_name=fqn[0],
+            original_file_path=f'models/{fqn[-1]}.sql',
             tags=[],
             resource_type=NodeType.Model,
             empty=False,
@@ -53,7 +55,7 @@ def _get_manifest(graph):
     nodes['m.X.e'].tags = ['efg', 'bcef']
     nodes['m.Y.f'].tags = ['efg', 'bcef']
     nodes['m.X.g'].tags = ['efg']
-    return mock.MagicMock(nodes=nodes)
+    return Manifest(nodes=nodes)
 
 
 @pytest.fixture
@@ -207,3 +209,41 @@ invalid_specs = [
 def test_invalid_specs(invalid):
     with pytest.raises(dbt.exceptions.DbtRuntimeError):
         graph_selector.SelectionCriteria.from_single_spec(invalid)
+
+
+def _per_node_bfs(graph, selected, max_depth, reverse):
+    result = set()
+    for node in selected:
+        result.update(
+            child for _, child in nx.bfs_edges(graph, node, reverse=reverse, depth_limit=max_depth)
+        )
+    return result
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('max_depth', [None, 0, 1, 2, 3])
+def test_select_relatives_matches_per_node_bfs(seed, max_depth):
+    random_graph = nx.gnp_random_graph(60, 0.06, seed=seed, directed=True)
+    dag = nx.DiGraph([(u, v) for u, v in random_graph.edges() if u < v])
+    dag.add_nodes_from(random_graph)
+    graph = graph_selector.Graph(dag)
+    selected = set(range(seed, 60, 7))
+
+    assert graph.select_children(selected, max_depth) == _per_node_bfs(
+        dag, selected, max_depth, reverse=False
+    )
+    assert graph.select_parents(selected, max_depth) == _per_node_bfs(
+        dag, selected, max_depth, reverse=True
+    )
+
+
+def test_select_relatives_missing_node():
+    with pytest.raises(dbt.exceptions.DbtInternalError):
+        _get_graph().select_children({'m.X.a', 'm.X.missing'})
+
+
+def test_select_relatives_depth_zero():
+    graph = graph_selector.Graph(nx.DiGraph([('a', 'b'), ('b', 'c')]))
+    # "a+0" and "0+c" have always included the direct children or parents
+    assert graph.select_children({'a'}, 0) == {'b'}
+    assert graph.select_parents({'c'}, 0) == {'b'}
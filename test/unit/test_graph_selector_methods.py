@@ -23,7 +23,8 @@ from dbt.contracts.graph.nodes import (
     TestMetadata,
     ColumnInfo,
 )
-from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.fingerprints import build_manifest_fingerprints
+from dbt.contracts.graph.manifest import Manifest, WritableManifest
 from dbt.contracts.graph.unparsed import ExposureType, Owner, MetricFilter,MetricTime
 from dbt.contracts.state import PreviousState
 from dbt.node_types import NodeType
@@ -42,6 +43,8 @@ from dbt.graph.selector_methods import (
     StateSelectorMethod,
     ExposureSelectorMethod,
     MetricSelectorMethod,
+    ConfigValues,
+    CaseInsensitive,
 )
 import dbt.exceptions
 import dbt.contracts.graph.nodes
@@ -859,6 +862,30 @@ def test_select_config_meta(manifest):
     assert search_manifest_using_method(manifest, list_method, 'false') == {'table_model'}
     assert not search_manifest_using_method(manifest, list_method, 'other') == {'table_model'}
 
+def test_select_config_values_candidates():
+    config_values = ConfigValues({
+        'true': True,
+        'one': 1,
+        'list': ['a', 1],
+        'dict': {'a': 1},
+        'table': 'table',
+    })
+    assert config_values.candidates('table') == {'table', 'dict'}
+    assert config_values.candidates('TRUE') == {'true', 'one', 'list', 'dict'}
+    assert set(config_values.candidates(CaseInsensitive('TABLE'))) == set(config_values.values)
+
+
+def test_select_lookup_rebuilt_after_update(manifest, table_model):
+    methods = MethodManager(manifest, None)
+    method = methods.get_method('tag', [])
+    assert not search_manifest_using_method(manifest, method, 'new_tag')
+    lookup = manifest.selector_lookup
+
+    manifest.update_node(table_model.replace(tags=['new_tag']))
+    assert manifest.selector_lookup is not lookup
+    assert search_manifest_using_method(manifest, method, 'new_tag') == {'table_model'}
+
+
 def test_select_test_name(manifest):
     methods = MethodManager(manifest, None)
     method = methods.get_method('test_name', [])
@@ -923,18 +950,30 @@ def previous_state(manifest):
     return state
 
 
+def refresh_fingerprints(manifest):
+    # a previous manifest that is changed in place needs new fingerprints, as
+    # it would have had if it had been written with those changes
+    if isinstance(manifest, WritableManifest):
+        manifest.fingerprints = build_manifest_fingerprints(
+            manifest.macros, (manifest.nodes, manifest.sources)
+        )
+
+
 def add_node(manifest, node):
     manifest.nodes[node.unique_id] = node
+    refresh_fingerprints(manifest)
 
 
 def add_macro(manifest, macro):
     manifest.macros[macro.unique_id] = macro
+    refresh_fingerprints(manifest)
 
 
 def change_node(manifest, node, change=None):
     if change is not None:
         node = change(node)
     manifest.nodes[node.unique_id] = node
+    refresh_fingerprints(manifest)
 
 
 def statemethod(manifest, previous_state):
@@ -1241,3 +1280,56 @@ def test_select_state_changed_test_macros_with_upstream_change(manifest, previou
     assert search_manifest_using_method(
         manifest, method, 'modified.macros') == {'model1', 'model2'}
     assert not search_manifest_using_method(manifest, method, 'new')
+
+
+def test_select_state_changed_macros_transitively(manifest, previous_state):
+    changed = make_macro('dbt', 'changed', 'new sql')
+    add_macro(manifest, changed)
+    add_macro(previous_state.manifest, changed.replace(macro_sql='old sql'))
+
+    # deep -> diamond_a/diamond_b -> changed, and a cycle that never reaches it
+    macros = [
+        make_macro('dbt', 'diamond_a', 'sql', depends_on_macros=[changed.unique_id]),
+        make_macro('dbt', 'diamond_b', 'sql', depends_on_macros=[changed.unique_id]),
+        make_macro('dbt', 'deep', 'sql', depends_on_macros=['macro.dbt.diamond_a', 'macro.dbt.diamond_b']),
+        make_macro('dbt', 'cycle_a', 'sql', depends_on_macros=['macro.dbt.cycle_b']),
+        make_macro('dbt', 'cycle_b', 'sql', depends_on_macros=['macro.dbt.cycle_a']),
+    ]
+    for macro in macros:
+        add_macro(manifest, macro)
+        add_macro(previous_state.manifest, macro)
+
+    for name, depends_on_macros in [('uses_deep', ['macro.dbt.deep']), ('uses_cycle', ['macro.dbt.cycle_a'])]:
+        model = make_model('dbt', name, 'select 1', depends_on_macros=depends_on_macros)
+        add_node(manifest, model)
+        add_node(previous_state.manifest, model)
+
+    method = statemethod(manifest, previous_state)
+    assert search_manifest_using_method(manifest, method, 'modified.macros') == {'uses_deep'}
+    assert method.modified_macros == {
+        changed.unique_id, 'macro.dbt.diamond_a', 'macro.dbt.diamond_b', 'macro.dbt.deep'
+    }
+
+
+@pytest.mark.parametrize('selector', [
+    'modified',
+    'modified.body',
+    'modified.configs',
+    'modified.persisted_descriptions',
+    'modified.relation',
+    'modified.macros',
+])
+def test_select_state_fingerprints_match_comparison(manifest, previous_state, view_model, table_model, seed, macro_default_test_not_null, selector):
+    change_node(manifest, view_model.replace(raw_code='select 2 as id'))
+    change_node(manifest, replace_config(table_model, alias='new_alias'))
+    change_node(manifest, seed.replace(description='a description'))
+    manifest.macros[macro_default_test_not_null.unique_id] = macro_default_test_not_null.replace(macro_sql='lalala')
+
+    method = statemethod(manifest, previous_state)
+    assert method.is_unchanged(selector, 'model.pkg.ephemeral_model', manifest.nodes['model.pkg.ephemeral_model'])
+    with_fingerprints = search_manifest_using_method(manifest, method, selector)
+
+    previous_state.manifest.fingerprints = None
+    method = statemethod(manifest, previous_state)
+    assert not method.is_unchanged(selector, 'model.pkg.ephemeral_model', manifest.nodes['model.pkg.ephemeral_model'])
+    assert with_fingerprints == search_manifest_using_method(manifest, method, selector)
@@ -4,6 +4,7 @@ import unittest
 from unittest import mock
 
 from dbt import compilation
+from dbt.contracts.graph.manifest import Manifest
 try:
     from queue import Empty
 except ImportError:
@@ -15,7 +16,7 @@ from dbt.graph.cli import parse_difference
 
 def _mock_manifest(nodes):
     config = mock.MagicMock(enabled=True)
-    manifest = mock.MagicMock(nodes={
+    manifest = Manifest(nodes={
         n: mock.MagicMock(
             unique_id=n,
             package_name='pkg',
@@ -23,9 +24,9 @@ def _mock_manifest(nodes):
             empty=False,
             config=config,
             fqn=['pkg', n],
+            original_file_path=f'models/{n}.sql',
         ) for n in nodes
     })
-    manifest.expect.side_effect = lambda n: mock.MagicMock(unique_id=n)
     return manifest
 
 
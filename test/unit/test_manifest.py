@@ -4,6 +4,8 @@ from unittest import mock
 
 from argparse import Namespace
 import copy
+import json
+import tempfile
 from collections import namedtuple
 from itertools import product
 from datetime import datetime
@@ -11,11 +13,15 @@ from datetime import datetime
 import pytest
 
 import dbt.flags
+import dbt.utils
 import dbt.version
 from dbt import tracking
 from dbt.adapters.base.plugin import AdapterPlugin
 from dbt.contracts.files import FileHash
-from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
+from dbt.contracts.graph.fingerprints import FingerprintBuilder
+from dbt.contracts.graph.manifest import (
+    EdgeLookup, Manifest, ManifestMetadata, WritableManifest
+)
 from dbt.contracts.graph.nodes import (
     ModelNode,
     DependsOn,
@@ -36,7 +42,9 @@ from dbt.contracts.graph.unparsed import (
 )
 
 from dbt.events.functions import reset_metadata_vars
+from dbt.exceptions import DbtInternalError
 from dbt.flags import set_from_args
+from dbt.parser.manifest import wait_for_manifest_write, write_manifest
 
 from dbt.node_types import NodeType
 import freezegun
@@ -337,6 +345,7 @@ class ManifestTest(unittest.TestCase):
                 'parent_map': {},
                 'child_map': {},
                 'group_map': {},
+                'fingerprints': {'version': 1, 'resources': {}},
                 'metadata': {
                     'generated_at': '2018-02-14T09:15:13Z',
                     'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v9.json',
@@ -417,6 +426,108 @@ class ManifestTest(unittest.TestCase):
             []
         )
 
+    @freezegun.freeze_time('2018-02-14T09:15:13Z')
+    def test__write_matches_to_dict(self):
+        nodes = copy.copy(self.nested_nodes)
+        disabled_node = copy.copy(nodes['model.root.dep'])
+        manifest = Manifest(
+            nodes=nodes, sources=self.sources, macros={}, docs={},
+            disabled={disabled_node.unique_id: [disabled_node]}, files={},
+            exposures=self.exposures, metrics=self.metrics, selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        writable = manifest.writable_manifest()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'manifest.json')
+            writable.write(path)
+            with open(path) as fp:
+                written = fp.read()
+        expected = json.dumps(writable.to_dict(omit_none=False), cls=dbt.utils.JSONEncoder)
+        self.assertEqual(written, expected)
+
+    @freezegun.freeze_time('2018-02-14T09:15:13Z')
+    def test__write_shards(self):
+        manifest = Manifest(
+            nodes=copy.copy(self.nested_nodes), sources=self.sources, macros={}, docs={},
+            disabled={}, files={}, exposures=self.exposures, metrics=self.metrics, selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        writable = manifest.writable_manifest()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch(
+                'dbt.contracts.graph.manifest.get_artifact_compression', return_value='gzip'
+            ):
+                writable.write_shards(tmpdir)
+            with open(os.path.join(tmpdir, 'index.json')) as fp:
+                index = json.load(fp)
+            self.assertEqual(index['compression'], 'gzip')
+            self.assertEqual(
+                index['shards']['nodes'], [{'resource_type': 'model', 'path': 'nodes.model.json.gz'}]
+            )
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, 'sources.json.gz')))
+            read = WritableManifest.read_shards_and_check_versions(tmpdir)
+        self.assertEqual(read.to_dict(omit_none=False), writable.to_dict(omit_none=False))
+
+    @freezegun.freeze_time('2018-02-14T09:15:13Z')
+    def test__write_manifest_background(self):
+        manifest = Manifest(
+            nodes=copy.copy(self.nested_nodes), sources={}, macros={}, docs={}, disabled={},
+            files={}, exposures={}, metrics={}, selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_manifest(manifest, tmpdir, background=True)
+            # removing or compiling a node after the write started doesn't
+            # change what's written
+            manifest.nodes.pop('model.root.multi')
+            manifest.nodes['model.root.nested'].compiled_code = 'select 2'
+            wait_for_manifest_write()
+            with open(os.path.join(tmpdir, 'manifest.json')) as fp:
+                written = json.load(fp)
+        self.assertIn('model.root.multi', written['nodes'])
+        self.assertNotEqual(written['nodes']['model.root.nested'].get('compiled_code'), 'select 2')
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with mock.patch('dbt.parser.manifest.get_flags', return_value=Namespace(SHARD_MANIFEST=True)):
+                write_manifest(manifest, tmpdir, background=True)
+                wait_for_manifest_write()
+            read = WritableManifest.read_shards_and_check_versions(os.path.join(tmpdir, 'manifest'))
+        self.assertEqual(set(read.nodes), set(manifest.nodes))
+
+        with mock.patch.object(WritableManifest, 'write', side_effect=OSError('disk full')):
+            write_manifest(manifest, 'target', background=True)
+            with self.assertRaises(OSError):
+                wait_for_manifest_write()
+        # the failure is only raised once
+        wait_for_manifest_write()
+
+    def test__writable_manifest_reuses_fingerprints(self):
+        manifest = Manifest(
+            nodes=copy.copy(self.nested_nodes), sources={}, macros={}, docs={}, disabled={},
+            files={}, exposures={}, metrics={}, selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        first = manifest.writable_manifest().fingerprints
+        with mock.patch.object(
+            FingerprintBuilder, 'fingerprint', autospec=True,
+            side_effect=FingerprintBuilder.fingerprint,
+        ) as fingerprint:
+            self.assertEqual(manifest.writable_manifest().fingerprints, first)
+            fingerprint.assert_not_called()
+
+            # only a replaced resource is fingerprinted again
+            node = manifest.nodes['model.root.nested']
+            manifest.nodes[node.unique_id] = node.replace(raw_code='select 2')
+            second = manifest.writable_manifest().fingerprints
+            self.assertEqual(fingerprint.call_count, 1)
+        self.assertNotEqual(
+            second.resources[node.unique_id]['body'], first.resources[node.unique_id]['body']
+        )
+        self.assertEqual(
+            {k: v for k, v in second.resources.items() if k != node.unique_id},
+            {k: v for k, v in first.resources.items() if k != node.unique_id},
+        )
+
     def test__build_flat_graph(self):
         exposures = copy.copy(self.exposures)
         metrics = copy.copy(self.metrics)
@@ -493,6 +604,7 @@ class ManifestTest(unittest.TestCase):
                 'child_map': {},
                 'group_map': {},
                 'docs': {},
+                'fingerprints': {'version': 1, 'resources': {}},
                 'metadata': {
                     'generated_at': '2018-02-14T09:15:13Z',
                     'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v9.json',
@@ -585,6 +697,97 @@ class ManifestTest(unittest.TestCase):
         original.build_flat_graph()
         copy = original.deepcopy()
         self.assertEqual(original.flat_graph, copy.flat_graph)
+        # every resource is copied up front
+        self.assertIsInstance(copy.nodes, dict)
+        self.assertIsNot(copy.nodes['model.snowplow.events'], test_node)
+
+    def test__deepcopy_is_independent(self):
+        nodes = copy.copy(self.nested_nodes)
+        disabled_node = nodes.pop('model.root.sibling')
+        original = Manifest(
+            nodes=nodes, sources=copy.copy(self.sources), macros={}, docs={},
+            disabled={disabled_node.unique_id: [disabled_node]}, files={},
+            exposures=copy.copy(self.exposures), metrics=copy.copy(self.metrics),
+            groups=copy.copy(self.groups), selectors={},
+            metadata=ManifestMetadata(generated_at=datetime.utcnow()),
+        )
+        original.build_flat_graph()
+        before = original.writable_manifest().to_dict(omit_none=True)
+        copied = original.deepcopy()
+        self.assertEqual(original.flat_graph, copied.flat_graph)
+
+        copied.nodes['model.snowplow.events'].config.materialized = 'table'
+        copied.nodes['model.snowplow.events'].depends_on.nodes.append('model.root.nested')
+        del copied.nodes['model.root.nested']
+        copied.nodes['model.root.new'] = disabled_node.replace(unique_id='model.root.new')
+        copied.sources['source.root.my_source.my_table'].description = 'changed'
+        copied.disabled['model.root.sibling'].clear()
+        copied.exposures.pop('exposure.root.my_exposure')
+        copied.build_parent_and_child_maps()
+
+        self.assertEqual(original.writable_manifest().to_dict(omit_none=True), before)
+        self.assertNotIn('model.root.nested', copied.nodes)
+        self.assertEqual(
+            set(copied.nodes), set(original.nodes) - {'model.root.nested'} | {'model.root.new'}
+        )
+        self.assertEqual(len(copied.nodes), len(original.nodes))
+        self.assertEqual(copied.nodes['model.snowplow.events'].config.materialized, 'table')
+        self.assertEqual(copied.disabled['model.root.sibling'], [])
+
+    def test__parent_and_child_maps_kept_up_to_date(self):
+        nodes = copy.copy(self.nested_nodes)
+        sibling = nodes.pop('model.root.sibling')
+        manifest = Manifest(
+            nodes=nodes, sources={}, macros={}, docs={}, disabled={}, files={},
+            exposures=copy.copy(self.exposures), metrics=copy.copy(self.metrics),
+            selectors={},
+        )
+
+        def check():
+            expected = EdgeLookup(manifest)
+            self.assertEqual(manifest.parent_map, expected.parent_map)
+            self.assertEqual(manifest.child_map, expected.child_map)
+
+        # model.root.multi depends on the missing model.root.sibling
+        check()
+        manifest.add_node_nofile(sibling)
+        check()
+        self.assertIn('model.root.multi', manifest.child_map['model.root.sibling'])
+
+        manifest.remove_node('model.root.events')
+        check()
+        dep = manifest.nodes['model.root.dep']
+        dep.depends_on.nodes.append('model.root.sibling')
+        manifest.update_node(dep)
+        check()
+        manifest.add_node_nofile(self.nested_nodes['model.root.events'])
+        check()
+        manifest.remove_exposure('exposure.root.my_exposure')
+        manifest.remove_metric('metric.root.my_metric')
+        check()
+
+        source = self.sources['source.root.my_source.my_table']
+        manifest.set_sources({source.unique_id: source})
+        sibling.depends_on.nodes.append(source.unique_id)
+        manifest.update_node(sibling)
+        check()
+        manifest.set_sources({})
+        check()
+
+    def test__check_parent_and_child_maps(self):
+        manifest = Manifest(
+            nodes=copy.copy(self.nested_nodes), sources={}, macros={}, docs={}, disabled={},
+            files={}, exposures={}, metrics={}, selectors={},
+        )
+        manifest.build_parent_and_child_maps()
+        manifest.nodes['model.root.dep'].depends_on.nodes.append('model.root.sibling')
+        flags = Namespace(VALIDATE_MANIFEST_EDGES=True)
+        with mock.patch('dbt.contracts.graph.manifest.get_flags', return_value=flags):
+            with self.assertRaises(DbtInternalError) as exc:
+                manifest.check_parent_and_child_maps()
+            self.assertIn('model.root.dep', str(exc.exception))
+            manifest.update_node(manifest.nodes['model.root.dep'])
+            manifest.check_parent_and_child_maps()
 
 class MixedManifestTest(unittest.TestCase):
     def setUp(self):
@@ -763,6 +966,7 @@ class MixedManifestTest(unittest.TestCase):
                 'parent_map': {},
                 'child_map': {},
                 'group_map': {},
+                'fingerprints': {'version': 1, 'resources': {}},
                 'metadata': {
                     'generated_at': '2018-02-14T09:15:13Z',
                     'dbt_schema_version': 'https://schemas.getdbt.com/dbt/manifest/v9.json',
@@ -2,6 +2,7 @@ import unittest
 from unittest import mock
 from unittest.mock import patch
 
+from .test_graph_selector_methods import make_model
 from .utils import config_from_parts_or_dicts, normalize
 
 from dbt.contracts.files import SourceFile, FileHash, FilePath
@@ -101,3 +102,37 @@ class TestLoader(unittest.TestCase):
             project_root=normalize(self.root_project_config.project_root),
         )
         return SourceFile(path=path, checksum=checksum)
+
+
+def test_reference_resolver_looks_up_references_once():
+    target = mock.MagicMock()
+    resolver = manifest.ReferenceResolver(target, 'root')
+    for node_package in ('root', 'root', 'other'):
+        resolver.resolve_ref('a', None, node_package)
+        resolver.resolve_ref('a', 'pkg', node_package)
+        resolver.resolve_source('src', 'tbl', node_package)
+    assert target.resolve_ref.call_args_list == [
+        mock.call('a', None, 'root', 'root'),
+        mock.call('a', 'pkg', 'root', 'root'),
+        mock.call('a', None, 'root', 'other'),
+    ]
+    assert target.resolve_source.call_count == 2
+
+
+def test_process_refs_assigns_depends_on_once():
+    model_a = make_model('root', 'a', 'select 1 as id')
+    model_b = make_model('root', 'b', 'select 1 as id', refs=[model_a])
+    model_c = make_model('root', 'c', 'select 1 as id', refs=[model_a, model_b])
+    for node in (model_b, model_c):
+        node.depends_on.nodes = []
+    model_c.refs.append(['a'])
+    target = Manifest(nodes={n.unique_id: n for n in (model_a, model_b, model_c)})
+    resolver = manifest.ReferenceResolver(target, 'root')
+    with mock.patch.object(target, 'resolve_ref', wraps=target.resolve_ref) as resolve_ref:
+        with mock.patch.object(target, 'update_node', wraps=target.update_node) as update_node:
+            for node in (model_b, model_c):
+                manifest._process_refs_for_node(target, 'root', node, resolver)
+    assert resolve_ref.call_count == 2
+    assert update_node.call_count == 2
+    assert model_b.depends_on.nodes == ['model.root.a']
+    assert model_c.depends_on.nodes == ['model.root.a', 'model.root.b', 'model.root.a']
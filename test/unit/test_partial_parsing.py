@@ -152,3 +152,20 @@ class TestPartialParsing(unittest.TestCase):
         schema_file_model_descriptions = set([model['description'] for model in schema_file.pp_dict['models']])
         expected_model_descriptions = set(['Test model', 'python'])
         self.assertEqual(schema_file_model_descriptions, expected_model_descriptions)
+
+    def test_deleted_model_schedules_children(self):
+        # my_model_untouched refs my_model
+        child = self.saved_manifest.nodes['model.my_test.my_model_untouched']
+        child.depends_on.nodes.append('model.my_test.my_model')
+        self.saved_manifest.update_edges(child)
+
+        # Delete the model file
+        sql_model_file_id = 'my_test://' + normalize('models/my_model.sql')
+        del self.partial_parsing.new_files[sql_model_file_id]
+
+        self.partial_parsing.build_file_diff()
+        pp_files = self.partial_parsing.get_parsing_files()
+        # the child is parsed again so that its ref fails
+        child_file_id = 'my_test://' + normalize('models/my_model_untouched.sql')
+        self.assertIn(child_file_id, pp_files['my_test']['ModelParser'])
+        self.assertNotIn('model.my_test.my_model_untouched', self.saved_manifest.nodes)
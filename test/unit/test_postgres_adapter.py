@@ -1,5 +1,9 @@
 import agate
+import datetime
 import decimal
+import os
+import pytz
+import tempfile
 import unittest
 from unittest import mock
 
@@ -9,10 +13,13 @@ from dbt.task.debug import DebugTask
 from dbt.adapters.base.query_headers import MacroQueryStringSetter
 from dbt.adapters.postgres import PostgresAdapter
 from dbt.adapters.postgres import Plugin as PostgresPlugin
+from dbt.adapters.postgres.impl import CsvCopyStream
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import ManifestStateCheck
+from dbt.contracts.graph.nodes import ModelNode
 from dbt.clients import agate_helper
-from dbt.exceptions import DbtValidationError, DbtConfigError
+from dbt.node_types import NodeType
+from dbt.exceptions import DbtDatabaseError, DbtValidationError, DbtConfigError, DbtRuntimeError, MacroResultError, UnexpectedNonTimestampError
 from psycopg2 import extensions as psycopg2_extensions
 from psycopg2 import DatabaseError
 
@@ -69,6 +76,33 @@ class TestPostgresAdapter(unittest.TestCase):
         connection.handle
         psycopg2.connect.assert_called_once()
 
+    def test_copy_csv_rows_reports_cast_errors(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'people.csv')
+            with open(path, 'w') as fp:
+                fp.write('id,name\n1,a\nunknown,b\n')
+            agate_table = agate.Table(
+                [['1', 'a']], ['id', 'name'], [agate_helper.Number(), agate.data_types.Text()]
+            )
+            agate_table.original_abspath = path
+
+            def copy_from_stream(sql, stream):
+                # psycopg2 fails the COPY with its own error when read() raises
+                try:
+                    stream.read()
+                except DbtRuntimeError as exc:
+                    raise DbtDatabaseError('COPY from stdin failed') from exc
+
+            relation = self.adapter.Relation.create('db', 'schema', 'people')
+            with mock.patch.object(
+                self.adapter.connections, 'copy_from_stream', side_effect=copy_from_stream
+            ):
+                with self.assertRaises(DbtRuntimeError) as exc:
+                    self.adapter.copy_csv_rows(relation, agate_table, 'id, name')
+        self.assertNotIsInstance(exc.exception, DbtDatabaseError)
+        self.assertIn(path, str(exc.exception))
+        self.assertIn('"unknown" in column "id" of row 2', str(exc.exception))
+
     @mock.patch('dbt.adapters.postgres.connections.psycopg2')
     def test_acquire_connection(self, psycopg2):
         connection = self.adapter.acquire_connection('dummy')
@@ -326,6 +360,136 @@ class TestPostgresAdapter(unittest.TestCase):
         )
         self.assertEqual(exceptions, [])
 
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_calculate_freshness_batch(self, mock_execute):
+        loaded = datetime.datetime(2023, 1, 1, 10, tzinfo=pytz.UTC)
+        now = datetime.datetime(2023, 1, 1, 12, tzinfo=pytz.UTC)
+        mock_execute.return_value.response = 'SELECT 2'
+        # rows may come back in any order
+        mock_execute.return_value.table = agate.Table(
+            rows=[(1, None, now), (0, loaded, now)],
+            column_names=['source_index', 'max_loaded_at', 'snapshotted_at'],
+        )
+        sources = [
+            (self.adapter.Relation.create(schema='raw', identifier='a'), 'loaded_at'),
+            (self.adapter.Relation.create(schema='raw', identifier='b'), 'loaded_at'),
+        ]
+        response, freshness = self.adapter.calculate_freshness_batch(sources, 'id > 1')
+
+        self.assertEqual(response, 'SELECT 2')
+        self.assertEqual(freshness[0]['max_loaded_at'], loaded)
+        self.assertEqual(freshness[0]['age'], 7200)
+        self.assertEqual(freshness[1]['max_loaded_at'].year, 1)
+        self.assertEqual(freshness[1]['snapshotted_at'], now)
+        mock_execute.assert_called_once_with(
+            'collect_freshness_batch', kwargs={'sources': sources, 'filter': 'id > 1'}, manifest=None
+        )
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_calculate_freshness_batch_timestamp_strings(self, mock_execute):
+        loaded = datetime.datetime(2023, 1, 1, 10, tzinfo=pytz.UTC)
+        now = '2023-01-01 12:00:00+00'
+        # columns with and without a time zone, returned as strings
+        mock_execute.return_value.table = agate.Table(
+            rows=[(0, '2023-01-01 10:00:00', now), (1, '2023-01-01 11:00:00+01', now)],
+            column_names=['source_index', 'max_loaded_at', 'snapshotted_at'],
+            column_types=[agate.Number(), agate.Text(), agate.Text()],
+        )
+        sources = [
+            (self.adapter.Relation.create(schema='raw', identifier='a'), 'loaded_at'),
+            (self.adapter.Relation.create(schema='raw', identifier='b'), 'loaded_at'),
+        ]
+        _, freshness = self.adapter.calculate_freshness_batch(sources, None)
+        self.assertEqual([f['max_loaded_at'] for f in freshness], [loaded, loaded])
+        self.assertEqual([f['age'] for f in freshness], [7200, 7200])
+
+        # a date is not a timestamp, as with collect_freshness
+        mock_execute.return_value.table = agate.Table(
+            rows=[(0, '2023-01-01', now), (1, '2023-01-01 11:00:00', now)],
+            column_names=['source_index', 'max_loaded_at', 'snapshotted_at'],
+            column_types=[agate.Number(), agate.Text(), agate.Text()],
+        )
+        with self.assertRaises(UnexpectedNonTimestampError):
+            self.adapter.calculate_freshness_batch(sources, None)
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_calculate_freshness_batch_missing_rows(self, mock_execute):
+        now = datetime.datetime(2023, 1, 1, 12, tzinfo=pytz.UTC)
+        mock_execute.return_value.table = agate.Table(
+            rows=[(0, now, now), (0, now, now)],
+            column_names=['source_index', 'max_loaded_at', 'snapshotted_at'],
+        )
+        sources = [
+            (self.adapter.Relation.create(schema='raw', identifier='a'), 'loaded_at'),
+            (self.adapter.Relation.create(schema='raw', identifier='b'), 'loaded_at'),
+        ]
+        with self.assertRaises(MacroResultError):
+            self.adapter.calculate_freshness_batch(sources, None)
+
+    @mock.patch.object(PostgresAdapter, '_get_one_catalog')
+    @mock.patch.object(PostgresAdapter, '_get_catalog_schemas')
+    def test_get_catalog_only_schemas(self, mock_get_schemas, mock_get_one):
+        info = mock.MagicMock(database='DBT')
+        mock_get_schemas.return_value.items.return_value = [(info, {'foo', 'bar', 'quux'})]
+        mock_get_one.return_value = agate.Table(rows=[], column_names=['table_database'])
+
+        mock_manifest = mock.MagicMock()
+        self.adapter.get_catalog(mock_manifest, only_schemas={('dbt', 'foo'), ('dbt', 'quux')})
+        mock_get_one.assert_called_once_with(info, {'foo', 'quux'}, mock_manifest)
+
+        mock_get_one.reset_mock()
+        self.adapter.get_catalog(mock_manifest, only_schemas=set())
+        mock_get_one.assert_not_called()
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_set_grants_cache(self, mock_execute):
+        mock_execute.return_value = agate.Table(
+            rows=[
+                ('table1', 'reporter', 'SELECT'),
+                ('table1', 'loader', 'INSERT'),
+                ('table2', 'reporter', 'SELECT'),
+            ],
+            column_names=['table_name', 'grantee', 'privilege_type'],
+        )
+        node = mock.MagicMock(
+            spec=ModelNode, resource_type=NodeType.Model,
+            database='dbt', schema='foo', alias='table1',
+            is_relational=True, is_ephemeral_model=False,
+            config={'grants': {'select': ['reporter']}},
+        )
+        manifest = mock.MagicMock(nodes={'model.x.table1': node})
+        self.adapter.set_grants_cache(manifest, {'model.x.table1'})
+
+        self.assertEqual(mock_execute.call_count, 1)
+        relation = self.adapter.Relation.create(database='dbt', schema='foo', identifier='table1')
+        self.assertEqual(
+            self.adapter.get_cached_grants(relation),
+            {'SELECT': ['reporter'], 'INSERT': ['loader']},
+        )
+        self.assertEqual(
+            self.adapter.get_cached_grants(relation.incorporate(path={'identifier': 'table3'})),
+            {},
+        )
+
+        # grants on a recreated relation have to be looked up again
+        self.adapter.cache_added(relation)
+        self.assertIsNone(self.adapter.get_cached_grants(relation))
+
+    @mock.patch.object(PostgresAdapter, 'execute_macro')
+    def test_set_grants_cache_failure(self, mock_execute):
+        mock_execute.side_effect = DbtDatabaseError('permission denied')
+        node = mock.MagicMock(
+            spec=ModelNode, resource_type=NodeType.Model,
+            database='dbt', schema='foo', alias='table1',
+            is_relational=True, is_ephemeral_model=False,
+            config={'grants': {'select': ['reporter']}},
+        )
+        manifest = mock.MagicMock(nodes={'model.x.table1': node})
+        self.adapter.set_grants_cache(manifest, {'model.x.table1'})
+
+        relation = self.adapter.Relation.create(database='dbt', schema='foo', identifier='table1')
+        self.assertIsNone(self.adapter.get_cached_grants(relation))
+
 
 class TestConnectingPostgresAdapter(unittest.TestCase):
     def setUp(self):
@@ -504,6 +668,58 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
         self.adapter.verify_database('postgres')
 
 
+class TestCsvCopyStream(unittest.TestCase):
+    def test_renders_cast_values(self):
+        column_types = [
+            agate_helper.Number(null_values=('null', '')),
+            agate.data_types.Text(null_values=('null', '')),
+            agate.data_types.Boolean(true_values=('true',), false_values=('false',), null_values=('null', '')),
+            agate_helper.ISODateTime(null_values=('null', '')),
+        ]
+        rows = iter([
+            ['1', 'a, "quoted" b', 'true', '2018-08-06T11:33:29'],
+            ['2.5', '', 'false'],
+            ['null', 'c', '', ''],
+        ])
+        stream = CsvCopyStream(rows, column_types, batch_size=2)
+
+        chunks = []
+        while True:
+            chunk = stream.read(16)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        self.assertEqual(stream.row_count, 3)
+        self.assertEqual(
+            ''.join(chunks),
+            '1,"a, ""quoted"" b",true,2018-08-06T11:33:29\n'
+            '2.5,,false,\n'
+            ',c,,\n'
+        )
+
+    def test_too_many_values(self):
+        stream = CsvCopyStream(iter([['1', '2']]), [agate.data_types.Text()])
+        with self.assertRaises(DbtRuntimeError):
+            stream.read()
+
+    def test_value_not_matching_sampled_type(self):
+        # the types come from a sample, which a later row may not match
+        rows = iter([['1', 'a'], ['2', 'b'], ['unknown', 'c']])
+        stream = CsvCopyStream(
+            rows, [agate_helper.Number(), agate.data_types.Text()], batch_size=2,
+            column_names=['id', 'name'], seed_name='seed "seeds/people.csv"',
+        )
+        self.assertEqual(stream.read(), '1,a\n2,b\n')
+        with self.assertRaises(DbtRuntimeError) as exc:
+            stream.read()
+        message = str(exc.exception)
+        self.assertIn('seeds/people.csv', message)
+        self.assertIn('"unknown" in column "id" of row 3', message)
+        self.assertIn('column_types', message)
+        self.assertIs(stream.error, exc.exception)
+
+
 class TestPostgresFilterCatalog(unittest.TestCase):
     def test__catalog_filter_table(self):
         manifest = mock.MagicMock()
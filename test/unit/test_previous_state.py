@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from dbt.contracts.graph.fingerprints import build_manifest_fingerprints
+from dbt.contracts.graph.manifest import WritableManifest
+from dbt.contracts.state import LazyMapping, PreviousState, macro_checksum
+
+
+MANIFEST_PATH = os.path.normpath(os.path.join(
+    os.path.dirname(__file__), '..', '..', 'tests', 'functional', 'artifacts', 'data', 'state',
+    'v9', 'manifest.json',
+))
+
+
+class TestPreviousState(unittest.TestCase):
+    def setUp(self):
+        self.state_dir = tempfile.mkdtemp()
+        shutil.copy(MANIFEST_PATH, os.path.join(self.state_dir, 'manifest.json'))
+        self.state = PreviousState(path=Path(self.state_dir), current_path=Path(self.state_dir))
+        self.expected = WritableManifest.read_and_check_versions(MANIFEST_PATH)
+
+    def tearDown(self):
+        shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    def test_artifacts_read_on_first_use(self):
+        self.assertEqual(self.state._loaded, set())
+        self.assertIsNone(self.state.results)
+        self.assertEqual(self.state._loaded, {'results'})
+        self.assertIsNotNone(self.state.manifest)
+        self.assertIs(self.state.manifest, self.state.manifest)
+
+    def test_nodes_deserialized_on_lookup(self):
+        nodes = self.state.manifest.nodes
+        self.assertIsInstance(nodes, LazyMapping)
+        self.assertEqual(set(nodes), set(self.expected.nodes))
+        self.assertEqual(nodes._loaded, {})
+
+        unique_id = 'model.test.my_model'
+        node = nodes[unique_id]
+        self.assertEqual(list(nodes._loaded), [unique_id])
+        self.assertIs(nodes[unique_id], node)
+        self.assertEqual(node.to_dict(), self.expected.nodes[unique_id].to_dict())
+
+    def test_lazy_manifest_serializes_the_same(self):
+        self.assertEqual(
+            self.state.manifest.to_dict(omit_none=False),
+            self.expected.to_dict(omit_none=False),
+        )
+
+    def test_index(self):
+        index = self.state.index
+        self.assertEqual(self.state.manifest.nodes._loaded, {})
+
+        model = self.expected.nodes['model.test.my_model']
+        entry = index['model.test.my_model']
+        self.assertEqual(entry.resource_type, 'model')
+        self.assertEqual(entry.checksum, model.checksum.checksum)
+        self.assertEqual(entry.relation_name, model.relation_name)
+        self.assertEqual(entry.macros, tuple(model.depends_on.macros))
+
+        unique_id, macro = next(iter(self.expected.macros.items()))
+        self.assertEqual(index[unique_id].checksum, macro_checksum(macro.macro_sql))
+
+    def test_missing_state(self):
+        state = PreviousState(path=Path('/path/does/not/exist'), current_path=Path('/path/does/not/exist'))
+        self.assertIsNone(state.manifest)
+        self.assertIsNone(state.index)
+        self.assertIsNone(state.sources)
+
+    def test_fingerprints_read_without_nodes(self):
+        self.assertIsNone(self.state.manifest.fingerprints)
+
+        written = self.expected
+        written.fingerprints = build_manifest_fingerprints(
+            written.macros, (written.nodes, written.sources)
+        )
+        written.write(os.path.join(self.state_dir, 'manifest.json'))
+        state = PreviousState(path=Path(self.state_dir), current_path=Path(self.state_dir))
+        self.assertEqual(state.manifest.fingerprints, written.fingerprints)
+        self.assertEqual(state.manifest.nodes._loaded, {})
@@ -0,0 +1,97 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from dbt.contracts.results import (
+    BaseResult,
+    RunExecutionResult,
+    RunResult,
+    RunResultsArtifact,
+    RunResultsWriter,
+    RunStatus,
+    TimingInfo,
+)
+
+
+def make_result(unique_id, status=RunStatus.Success):
+    timing = TimingInfo('execute')
+    timing.begin()
+    timing.end()
+    return RunResult(
+        node=mock.MagicMock(unique_id=unique_id),
+        status=status,
+        timing=[timing],
+        thread_id='Thread-1',
+        execution_time=0.5,
+        adapter_response={'_message': 'SELECT 1', 'rows_affected': 1},
+        message='SELECT 1',
+        failures=None,
+    )
+
+
+class TestRunResultsWriter(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'target', 'run_results.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _execution_result(self, results):
+        return RunExecutionResult(
+            results=results,
+            elapsed_time=1.25,
+            generated_at=datetime(2023, 1, 1, 12, 0, 0),
+            args={'which': 'run', 'select': ['a']},
+        )
+
+    def test_same_output_as_artifact(self):
+        results = [make_result('model.test.a'), make_result('model.test.b', RunStatus.Error)]
+        hook_failure = BaseResult(
+            status=RunStatus.Error, timing=[], thread_id='main', execution_time=0,
+            adapter_response={}, message='hook failed', failures=1,
+        )
+        writer = RunResultsWriter(self.path)
+        for result in results:
+            writer.add(result)
+        writer.add(hook_failure)
+        execution_result = self._execution_result(results + [hook_failure])
+        self.assertTrue(writer.finalize(execution_result))
+        self.assertFalse(os.path.exists(writer.jsonl_path))
+        with open(self.path) as fp:
+            streamed = fp.read()
+
+        expected_path = os.path.join(self.tempdir, 'expected.json')
+        RunResultsArtifact.from_execution_results(
+            results=execution_result.results,
+            elapsed_time=execution_result.elapsed_time,
+            generated_at=execution_result.generated_at,
+            args=execution_result.args,
+        ).write(expected_path)
+        with open(expected_path) as fp:
+            expected = fp.read()
+
+        self.assertEqual(streamed, expected)
+        self.assertEqual(len(json.loads(streamed)['results']), 2)
+
+    def test_keep_jsonl(self):
+        writer = RunResultsWriter(self.path, keep_jsonl=True)
+        writer.add(make_result('model.test.a'))
+        self.assertTrue(writer.finalize(self._execution_result([make_result('model.test.a')])))
+        with open(writer.jsonl_path) as fp:
+            lines = [json.loads(line) for line in fp]
+        self.assertEqual([line['unique_id'] for line in lines], ['model.test.a'])
+
+    def test_mismatched_results(self):
+        writer = RunResultsWriter(self.path)
+        writer.add(make_result('model.test.a'))
+        execution_result = self._execution_result(
+            [make_result('model.test.a'), make_result('model.test.b')]
+        )
+        self.assertFalse(writer.finalize(execution_result))
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(writer.jsonl_path))
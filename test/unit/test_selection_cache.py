@@ -0,0 +1,98 @@
+import os
+from unittest import mock
+
+import pytest
+
+import dbt.graph.cli as graph_cli
+import dbt.graph.selector as graph_selector
+from dbt.contracts.files import FileHash
+from dbt.exceptions import InvalidSelectorError
+from dbt.graph.selection_cache import SelectionCache, spec_methods
+
+from .test_graph_selection import _get_graph, _get_manifest
+
+
+@pytest.fixture
+def graph():
+    return _get_graph()
+
+
+@pytest.fixture
+def manifest(graph):
+    return _get_manifest(graph)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SelectionCache(str(tmp_path / 'selection_cache'))
+
+
+def _selector(graph, manifest, cache):
+    selector = graph_selector.NodeSelector(graph, manifest)
+    selector.selection_cache = cache
+    return selector
+
+
+def test_cached_selection_skips_graph(graph, manifest, cache):
+    spec = graph_cli.parse_difference(['tag:abc+'], ['X.e'], 'eager')
+    selector = _selector(graph, manifest, cache)
+    selected = selector.get_selected(spec)
+    assert selected == {'m.X.a', 'm.Y.b', 'm.X.c', 'm.Y.d', 'm.Y.f', 'm.X.g'}
+    assert len(os.listdir(cache.path)) == 1
+
+    selector = _selector(graph, manifest, cache)
+    assert selector.get_selected(spec) == selected
+    assert selector._graph is None
+
+
+def test_cache_key_covers_spec_and_manifest(graph, manifest, cache):
+    selector = _selector(graph, manifest, cache)
+
+    def key(spec):
+        return cache.key(manifest, spec, selector, None)
+
+    spec = graph_cli.parse_difference(['tag:abc'], None, 'eager')
+    assert key(spec) == key(graph_cli.parse_difference(['tag:abc'], None, 'eager'))
+    assert key(spec) != key(graph_cli.parse_difference(['tag:abc+'], None, 'eager'))
+    assert key(spec) != key(graph_cli.parse_difference(['tag:abc'], None, 'cautious'))
+
+    before = key(spec)
+    manifest.state_check.vars_hash = FileHash.from_contents('{"var": 1}')
+    assert key(spec) != before
+
+    types_selector = graph_selector.ResourceTypeSelector(graph, manifest, None, ['model'])
+    assert cache.key(manifest, spec, types_selector, None) != key(spec)
+
+
+def test_cached_warnings_replayed(graph, manifest, cache):
+    spec = graph_cli.parse_difference(['tag:missing'], None, 'eager')
+    with mock.patch.object(graph_selector, 'warn_or_error') as warn:
+        assert _selector(graph, manifest, cache).get_selected(spec) == set()
+        assert _selector(graph, manifest, cache).get_selected(spec) == set()
+    assert warn.call_count == 2
+    assert [c.args[0].spec_raw for c in warn.call_args_list] == ['tag:missing'] * 2
+
+
+def test_invalid_selector_not_cached(graph, manifest, cache):
+    spec = graph_cli.parse_difference(['tag:abc'], None, 'eager')
+    selector = _selector(graph, manifest, cache)
+    with mock.patch.object(
+        selector, 'select_included', side_effect=InvalidSelectorError('invalid')
+    ):
+        assert selector.get_selected(spec) == set()
+    assert not os.path.exists(cache.path)
+
+
+def test_spec_methods():
+    spec = graph_cli.parse_difference(['state:modified+', 'tag:abc'], ['result:error'], 'eager')
+    assert spec_methods(spec) == {'state', 'tag', 'result'}
+
+
+def test_prune_keeps_recent_entries(cache):
+    for i in range(5):
+        cache.put(f'key{i}', [], [])
+        os.utime(os.path.join(cache.path, f'key{i}.json'), (i, i))
+    cache.prune(keep=2)
+    assert sorted(os.listdir(cache.path)) == ['key3.json', 'key4.json']
+    assert cache.get('key4') == {'key': 'key4', 'selected': [], 'warnings': []}
+    assert cache.get('key0') is None
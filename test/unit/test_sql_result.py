@@ -1,4 +1,5 @@
 import unittest
+from decimal import Decimal
 from dbt.adapters.sql.connections import SQLConnectionManager
 
 class TestProcessSQLResult(unittest.TestCase):
@@ -16,3 +17,41 @@ class TestProcessSQLResult(unittest.TestCase):
 			SQLConnectionManager.process_results(cols_with_more_dupes, rows),
 			[{"a": 1, "a_2": 2, "a_3": 3, "b": 4}]
 		)
+
+
+class FakeCursor:
+	def __init__(self, column_names, rows):
+		self.description = [(name, None) for name in column_names]
+		self.rows = list(rows)
+		self.fetch_sizes = []
+
+	def fetchmany(self, size):
+		self.fetch_sizes.append(size)
+		batch, self.rows = self.rows[:size], self.rows[size:]
+		return batch
+
+
+class TestGetResultFromCursor(unittest.TestCase):
+	def test_fetches_in_batches(self):
+		cursor = FakeCursor(['a', 'b', 'a'], [(i, str(i), i * 2) for i in range(5)])
+		batches = list(SQLConnectionManager.iter_batches_from_cursor(cursor, batch_size=2))
+		self.assertEqual([len(b) for b in batches], [2, 2, 1])
+		self.assertEqual(cursor.fetch_sizes, [2, 2, 2, 2])
+
+	def test_columnar_result(self):
+		cursor = FakeCursor(['a', 'b', 'a'], [(1, 'x', 2), (3, 'y', 4)])
+		table = SQLConnectionManager.get_result_from_cursor(cursor)
+		self.assertEqual(table.column_names, ('a', 'b', 'a_2'))
+		self.assertEqual(len(table), 2)
+		self.assertFalse(table.is_materialized)
+		self.assertEqual(table.column_values('a_2'), [Decimal(2), Decimal(4)])
+		# agate semantics are available on demand
+		self.assertEqual(table.columns['b'].values(), ('x', 'y'))
+		self.assertTrue(table.is_materialized)
+
+	def test_no_description(self):
+		cursor = FakeCursor([], [])
+		cursor.description = None
+		table = SQLConnectionManager.get_result_from_cursor(cursor)
+		self.assertEqual(len(table), 0)
+		self.assertEqual(table.column_names, ())
@@ -3,6 +3,7 @@ import shutil
 import stat
 import unittest
 import tarfile
+import gzip
 import io
 import pathspec
 from pathlib import Path
@@ -283,3 +284,32 @@ class TestUntarPackage(unittest.TestCase):
             with self.assertRaises(tarfile.ReadError) as exc:
                 dbt.clients.system.untar_package(named_file.name, self.tempdest)
             self.assertEqual("empty file", str(exc.exception))
+
+
+class TestCompressedJson(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'manifest.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_write_and_read_gzip(self):
+        dbt.clients.system.write_json(self.path, {'a': [1, 2]}, compression='gzip')
+        self.assertFalse(os.path.exists(self.path))
+        with gzip.open(self.path + '.gz', 'rt') as f:
+            self.assertEqual(f.read(), '{"a": [1, 2]}')
+        # the plain path finds the compressed copy
+        self.assertEqual(dbt.clients.system.read_json(self.path), {'a': [1, 2]})
+        self.assertEqual(dbt.clients.system.read_json(self.path + '.gz'), {'a': [1, 2]})
+
+    def test_write_removes_other_formats(self):
+        dbt.clients.system.write_json(self.path, {'a': 1}, compression='gzip')
+        dbt.clients.system.write_json(self.path, {'a': 2})
+        self.assertFalse(os.path.exists(self.path + '.gz'))
+        self.assertEqual(dbt.clients.system.read_json(self.path), {'a': 2})
+
+    def test_find_compressed_file_missing(self):
+        self.assertEqual(
+            dbt.clients.system.find_compressed_file(self.path), (self.path, None)
+        )
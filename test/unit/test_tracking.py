@@ -2,7 +2,11 @@ import dbt.tracking
 import datetime
 import shutil
 import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest import mock
 from unittest.mock import MagicMock
 
 class TestTracking(unittest.TestCase):
@@ -87,3 +91,64 @@ class TestTracking(unittest.TestCase):
                 )
 
                 assert dbt.tracking.active_user.do_not_track != send_anonymous_usage_stats
+
+
+class SlowCollectorHandler(BaseHTTPRequestHandler):
+    delay = 1.0
+    requests = []
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        time.sleep(self.delay)
+        SlowCollectorHandler.requests.append(body)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBackgroundTracking(unittest.TestCase):
+    def setUp(self):
+        SlowCollectorHandler.requests = []
+        self.server = HTTPServer(('127.0.0.1', 0), SlowCollectorHandler)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.server_thread.start()
+
+        self.emitter = dbt.tracking.TimeoutEmitter()
+        self.emitter.endpoint = 'http://127.0.0.1:{}/com.snowplowanalytics.snowplow/tp2'.format(
+            self.server.server_address[1]
+        )
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_slow_collector_does_not_block(self):
+        start = time.monotonic()
+        # filling the buffer sends it, which used to block on the collector
+        for i in range(self.emitter.buffer_size):
+            self.emitter.input({'e': 'se', 'se_ca': 'dbt', 'se_ac': str(i)})
+        self.assertLess(time.monotonic() - start, 1.0)
+
+        self.assertFalse(self.emitter.sender.wait(0.1))
+        self.assertTrue(self.emitter.sender.wait(10))
+        self.assertEqual(len(SlowCollectorHandler.requests), 1)
+
+    def test_flush_budget(self):
+        tracker = dbt.tracking.Tracker(self.emitter, namespace='cf', app_id='dbt')
+        self.emitter.input({'e': 'se', 'se_ca': 'dbt', 'se_ac': 'invocation'})
+        with mock.patch.object(dbt.tracking, 'emitter', self.emitter), \
+                mock.patch.object(dbt.tracking, 'tracker', tracker), \
+                mock.patch.object(dbt.tracking, 'FLUSH_TIMEOUT', 0.2):
+            start = time.monotonic()
+            dbt.tracking.flush()
+            self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(self.emitter.buffer, [])
+
+    def test_full_queue_drops_batches(self):
+        sender = dbt.tracking.BackgroundSender(lambda batch: time.sleep(1), max_batches=1)
+        for i in range(5):
+            sender.put([i])
+        # at most one batch is being sent and one is queued
+        self.assertLessEqual(sender.queue.unfinished_tasks, 2)
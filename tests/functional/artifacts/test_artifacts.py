@@ -370,6 +370,7 @@ def verify_manifest(project, expected_manifest, start_time, manifest_schema_path
         "disabled",
         "exposures",
         "selectors",
+        "fingerprints",
     }
 
     assert set(manifest.keys()) == manifest_keys
@@ -390,6 +391,12 @@ def verify_manifest(project, expected_manifest, start_time, manifest_schema_path
                 and metadata["send_anonymous_usage_stats"] is False
             )
             assert "adapter_type" in metadata and metadata["adapter_type"] == project.adapter_type
+        elif key == "fingerprints":
+            fingerprints = manifest["fingerprints"]
+            assert fingerprints["version"] == 1
+            assert set(fingerprints["resources"]) == set(manifest["nodes"]) | set(
+                manifest["sources"]
+            )
         elif key in ["nodes", "sources", "exposures", "metrics", "disabled", "docs"]:
             for unique_id, node in expected_manifest[key].items():
                 assert unique_id in manifest[key]
@@ -0,0 +1,43 @@
+import pytest
+
+from dbt.tests.util import run_dbt, write_file
+
+
+model_one_sql = "select 1 as id"
+model_two_sql = "select 1 as id, 'a' as name"
+
+
+class TestIncrementalCatalog:
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {
+            "model_one.sql": model_one_sql,
+            "model_two.sql": model_two_sql,
+        }
+
+    def test_incremental_catalog(self, project):
+        run_dbt(["run"])
+        catalog = run_dbt(["docs", "generate", "--incremental-catalog"])
+        assert set(catalog.nodes) == {"model.test.model_one", "model.test.model_two"}
+
+        # nothing was rebuilt: the previous entries are reused as they are
+        project.run_sql(f"alter table {project.test_schema}.model_one add column extra int")
+        catalog = run_dbt(["docs", "generate", "--incremental-catalog", "--no-compile"])
+        assert set(catalog.nodes["model.test.model_one"].columns) == {"id"}
+
+        # a full catalog picks up the change
+        catalog = run_dbt(["docs", "generate", "--no-compile"])
+        assert set(catalog.nodes["model.test.model_one"].columns) == {"id", "extra"}
+
+        # rebuilt models are queried again
+        run_dbt(["run", "--select", "model_two"])
+        catalog = run_dbt(["docs", "generate", "--incremental-catalog", "--no-compile"])
+        assert set(catalog.nodes) == {"model.test.model_one", "model.test.model_two"}
+        assert set(catalog.nodes["model.test.model_two"].columns) == {"id", "name"}
+
+        # a rebuild is seen even when a later invocation replaced run_results.json
+        write_file("select 1 as id, 2 as other", project.project_root, "models", "model_one.sql")
+        run_dbt(["run", "--select", "model_one"])
+        run_dbt(["test"])
+        catalog = run_dbt(["docs", "generate", "--incremental-catalog", "--no-compile"])
+        assert set(catalog.nodes["model.test.model_one"].columns) == {"id", "other"}
@@ -0,0 +1,59 @@
+import pytest
+from dbt.tests.util import run_dbt
+
+
+seed_rows = ["id,name,score,active,loaded_at"] + [
+    f"{i},\"name, {i}\",{i}.5,{'true' if i % 2 else 'false'},2023-01-01 00:00:00"
+    for i in range(1, 25001)
+]
+seeds__big_seed_csv = "\n".join(seed_rows) + "\n"
+
+seeds__small_seed_csv = """id,name,code
+1,Alice,0005
+2,,null
+"""
+
+
+class TestPostgresSeedCopy:
+    @pytest.fixture(scope="class")
+    def seeds(self):
+        return {
+            "big_seed.csv": seeds__big_seed_csv,
+            "small_seed.csv": seeds__small_seed_csv,
+        }
+
+    @pytest.fixture(scope="class")
+    def project_config_update(self):
+        return {
+            "seeds": {
+                "+use_copy": True,
+                "test": {"small_seed": {"+column_types": {"code": "text"}}},
+            },
+        }
+
+    def test_seed_copy(self, project):
+        results = run_dbt(["seed"])
+        assert len(results) == 2
+        by_name = {r.node.name: r for r in results}
+        # the row count covers the whole file, not only the sample used for type inference
+        assert by_name["big_seed"].adapter_response["rows_affected"] == 25000
+        assert by_name["small_seed"].adapter_response["rows_affected"] == 2
+
+        result = project.run_sql(
+            "select count(*), sum(score), count(*) filter (where active) from {schema}.big_seed",
+            fetch="one",
+        )
+        assert result[0] == 25000
+        assert float(result[1]) == sum(i + 0.5 for i in range(1, 25001))
+        assert result[2] == 12500
+
+        rows = project.run_sql(
+            "select id, name, code from {schema}.small_seed order by id", fetch="all"
+        )
+        assert rows == [(1, "Alice", "0005"), (2, None, None)]
+
+        # reseeding truncates and copies again
+        results = run_dbt(["seed"])
+        assert len(results) == 2
+        result = project.run_sql("select count(*) from {schema}.big_seed", fetch="one")
+        assert result[0] == 25000
@@ -349,3 +349,64 @@ class TestOverrideSourceFreshness(SuccessfulSourceFreshnessTest):
             "filter": None,
         }
         assert result_source_d["criteria"] == expected
+
+
+class TestBatchedSourceFreshness(SuccessfulSourceFreshnessTest):
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"schema.yml": override_freshness_models_schema_yml}
+
+    def test_batched_source_freshness(self, project):
+        self._set_updated_at_to(project, timedelta(hours=-8))
+
+        results = self.run_dbt_with_vars(project, ["source", "freshness"])
+        assert len(results) == 4
+        assert {r.node.name: str(r.status) for r in results} == {
+            "source_a": "warn",
+            "source_b": "warn",
+            "source_c": "warn",
+            "source_d": "warn",
+        }
+        # the four sources share a schema and a filter: checked by one query
+        execute_timings = set()
+        for result in results:
+            assert result.adapter_response["rows_affected"] == 4
+            assert result.adapter_response["batch_size"] == 4
+            [execute] = [t for t in result.timing if t.name == "execute"]
+            execute_timings.add((execute.started_at, execute.completed_at))
+            assert result.max_loaded_at.strftime("%Y-%m-%dT%H:%M:%S+00:00") == (
+                pytest.last_inserted_time
+            )
+        # they report the timing of the query they shared
+        assert len(execute_timings) == 1
+
+
+overridden_collect_freshness_sql = """
+{% macro collect_freshness(source, loaded_at_field, filter) %}
+  {% call statement('collect_freshness', fetch_result=True, auto_begin=False) -%}
+    select max({{ loaded_at_field }}) as max_loaded_at, {{ current_timestamp() }} as snapshotted_at
+    from {{ source }}
+  {% endcall %}
+  {{ return(load_result('collect_freshness')) }}
+{% endmacro %}
+"""
+
+
+class TestOverriddenCollectFreshnessNotBatched(SuccessfulSourceFreshnessTest):
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"schema.yml": override_freshness_models_schema_yml}
+
+    @pytest.fixture(scope="class")
+    def macros(self):
+        return {"collect_freshness.sql": overridden_collect_freshness_sql}
+
+    def test_overridden_collect_freshness(self, project):
+        self._set_updated_at_to(project, timedelta(hours=-8))
+
+        results = self.run_dbt_with_vars(project, ["source", "freshness"])
+        assert len(results) == 4
+        # the project's collect_freshness checks each source on its own
+        for result in results:
+            assert result.adapter_response["rows_affected"] == 1
+            assert "batch_size" not in result.adapter_response
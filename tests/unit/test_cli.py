@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import click
 
 from dbt.cli.main import cli
@@ -41,3 +44,30 @@ class TestCLI:
                     run_test(command)
 
         run_test(cli)
+
+    # Importing the cli must not import tasks, adapters, manifests or their
+    # dependencies; commands import what they need when they run. The
+    # `python -X importtime` report lists every module the import loaded.
+    def test_cli_import_is_lightweight(self):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import dbt.cli.main"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported = {
+            line.split("|")[-1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:")
+        }
+        assert "dbt.cli.main" in imported
+        heavy = [
+            "agate",
+            "dbt.adapters.factory",
+            "dbt.contracts.graph.manifest",
+            "dbt.task.base",
+            "dbt.tracking",
+            "jinja2",
+            "networkx",
+        ]
+        assert [module for module in heavy if module in imported] == []
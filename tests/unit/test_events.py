@@ -1,5 +1,9 @@
+import betterproto
 import re
+import threading
+from io import StringIO
 from typing import TypeVar
+from unittest import mock
 
 from dbt.contracts.results import TimingInfo
 from dbt.events import AdapterLogger, test_types, types
@@ -8,12 +12,15 @@ from dbt.events.base_types import (
     DebugLevel,
     DynamicLevel,
     ErrorLevel,
+    EventLevel,
     InfoLevel,
     TestLevel,
     WarnLevel,
     msg_from_base_event,
 )
+from dbt.events.eventmgr import BackPressure, EventManager, LoggerConfig
 from dbt.events.functions import msg_to_dict, msg_to_json
+from dbt.events.serialization import message_to_dict
 from dbt.flags import set_from_args
 from argparse import Namespace
 
@@ -431,6 +438,110 @@ class TestEventJSONSerialization:
             count += 1
         print(f"--- Found {count} events")
 
+    # the fast serializer must produce exactly what betterproto's to_dict does
+    def test_serializer_parity(self):
+        set_from_args(Namespace(WARN_ERROR=False), None)
+        for event in sample_values:
+            msg = msg_from_base_event(event)
+            fast = message_to_dict(msg)
+            # to_dict converts message values of maps in place, so call it last
+            expected = msg.to_dict(casing=betterproto.Casing.SNAKE, include_default_values=True)
+            assert fast == expected, f"{msg.info.name} serializes differently"
+
+
+class TestEventManagerLevels:
+    def test_skips_events_below_logger_levels(self):
+        manager = EventManager()
+        stream = StringIO()
+        manager.add_logger(
+            LoggerConfig(name="test_levels", level=EventLevel.INFO, output_stream=stream)
+        )
+        with mock.patch(
+            "dbt.events.eventmgr.msg_from_base_event", wraps=msg_from_base_event
+        ) as mock_msg:
+            manager.fire_event(types.AdapterEventDebug(name="dbt_tests", base_msg="skipped"))
+            assert mock_msg.call_count == 0
+            manager.fire_event(types.AdapterEventInfo(name="dbt_tests", base_msg="written"))
+            assert mock_msg.call_count == 1
+            # an explicit level overrides the level of the event
+            manager.fire_event(
+                types.AdapterEventDebug(name="dbt_tests", base_msg="raised"),
+                level=EventLevel.WARN,
+            )
+            assert mock_msg.call_count == 2
+        manager.flush()
+        assert "skipped" not in stream.getvalue()
+        assert "written" in stream.getvalue()
+        assert "raised" in stream.getvalue()
+
+    def test_callbacks_receive_all_levels(self):
+        manager = EventManager()
+        manager.add_logger(
+            LoggerConfig(name="test_levels", level=EventLevel.ERROR, output_stream=StringIO())
+        )
+        received = []
+        manager.callbacks.append(received.append)
+        manager.fire_event(types.AdapterEventDebug(name="dbt_tests", base_msg="debug"))
+        assert [msg.info.level for msg in received] == ["debug"]
+
+
+class TestAsyncWriter:
+    def test_writes_in_order(self):
+        manager = EventManager()
+        stream = StringIO()
+        manager.add_logger(
+            LoggerConfig(name="test_async", level=EventLevel.INFO, output_stream=stream)
+        )
+        manager.start_async_writer(batch_size=7)
+
+        def fire(thread_index):
+            for i in range(100):
+                manager.fire_event(
+                    types.AdapterEventInfo(name="dbt_tests", base_msg=f"{thread_index}-{i}")
+                )
+
+        threads = [threading.Thread(target=fire, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        manager.stop_async_writer()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 400
+        for t in range(4):
+            thread_lines = [line.split()[-1] for line in lines if f" {t}-" in line]
+            assert thread_lines == [f"{t}-{i}" for i in range(100)]
+
+    def test_drop_debug(self):
+        started, gate = threading.Event(), threading.Event()
+
+        def blocking_filter(msg):
+            started.set()
+            return gate.wait()
+
+        manager = EventManager()
+        manager.add_logger(
+            LoggerConfig(
+                name="test_async_drop",
+                level=EventLevel.DEBUG,
+                filter=blocking_filter,
+                output_stream=StringIO(),
+            )
+        )
+        manager.start_async_writer(
+            max_queue_size=1, batch_size=1, back_pressure=BackPressure.DropDebug
+        )
+        writer = manager._writer
+        manager.fire_event(types.AdapterEventInfo(name="dbt_tests", base_msg="first"))
+        started.wait()
+        # the writer is busy with the first event, so the queue only has room for one more
+        manager.fire_event(types.AdapterEventDebug(name="dbt_tests", base_msg="queued"))
+        manager.fire_event(types.AdapterEventDebug(name="dbt_tests", base_msg="dropped"))
+        gate.set()
+        manager.stop_async_writer()
+        assert writer.dropped == 1
+
 
 T = TypeVar("T")
 